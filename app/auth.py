@@ -10,51 +10,61 @@ from flask import current_app, jsonify, request
 from flask_httpauth import HTTPBasicAuth
 from werkzeug.security import check_password_hash
 from services.config.config_service import load_config
-from datetime import datetime, timedelta, timezone
+from collections import OrderedDict, deque
+import hashlib
+import hmac
+import os
+import secrets
 import threading
+import time
 import discord
 
 auth = HTTPBasicAuth()
 
 # Simple internal rate limiter implementation
 class SimpleRateLimiter:
+    """Per-IP sliding-window rate limiter with O(1) amortized checks.
+
+    Each IP owns a ring of at most ``limit`` request timestamps; a request is
+    rejected while the ring is full and its oldest entry is still inside the
+    window. ``ip_dict`` is kept ordered by each IP's most recent accepted
+    request, so idle IPs are evicted lazily from the front instead of scanning
+    every tracked client on each call.
+    """
+
     def __init__(self, limit=5, per_seconds=60):
         self.limit = limit
         self.window = per_seconds
-        self.ip_dict = {}
+        self.ip_dict = OrderedDict()
         self.lock = threading.Lock()
 
     def is_rate_limited(self, ip):
         """Checks if an IP has exceeded the rate limit"""
-        now = datetime.now(timezone.utc)
+        now = time.monotonic()
         with self.lock:
-            # Delete old entries
             self.cleanup_old_entries(now)
 
-            # Initialize if IP is not in dict
-            if ip not in self.ip_dict:
-                self.ip_dict[ip] = []
-
-            # Count the number of requests in the last period
-            count = len(self.ip_dict[ip])
+            timestamps = self.ip_dict.get(ip)
+            if timestamps is None:
+                timestamps = self.ip_dict[ip] = deque(maxlen=self.limit)
 
-            # If the limit is already reached, reject
-            if count >= self.limit:
+            # Ring is full and its oldest request is still inside the window
+            if len(timestamps) >= self.limit and (not timestamps or timestamps[0] > now - self.window):
                 return True
 
-            # Otherwise add request and allow
-            self.ip_dict[ip].append(now)
+            # Otherwise record the request; deque(maxlen) drops the oldest one
+            timestamps.append(now)
+            self.ip_dict.move_to_end(ip)
             return False
 
     def cleanup_old_entries(self, now):
-        """Removes old entries from the rate limiter"""
-        cutoff = now - timedelta(seconds=self.window)
-        for ip in list(self.ip_dict.keys()):
-            # Only keep timestamps that are within the window
-            self.ip_dict[ip] = [ts for ts in self.ip_dict[ip] if ts > cutoff]
-            # Remove empty lists
-            if not self.ip_dict[ip]:
-                del self.ip_dict[ip]
+        """Evicts IPs whose most recent accepted request left the window"""
+        cutoff = now - self.window
+        while self.ip_dict:
+            ip, timestamps = next(iter(self.ip_dict.items()))
+            if timestamps and timestamps[-1] > cutoff:
+                break
+            del self.ip_dict[ip]
 
 # Global rate limiter - reasonable for normal usage
 auth_limiter = SimpleRateLimiter(limit=100, per_seconds=60)  # 100 requests per minute
@@ -65,6 +75,83 @@ auth_limiter = SimpleRateLimiter(limit=100, per_seconds=60)  # 100 requests per
 setup_limiter = SimpleRateLimiter(limit=5, per_seconds=60)
 
 
+class VerifiedCredentialCache:
+    """Short-lived cache of credentials that already passed the password hash check.
+
+    Basic auth resends the credentials with every request, so without a cache
+    every dashboard poll pays the full key-derivation cost. Entries are keyed by
+    an HMAC-SHA256 digest of the credentials under a random per-process key, so
+    neither the password nor an offline-attackable hash of it is held in memory.
+    The whole cache is dropped as soon as the configured user or password hash
+    changes.
+    """
+
+    def __init__(self, ttl_seconds=60, max_entries=64):
+        self.ttl = ttl_seconds
+        self.max_entries = max_entries
+        self._key = secrets.token_bytes(32)
+        self._entries = {}
+        self._fingerprint = None
+        self.lock = threading.Lock()
+
+    def _digest(self, username, password):
+        material = f"{username}\x00{password}".encode('utf-8', 'surrogatepass')
+        return hmac.new(self._key, material, hashlib.sha256).digest()
+
+    def _sync(self, stored_user, stored_hash):
+        fingerprint = (stored_user, stored_hash)
+        if fingerprint != self._fingerprint:
+            self._entries.clear()
+            self._fingerprint = fingerprint
+
+    def is_verified(self, username, password, stored_user, stored_hash):
+        """Return True if these credentials were verified against the current config."""
+        if self.ttl <= 0:
+            return False
+        digest = self._digest(username, password)
+        now = time.monotonic()
+        with self.lock:
+            self._sync(stored_user, stored_hash)
+            expires = self._entries.get(digest)
+            if expires is None:
+                return False
+            if expires <= now:
+                del self._entries[digest]
+                return False
+            return True
+
+    def remember(self, username, password, stored_user, stored_hash):
+        """Record credentials that just passed check_password_hash."""
+        if self.ttl <= 0:
+            return
+        digest = self._digest(username, password)
+        now = time.monotonic()
+        with self.lock:
+            self._sync(stored_user, stored_hash)
+            if len(self._entries) >= self.max_entries:
+                self._entries = {d: exp for d, exp in self._entries.items() if exp > now}
+                while len(self._entries) >= self.max_entries:
+                    # Evict the entry closest to expiry
+                    del self._entries[min(self._entries, key=self._entries.get)]
+            self._entries[digest] = now + self.ttl
+
+    def clear(self):
+        with self.lock:
+            self._entries.clear()
+            self._fingerprint = None
+
+
+def _get_credential_cache_ttl():
+    try:
+        return max(0, int(os.environ.get('DDC_AUTH_CACHE_TTL', '60')))
+    except ValueError:
+        return 60
+
+
+# Set DDC_AUTH_CACHE_TTL=0 to verify the password hash on every request
+credential_cache = VerifiedCredentialCache(ttl_seconds=_get_credential_cache_ttl())
+
+
 def init_limiter(app):
     """Initializes rate limiting for login attempts"""
     @app.before_request
@@ -114,8 +201,12 @@ def verify_password(username, password):
         logger.error("SECURITY: No password hash configured - authentication disabled for safety")
         logger.error("FIRST TIME SETUP: Use admin/setup to access setup page, then set your password")
         return None  # Fail securely - no authentication possible without configured password
-    elif username == stored_user and check_password_hash(stored_hash, password):
-        return username
+    elif username == stored_user:
+        if credential_cache.is_verified(username, password, stored_user, stored_hash):
+            return username
+        if check_password_hash(stored_hash, password):
+            credential_cache.remember(username, password, stored_user, stored_hash)
+            return username
     logger.warning(f"Failed login attempt for user: {username}")
     return None
 
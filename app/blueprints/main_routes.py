@@ -11,7 +11,6 @@ from flask import (
     jsonify, session, current_app, send_file, Response
 )
 from datetime import datetime
-import io
 import re
 
 # Import auth from app.auth
@@ -422,6 +421,56 @@ def performance_stats():
             'message': "Service error: Unable to access performance statistics service."
         })
 
+@main_bp.route('/api/memory-profile', methods=['GET', 'POST'])
+@auth.login_required
+def memory_profile():
+    """
+    Opt-in tracemalloc memory profile: allocation growth since the baseline, grouped by module.
+    The Web UI runs inside the bot process, so the report covers both.
+    POST {"action": "start" | "stop" | "snapshot" | "baseline"} controls profiling.
+    """
+    try:
+        from services.infrastructure.memory_profiler_service import GROUP_BY, get_memory_profiler_service
+
+        profiler = get_memory_profiler_service()
+        top = max(1, min(request.args.get('top', 20, type=int), 200))
+        group_by = request.args.get('group_by', 'module')
+        if group_by not in GROUP_BY:
+            return jsonify({'success': False, 'message': f"group_by must be one of {', '.join(GROUP_BY)}"}), 400
+
+        if request.method == 'POST':
+            data = request.get_json(silent=True) or {}
+            action = data.get('action')
+            if action == 'start':
+                profiler.start(int(data.get('frames', 1)))
+            elif action == 'stop':
+                profiler.stop()
+            elif action in ('snapshot', 'baseline'):
+                if not profiler.is_tracing:
+                    return jsonify({'success': False, 'message': "Memory profiling is not running"}), 409
+                if action == 'snapshot':
+                    profiler.take_snapshot(data.get('label'))
+                else:
+                    profiler.set_baseline()
+            else:
+                return jsonify({'success': False, 'message': "Unknown action"}), 400
+            log_user_action(action="MEMORY_PROFILE", target="Memory Profiler", source="Web UI", details=f"Action: {action}")
+
+        return jsonify({
+            'success': True,
+            'report': profiler.get_report(top=top, group_by=group_by, since=request.args.get('since'))
+        })
+
+    except (ImportError, AttributeError, RuntimeError) as e:
+        current_app.logger.error(f"Service dependency error in memory_profile endpoint: {e}", exc_info=True)
+        return jsonify({
+            'success': False,
+            'message': "Service error: Unable to access memory profiler."
+        }), 500
+    except (ValueError, TypeError) as e:
+        current_app.logger.error(f"Data error in memory_profile endpoint: {e}", exc_info=True)
+        return jsonify({'success': False, 'message': "Invalid memory profile request."}), 400
+
 @main_bp.route('/api/spam-protection', methods=['GET'])
 @auth.login_required
 def get_spam_protection():
@@ -813,6 +862,15 @@ def game_query_support_status():
     })
 
 
+def _conditional_asset_response(response, etag, data):
+    """Attach a content-addressed ETag and answer If-None-Match with 304."""
+    if not etag:
+        from services.mech.mech_asset_registry import compute_etag
+        etag = compute_etag(data)
+    response.set_etag(etag)
+    return response.make_conditional(request)
+
+
 @main_bp.route('/mech_animation')
 def mech_animation():
     """Live mech animation endpoint using MechWebService."""
@@ -827,11 +885,12 @@ def mech_animation():
         result = service.get_live_animation(request_obj)
 
         if result.success and result.animation_bytes:
-            return Response(
+            response = Response(
                 result.animation_bytes,
                 mimetype=result.content_type,
                 headers=result.cache_headers or {}
             )
+            return _conditional_asset_response(response, getattr(result, 'etag', None), result.animation_bytes)
         else:
             # Return error response based on result
             return Response(
@@ -1080,11 +1139,34 @@ def reset_mech_difficulty():
 def donations_api():
     """
     API endpoint to get donation data for the modal.
+
+    ``offset``/``limit``/``donor``/``type``/``since``/``until`` return a
+    paginated, filtered page served from the donation projection, with the
+    donation stats (the modal pages this way). Without query parameters the
+    newest 100 display rows are returned.
     """
     try:
         from services.donation.donation_management_service import get_donation_management_service
         donation_service = get_donation_management_service()
 
+        page_args = ('offset', 'limit', 'donor', 'type', 'since', 'until')
+        if any(arg in request.args for arg in page_args):
+            page = donation_service.get_donation_page(
+                offset=request.args.get('offset', 0, type=int),
+                limit=min(request.args.get('limit', 50, type=int), 500),
+                donor=request.args.get('donor'),
+                donation_type=request.args.get('type'),
+                since=request.args.get('since'),
+                until=request.args.get('until')
+            )
+            if not page.success:
+                current_app.logger.error(f"Failed to load donation page: {page.error}")
+                return jsonify({
+                    'success': False,
+                    'error': 'Failed to load donations'
+                })
+            return jsonify({'success': True, **page.data})
+
         # Get donation history and stats using service
         result = donation_service.get_donation_history(limit=100)
 
@@ -1427,21 +1509,18 @@ def get_mech_display_image(level: int, image_type: str):
             current_app.logger.error(f"Failed to get mech display image: {image_result.error_message}")
             return jsonify({'error': 'Image not available'}), 404
 
-        # Create in-memory file object for serving
-        image_buffer = io.BytesIO(image_result.image_bytes)
-        image_buffer.seek(0)
-
-        # Determine content type and set caching headers
+        # Bytes come straight from the in-memory asset registry; ETag is the content hash
         response = Response(
-            image_buffer.getvalue(),
+            image_result.image_bytes,
             mimetype='image/webp',
             headers={
-                'Content-Type': 'image/webp',
-                'Cache-Control': 'public, max-age=86400',  # Cache for 24 hours
-                'ETag': f'mech-{level}-{image_type}',
+                'Cache-Control': 'public, max-age=300, must-revalidate',
                 'Content-Disposition': f'inline; filename="{image_result.filename}"'
             }
         )
+        response = _conditional_asset_response(response, getattr(image_result, 'etag', None), image_result.image_bytes)
+        if response.status_code == 304:
+            return response
 
         current_app.logger.info(f"Served mech display image: Level {level} {image_type} ({len(image_result.image_bytes)} bytes)")
         return response
@@ -13,7 +13,7 @@ of global side-effects that happen during module import and makes it easier to
 unit-test the configuration primitives in isolation.
 """
 
-from .performance import apply_runtime_tweaks
+from .performance import apply_runtime_tweaks, enable_memory_profiling
 from .runtime import (
     configure_environment,
     ensure_log_files,
@@ -25,6 +25,7 @@ from .runtime import (
 
 __all__ = [
     "apply_runtime_tweaks",
+    "enable_memory_profiling",
     "configure_environment",
     "ensure_log_files",
     "ensure_token_security",
@@ -62,3 +62,20 @@ def _ensure_malloc_trim(logger: logging.Logger) -> None:
     # allowing the allocator to hand memory back once caches go cold.
     os.environ["MALLOC_TRIM_THRESHOLD_"] = "131072"
     logger.debug("Enabled MALLOC_TRIM_THRESHOLD_=131072 for improved memory reuse")
+
+
+def enable_memory_profiling(logger: logging.Logger) -> bool:
+    """Start tracemalloc profiling when ``DDC_MEMORY_PROFILING`` is set.
+
+    Call once per process; the bot and the Web UI share the profiler.
+    """
+
+    from services.infrastructure import memory_profiler_service as profiler_module
+
+    if not profiler_module.is_enabled():
+        return False
+
+    profiler = profiler_module.get_memory_profiler_service()
+    profiler.start(int(os.getenv(profiler_module.ENV_FRAMES, profiler_module.DEFAULT_FRAMES)))
+    logger.info("Memory profiling enabled")
+    return True
@@ -14,6 +14,8 @@ import discord
 import docker
 import inspect
 
+from utils import import_profiler
+
 from ..commands import list_registered_command_names, setup_schedule_commands
 from ..startup_context import StartupContext, as_step
 
@@ -26,7 +28,8 @@ async def load_extensions_step(context: StartupContext) -> None:
     extensions = [
         "cogs.docker_control",
         "cogs.auto_action_monitor",
-        "cogs.translation_monitor"
+        "cogs.translation_monitor",
+        "cogs.member_count_monitor"
     ]
 
     logger.info("Loading extensions...")
@@ -50,6 +53,12 @@ async def load_extensions_step(context: StartupContext) -> None:
             if ext == "cogs.docker_control":
                 raise
 
+    # Cold start import costs (only collected with DDC_PROFILE_IMPORTS=1)
+    profiler = import_profiler.get_import_profiler()
+    if profiler.active:
+        profiler.stop()
+        profiler.log_report(logger)
+
 
 @as_step
 async def prepare_schedule_commands_step(context: StartupContext) -> None:
@@ -256,22 +256,25 @@ def get_docker_containers_live(logger, force_refresh=False, container_name=None)
                 logger.debug(f"Limiting display to {MAX_CONTAINERS_DISPLAY} containers (total: {len(docker_cache['containers'])})")
             return list(containers_to_return), docker_cache['error']
 
-def update_docker_cache(logger):
-    """Updates the Docker container cache with current data and memory optimization"""
+def update_docker_cache(logger, max_age=None):
+    """Updates the Docker container cache from the shared container snapshot.
+
+    The list comes from the process-wide snapshot the bot also reads and
+    publishes to, so the daemon is only queried when neither side has a list
+    younger than ``max_age`` seconds (defaults to ``DOCKER_QUERY_COOLDOWN``).
+    """
     global last_docker_query_time
-    import gc
+    from services.docker_service.container_snapshot import get_container_snapshot_provider
 
-    logger.info("Updating Docker cache with memory optimization")
+    logger.info("Updating Docker cache from shared container snapshot")
     last_docker_query_time = time.time()  # Update query time immediately
+    if max_age is None:
+        max_age = DOCKER_QUERY_COOLDOWN
 
-    client = None
     try:
-        # Configure Docker client with timeout directly (thread-safe)
-        client = docker.from_env(timeout=BACKGROUND_REFRESH_TIMEOUT)
-
         try:
-            # Direct call without signal-based timeout wrapper
-            containers_to_process = client.containers.list(all=True)
+            snapshot = get_container_snapshot_provider().get(max_age=max_age)
+            containers_to_process = list(snapshot.containers)
         except Exception as te:
             # Catch timeouts from requests/docker-py
             if "Read timed out" in str(te) or "UnixHTTPConnectionPool" in str(te):
@@ -304,20 +307,20 @@ def update_docker_cache(logger):
             for container in containers_limited:
                 # Create optimized container data (only essential fields)
                 container_data = {
-                    'id': container.id[:12],
-                    'name': container.name,
-                    'status': container.status,
-                    'image': container.image.tags[0] if container.image.tags else container.image.id[:12]
+                    'id': container.get('id', ''),
+                    'name': container.get('name', ''),
+                    'status': container.get('status', 'unknown'),
+                    'image': container.get('image', '')
                 }
 
                 # Calculate a hash for change detection
                 container_hash = hash_container_data(container_data)
-                old_hash = docker_cache['container_hashes'].get(container.name)
+                old_hash = docker_cache['container_hashes'].get(container_data['name'])
 
                 # Update timestamp and hash only if something has changed
                 if old_hash != container_hash:
-                    docker_cache['container_timestamps'][container.name] = current_time
-                    docker_cache['container_hashes'][container.name] = container_hash
+                    docker_cache['container_timestamps'][container_data['name']] = current_time
+                    docker_cache['container_hashes'][container_data['name']] = container_hash
 
                 docker_cache['containers'].append(container_data)
 
@@ -333,10 +336,6 @@ def update_docker_cache(logger):
             memory_saved = old_container_count - container_count if old_container_count > container_count else 0
             logger.info(f"Docker cache updated with {container_count} containers (memory optimization: {memory_saved} containers removed)")
 
-            # Force garbage collection periodically
-            if docker_cache['access_count'] % 20 == 0:
-                gc.collect()
-
     except docker.errors.DockerException as e_outer:
         error_msg = f"Docker connection error during live query: {str(e_outer)}"
         logger.error(error_msg)
@@ -377,13 +376,6 @@ def update_docker_cache(logger):
 
         with cache_lock:
             docker_cache['error'] = f"⚠️ DOCKER QUERY ERROR: {str(e_general)}"
-    finally:
-        if client:
-            try:
-                client.close()
-            except (AttributeError, RuntimeError) as close_err:
-                # Service errors (client close failures, invalid client state)
-                logger.debug(f"Error closing Docker client after live query: {close_err}")
 
 def _cleanup_docker_cache(logger, current_time):
     """Performs memory cleanup on Docker cache"""
@@ -416,10 +408,6 @@ def _cleanup_docker_cache(logger, current_time):
 
     docker_cache['last_cleanup'] = current_time
 
-    # Force garbage collection after cleanup
-    import gc
-    gc.collect()
-
 def background_refresh_worker(logger):
     """Background worker for regular Docker cache updates"""
     logger.info("Starting background Docker cache refresh worker")
@@ -433,8 +421,8 @@ def background_refresh_worker(logger):
     try:
         while not stop_background_thread.is_set():
             try:
-                # Update the cache
-                update_docker_cache(logger)
+                # Update the cache, reusing a list the bot fetched within the interval
+                update_docker_cache(logger, max_age=BACKGROUND_REFRESH_INTERVAL)
 
                 # Wait for the configured time, but check regularly for stop signal
                 # Shorten the interval to notice the stop signal faster
@@ -14,12 +14,13 @@ import json
 from datetime import datetime, timezone
 from typing import Any, Dict, List
 
-from flask import Flask, jsonify, request
+from flask import Flask, Response, jsonify, request
 
 from app.auth import auth
 from services.admin.admin_service import get_admin_service
 from services.config.config_service import load_config
 from services.config.server_config_service import get_server_config_service
+from utils.observability import metrics
 
 
 def _validate_admin_users(admin_users: List[str]) -> Dict[str, Any]:
@@ -30,7 +31,7 @@ def _validate_admin_users(admin_users: List[str]) -> Dict[str, Any]:
 
 
 def register_routes(app: Flask) -> None:
-    """Attach the admin management and health routes."""
+    """Attach the admin management, health and metrics routes."""
 
     @app.route("/api/admin-users", methods=["GET", "POST"])
     @auth.login_required
@@ -96,3 +97,9 @@ def register_routes(app: Flask) -> None:
                 "timestamp": datetime.now(timezone.utc).isoformat(),
             }
             return jsonify(error_data), 500
+
+    @app.route("/metrics")
+    @auth.login_required
+    def prometheus_metrics():
+        """Expose collected metrics in the Prometheus text format."""
+        return Response(metrics.render_prometheus(), mimetype="text/plain; version=0.0.4; charset=utf-8")
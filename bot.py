@@ -17,6 +17,12 @@ import sys
 import time
 from datetime import datetime, timezone
 
+# Opt-in import-time profiling (DDC_PROFILE_IMPORTS=1) must start before the heavy imports.
+# run.py starts it earlier; this covers running the bot standalone (start is idempotent)
+from utils import import_profiler
+
+import_profiler.start_from_env()
+
 import pytz
 
 # Fix for audioop module in Python 3.13
@@ -11,12 +11,25 @@ import discord
 from discord.ui import View, Button
 import asyncio
 import logging
+import os
+import time
+from typing import Optional
 
 # SERVICE FIRST: Import all required services
 from services.admin.admin_service import get_admin_service
 from services.status.status_cache_service import get_status_cache_service
 from services.config.server_config_service import get_server_config_service
 from services.config.config_service import load_config  # Keep for backward compatibility
+from services.docker_service.bulk_action_service import (
+    DEFAULT_CONTAINER_TIMEOUT,
+    DEFAULT_MAX_PARALLEL,
+    BulkActionProgress,
+    BulkActionRequest,
+    BulkActionResult,
+    build_action_groups,
+    get_bulk_action_service,
+)
+from services.discord.message_location_registry import ADMIN_OVERVIEW, get_message_location_registry
 from cogs.translation_manager import _
 
 logger = logging.getLogger('ddc.admin_overview')
@@ -402,340 +415,219 @@ class StopAllConfirmationView(View):
         self.add_item(ConfirmStopAllButton(cog_instance, channel_id))
         self.add_item(CancelBulkActionButton())
 
-class ConfirmRestartAllButton(Button):
-    """Button to confirm restart all action."""
-
-    def __init__(self, cog_instance, channel_id: int):
-        self.cog = cog_instance
-        self.channel_id = channel_id
-
-        super().__init__(
-            style=discord.ButtonStyle.danger,
-            label=_("Yes, Restart All"),
-            custom_id="confirm_restart_all"
+def _bulk_action_texts(action: str):
+    """Translated (progress title, done title, success line) for a bulk action."""
+    if action == 'stop':
+        return (_("⏹️ Stopping containers…"), _("⏹️ Stop All Complete"),
+                _("Successfully stopped: **{count}** containers"))
+    if action == 'start':
+        return (_("▶️ Starting containers…"), _("▶️ Start All Complete"),
+                _("Successfully started: **{count}** containers"))
+    return (_("🔄 Restarting containers…"), _("🔄 Restart All Complete"),
+            _("Successfully restarted: **{count}** containers"))
+
+
+# Minimum seconds between progress edits (Discord rate-limits message edits)
+BULK_PROGRESS_EDIT_INTERVAL = 1.5
+
+
+def _is_running_cached(docker_name: str) -> bool:
+    """Running state of a container according to the status cache."""
+    # IMPORTANT: Always use docker_name for cache lookups (stable identifier)
+    cached_entry = get_status_cache_service().get(docker_name)
+    if not cached_entry or not cached_entry.get('data'):
+        return False
+    status_result = cached_entry['data']
+    from services.docker_status.models import ContainerStatusResult
+    if isinstance(status_result, ContainerStatusResult):
+        return status_result.is_running
+    # Backwards compatibility: old tuple format
+    if isinstance(status_result, tuple) and len(status_result) >= 2:
+        return bool(status_result[1])
+    return False
+
+
+def select_bulk_targets(servers, action: str):
+    """Split active servers into bulk action targets and skipped containers.
+
+    ``restart``/``stop`` only touch running containers, ``start`` only stopped
+    ones. Returns ``(targets, skipped_count)``.
+    """
+    targets = []
+    skipped = 0
+    for server in servers:
+        if not isinstance(server, dict) or not server.get('active', False):
+            continue
+        docker_name = server.get('docker_name')
+        if not docker_name or not isinstance(docker_name, str):
+            continue
+        if _is_running_cached(docker_name) == (action != 'start'):
+            targets.append(server)
+        else:
+            skipped += 1
+    return targets, skipped
+
+
+class BulkProgressReporter:
+    """Streams bulk action progress into one message, throttling edits."""
+
+    def __init__(self, interaction: discord.Interaction, action: str, skipped: int,
+                 min_interval: float = BULK_PROGRESS_EDIT_INTERVAL):
+        self.interaction = interaction
+        self.action = action
+        self.skipped = skipped
+        self.min_interval = min_interval
+        self.view: Optional[View] = None
+        self._last_edit = 0.0
+        self.edits = 0
+
+    def progress_embed(self, progress: BulkActionProgress) -> discord.Embed:
+        title = _bulk_action_texts(self.action)[0]
+        lines = [
+            f"**{progress.done}/{progress.total}** • ✅ {progress.succeeded} • ❌ {progress.failed}",
+        ]
+        if progress.group_count > 1:
+            lines.append(_("Group {current} of {count}").format(current=progress.current_group, count=progress.group_count))
+        if progress.last is not None:
+            icon = "✅" if progress.last.success else "❌"
+            lines.append(f"{icon} {progress.last.container_name}")
+        if progress.cancelled:
+            lines.append(_("Cancelling - running actions are finishing…"))
+        return discord.Embed(title=title, description="\n".join(lines), color=discord.Color.blue())
+
+    def result_embed(self, result: BulkActionResult) -> discord.Embed:
+        _title, done_title, success_line = _bulk_action_texts(self.action)
+        description = success_line.format(count=result.succeeded)
+        if result.failed > 0:
+            description += _("\nFailed: **{count}** containers").format(count=result.failed)
+            failed_names = [o.container_name for o in result.outcomes if o.status in ('failed', 'timeout')]
+            description += "\n" + ", ".join(failed_names[:15]) + (" …" if len(failed_names) > 15 else "")
+        if result.skipped > 0:
+            description += _("\nCancelled or busy: **{count}** containers").format(count=result.skipped)
+        if self.skipped > 0 and self.action == 'start':
+            description += _("\nSkipped (already running): **{count}** containers").format(count=self.skipped)
+        elif self.skipped > 0:
+            description += _("\nSkipped (not running): **{count}** containers").format(count=self.skipped)
+        description += "\n" + _("Duration: {seconds:.1f}s").format(seconds=result.duration_ms / 1000)
+        return discord.Embed(
+            title=done_title,
+            description=description,
+            color=discord.Color.green() if result.failed == 0 and not result.cancelled else discord.Color.orange()
         )
 
-    async def callback(self, interaction: discord.Interaction) -> None:
-        """Execute restart all containers."""
-        # Edge case: Defer immediately
+    async def _edit(self, **kwargs) -> None:
         try:
-            await interaction.response.defer()
-        except discord.errors.NotFound:
-            logger.warning("Restart all confirmation interaction expired")
+            await self.interaction.edit_original_response(**kwargs)
+            self.edits += 1
+        except (discord.errors.NotFound, discord.errors.HTTPException) as e:
+            logger.debug(f"Could not update bulk progress message: {e}")
+
+    async def __call__(self, progress: BulkActionProgress) -> None:
+        if progress.finished:
+            return  # the result embed replaces the progress message
+        now = time.monotonic()
+        if progress.done < progress.total and now - self._last_edit < self.min_interval:
             return
-        except (discord.errors.HTTPException, discord.errors.DiscordException) as e:
-            logger.error(f"Error deferring restart all confirmation: {e}", exc_info=True)
-            return
-
-        # Edge case: Prevent concurrent bulk operations
-        if hasattr(self.cog, '_bulk_operation_in_progress'):
-            if self.cog._bulk_operation_in_progress:
-                await interaction.followup.send(
-                    _("⏳ Another bulk operation is in progress. Please wait."),
-                    ephemeral=True
-                )
-                return
-
-        # Set operation lock
-        self.cog._bulk_operation_in_progress = True
-
-        try:
-            # SERVICE FIRST: Use ServerConfigService to get server configurations
-            server_config_service = get_server_config_service()
-            all_servers = server_config_service.get_all_servers()
-
-            # CRITICAL: Filter to only ACTIVE containers (as shown in Admin Overview)
-            servers = [s for s in all_servers if s.get('active', False)]
-
-            if not servers:
-                await interaction.followup.send(
-                    _("❌ No active servers configured."),
-                    ephemeral=True
-                )
-                return
+        self._last_edit = now
+        await self._edit(content=None, embed=self.progress_embed(progress), view=self.view)
 
-            logger.info(f"Restart All: Processing {len(servers)} active containers (filtered from {len(all_servers)} total)")
+    async def finish(self, result: BulkActionResult) -> None:
+        await self._edit(content=None, embed=self.result_embed(result), view=None)
 
-            restarted_count = 0
-            failed_count = 0
-            skipped_count = 0
 
-            # Import docker service with error handling
-            try:
-                from services.docker_service.docker_action_service import docker_action_service_first
-            except ImportError as e:
-                logger.error(f"Failed to import docker action service: {e}")
-                await interaction.followup.send(
-                    _("❌ Docker service unavailable. Operation cancelled."),
-                    ephemeral=True
-                )
-                return
-
-            # Process containers with rate limiting
-            for server in servers:
-                if not isinstance(server, dict):
-                    continue
-
-                docker_name = server.get('docker_name')
-                if not docker_name or not isinstance(docker_name, str):
-                    continue
-
-                # SERVICE FIRST: Use StatusCacheService to check if container is running
-                # IMPORTANT: Always use docker_name for cache lookups (stable identifier)
-                status_cache_service = get_status_cache_service()
-                cached_entry = status_cache_service.get(docker_name)
-
-                # Extract is_running from cache data (ContainerStatusResult object)
-                is_running = False
-                if cached_entry and cached_entry.get('data'):
-                    status_result = cached_entry['data']
-                    # Modern format: ContainerStatusResult dataclass
-                    from services.docker_status.models import ContainerStatusResult
-                    if isinstance(status_result, ContainerStatusResult):
-                        is_running = status_result.is_running
-                    # Backwards compatibility: old tuple format
-                    elif isinstance(status_result, tuple) and len(status_result) >= 2:
-                        is_running = status_result[1]
-
-                if is_running:
-                                # Restart container with timeout protection
-                                try:
-                                    # Add small delay between operations to avoid overloading
-                                    if restarted_count > 0:
-                                        await asyncio.sleep(0.5)
-
-                                    # Set timeout for docker operation
-                                    success = await asyncio.wait_for(
-                                        docker_action_service_first(docker_name, "restart"),
-                                        timeout=30.0  # 30 second timeout per container
-                                    )
-                                    if success:
-                                        restarted_count += 1
-                                        logger.info(f"Successfully restarted {docker_name}")
-                                    else:
-                                        failed_count += 1
-                                        logger.warning(f"Failed to restart {docker_name}")
-                                except asyncio.TimeoutError:
-                                    logger.error(f"Timeout restarting {docker_name}")
-                                    failed_count += 1
-                                except (RuntimeError, OSError) as e:
-                                    logger.error(f"Error restarting {docker_name}: {e}", exc_info=True)
-                                    failed_count += 1
-                else:
-                    skipped_count += 1
-
-            # Send result message
-            description = _("Successfully restarted: **{count}** containers").format(count=restarted_count)
-            if failed_count > 0:
-                description += _("\nFailed: **{count}** containers").format(count=failed_count)
-            if skipped_count > 0:
-                description += _("\nSkipped (not running): **{count}** containers").format(count=skipped_count)
-
-            embed = discord.Embed(
-                title=_("🔄 Restart All Complete"),
-                description=description,
-                color=discord.Color.green() if failed_count == 0 else discord.Color.orange()
-            )
-            await interaction.followup.send(embed=embed, ephemeral=True)
+class CancelBulkOperationButton(Button):
+    """Cancels a running bulk operation."""
 
-            # Update admin overview after a delay (but don't wait for it)
-            asyncio.create_task(self._delayed_overview_update())
-
-        except (ImportError, KeyError, RuntimeError, asyncio.TimeoutError) as e:
-            logger.error(f"Critical error in restart all: {e}", exc_info=True)
-            try:
-                await interaction.followup.send(
-                    _("❌ An error occurred during the restart operation."),
-                    ephemeral=True
-                )
-            except (discord.errors.NotFound, discord.errors.HTTPException):
-                pass
-        finally:
-            # Always release the lock
-            self.cog._bulk_operation_in_progress = False
+    def __init__(self, operation_id: int):
+        self.operation_id = operation_id
+        super().__init__(
+            style=discord.ButtonStyle.secondary,
+            label=_("Cancel"),
+            custom_id=f"cancel_bulk_operation_{operation_id}"
+        )
 
-    async def _delayed_overview_update(self):
-        """Update admin overview after a delay."""
+    async def callback(self, interaction: discord.Interaction) -> None:
+        get_bulk_action_service().cancel(self.operation_id)
+        self.disabled = True
         try:
-            await asyncio.sleep(5)
-            await self._update_admin_overview()
-        except (asyncio.CancelledError, RuntimeError) as e:
-            logger.error(f"Error updating admin overview after restart: {e}", exc_info=True)
+            await interaction.response.edit_message(view=self.view)
+        except (discord.errors.NotFound, discord.errors.HTTPException) as e:
+            logger.debug(f"Could not acknowledge bulk cancel: {e}")
 
-    async def _update_admin_overview(self):
-        """Update admin overview message after bulk action."""
-        try:
-            # Find and update admin overview messages in channel
-            channel = self.cog.bot.get_channel(self.channel_id)
-            if channel:
-                async for message in channel.history(limit=50):
-                    if message.author == self.cog.bot.user and message.embeds:
-                        embed = message.embeds[0]
-                        if embed.title == "Admin Overview":
-                            # SERVICE FIRST: Recreate admin overview using service
-                            server_config_service = get_server_config_service()
-                            ordered_servers = server_config_service.get_ordered_servers()
-                            config = load_config()  # Still need config for embed creation
-
-                            new_embed, _, has_running = await self.cog._create_admin_overview_embed(ordered_servers, config)
-                            new_view = AdminOverviewView(self.cog, self.channel_id, has_running)
-
-                            await message.edit(embed=new_embed, view=new_view)
-                            break
-        except (discord.errors.DiscordException, ImportError, AttributeError) as e:
-            logger.error(f"Error updating admin overview: {e}", exc_info=True)
 
-class ConfirmStopAllButton(Button):
-    """Button to confirm stop all action."""
+class _ConfirmBulkActionButton(Button):
+    """Base for the confirm buttons: runs the bulk action with live progress."""
 
-    def __init__(self, cog_instance, channel_id: int):
+    action = 'restart'
+
+    def __init__(self, cog_instance, channel_id: int, label: str, custom_id: str):
         self.cog = cog_instance
         self.channel_id = channel_id
-
-        super().__init__(
-            style=discord.ButtonStyle.danger,
-            label=_("Yes, Stop All"),
-            custom_id="confirm_stop_all"
-        )
+        super().__init__(style=discord.ButtonStyle.danger, label=label, custom_id=custom_id)
 
     async def callback(self, interaction: discord.Interaction) -> None:
-        """Execute stop all containers."""
+        """Execute the bulk action for all matching active containers."""
         # Edge case: Defer immediately
         try:
             await interaction.response.defer()
         except discord.errors.NotFound:
-            logger.warning("Stop all confirmation interaction expired")
+            logger.warning(f"{self.action} all confirmation interaction expired")
             return
         except (discord.errors.HTTPException, discord.errors.DiscordException) as e:
-            logger.error(f"Error deferring stop all confirmation: {e}", exc_info=True)
+            logger.error(f"Error deferring {self.action} all confirmation: {e}", exc_info=True)
             return
 
-        # Edge case: Prevent concurrent bulk operations
-        if hasattr(self.cog, '_bulk_operation_in_progress'):
-            if self.cog._bulk_operation_in_progress:
-                await interaction.followup.send(
-                    _("⏳ Another bulk operation is in progress. Please wait."),
-                    ephemeral=True
-                )
-                return
-
-        # Set operation lock
-        self.cog._bulk_operation_in_progress = True
-
         try:
             # SERVICE FIRST: Use ServerConfigService to get server configurations
-            server_config_service = get_server_config_service()
-            all_servers = server_config_service.get_all_servers()
-
-            # CRITICAL: Filter to only ACTIVE containers (as shown in Admin Overview)
-            servers = [s for s in all_servers if s.get('active', False)]
+            all_servers = get_server_config_service().get_all_servers()
+            # CRITICAL: Only ACTIVE containers (as shown in Admin Overview)
+            targets, skipped = select_bulk_targets(all_servers, self.action)
 
-            if not servers:
-                await interaction.followup.send(
-                    _("❌ No active servers configured."),
-                    ephemeral=True
-                )
+            if not any(s.get('active', False) for s in all_servers if isinstance(s, dict)):
+                await interaction.followup.send(_("❌ No active servers configured."), ephemeral=True)
                 return
 
-            logger.info(f"Stop All: Processing {len(servers)} active containers (filtered from {len(all_servers)} total)")
-
-            stopped_count = 0
-            failed_count = 0
-            skipped_count = 0
-
-            # Import docker service with error handling
-            try:
-                from services.docker_service.docker_action_service import docker_action_service_first
-            except ImportError as e:
-                logger.error(f"Failed to import docker action service: {e}")
+            service = get_bulk_action_service()
+            if targets and all(service.is_busy(s['docker_name']) for s in targets):
                 await interaction.followup.send(
-                    _("❌ Docker service unavailable. Operation cancelled."),
+                    _("⏳ Another bulk operation is in progress. Please wait."),
                     ephemeral=True
                 )
                 return
 
-            # Process containers with rate limiting
-            for server in servers:
-                if not isinstance(server, dict):
-                    continue
+            logger.info(f"{self.action.capitalize()} All: {len(targets)} containers, {skipped} skipped "
+                        f"(from {len(all_servers)} configured)")
 
-                docker_name = server.get('docker_name')
-                if not docker_name or not isinstance(docker_name, str):
-                    continue
-
-                # SERVICE FIRST: Use StatusCacheService to check if container is running
-                # IMPORTANT: Always use docker_name for cache lookups (stable identifier)
-                status_cache_service = get_status_cache_service()
-                cached_entry = status_cache_service.get(docker_name)
-
-                # Extract is_running from cache data (ContainerStatusResult object)
-                is_running = False
-                if cached_entry and cached_entry.get('data'):
-                    status_result = cached_entry['data']
-                    # Modern format: ContainerStatusResult dataclass
-                    from services.docker_status.models import ContainerStatusResult
-                    if isinstance(status_result, ContainerStatusResult):
-                        is_running = status_result.is_running
-                    # Backwards compatibility: old tuple format
-                    elif isinstance(status_result, tuple) and len(status_result) >= 2:
-                        is_running = status_result[1]
-
-                if is_running:
-                                # Stop container with timeout protection
-                                try:
-                                    # Add small delay between operations to avoid overloading
-                                    if stopped_count > 0:
-                                        await asyncio.sleep(0.5)
-
-                                    # Set timeout for docker operation
-                                    success = await asyncio.wait_for(
-                                        docker_action_service_first(docker_name, "stop"),
-                                        timeout=30.0  # 30 second timeout per container
-                                    )
-                                    if success:
-                                        stopped_count += 1
-                                        logger.info(f"Successfully stopped {docker_name}")
-                                    else:
-                                        failed_count += 1
-                                        logger.warning(f"Failed to stop {docker_name}")
-                                except asyncio.TimeoutError:
-                                    logger.error(f"Timeout stopping {docker_name}")
-                                    failed_count += 1
-                                except (RuntimeError, OSError) as e:
-                                    logger.error(f"Error stopping {docker_name}: {e}", exc_info=True)
-                                    failed_count += 1
-                else:
-                    skipped_count += 1
-
-            # Send result message
-            description = _("Successfully stopped: **{count}** containers").format(count=stopped_count)
-            if failed_count > 0:
-                description += _("\nFailed: **{count}** containers").format(count=failed_count)
-            if skipped_count > 0:
-                description += _("\nSkipped (not running): **{count}** containers").format(count=skipped_count)
-
-            embed = discord.Embed(
-                title=_("⏹️ Stop All Complete"),
-                description=description,
-                color=discord.Color.green() if failed_count == 0 else discord.Color.orange()
+            request = BulkActionRequest(
+                action=self.action,
+                groups=build_action_groups(targets, self.action),
+                max_parallel=max(1, int(os.environ.get('DDC_BULK_ACTION_PARALLEL', DEFAULT_MAX_PARALLEL))),
+                timeout_per_container=float(os.environ.get('DDC_BULK_ACTION_TIMEOUT', DEFAULT_CONTAINER_TIMEOUT)),
             )
-            await interaction.followup.send(embed=embed, ephemeral=True)
+            reporter = BulkProgressReporter(interaction, self.action, skipped)
+            operation = service.start(request, reporter)
+            reporter.view = View(timeout=None)
+            reporter.view.add_item(CancelBulkOperationButton(operation.operation_id))
+            await reporter(BulkActionProgress(
+                operation_id=operation.operation_id, action=self.action,
+                total=sum(len(g) for g in request.groups), done=0, succeeded=0, failed=0,
+                current_group=1, group_count=len(request.groups)))
+
+            result = await operation.wait()
+            await reporter.finish(result)
 
             # Update admin overview after a delay (but don't wait for it)
             asyncio.create_task(self._delayed_overview_update())
 
-        except (ImportError, KeyError, RuntimeError, asyncio.TimeoutError) as e:
-            logger.error(f"Critical error in stop all: {e}", exc_info=True)
+        except (ImportError, KeyError, RuntimeError, ValueError, asyncio.TimeoutError) as e:
+            logger.error(f"Critical error in {self.action} all: {e}", exc_info=True)
             try:
                 await interaction.followup.send(
-                    _("❌ An error occurred during the stop operation."),
+                    _("❌ An error occurred during the bulk operation."),
                     ephemeral=True
                 )
             except (discord.errors.NotFound, discord.errors.HTTPException):
                 pass
-        finally:
-            # Always release the lock
-            self.cog._bulk_operation_in_progress = False
 
     async def _delayed_overview_update(self):
         """Update admin overview after a delay."""
@@ -743,31 +635,54 @@ class ConfirmStopAllButton(Button):
             await asyncio.sleep(5)
             await self._update_admin_overview()
         except (asyncio.CancelledError, RuntimeError) as e:
-            logger.error(f"Error updating admin overview after stop: {e}", exc_info=True)
+            logger.error(f"Error updating admin overview after {self.action}: {e}", exc_info=True)
 
     async def _update_admin_overview(self):
         """Update admin overview message after bulk action."""
         try:
-            # Find and update admin overview messages in channel
             channel = self.cog.bot.get_channel(self.channel_id)
-            if channel:
-                async for message in channel.history(limit=50):
-                    if message.author == self.cog.bot.user and message.embeds:
-                        embed = message.embeds[0]
-                        if embed.title == "Admin Overview":
-                            # SERVICE FIRST: Recreate admin overview using service
-                            server_config_service = get_server_config_service()
-                            ordered_servers = server_config_service.get_ordered_servers()
-                            config = load_config()  # Still need config for embed creation
-
-                            new_embed, _, has_running = await self.cog._create_admin_overview_embed(ordered_servers, config)
-                            new_view = AdminOverviewView(self.cog, self.channel_id, has_running)
-
-                            await message.edit(embed=new_embed, view=new_view)
-                            break
+            if not channel:
+                return
+            # Recorded id first (one fetch); history scan only if it is gone
+            bot_user = self.cog.bot.user
+            message = await get_message_location_registry().resolve(
+                channel, ADMIN_OVERVIEW,
+                matcher=lambda m: m.author == bot_user and bool(m.embeds) and m.embeds[0].title == "Admin Overview",
+            )
+            if message is None:
+                return
+            self.cog.channel_server_message_ids.setdefault(self.channel_id, {})[ADMIN_OVERVIEW] = message.id
+
+            # SERVICE FIRST: Recreate admin overview using service
+            server_config_service = get_server_config_service()
+            ordered_servers = server_config_service.get_ordered_servers()
+            config = load_config()  # Still need config for embed creation
+
+            new_embed, _, has_running = await self.cog._create_admin_overview_embed(ordered_servers, config)
+            new_view = AdminOverviewView(self.cog, self.channel_id, has_running)
+
+            await message.edit(embed=new_embed, view=new_view)
         except (discord.errors.DiscordException, ImportError, AttributeError) as e:
             logger.error(f"Error updating admin overview: {e}", exc_info=True)
 
+
+class ConfirmRestartAllButton(_ConfirmBulkActionButton):
+    """Button to confirm restart all action."""
+
+    action = 'restart'
+
+    def __init__(self, cog_instance, channel_id: int):
+        super().__init__(cog_instance, channel_id, _("Yes, Restart All"), "confirm_restart_all")
+
+
+class ConfirmStopAllButton(_ConfirmBulkActionButton):
+    """Button to confirm stop all action."""
+
+    action = 'stop'
+
+    def __init__(self, cog_instance, channel_id: int):
+        super().__init__(cog_instance, channel_id, _("Yes, Stop All"), "confirm_stop_all")
+
 class CancelBulkActionButton(Button):
     """Button to cancel bulk action."""
 
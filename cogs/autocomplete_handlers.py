@@ -11,10 +11,9 @@ These functions provide dropdown suggestions for command arguments.
 """
 import logging
 import discord
-import docker
 from datetime import datetime, timezone
 from typing import List
-from functools import lru_cache
+from functools import lru_cache, partial
 import time
 
 # Import app_commands using central utility
@@ -22,93 +21,26 @@ from utils.app_commands_helper import get_app_commands
 app_commands = get_app_commands()
 
 # Import utility functions
-from services.config.config_service import load_config
-from utils.config_cache import get_cached_servers
+from utils.autocomplete_index import AutocompleteIndex, get_autocomplete_index_cache
 from utils.logging_utils import setup_logger
-from services.docker_service.status_cache_runtime import get_docker_status_cache_runtime
 from services.scheduling.scheduler import (
     VALID_CYCLES, VALID_ACTIONS
 )
+from .control_helpers import get_container_name_index
 
 # Configure logger for this module
 logger = setup_logger('ddc.autocomplete_handlers', level=logging.DEBUG)
 
-# --- Custom Cache for schedule_container_select ---
-_schedule_container_cache = None
-_schedule_container_cache_timestamp = 0
-_SCHEDULE_CONTAINER_CACHE_TTL = 60
-
 # --- Container Selection Autocomplete ---
 async def schedule_container_select(
     ctx: discord.AutocompleteContext # Explicitly AutocompleteContext for PyCord
 ):
     """Autocomplete function for container names in schedule command.
     Always returns a simple list of strings to avoid serialization issues.
-    Uses a custom cache to reduce load.
+    Lists every configured container (those are the ones that can be scheduled)
+    from an index that is rebuilt only when the configuration changes.
     """
-    global _schedule_container_cache, _schedule_container_cache_timestamp
-    value_being_typed = ctx.value
-    current_time = time.time()
-
-    # Check cache
-    if _schedule_container_cache is not None and (current_time - _schedule_container_cache_timestamp < _SCHEDULE_CONTAINER_CACHE_TTL):
-        logger.debug(f"schedule_container_select: Using cached data. Input: '{value_being_typed}'")
-        # Filter cached choices based on current input
-        return _filter_choices(value_being_typed, _schedule_container_cache)
-
-    logger.debug(f"schedule_container_select: Cache miss or expired. Refreshing. Input: '{value_being_typed}'")
-
-    servers = get_cached_servers()  # Performance optimization: use cache instead of load_config()
-    choices_to_cache = [] # This list will be cached
-
-    active_docker_data_set = set() # Stores (docker_name, is_running)
-    try:
-        # SERVICE FIRST: Use container status service instead of old docker_utils
-        from services.infrastructure.container_status_service import get_container_list_service_first
-        containers_data = await get_container_list_service_first() # Modern service with caching
-
-        if containers_data:
-            for container_data in containers_data:
-                docker_name = container_data.get('name')
-                if docker_name:
-                    # is_running = container_data.get('running', False) # Status not directly used for choice generation here
-                    active_docker_data_set.add(docker_name) # Store only names for matching
-            logger.debug(f"Found {len(active_docker_data_set)} active container names via Docker API/utils cache")
-        else:
-            logger.debug("No active container names found via Docker API/utils cache")
-
-    except (RuntimeError, docker.errors.APIError, docker.errors.DockerException) as e:
-        logger.error(f"Error accessing Docker API or its cache in schedule_container_select: {e}", exc_info=True)
-        # Fallback to docker_status_cache from cogs.docker_control if direct/util-cached query fails
-        try:
-            runtime = get_docker_status_cache_runtime()
-            logger.debug("Falling back to shared docker status cache runtime for active container names")
-            for docker_name_cached, container_item in runtime.items():
-                if docker_name_cached and container_item and isinstance(container_item, dict) and 'data' in container_item:
-                    active_docker_data_set.add(docker_name_cached)
-        except (RuntimeError, docker.errors.APIError, docker.errors.DockerException) as e:
-            logger.error(f"Error accessing docker status cache runtime: {e}")
-
-    # Populate choices_to_cache from configured servers
-    # We present all configured servers, their actual current status (running/stopped)
-    # from get_containers_data or the fallback cache is primarily for display elsewhere,
-    # not strictly for filtering the list of *schedulable* containers in autocomplete.
-    # The main goal here is to list containers that *can* be scheduled.
-    for server in servers:
-        docker_name = server.get('docker_name')
-        # display_name = server.get('name', docker_name) # Not directly used for filtering value_being_typed against display_name here
-
-        if docker_name:
-            choices_to_cache.append(docker_name)
-            # Optionally, could add display_name if filtering logic were to change to also match display_name:
-            # choices_to_cache.append(display_name) # But ensure _filter_choices handles this or adapt
-
-    # Update cache
-    _schedule_container_cache = sorted(list(set(choices_to_cache))) # Ensure uniqueness and sort
-    _schedule_container_cache_timestamp = current_time
-
-    logger.debug(f"schedule_container_select: Refreshed cache. Returning filtered choices. Input: '{value_being_typed}'")
-    return _filter_choices(value_being_typed, _schedule_container_cache)
+    return get_container_name_index().search(ctx.value)
 
 # --- General Filtering Function ---
 def _filter_choices(value_being_typed: str, choices_list: List[str]) -> List[str]:
@@ -160,6 +92,11 @@ def _get_time_suggestions():
     suggestions.sort()
     return suggestions
 
+@lru_cache(maxsize=1)
+def _get_time_index() -> AutocompleteIndex:
+    """Index over the static time suggestions"""
+    return AutocompleteIndex(_get_time_suggestions())
+
 # --- Time Selection Autocomplete ---
 async def schedule_time_select(
     ctx: discord.AutocompleteContext
@@ -197,42 +134,43 @@ async def schedule_time_select(
                 pass # Fall through to general filtering
 
     # General text filtering if specific filtering not applicable
-    return _filter_choices(value_being_typed, suggestions_24h)
+    return _get_time_index().search(value_being_typed)
 
-# --- Month Selection Autocomplete ---
-async def schedule_month_select(
-    ctx: discord.AutocompleteContext
-):
-    value_being_typed = ctx.value
+# --- Translated Choice Indexes ---
+_MONTH_NAMES = ["January", "February", "March", "April", "May", "June",
+                "July", "August", "September", "October", "November", "December"]
+_WEEKDAY_NAMES = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"]
+_INFO_PERIODS = ["all", "next_week", "next_month", "today", "tomorrow"]
 
-    # Import the translation function
-    from .translation_manager import _
+def _translated_index(name: str, values: List[str], label) -> AutocompleteIndex:
+    """Return the index for ``values`` in the current bot language.
+
+    ``label(value, translate)`` yields the searchable terms of one value. The
+    index is rebuilt only when the configured language changes, so a
+    keystroke costs one language lookup instead of a translation per choice.
+    """
+    from .translation_manager import translation_manager
 
-    # Get the current language from config
-    config = load_config()  # Performance optimization: use cache instead of load_config()
-    current_language = config.get('language', 'en')
+    language = translation_manager.get_current_language()
 
-    # English month names
-    month_names = ["January", "February", "March", "April", "May", "June",
-                 "July", "August", "September", "October", "November", "December"]
+    def _build():
+        translate = partial(translation_manager.translate, lang=language)
+        return [(value, label(value, translate)) for value in values]
 
-    # Build display map with translations if not English
-    month_map_display = {}
-    for i, name in enumerate(month_names):
-        month_num = f"{i+1:02d}"
+    return get_autocomplete_index_cache().get(name, _build, version=language)
 
-        # Get translated month name
-        translated_name = _(name)
+def _month_terms(month_num: str, translate) -> List[str]:
+    name = _MONTH_NAMES[int(month_num) - 1]
+    return [f"{month_num} - {translate(name)}", name]
 
-        # Use translated name if available, otherwise use English
-        display_name = translated_name if translated_name != name else name
-        month_map_display[month_num] = f"{month_num} - {display_name}"
+# --- Month Selection Autocomplete ---
+async def schedule_month_select(
+    ctx: discord.AutocompleteContext
+):
+    value_being_typed = ctx.value
 
-    choices = []
-    for val, name in month_map_display.items():
-        if not value_being_typed or value_being_typed.lower() in name.lower() or value_being_typed == val:
-            # Return value directly instead of app_commands.Choice
-            choices.append(val)
+    month_values = [f"{i:02d}" for i in range(1, 13)]
+    choices = _translated_index('months', month_values, _month_terms).search(value_being_typed)
 
     # Add pure numeric typing support
     if value_being_typed and value_being_typed.isdigit():
@@ -248,27 +186,10 @@ async def schedule_month_select(
 async def schedule_weekday_select(
     ctx: discord.AutocompleteContext
 ):
-    value_being_typed = ctx.value
-
-    # Import the translation function
-    from .translation_manager import _
-
-    # Standard English weekday names
-    weekdays = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"]
-
-    # Get translated choices based on both English and translated matching
-    choices = []
-    for day in weekdays:
-        # Get translated version
-        translated_day = _(day)
-
-        # Add to choices if input matches either English or translated version
-        if (not value_being_typed or
-            value_being_typed.lower() in day.lower() or
-            value_being_typed.lower() in translated_day.lower()):
-            choices.append(day)  # Always use English values for consistency
-
-    return choices[:25]
+    # Match English or translated names; always use English values for consistency
+    index = _translated_index('weekdays', _WEEKDAY_NAMES, lambda day, translate: [translate(day)])
+    matches = set(index.search(ctx.value))
+    return [day for day in _WEEKDAY_NAMES if day in matches]
 
 # --- Day of Month Cache ---
 @lru_cache(maxsize=1)
@@ -315,27 +236,10 @@ async def schedule_day_select(
 async def schedule_info_period_select(
     ctx: discord.AutocompleteContext
 ):
-    value_being_typed = ctx.value
-
-    # Import the translation function
-    from .translation_manager import _
-
-    # Standard period values
-    periods = ["all", "next_week", "next_month", "today", "tomorrow"]
-
-    # Get translated choices based on both English and translated matching
-    choices = []
-    for period in periods:
-        # Get translated version
-        translated_period = _(period)
-
-        # Add to choices if input matches either English or translated version
-        if (not value_being_typed or
-            value_being_typed.lower() in period.lower() or
-            value_being_typed.lower() in translated_period.lower()):
-            choices.append(period)  # Always use English values for consistency
-
-    return choices[:25]
+    # Match English or translated periods; always use English values for consistency
+    index = _translated_index('info_periods', _INFO_PERIODS, lambda period, translate: [translate(period)])
+    matches = set(index.search(ctx.value))
+    return [period for period in _INFO_PERIODS if period in matches]
 
 # --- Year Selection Autocomplete ---
 async def schedule_year_select(
@@ -348,61 +252,45 @@ async def schedule_year_select(
     return _filter_choices(value_being_typed, years_str)
 
 # --- Task ID Selection Autocomplete for Schedule Delete ---
+def _task_terms(task) -> List[str]:
+    return [f"{task.task_id} - {task.container_name} ({task.action}, {task.cycle})"]
+
 async def schedule_task_id_select(
     ctx: discord.AutocompleteContext
 ):
     """Autocomplete function for task IDs in schedule_delete command.
-    Shows active scheduled tasks with format: 'task_id - container (action, cycle)'
+    Matches the task ID or the format 'task_id - container (action, cycle)'
+    against active tasks, indexed once per task store version.
     """
     value_being_typed = ctx.value
 
     try:
-        from services.scheduling.scheduler import load_tasks, CYCLE_ONCE
-        import time
+        from services.scheduling.scheduler import refresh_task_store, CYCLE_ONCE
 
-        # Load all tasks
-        all_tasks = load_tasks()
-        if not all_tasks:
-            return []
+        # Reloads tasks.json only if it changed on disk
+        store = refresh_task_store()
+        index = get_autocomplete_index_cache().get(
+            'task_ids',
+            lambda: [(task.task_id, _task_terms(task)) for task in store.tasks() if task.is_active],
+            source=store, version=store.version,
+        )
 
-        # Filter to only active tasks
         current_time = time.time()
-        active_tasks = []
-
-        for task in all_tasks:
-            # Skip inactive tasks
-            if not task.is_active:
-                continue
 
-            # Skip expired one-time tasks
+        def _is_pending(task_id: str) -> bool:
+            # Skip expired one-time tasks (time-dependent, so checked per query)
+            task = store.get(task_id)
+            if task is None or not task.is_active:
+                return False
             if task.cycle == CYCLE_ONCE:
                 if task.next_run_ts is None or task.next_run_ts < current_time:
-                    continue
+                    return False
                 if getattr(task, 'status', None) == "completed":
-                    continue
-
-            active_tasks.append(task)
-
-        # Create choices in format: task_id - container (action, cycle)
-        choices = []
-        for task in active_tasks[:25]:  # Discord limit
-            try:
-                # Create display format
-                display_name = f"{task.task_id} - {task.container_name} ({task.action}, {task.cycle})"
-
-                # For autocomplete, we return the task_id as value but show the descriptive format
-                # Check if user input matches task_id or any part of the display
-                if (not value_being_typed or
-                    value_being_typed.lower() in task.task_id.lower() or
-                    value_being_typed.lower() in display_name.lower()):
-                    choices.append(task.task_id)
-
-            except (RuntimeError) as e:
-                logger.debug(f"Error formatting task {task.task_id}: {e}")
-                continue
+                    return False
+            return True
 
-        return choices[:25]
+        return index.search(value_being_typed, predicate=_is_pending)
 
-    except (RuntimeError) as e:
+    except (RuntimeError, AttributeError, TypeError) as e:
         logger.error(f"Error in schedule_task_id_select: {e}", exc_info=True)
         return []
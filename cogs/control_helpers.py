@@ -8,11 +8,12 @@
 
 import discord
 from typing import List, Union
-from services.config.config_service import load_config
+from services.config.config_service import load_config_snapshot
 from .translation_manager import _ # Import the translation function
 from utils.time_utils import format_datetime_with_timezone, get_datetime_imports # Import time helper
 from utils.logging_utils import get_module_logger
 from utils.config_cache import get_cached_guild_id, get_cached_servers
+from utils.autocomplete_index import AutocompleteIndex, get_autocomplete_index_cache
 
 # Central datetime imports
 datetime, timedelta, timezone, time = get_datetime_imports()
@@ -34,68 +35,64 @@ def get_guild_id() -> Union[List[int], None]:
     logger.warning("No valid guild_id found in config. Commands will be registered globally.")
     return None
 
+def get_container_name_index() -> AutocompleteIndex:
+    """Returns the autocomplete index of configured container names.
+
+    The index is rebuilt only when the cached server list is replaced, i.e.
+    after a configuration reload.
+    """
+    servers = get_cached_servers()
+    return get_autocomplete_index_cache().get(
+        'container_names',
+        lambda: sorted({server.get('docker_name') for server in servers if server.get('docker_name')}),
+        source=servers,
+    )
+
 # Updated function for Discord Autocomplete
 async def container_select(original_ctx, original_current):
     """ Returns a list of configured Docker containers for autocomplete.
     This function handles both discord.py and PyCord style autocomplete contexts.
     Always returns a simple list of strings to avoid serialization issues.
     """
-    logger.info(f"[container_select] ENTER. original_ctx type: {type(original_ctx)}, original_current type: {type(original_current)}")
+    logger.debug(f"[container_select] ENTER. original_ctx type: {type(original_ctx)}, original_current type: {type(original_current)}")
 
     search_text = ""
     # Based on logs: original_ctx is None, original_current is AutocompleteContext for schedule commands.
     if hasattr(original_current, 'value') and not isinstance(original_current, str):
-        logger.info(f"  Treating original_current as AutocompleteContext. Accessing original_current.value.")
+        logger.debug(f"  Treating original_current as AutocompleteContext. Accessing original_current.value.")
         try:
             search_text = original_current.value or ""
-            logger.info(f"  Search text from original_current.value: '{search_text}'")
+            logger.debug(f"  Search text from original_current.value: '{search_text}'")
         except (RuntimeError) as e:
             logger.error(f"  Error accessing original_current.value: {e}. Defaulting search_text.", exc_info=True)
             search_text = ""
     elif hasattr(original_ctx, 'value') and not isinstance(original_ctx, str):
         # Fallback if original_ctx is an AutocompleteContext (e.g. PyCord standard)
-        logger.info(f"  Treating original_ctx as AutocompleteContext. Accessing original_ctx.value.")
+        logger.debug(f"  Treating original_ctx as AutocompleteContext. Accessing original_ctx.value.")
         try:
             search_text = original_ctx.value or ""
-            logger.info(f"  Search text from original_ctx.value: '{search_text}'")
+            logger.debug(f"  Search text from original_ctx.value: '{search_text}'")
         except (RuntimeError, discord.Forbidden, discord.HTTPException, discord.NotFound) as e:
             logger.error(f"  Error accessing original_ctx.value: {e}. Defaulting search_text.", exc_info=True)
             search_text = ""
     elif isinstance(original_current, str):
         # Standard discord.py: original_current is the string value, original_ctx is Interaction
-        logger.info(f"  Treating original_current as string value: '{original_current}'")
+        logger.debug(f"  Treating original_current as string value: '{original_current}'")
         search_text = original_current
     else:
         logger.warning(f"  Could not reliably determine search_text. Defaulting to empty. original_ctx type: {type(original_ctx)}, original_current type: {type(original_current)}")
         search_text = ""
 
-    logger.info(f"[container_select] Determined search_text: '{search_text}'")
-
-    servers = get_cached_servers()  # Performance optimization: use cache instead of load_config()
-    if not servers:
-        logger.warning("[container_select] No servers found in configuration (or servers list is empty). Returning empty list.")
-        # return [] # If servers is empty, initial_container_names will be empty naturally
-
-    initial_container_names = [server.get('docker_name') for server in servers if server.get('docker_name')]
-    logger.info(f"[container_select] Initial unfiltered container names from config: {initial_container_names}")
-
-    container_names_to_return = []
-    if not search_text:
-        logger.debug("[container_select] No search_text, will return all initial_container_names.")
-        container_names_to_return = initial_container_names
-    else:
-        search_text_lower = search_text.lower()
-        logger.debug(f"[container_select] Filtering with search_text_lower: '{search_text_lower}'")
-        container_names_to_return = [name for name in initial_container_names if search_text_lower in name.lower()]
-        logger.info(f"[container_select] Filtered container names: {container_names_to_return}")
+    logger.debug(f"[container_select] Determined search_text: '{search_text}'")
 
-    logger.info(f"[container_select] EXIT. Returning {len(container_names_to_return)} items: {container_names_to_return[:25]}")
-    return container_names_to_return[:25]
+    container_names_to_return = get_container_name_index().search(search_text)
+    logger.debug(f"[container_select] EXIT. Returning {len(container_names_to_return)} items: {container_names_to_return}")
+    return container_names_to_return
 
 def _channel_has_permission(channel_id: int, permission_key: str, config: dict = None) -> bool:
     """Checks if a channel has a specific permission."""
     if config is None:
-        config = load_config()  # Performance optimization: use cache if no config provided
+        config = load_config_snapshot()
 
     channel_permissions = config.get('channel_permissions', {})
     channel_config = channel_permissions.get(str(channel_id))
@@ -111,7 +108,7 @@ def _channel_has_permission(channel_id: int, permission_key: str, config: dict =
 def _get_pending_embed(display_name: str) -> discord.Embed:
     """Generates a standardized embed for the pending status in the box design."""
     # --- Start: Adjusted box formatting for Pending --- #
-    config = load_config()  # Performance optimization: use cache instead of load_config()
+    config = load_config_snapshot()
     language = config.get('language', 'de') # Needed for translation context
     status_text = _("Pending...") # Use translated text
     current_emoji = "⏳"
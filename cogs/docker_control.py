@@ -25,12 +25,13 @@ DiscordOption = get_discord_option()
 from services.discord.channel_cleanup_service import get_channel_cleanup_service
 
 # Import our utility functions
-from services.config.config_service import load_config
+from services.config.config_service import load_config, load_config_snapshot
 from services.config.server_config_service import get_server_config_service
 # SERVICE FIRST: docker_action moved to docker_action_service.py
 
 from utils.time_utils import format_datetime_with_timezone
 from utils.logging_utils import setup_logger
+from utils.observability import timed
 from services.docker_service.server_order import load_server_order, save_server_order
 from services.docker_service.status_cache_runtime import get_docker_status_cache_runtime
 
@@ -137,6 +138,13 @@ class DockerControlCog(commands.Cog, StatusHandlersMixin):
                     self.channel_server_message_ids[cid] = restored
             except (ValueError, TypeError):
                 logger.warning(f"Invalid persisted overview id entry for channel {cid_str}")
+        # Message location registry: recorded at send time, preferred over the mech state copy
+        from services.discord.message_location_registry import (
+            ADMIN_OVERVIEW, OVERVIEW, get_message_location_registry)
+        self.message_locations = get_message_location_registry()
+        for purpose in (OVERVIEW, ADMIN_OVERVIEW):
+            for location in self.message_locations.locations(purpose):
+                self.channel_server_message_ids.setdefault(location.channel_id, {})[purpose] = location.message_id
         if self.channel_server_message_ids:
             logger.info(f"Restored persisted overview message ids for {len(self.channel_server_message_ids)} channel(s)")
         self.last_message_update_time: Dict[int, Dict[str, datetime]] = {}
@@ -405,9 +413,9 @@ class DockerControlCog(commands.Cog, StatusHandlersMixin):
             try:
                 await self.bot.wait_until_ready()
 
-                # Force reload config
+                # The config cache is validated against every channel/container file
                 from services.config.config_service import get_config_service
-                config = get_config_service().get_config(force_reload=True)
+                config = get_config_service().get_config()
                 new_channel_permissions = config.get('channel_permissions', {})
 
                 new_channel_ids = {int(cid) for cid in new_channel_permissions if cid.isdigit()}
@@ -663,7 +671,7 @@ class DockerControlCog(commands.Cog, StatusHandlersMixin):
     @tasks.loop(minutes=1, reconnect=True)
     async def periodic_message_edit_loop(self):
         """Periodically checks and edits messages in channels that require updates."""
-        config = load_config()
+        config = load_config_snapshot()
         if not config:
             logger.error("Periodic Edit Loop: Could not load configuration. Skipping cycle.")
             return
@@ -1118,6 +1126,11 @@ class DockerControlCog(commands.Cog, StatusHandlersMixin):
     @commands.Cog.listener()
     async def on_message(self, message: discord.Message):
         """Listens to messages to update channel activity for inactivity tracking."""
+        if self.bot.user is not None and message.author.id == self.bot.user.id:
+            # Own message: record it so channel cleanup can delete it by id later
+            if message.guild:
+                self.cleanup_service.record_sent_message(message)
+            return
         if message.author.bot:  # Ignore bot messages for triggering activity
             return
         if not message.guild:  # Ignore DMs
@@ -1140,6 +1153,15 @@ class DockerControlCog(commands.Cog, StatusHandlersMixin):
                 logger.debug(f"[on_message] Updating last_channel_activity for channel {channel_id} to {now_utc} due to user message.")
                 self.last_channel_activity[channel_id] = now_utc
 
+    @commands.Cog.listener()
+    async def on_raw_message_delete(self, payload: discord.RawMessageDeleteEvent):
+        """Keeps the sent message index free of messages deleted elsewhere."""
+        self.cleanup_service.forget_messages(payload.channel_id, [payload.message_id])
+
+    @commands.Cog.listener()
+    async def on_raw_bulk_message_delete(self, payload: discord.RawBulkMessageDeleteEvent):
+        self.cleanup_service.forget_messages(payload.channel_id, payload.message_ids)
+
     # --- STATUS HANDLERS MOVED TO status_handlers.py ---
     # All status-related functionality has been moved to the StatusHandlersMixin class in status_handlers.py
     # This includes the following methods:
@@ -1369,9 +1391,9 @@ class DockerControlCog(commands.Cog, StatusHandlersMixin):
 
             logger.info("Proceeding with initial status send")
 
-            # Force reload to ensure we get fresh config (not stale cache from bootstrap)
+            # Cached config is only reused while no config file changed since bootstrap
             from services.config.config_service import get_config_service
-            current_config = get_config_service().get_config(force_reload=True)
+            current_config = get_config_service().get_config()
             if not current_config:
                 logger.error("Could not load configuration for initial status send.")
                 return
@@ -1563,7 +1585,8 @@ class DockerControlCog(commands.Cog, StatusHandlersMixin):
         return lock
 
     def _persist_tracked_message_ids(self) -> None:
-        """Persist overview/admin_overview message ids to mech_state.json (best-effort).
+        """Persist overview/admin_overview message ids to mech_state.json and the
+        message location registry (best-effort).
 
         Only the single managed overview id per channel is stored; per-server/per-docker
         ids are intentionally excluded. This enables _delete_tracked_overview_messages to
@@ -1579,6 +1602,13 @@ class DockerControlCog(commands.Cog, StatusHandlersMixin):
                 if kept:
                     snapshot[str(cid)] = kept
             self.mech_state_manager.set_state("channel_overview_message_ids", snapshot)
+            registry = getattr(self, 'message_locations', None)
+            if registry is not None:
+                guild_ids = {}
+                for cid in self.channel_server_message_ids:
+                    guild = getattr(self.bot.get_channel(cid), 'guild', None)
+                    guild_ids[cid] = getattr(guild, 'id', None)
+                registry.sync(('overview', 'admin_overview'), self.channel_server_message_ids, guild_ids)
         except (OSError, RuntimeError, TypeError, ValueError) as e:
             logger.warning(f"Could not persist overview message ids: {e}")
 
@@ -2335,6 +2365,7 @@ class DockerControlCog(commands.Cog, StatusHandlersMixin):
     # NOTE: Old _create_overview_embed method was removed
     # Use _create_overview_embed_expanded or _create_overview_embed_collapsed instead
 
+    @timed("overview.render.expanded")
     async def _create_overview_embed_expanded(self, ordered_servers, config, force_refresh=False):
         """Creates the server overview embed with EXPANDED mech status details.
 
@@ -2360,7 +2391,7 @@ class DockerControlCog(commands.Cog, StatusHandlersMixin):
 
         # Build server status lines (same logic as original)
         now_utc = datetime.now(timezone.utc)
-        fresh_config = load_config()
+        fresh_config = load_config_snapshot()
         timezone_str = fresh_config.get('timezone') if fresh_config else config.get('timezone')
 
         current_time = format_datetime_with_timezone(now_utc, timezone_str, time_only=True)
@@ -2703,6 +2734,7 @@ class DockerControlCog(commands.Cog, StatusHandlersMixin):
         # Return tuple (embed, animation_file) - single file for expanded view
         return embed, animation_file
 
+    @timed("overview.render.admin")
     async def _create_admin_overview_embed(self, ordered_servers, config, force_refresh=False):
         """Creates the admin overview embed with CPU and RAM details for control channels.
 
@@ -2723,7 +2755,7 @@ class DockerControlCog(commands.Cog, StatusHandlersMixin):
 
         # Get current time in local timezone
         now_utc = datetime.now(timezone.utc)
-        fresh_config = load_config()
+        fresh_config = load_config_snapshot()
         timezone_str = fresh_config.get('timezone') if fresh_config else config.get('timezone')
         current_time = format_datetime_with_timezone(now_utc, timezone_str, time_only=True)
 
@@ -2896,6 +2928,7 @@ class DockerControlCog(commands.Cog, StatusHandlersMixin):
 
         return embed, None, has_running_containers
 
+    @timed("overview.render.collapsed")
     async def _create_overview_embed_collapsed(self, ordered_servers, config, force_refresh=False):
         """Creates the server overview embed with COLLAPSED mech status (animation only).
 
@@ -2924,7 +2957,7 @@ class DockerControlCog(commands.Cog, StatusHandlersMixin):
 
         # Build server status lines (same logic as original)
         now_utc = datetime.now(timezone.utc)
-        fresh_config = load_config()
+        fresh_config = load_config_snapshot()
         timezone_str = fresh_config.get('timezone') if fresh_config else config.get('timezone')
 
         current_time = format_datetime_with_timezone(now_utc, timezone_str, time_only=True)
@@ -3593,15 +3626,16 @@ class DockerControlCog(commands.Cog, StatusHandlersMixin):
         await self.bot.wait_until_ready()
 
     # --- Mech Status Cache Startup ---
-    @tasks.loop(count=1)  # Only run once to start the background loop
+    @tasks.loop(count=1)  # One-shot warmup; the cache is invalidated by events afterwards
     async def start_mech_cache_loop(self):
-        """Start the MechStatusCacheService background loop."""
+        """Compute the initial MechStatusCacheService state off the event loop."""
         try:
-            logger.info("Starting MechStatusCacheService background loop...")
-            await self.mech_status_cache_service.start_background_loop()
-            logger.info("MechStatusCacheService background loop started successfully")
-        except (discord.errors.DiscordException, RuntimeError, ValueError, OSError) as e:
-            logger.error(f"Failed to start MechStatusCacheService background loop: {e}", exc_info=True)
+            from services.mech.mech_status_cache_service import MechStatusCacheRequest
+            logger.info("Warming MechStatusCacheService...")
+            await asyncio.to_thread(self.mech_status_cache_service.get_cached_status, MechStatusCacheRequest())
+            logger.info("MechStatusCacheService warmed")
+        except (ImportError, RuntimeError, ValueError, OSError) as e:
+            logger.error(f"Failed to warm MechStatusCacheService: {e}", exc_info=True)
 
     @start_mech_cache_loop.before_loop
     async def before_start_mech_cache_loop(self):
@@ -3980,6 +4014,13 @@ class DockerControlCog(commands.Cog, StatusHandlersMixin):
         if hasattr(self, 'performance_cache_clear_loop') and self.performance_cache_clear_loop.is_running(): self.performance_cache_clear_loop.cancel()
         logger.info("All direct Cog loops cancellation attempted.")
 
+        # Write pending sent message index changes (also flushed at interpreter exit)
+        if hasattr(self, 'cleanup_service'):
+            try:
+                self.cleanup_service.message_index.flush()
+            except (RuntimeError, OSError) as e:
+                logger.error(f"Error flushing sent message index on unload: {e}", exc_info=True)
+
         # PERFORMANCE OPTIMIZATION: Clear all caches on unload
         try:
             from .control_ui import _clear_caches
@@ -5064,7 +5105,7 @@ def setup(bot):
     check_donation_notifications.start()
     cog.donation_notification_task = check_donation_notifications
 
-    # Start the Mech Status Cache background loop
+    # Warm the Mech Status Cache (event-invalidated, no refresh loop)
     cog.start_mech_cache_loop.start()
     logger.info("Mech Status Cache startup task initiated")
 
@@ -0,0 +1,64 @@
+# -*- coding: utf-8 -*-
+# ============================================================================ #
+# DockerDiscordControl (DDC) - Member Count Monitor Cog                       #
+# ============================================================================ #
+"""
+Keeps the status-channel membership index current from gateway events.
+
+The unique member count (mech difficulty) reads this index instead of walking
+every status channel's member list. Joins, leaves, role changes and permission
+overwrite changes update it incrementally; the index rebuilds itself
+periodically to reconcile missed events.
+"""
+
+import logging
+import discord
+from discord.ext import commands
+
+from services.member_count import get_member_count_service
+
+logger = logging.getLogger('ddc.cogs.member_count_monitor')
+
+
+class MemberCountMonitor(commands.Cog):
+    """Feeds member and channel permission events into the membership index."""
+
+    def __init__(self, bot):
+        self.bot = bot
+        self.index = get_member_count_service().membership_index
+        logger.info("MemberCountMonitor Cog initialized")
+
+    @commands.Cog.listener()
+    async def on_member_join(self, member: discord.Member):
+        self.index.update_member(member.guild, member)
+
+    @commands.Cog.listener()
+    async def on_member_remove(self, member: discord.Member):
+        self.index.remove_member(member.guild.id, member.id)
+
+    @commands.Cog.listener()
+    async def on_member_update(self, before: discord.Member, after: discord.Member):
+        if before.roles != after.roles:
+            self.index.update_member(after.guild, after)
+
+    @commands.Cog.listener()
+    async def on_guild_channel_update(self, before, after):
+        if getattr(before, 'overwrites', None) != getattr(after, 'overwrites', None):
+            self.index.refresh_channel(after.guild.id, after)
+
+    @commands.Cog.listener()
+    async def on_guild_role_update(self, before: discord.Role, after: discord.Role):
+        if before.permissions != after.permissions:
+            self.index.refresh_guild(after.guild)
+
+    @commands.Cog.listener()
+    async def on_guild_role_delete(self, role: discord.Role):
+        self.index.refresh_guild(role.guild)
+
+    @commands.Cog.listener()
+    async def on_guild_remove(self, guild: discord.Guild):
+        self.index.forget_guild(guild.id)
+
+
+def setup(bot):
+    bot.add_cog(MemberCountMonitor(bot))
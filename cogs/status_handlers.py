@@ -18,6 +18,7 @@ import discord
 
 # Import necessary utilities
 from utils.logging_utils import get_module_logger
+from utils.observability import metrics
 from services.infrastructure.container_status_service import get_docker_info_dict_service_first, get_docker_stats_service_first
 from utils.time_utils import format_datetime_with_timezone
 from services.config.server_config_service import get_server_config_service
@@ -296,9 +297,11 @@ class StatusHandlersMixin:
                 TOKEN_PROTOCOLS)
             svc = get_game_query_service()
 
-            targets = []
+            candidates = []
             for docker_name, result in status_results.items():
                 if not (isinstance(result, ContainerStatusResult) and result.success and result.is_running):
+                    # Stopped/restarting: its resolved target and winning port may change
+                    svc.forget_container(docker_name, keep_cache=True)
                     continue
                 cfg = servers_by_docker_name.get(docker_name) or {}
                 if not cfg.get('query_enabled'):
@@ -316,8 +319,15 @@ class StatusHandlersMixin:
                             proto = detected
                     except (ImportError, RuntimeError, AttributeError):
                         pass
-                host, ports = await svc.resolve_query_candidates(
-                    docker_name, cfg.get('query_host', ''), cfg.get('query_port', 0), proto)
+                candidates.append((docker_name, cfg, proto))
+
+            # Resolve all targets concurrently (memoized per container, so usually no Docker call)
+            resolved = await asyncio.gather(*(
+                svc.resolve_query_candidates(name, cfg.get('query_host', ''), cfg.get('query_port', 0), proto)
+                for name, cfg, proto in candidates))
+
+            targets = []
+            for (docker_name, cfg, proto), (host, ports) in zip(candidates, resolved):
                 if not host or not ports:
                     continue
                 targets.append(GameQueryRequest(
@@ -818,7 +828,7 @@ class StatusHandlersMixin:
                 if allow_toggle and running and details_allowed:
                     view = ControlView(
                         self, server_conf, is_running=running,
-                        channel_has_control_permission=_channel_has_permission(channel_id, server_conf)
+                        channel_has_control_permission=_channel_has_permission(channel_id, 'control', current_config)
                     )
                 else:
                     view = None
@@ -1213,11 +1223,14 @@ class StatusHandlersMixin:
 
             # PERFORMANCE FIX: Add timeout to prevent slow Discord API calls from blocking the system
             try:
+                edit_start = time.time()
                 await asyncio.wait_for(
                     message_to_edit.edit(embed=embed, view=view if view and view.children else None),
                     timeout=5.0  # 5 second timeout for Discord API calls
                 )
+                metrics.histogram("discord.message_edit.duration_ms", (time.time() - edit_start) * 1000)
             except asyncio.TimeoutError:
+                metrics.increment("discord.message_edit.timeouts")
                 elapsed_time = (time.time() - start_time) * 1000
                 logger.error(f"_edit_single_message: TIMEOUT for '{display_name}' after 5000ms (total time: {elapsed_time:.1f}ms)")
                 # For timeout cases, still update the cache to prevent immediate retry
@@ -27,6 +27,7 @@ from .translation_manager import _
 import asyncio
 import aiohttp
 from services.automation import get_auto_action_config_service
+from services.web.container_log_service import ContainerLogCursor
 
 logger = get_module_logger('status_info_integration')
 
@@ -255,6 +256,11 @@ class LiveLogView(discord.ui.View):
         self.cog_instance = None  # Will be set when needed
         self.recreation_task = None  # Task for auto-recreation
 
+        # Per-viewer cursor: refreshes only pull lines newer than the last one shown
+        tail_lines = int(os.getenv('DDC_LIVE_LOGS_TAIL_LINES', '50'))
+        self.log_cursor = ContainerLogCursor(container_name, tail_lines)
+        self.last_poll_new_lines = 0
+
         # Create all buttons in the correct order
         self._create_all_buttons()
 
@@ -331,6 +337,7 @@ class LiveLogView(discord.ui.View):
             new_view = LiveLogView(self.container_name, self.auto_refresh_enabled)
             new_view.refresh_count = self.refresh_count
             new_view.cog_instance = self.cog_instance
+            new_view.log_cursor = self.log_cursor
 
             # Determine embed based on current state
             if self.auto_refresh_enabled and self.auto_refresh_task and not self.auto_refresh_task.done():
@@ -399,6 +406,11 @@ class LiveLogView(discord.ui.View):
 
                 # Get updated logs
                 logs = await self._get_container_logs()
+                remaining = self.max_refreshes - self.refresh_count
+
+                # Nothing new since the last edit - skip the Discord round-trip
+                if self.last_poll_new_lines == 0 and remaining > 0:
+                    continue
 
                 if logs and self.message_ref:
                     # Update embed
@@ -409,8 +421,6 @@ class LiveLogView(discord.ui.View):
                         timestamp=datetime.now(timezone.utc)
                     )
 
-                    remaining = self.max_refreshes - self.refresh_count
-
                     if remaining > 0:
                         embed.set_footer(text=f"🔄 Auto-refreshing every {self.refresh_interval}s • {remaining} updates remaining")
                     else:
@@ -606,7 +616,7 @@ class LiveLogView(discord.ui.View):
             logger.error(f"Error in on_timeout: {e}", exc_info=True)
 
     async def _get_container_logs(self) -> str:
-        """Get the last 50 log lines for the container."""
+        """Get the container's log window, fetching only lines newer than this view's cursor."""
         try:
             import docker
             import asyncio
@@ -621,14 +631,14 @@ class LiveLogView(discord.ui.View):
                 client = docker.from_env()
                 try:
                     container = client.containers.get(self.container_name)
-                    tail_lines = int(os.getenv('DDC_LIVE_LOGS_TAIL_LINES', '50'))
-                    logs_bytes = container.logs(tail=tail_lines, timestamps=True)
-                    return logs_bytes.decode('utf-8', errors='replace')
+                    return self.log_cursor.poll(container)
                 finally:
                     client.close()
 
             # Run synchronous operation in thread pool to avoid blocking
-            logs = await asyncio.get_event_loop().run_in_executor(None, get_logs_sync)
+            new_lines = await asyncio.get_event_loop().run_in_executor(None, get_logs_sync)
+            self.last_poll_new_lines = len(new_lines)
+            logs = self.log_cursor.render()
 
             # Limit log output to prevent Discord message limits
             if len(logs) > 1800:  # Leave room for embed formatting
@@ -713,13 +723,16 @@ class DebugLogsButton(discord.ui.Button):
             # Check if auto-start is enabled via environment variable
             auto_start_enabled = os.getenv('DDC_LIVE_LOGS_AUTO_START', 'false').lower() in ['true', '1', 'on', 'yes']
 
-            # Get initial logs
-            log_lines = await self._get_container_logs()
+            # Get initial logs; the view continues from this cursor
+            tail_lines = int(os.getenv('DDC_LIVE_LOGS_TAIL_LINES', '50'))
+            log_cursor = ContainerLogCursor(self.container_name, tail_lines)
+            log_lines = await self._get_container_logs(log_cursor)
 
             if log_lines:
                 # Create live log view - auto-refresh based on setting
                 view = LiveLogView(self.container_name, auto_refresh=auto_start_enabled)
                 view.cog_instance = self.cog  # Set cog reference for recreation
+                view.log_cursor = log_cursor
 
                 # Create debug embed with appropriate title and color
                 if auto_start_enabled:
@@ -774,8 +787,8 @@ class DebugLogsButton(discord.ui.Button):
             except:
                 pass
 
-    async def _get_container_logs(self) -> str:
-        """Get the last 50 log lines for the container."""
+    async def _get_container_logs(self, log_cursor: ContainerLogCursor) -> str:
+        """Get the container's initial log window through ``log_cursor``."""
         try:
             import docker
             import asyncio
@@ -790,14 +803,13 @@ class DebugLogsButton(discord.ui.Button):
                 client = docker.from_env()
                 try:
                     container = client.containers.get(self.container_name)
-                    tail_lines = int(os.getenv('DDC_LIVE_LOGS_TAIL_LINES', '50'))
-                    logs_bytes = container.logs(tail=tail_lines, timestamps=True)
-                    return logs_bytes.decode('utf-8', errors='replace')
+                    return log_cursor.poll(container)
                 finally:
                     client.close()
 
             # Run synchronous operation in thread pool to avoid blocking
-            logs = await asyncio.get_event_loop().run_in_executor(None, get_logs_sync)
+            await asyncio.get_event_loop().run_in_executor(None, get_logs_sync)
+            logs = log_cursor.render()
 
             # Limit log output to prevent Discord message limits
             if len(logs) > 1800:  # Leave room for embed formatting
@@ -9,7 +9,7 @@ import json
 import os
 import threading
 from pathlib import Path
-from services.config.config_service import load_config
+from services.config.config_service import load_config_snapshot
 import logging
 from utils.logging_utils import setup_logger
 
@@ -20,9 +20,15 @@ _LOCALES_DIR = Path(__file__).resolve().parent.parent / 'locales'
 
 
 class TranslationManager:
-    """Singleton class for translations loaded from JSON files."""
+    """Singleton class for translations loaded from JSON files.
+
+    Only the available language codes are discovered at startup and English
+    (the fallback target) is parsed eagerly; other locales are read from disk
+    the first time they are used.
+    """
     _instance = None
     _translations = None
+    _available_codes = None
     _current_language = None
     _lock = threading.Lock()
 
@@ -32,47 +38,67 @@ class TranslationManager:
             cls._instance._load_translations()
         return cls._instance
 
-    def _load_translations(self):
-        """Load translations from JSON files in locales/ directory."""
-        self._translations = {}
-        locales_dir = _LOCALES_DIR
-
-        if not locales_dir.exists():
-            logger.warning(f"Locales directory not found: {locales_dir}")
+    def _discover_available_locales(self):
+        """Scan the locales directory for available language codes (no parsing)."""
+        self._available_codes = set()
+        if not _LOCALES_DIR.exists():
+            logger.warning(f"Locales directory not found: {_LOCALES_DIR}")
             return
-
-        for json_file in sorted(locales_dir.glob('*.json')):
+        for json_file in _LOCALES_DIR.glob('*.json'):
             if json_file.stem.startswith(('_', 'meta')):
                 continue
-            lang_code = json_file.stem
+            self._available_codes.add(json_file.stem)
+
+    def _ensure_loaded(self, lang_code):
+        """Load a single language file on demand. Returns True if loaded or already present."""
+        if lang_code in self._translations:
+            return True
+        if lang_code not in self._available_codes:
+            return False
+        with self._lock:
+            if lang_code in self._translations:  # double-checked
+                return True
             try:
-                with open(json_file, 'r', encoding='utf-8') as f:
+                with open(_LOCALES_DIR / f"{lang_code}.json", 'r', encoding='utf-8') as f:
                     self._translations[lang_code] = json.load(f)
                 logger.debug(f"Loaded {len(self._translations[lang_code])} translations for '{lang_code}'")
+                return True
             except (json.JSONDecodeError, OSError) as e:
                 logger.error(f"Failed to load translations for '{lang_code}': {e}")
+                return False
 
-        logger.info(f"Translations loaded: {sorted(self._translations.keys())} ({len(self._translations)} languages)")
+    def _load_translations(self, languages=('en',)):
+        """Discover locales in locales/ and load the given languages."""
+        self._translations = {}
+        self._discover_available_locales()
+        for lang_code in languages:
+            self._ensure_loaded(lang_code)
+        logger.info(f"Translations: {len(self._available_codes)} languages available, "
+                    f"loaded {sorted(self._translations.keys())}")
 
     def reload_translations(self):
-        """Reload all translation files from disk (hot-reload)."""
+        """Reload translation files from disk (hot-reload).
+
+        Languages that were in use are re-read; the rest stay lazy.
+        """
         with self._lock:
-            self._load_translations()
-            logger.info(f"Translations reloaded: {sorted(self._translations.keys())}")
+            previously_loaded = set(self._translations) | {'en'}
+        self._load_translations(sorted(previously_loaded))
+        logger.info(f"Translations reloaded: {sorted(self._translations.keys())}")
 
     def get_available_languages(self):
         """Return list of available language codes."""
-        return sorted(self._translations.keys())
+        return sorted(self._available_codes)
 
     def get_current_language(self):
         """Returns the current bot language from configuration."""
         try:
-            config = load_config()
+            config = load_config_snapshot()
         except Exception:
             return 'en'
 
         lang = config.get('language', 'en')
-        if lang not in self._translations:
+        if not self._ensure_loaded(lang):
             lang = 'en'
         self._current_language = lang
         return lang
@@ -88,7 +114,7 @@ class TranslationManager:
             lang = self.get_current_language()
 
         # Try requested language
-        if lang in self._translations:
+        if self._ensure_loaded(lang):
             result = self._translations[lang].get(text)
             if result:
                 return result
@@ -113,5 +139,5 @@ def _(text):
 
 
 def get_translations():
-    """Returns the translation dictionary with all languages."""
+    """Returns the translation dictionary of the languages loaded so far."""
     return translation_manager._translations
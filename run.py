@@ -16,7 +16,15 @@ import logging
 import sys
 import os
 import time
+
+# Opt-in import-time profiling (DDC_PROFILE_IMPORTS=1): the Web UI import below
+# already pulls in discord and most services, so start before it
+from utils import import_profiler
+
+import_profiler.start_from_env()
+
 from waitress import serve
+from app.bootstrap import enable_memory_profiling
 from app.web_ui import create_app
 from bot import main as run_bot
 from utils.logging_utils import get_module_logger
@@ -63,6 +71,9 @@ def main():
     logger.info("   DockerDiscordControl (DDC) - Startup Sequence   ")
     logger.info("==================================================")
 
+    # Opt-in tracemalloc profiling (DDC_MEMORY_PROFILING=1), shared by the Web UI and the bot
+    enable_memory_profiling(logger)
+
     # 1. Start Web Server (Daemon Thread)
     # Daemon means it will be killed automatically when the main thread (Bot) exits
     web_thread = threading.Thread(target=start_web_server, daemon=True, name="Web-UI")
@@ -45,6 +45,8 @@ def main():
         if result.success:
             print(f'✅ SUCCESS: {result.message}')
             print(f'📊 Processed {result.levels_processed} evolution levels')
+            for level, seconds in sorted(result.level_timings.items()):
+                print(f'   Level {level:>2}: {seconds:.2f}s')
             print()
             print('🚀 Discord interactions will now load instantly!')
             print('🎯 No bot restart required.')
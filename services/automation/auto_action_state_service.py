@@ -6,20 +6,31 @@
 Service First: State Management for Auto-Actions
 Handles runtime state, cooldown tracking, and execution history.
 Persists to config/auto_actions_state.json to survive restarts (optional but good practice).
+
+State changes are applied in memory; the file is written behind, at most once
+per debounce window, so a burst of triggers costs one write. Pending changes
+are flushed at interpreter exit (or explicitly via flush()).
 """
 
+import atexit
+import heapq
 import json
 import logging
 import time
 import os
 import tempfile
+from collections import deque
+from itertools import islice
 from pathlib import Path
-from typing import Dict, Any, List, Optional
-from threading import Lock
+from typing import Deque, Dict, Any, List, Optional
+from threading import Lock, Timer
 from dataclasses import dataclass, asdict, field
 
 logger = logging.getLogger('ddc.auto_action_state_service')
 
+SAVE_DEBOUNCE_SECONDS = 1.0
+MAX_HISTORY_PER_CONTAINER = 100  # Question 21: max 100 entries per container
+
 @dataclass
 class TriggerEvent:
     """Represents a single execution of an auto-action."""
@@ -37,6 +48,8 @@ class TriggerEvent:
 class AutoActionStateService:
     """Service for managing AAS runtime state."""
 
+    save_debounce_seconds = SAVE_DEBOUNCE_SECONDS
+
     def __init__(self):
         try:
             self.base_dir = Path(__file__).parents[2]
@@ -45,14 +58,18 @@ class AutoActionStateService:
             
         self.state_file = self.base_dir / "config" / "auto_actions_state.json"
         self._lock = Lock()
+        self._io_lock = Lock()  # Serializes file writes
+        self._dirty = False
+        self._save_timer: Optional[Timer] = None
         
         # Runtime State
         self.global_last_triggered = 0.0
         self.rule_cooldowns: Dict[str, float] = {}  # rule_id -> timestamp
         self.container_cooldowns: Dict[str, float] = {} # container_name -> timestamp
-        self.trigger_history: Dict[str, List[Dict[str, Any]]] = {} # container -> list of events
-        
+        self.trigger_history: Dict[str, Deque[Dict[str, Any]]] = {} # container -> events, newest first
+
         self._load_state()
+        atexit.register(self.flush)
         logger.info("AutoActionStateService initialized")
 
     def _load_state(self):
@@ -77,7 +94,10 @@ class AutoActionStateService:
 
                 self.rule_cooldowns = data.get('rule_cooldowns', {})
                 self.container_cooldowns = data.get('container_cooldowns', {})
-                self.trigger_history = data.get('trigger_history', {})
+                self.trigger_history = {
+                    container: deque(events[:MAX_HISTORY_PER_CONTAINER], maxlen=MAX_HISTORY_PER_CONTAINER)
+                    for container, events in (data.get('trigger_history') or {}).items()
+                }
 
             # Save migrated state to update file format
             if needs_migration:
@@ -88,38 +108,60 @@ class AutoActionStateService:
             logger.error(f"Error loading AAS state: {e}")
 
     def _save_state(self):
-        """Persist state to disk (async safe via lock)."""
-        # Note: We don't need to save on every single event to avoid IO spam.
-        # But for V1 reliability, we'll save on significant changes.
+        """Persist the current state to disk right away."""
+        with self._lock:
+            self._dirty = True
+        self.flush()
+
+    def _schedule_save(self):
+        """Mark state dirty; one write follows after the debounce window. Caller holds the lock."""
+        self._dirty = True
+        if self._save_timer is None:
+            timer = Timer(self.save_debounce_seconds, self.flush)
+            timer.daemon = True
+            self._save_timer = timer
+            timer.start()
+
+    def flush(self) -> bool:
+        """Write pending state changes now. Returns True if something was written."""
+        # The snapshot is taken under the I/O lock so writes land in snapshot order
+        with self._io_lock:
+            with self._lock:
+                if self._save_timer is not None:
+                    self._save_timer.cancel()
+                    self._save_timer = None
+                if not self._dirty:
+                    return False
+                self._dirty = False
+                data = {
+                    'global_last_triggered': self.global_last_triggered,
+                    'rule_cooldowns': dict(self.rule_cooldowns),
+                    'container_cooldowns': dict(self.container_cooldowns),
+                    'trigger_history': {c: list(events) for c, events in self.trigger_history.items()}
+                }
+            self._write_state(data)
+        return True
+
+    def _write_state(self, data: Dict[str, Any]):
+        """Atomic write (temp file, fsync, rename). Caller holds the I/O lock, not the state lock."""
+        temp_path = None
         try:
-            data = {
-                'global_last_triggered': self.global_last_triggered,
-                'rule_cooldowns': self.rule_cooldowns,
-                'container_cooldowns': self.container_cooldowns,
-                'trigger_history': self.trigger_history
-            }
-            
             temp_dir = str(self.state_file.parent)
             fd, temp_path = tempfile.mkstemp(dir=temp_dir, text=True, suffix='.json.tmp')
-            
+
             with os.fdopen(fd, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2)
+                json.dump(data, f, separators=(',', ':'))
                 f.flush()
                 os.fsync(f.fileno())
-                
-            if os.name == 'posix':
-                os.rename(temp_path, self.state_file)
-            else:
-                if self.state_file.exists():
-                    self.state_file.unlink()
-                os.rename(temp_path, self.state_file)
-                
-        except Exception as e:
-            logger.error(f"Error saving AAS state: {e}")
-            if os.path.exists(temp_path):
+
+            os.replace(temp_path, self.state_file)
+
+        except (OSError, TypeError, ValueError) as e:
+            logger.error(f"Error saving AAS state: {e}", exc_info=True)
+            if temp_path and os.path.exists(temp_path):
                 try:
                     os.unlink(temp_path)
-                except:
+                except OSError:
                     pass
 
     # --- Public API ---
@@ -257,33 +299,26 @@ class AutoActionStateService:
                 details=details
             )
             
-            if container not in self.trigger_history:
-                self.trigger_history[container] = []
-                
-            # Add to front
-            self.trigger_history[container].insert(0, event.to_dict())
-            
-            # Prune history (Question 21: max 100 entries per container)
-            if len(self.trigger_history[container]) > 100:
-                self.trigger_history[container] = self.trigger_history[container][:100]
-                
-        # Persist state
-        self._save_state()
+            history = self.trigger_history.get(container)
+            if not isinstance(history, deque):
+                history = deque(history or (), maxlen=MAX_HISTORY_PER_CONTAINER)
+                self.trigger_history[container] = history
+
+            # Add to front; maxlen prunes the oldest entry
+            history.appendleft(event.to_dict())
+
+            # Persist state (coalesced, written behind)
+            self._schedule_save()
 
     def get_history(self, container: Optional[str] = None, limit: int = 50) -> List[Dict[str, Any]]:
         """Get execution history."""
         with self._lock:
             if container:
-                return self.trigger_history.get(container, [])[:limit]
-            
-            # Flatten all history if no container specified
-            all_events = []
-            for events in self.trigger_history.values():
-                all_events.extend(events)
-            
-            # Sort by timestamp desc
-            all_events.sort(key=lambda x: x['timestamp'], reverse=True)
-            return all_events[:limit]
+                return list(islice(self.trigger_history.get(container, ()), limit))
+
+            # Every history is newest first: merge them instead of sorting everything
+            merged = heapq.merge(*self.trigger_history.values(), key=lambda x: x['timestamp'], reverse=True)
+            return list(islice(merged, limit))
 
 # Singleton
 _state_service = None
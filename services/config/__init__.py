@@ -10,7 +10,8 @@ Config Services Package - Unified configuration service
 """
 
 from .config_service import get_config_service, ConfigService, ConfigServiceResult
+from .config_cache_service import ConfigSnapshot
 
 __all__ = [
-    'get_config_service', 'ConfigService', 'ConfigServiceResult'
+    'get_config_service', 'ConfigService', 'ConfigServiceResult', 'ConfigSnapshot'
 ]
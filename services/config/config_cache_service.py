@@ -8,17 +8,129 @@
 """
 Configuration Cache Service - Handles config caching and token encryption caching
 Part of ConfigService refactoring for Single Responsibility Principle
+
+Cached configs are validated against a fingerprint: the stat vector (inode,
+mtime, size) of every file the config is built from, including
+``containers/*.json`` and ``channels/*.json``. Any edit, addition or removal
+of such a file invalidates the cache; unrelated files in ``config/`` do not.
+
+Besides the mutable copies handed out by :meth:`get_cached_config`, a deeply
+immutable :class:`ConfigSnapshot` with a version number can be shared without
+copying. The version only increases when the loaded content changed.
 """
 
 import hashlib
 import logging
 import os
+import stat
+import time
+from dataclasses import dataclass
 from pathlib import Path
 from threading import Lock
-from typing import Dict, Any, Optional
+from types import MappingProxyType
+from typing import Dict, Any, Iterable, Iterator, Mapping, Optional, Tuple
 
 logger = logging.getLogger('ddc.config_cache')
 
+# Subdirectories whose *.json files are part of the unified config
+CONFIG_SUBDIRS = ('containers', 'channels')
+
+Fingerprint = Tuple[Tuple[str, int, int, int], ...]
+
+
+def config_fingerprint(files: Iterable[Path] = (), dirs: Iterable[Path] = ()) -> Fingerprint:
+    """Stat vector of the given files plus every ``*.json`` file in ``dirs``.
+
+    Missing files simply do not appear, so creating or deleting one changes
+    the fingerprint as well.
+    """
+    entries = []
+    for path in files:
+        try:
+            st = os.stat(path)
+        except OSError:
+            continue
+        entries.append((str(path), st.st_ino, st.st_mtime_ns, st.st_size))
+    for directory in dirs:
+        try:
+            with os.scandir(directory) as it:
+                for entry in it:
+                    if not entry.name.endswith('.json'):
+                        continue
+                    try:
+                        st = entry.stat()
+                    except OSError:
+                        continue
+                    if stat.S_ISREG(st.st_mode):
+                        entries.append((entry.path, st.st_ino, st.st_mtime_ns, st.st_size))
+        except OSError:
+            continue
+    entries.sort()
+    return tuple(entries)
+
+
+def freeze_config(value: Any) -> Any:
+    """Deeply immutable copy: dicts become read-only mappings, lists tuples."""
+    if isinstance(value, Mapping):
+        return MappingProxyType({key: freeze_config(item) for key, item in value.items()})
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze_config(item) for item in value)
+    if isinstance(value, (set, frozenset)):
+        return frozenset(freeze_config(item) for item in value)
+    return value
+
+
+def thaw_config(value: Any) -> Any:
+    """Mutable deep copy of a frozen config (e.g. to modify and save it)."""
+    if isinstance(value, Mapping):
+        return {key: thaw_config(item) for key, item in value.items()}
+    if isinstance(value, tuple):
+        return [thaw_config(item) for item in value]
+    if isinstance(value, frozenset):
+        return {thaw_config(item) for item in value}
+    return value
+
+
+@dataclass(frozen=True)
+class ConfigSnapshot:
+    """Immutable view of the unified configuration.
+
+    Safe to share between threads and to keep around; compare ``version``
+    to find out whether the configuration changed since.
+    """
+    version: int
+    config: Mapping[str, Any]
+    loaded_at: float = 0.0
+
+    def __getitem__(self, key: str) -> Any:
+        return self.config[key]
+
+    def __contains__(self, key: object) -> bool:
+        return key in self.config
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.config)
+
+    def __len__(self) -> int:
+        return len(self.config)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return self.config.get(key, default)
+
+    def thaw(self) -> Dict[str, Any]:
+        return thaw_config(self.config)
+
+
+@dataclass
+class _CacheEntry:
+    config: Dict[str, Any]
+    fingerprint: Fingerprint
+    snapshot: ConfigSnapshot
+
+
+def _default_fingerprint(config_dir: Path) -> Fingerprint:
+    return config_fingerprint(dirs=(config_dir, *(config_dir / sub for sub in CONFIG_SUBDIRS)))
+
 
 class ConfigCacheService:
     """
@@ -26,60 +138,92 @@ class ConfigCacheService:
 
     Responsibilities:
     - Cache configuration data
-    - Cache timestamps for invalidation
+    - Cache file fingerprints for invalidation
+    - Hand out versioned immutable snapshots
     - Cache decrypted tokens
     - Thread-safe cache operations
     """
 
     def __init__(self):
         """Initialize cache service."""
-        self._config_cache: Dict[str, Any] = {}
-        self._cache_timestamps: Dict[str, float] = {}
+        self._entries: Dict[str, _CacheEntry] = {}
+        # Last version and content per key; survives invalidate_cache() so versions stay monotonic
+        self._versions: Dict[str, Tuple[int, Dict[str, Any]]] = {}
         self._cache_lock = Lock()
 
         # Token encryption cache
         self._token_cache: Optional[str] = None
         self._token_cache_hash: Optional[str] = None
 
-    def get_cached_config(self, cache_key: str, config_dir: Path) -> Optional[Dict[str, Any]]:
+    def get_cached_config(self, cache_key: str, config_dir: Path,
+                          fingerprint: Optional[Fingerprint] = None) -> Optional[Dict[str, Any]]:
         """
         Get cached configuration if valid.
 
         Args:
             cache_key: Cache key to lookup
-            config_dir: Config directory to check modification time
+            config_dir: Config directory (fingerprinted when no fingerprint is given)
+            fingerprint: Current fingerprint of the files the config is built from
 
         Returns:
             Cached config dict if valid, None otherwise
         """
+        if fingerprint is None:
+            fingerprint = _default_fingerprint(config_dir)
         with self._cache_lock:
-            current_time = os.path.getmtime(config_dir) if config_dir.exists() else 0
-
-            if (cache_key in self._config_cache and
-                self._cache_timestamps.get(cache_key, 0) >= current_time):
-                return self._config_cache[cache_key].copy()
+            entry = self._entries.get(cache_key)
+            if entry is not None and entry.fingerprint == fingerprint:
+                return entry.config.copy()
 
             return None
 
-    def set_cached_config(self, cache_key: str, config: Dict[str, Any], config_dir: Path) -> None:
+    def set_cached_config(self, cache_key: str, config: Dict[str, Any], config_dir: Path,
+                          fingerprint: Optional[Fingerprint] = None) -> None:
         """
         Cache configuration data.
 
+        Pass the fingerprint taken *before* loading, so an edit made while
+        loading is detected by the next lookup.
+
         Args:
             cache_key: Cache key to store under
             config: Configuration data to cache
-            config_dir: Config directory to get modification time
+            config_dir: Config directory (fingerprinted when no fingerprint is given)
+            fingerprint: Fingerprint of the files the config was loaded from
         """
+        if fingerprint is None:
+            fingerprint = _default_fingerprint(config_dir)
+        with self._cache_lock:
+            version, previous = self._versions.get(cache_key, (0, None))
+            if previous != config:
+                version += 1
+            stored = config.copy()
+            self._versions[cache_key] = (version, stored)
+            # Frozen right away: later changes to the caller's (shared) nested objects can't leak in
+            snapshot = ConfigSnapshot(version, freeze_config(config), time.time())
+            self._entries[cache_key] = _CacheEntry(stored, fingerprint, snapshot)
+
+    def get_cached_snapshot(self, cache_key: str, config_dir: Path,
+                            fingerprint: Optional[Fingerprint] = None) -> Optional[ConfigSnapshot]:
+        """Immutable snapshot of the cached config if still valid, None otherwise."""
+        if fingerprint is None:
+            fingerprint = _default_fingerprint(config_dir)
+        with self._cache_lock:
+            entry = self._entries.get(cache_key)
+            if entry is None or entry.fingerprint != fingerprint:
+                return None
+            return entry.snapshot
+
+    def current_snapshot(self, cache_key: str) -> Optional[ConfigSnapshot]:
+        """Snapshot of the last cached config without a freshness check."""
         with self._cache_lock:
-            current_time = os.path.getmtime(config_dir) if config_dir.exists() else 0
-            self._config_cache[cache_key] = config.copy()
-            self._cache_timestamps[cache_key] = current_time
+            entry = self._entries.get(cache_key)
+            return entry.snapshot if entry is not None else None
 
     def invalidate_cache(self) -> None:
         """Clear all caches."""
         with self._cache_lock:
-            self._config_cache.clear()
-            self._cache_timestamps.clear()
+            self._entries.clear()
             self._token_cache = None
             self._token_cache_hash = None
         logger.debug("Cache invalidated")
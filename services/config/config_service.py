@@ -28,12 +28,11 @@ from dataclasses import dataclass, asdict
 from cryptography.fernet import Fernet, InvalidToken
 from cryptography.hazmat.primitives import hashes
 from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
-from werkzeug.security import generate_password_hash, check_password_hash
 
 # Import refactored services
 from .config_migration_service import ConfigMigrationService
 from .config_validation_service import ConfigValidationService
-from .config_cache_service import ConfigCacheService
+from .config_cache_service import ConfigCacheService, ConfigSnapshot, config_fingerprint
 from .config_loader_service import ConfigLoaderService
 from .config_form_parser_service import ConfigFormParserService
 
@@ -274,10 +273,12 @@ class ConfigService:
             :class:`ConfigLoaderService` - Underlying loading implementation
         """
         cache_key = 'unified'
+        # Taken before loading: an edit made while loading invalidates the result next time
+        fingerprint = self._config_fingerprint()
 
         # Try to get from cache if not force reload
         if not force_reload:
-            cached_config = self._cache_service.get_cached_config(cache_key, self.config_dir)
+            cached_config = self._cache_service.get_cached_config(cache_key, self.config_dir, fingerprint)
             if cached_config is not None:
                 return cached_config
 
@@ -299,10 +300,38 @@ class ConfigService:
                 logger.error("Token decryption failed in get_config()")
 
         # Cache the result using cache service
-        self._cache_service.set_cached_config(cache_key, config, self.config_dir)
+        self._cache_service.set_cached_config(cache_key, config, self.config_dir, fingerprint)
 
         return config
 
+    def get_config_snapshot(self) -> ConfigSnapshot:
+        """Get the unified configuration as a deeply immutable, versioned snapshot.
+
+        Unlike :meth:`get_config` nothing is copied: every caller shares the
+        same read-only view until a contributing file changes on disk.
+        ``snapshot.version`` increases whenever the content changed. Use
+        :meth:`ConfigSnapshot.thaw` for a mutable copy.
+
+        Example:
+            >>> snapshot = get_config_service().get_config_snapshot()
+            >>> snapshot['language'], snapshot.version
+        """
+        snapshot = self._cache_service.get_cached_snapshot('unified', self.config_dir, self._config_fingerprint())
+        if snapshot is None:
+            self.get_config(force_reload=True)
+            snapshot = self._cache_service.current_snapshot('unified')
+        return snapshot
+
+    def _config_fingerprint(self):
+        """Stat vector of every file get_config() reads (see ConfigCacheService)."""
+        return config_fingerprint(
+            files=(self.main_config_file, self.auth_config_file, self.heartbeat_config_file,
+                   self.web_ui_config_file, self.docker_settings_file, self.bot_config_file,
+                   self.docker_config_file, self.web_config_file, self.channels_config_file,
+                   self.config_dir / "server_order.json"),
+            dirs=(self.containers_dir, self.channels_dir),
+        )
+
     def save_config(self, config: Dict[str, Any]) -> ConfigServiceResult:
         """
         Save main configuration to config/config.json using atomic write pattern.
@@ -814,6 +843,10 @@ def load_config() -> Dict[str, Any]:
     """Legacy compatibility: Load unified configuration."""
     return get_config_service().get_config()
 
+def load_config_snapshot() -> ConfigSnapshot:
+    """Load the unified configuration as a read-only, versioned snapshot."""
+    return get_config_service().get_config_snapshot()
+
 def save_config(config: Dict[str, Any]) -> bool:
     """Legacy compatibility: Save configuration."""
     result = get_config_service().save_config(config)
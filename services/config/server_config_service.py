@@ -9,12 +9,14 @@
 SERVICE FIRST: Server Configuration Service - SINGLE POINT OF TRUTH
 """
 
+import copy
 import docker
 import logging
 import json
 from pathlib import Path
 from typing import List, Dict, Any, Optional
 from .config_service import load_config
+from .config_cache_service import config_fingerprint
 
 logger = logging.getLogger('ddc.server_config_service')
 
@@ -28,6 +30,7 @@ class ServerConfigService:
     def __init__(self):
         """Initialize the ServerConfigService."""
         self._cache: Optional[List[Dict[str, Any]]] = None
+        self._cache_fingerprint = None
         logger.info("ServerConfigService initialized - Single Point of Truth from container JSONs")
 
     def _load_container_configs(self) -> List[Dict[str, Any]]:
@@ -115,12 +118,19 @@ class ServerConfigService:
     def get_all_servers(self) -> List[Dict[str, Any]]:
         """Get all server configurations from individual container JSONs.
 
+        The files are only re-read when one of them was added, removed or
+        changed (stat fingerprint), so the result is never stale.
+
         Returns:
             List of server configurations from /config/containers/*.json
         """
-        # Always reload to ensure we have latest data (Single Point of Truth)
-        self._cache = self._load_container_configs()
-        return self._cache if self._cache else []
+        containers_dir = Path(__file__).parents[2] / 'config' / 'containers'
+        fingerprint = config_fingerprint(dirs=(containers_dir,))
+        if not self._cache or fingerprint != self._cache_fingerprint:
+            self._cache = self._load_container_configs()
+            self._cache_fingerprint = fingerprint
+        # Deep copies: callers may modify the entries (and their nested lists) they get
+        return copy.deepcopy(self._cache) if self._cache else []
 
     def get_valid_containers(self) -> List[Dict[str, str]]:
         """Get list of valid containers with docker_name.
@@ -9,6 +9,7 @@ Services:
 - ConditionalUpdateCacheService: Conditional message update caching
 - ChannelCleanupService: Channel cleanup operations
 - StatusOverviewService: Status overview generation
+- MessageLocationRegistry: Persistent locations of managed messages
 """
 
 __all__ = [
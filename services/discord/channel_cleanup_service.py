@@ -19,16 +19,58 @@ Service-First Architecture:
 - Single Source of Truth for Discord cleanup operations
 - Used by multiple cogs and recovery systems
 - Isolated, testable, and reusable
+
+Own messages are recorded in the SentMessageIndex as they are posted. Once a
+channel has been swept by history one time, later bot-message cleanups delete
+exactly the recorded ids (100 per bulk delete, paced) without reading history.
 """
 
 import asyncio
+import time
 import discord
 from datetime import datetime, timezone, timedelta
 from typing import List, Optional, Dict, Any, Callable
 from utils.logging_utils import get_module_logger
 
+from .sent_message_index import SentMessageIndex, get_sent_message_index, snowflake_timestamp
+
 logger = get_module_logger('channel_cleanup_service')
 
+BULK_DELETE_BATCH_SIZE = 100
+# Discord rejects bulk deletes of messages older than 14 days; keep a margin
+BULK_DELETE_MAX_AGE_SECONDS = 14 * 24 * 3600 - 3600
+BULK_DELETE_PACING_SECONDS = 1.0
+INDIVIDUAL_DELETE_PACING_SECONDS = 0.25
+
+LIVE_LOG_TITLE_KEYWORDS = ("Live Logs", "Live Debug Logs", "Debug Logs", "🔍 Live", "🔍 Debug", "🔄 Debug")
+LIVE_LOG_FOOTER_KEYWORDS = ("Auto-refreshing", "manually refreshed", "Auto-refresh", "live updates")
+
+
+def is_preserved_bot_message(message: discord.Message) -> bool:
+    """True for bot messages cleanup must keep: Live Log and AAS notification messages."""
+    # Check if this is a Live Log message by looking for specific indicators
+    for embed in message.embeds or []:
+        # Check for Live Log indicators in title
+        if embed.title and any(keyword in embed.title for keyword in LIVE_LOG_TITLE_KEYWORDS):
+            logger.debug(f"Preserving Live Log message {message.id} with title: {embed.title}")
+            return True
+
+        # Check for Live Log indicators in footer
+        if embed.footer and embed.footer.text and any(keyword in embed.footer.text for keyword in LIVE_LOG_FOOTER_KEYWORDS):
+            logger.debug(f"Preserving Live Log message {message.id} with footer: {embed.footer.text}")
+            return True
+
+    # Check if this is an AAS (Auto-Action System) notification message
+    # AAS messages have pattern: "⚡ `action` **container** — *RuleName*" or "⚠️ ... — *RuleName*"
+    content = message.content
+    if content and isinstance(content, str):
+        # AAS messages start with ⚡ or ⚠️ and contain " — *" (rule name in italics)
+        if (content.startswith("⚡") or content.startswith("⚠️")) and " — *" in content:
+            logger.debug(f"Preserving AAS message {message.id}: {content[:50]}...")
+            return True
+
+    return False
+
 
 class ChannelCleanupRequest:
     """Request object for channel cleanup operations."""
@@ -43,7 +85,8 @@ class ChannelCleanupRequest:
         target_author: Optional[discord.User] = None,
         custom_filter: Optional[Callable[[discord.Message], bool]] = None,
         use_purge: bool = False,
-        purge_timeout: float = 30.0
+        purge_timeout: float = 30.0,
+        use_index: bool = False
     ):
         self.channel = channel
         self.reason = reason
@@ -54,6 +97,7 @@ class ChannelCleanupRequest:
         self.custom_filter = custom_filter  # Custom message filter function
         self.use_purge = use_purge  # Use Discord's purge API for efficiency
         self.purge_timeout = purge_timeout  # Timeout for purge operations
+        self.use_index = use_index  # Delete recorded own message ids once the channel is indexed
 
 
 class ChannelCleanupResult:
@@ -63,6 +107,7 @@ class ChannelCleanupResult:
         self.success: bool = False
         self.error: Optional[str] = None
         self.messages_found: int = 0
+        self.messages_scanned: int = 0  # History messages read (history path only)
         self.messages_deleted: int = 0
         self.bulk_deleted: int = 0
         self.individually_deleted: int = 0
@@ -87,10 +132,26 @@ class ChannelCleanupService:
     - Comprehensive result reporting
     """
 
-    def __init__(self, bot: discord.Bot):
+    def __init__(self, bot: discord.Bot, message_index: Optional[SentMessageIndex] = None):
         self.bot = bot
+        self._message_index = message_index
         logger.info("Discord Channel Cleanup Service initialized")
 
+    @property
+    def message_index(self) -> SentMessageIndex:
+        if self._message_index is None:
+            self._message_index = get_sent_message_index()
+        return self._message_index
+
+    def record_sent_message(self, message: discord.Message) -> None:
+        """Record a message the bot posted (called from the on_message listener)."""
+        self.message_index.record(message.channel.id, message.id,
+                                  preserved=is_preserved_bot_message(message))
+
+    def forget_messages(self, channel_id: int, message_ids) -> None:
+        """Drop deleted messages from the index (raw delete gateway events)."""
+        self.message_index.forget(channel_id, message_ids)
+
     async def clean_sweep_bot_messages(
         self,
         channel: discord.TextChannel,
@@ -113,7 +174,8 @@ class ChannelCleanupService:
             reason=reason,
             message_limit=message_limit,
             bot_only=True,
-            target_author=self.bot.user
+            target_author=self.bot.user,
+            use_index=True
         )
 
         return await self.cleanup_channel(request)
@@ -144,34 +206,7 @@ class ChannelCleanupService:
             """Filter function that excludes Live Log and AAS messages."""
             if message.author != self.bot.user:
                 return False
-
-            # Check if this is a Live Log message by looking for specific indicators
-            if message.embeds:
-                for embed in message.embeds:
-                    # Check for Live Log indicators in title
-                    if embed.title and any(keyword in embed.title for keyword in [
-                        "Live Logs", "Live Debug Logs", "Debug Logs", "🔍 Live", "🔍 Debug", "🔄 Debug"
-                    ]):
-                        logger.debug(f"Preserving Live Log message {message.id} with title: {embed.title}")
-                        return False
-
-                    # Check for Live Log indicators in footer
-                    if embed.footer and embed.footer.text and any(keyword in embed.footer.text for keyword in [
-                        "Auto-refreshing", "manually refreshed", "Auto-refresh", "live updates"
-                    ]):
-                        logger.debug(f"Preserving Live Log message {message.id} with footer: {embed.footer.text}")
-                        return False
-
-            # Check if this is an AAS (Auto-Action System) notification message
-            # AAS messages have pattern: "⚡ `action` **container** — *RuleName*" or "⚠️ ... — *RuleName*"
-            if message.content:
-                content = message.content
-                # AAS messages start with ⚡ or ⚠️ and contain " — *" (rule name in italics)
-                if (content.startswith("⚡") or content.startswith("⚠️")) and " — *" in content:
-                    logger.debug(f"Preserving AAS message {message.id}: {content[:50]}...")
-                    return False
-
-            return True
+            return not is_preserved_bot_message(message)
 
         request = ChannelCleanupRequest(
             channel=channel,
@@ -181,7 +216,8 @@ class ChannelCleanupService:
             target_author=self.bot.user,
             custom_filter=is_bot_but_not_preserved,
             use_purge=True,  # Use purge for efficiency like original method
-            purge_timeout=30.0
+            purge_timeout=30.0,
+            use_index=True
         )
 
         return await self.cleanup_channel(request)
@@ -202,12 +238,23 @@ class ChannelCleanupService:
         try:
             logger.info(f"🧹 CLEANUP START: Channel {request.channel.id} (reason: {request.reason})")
 
+            if request.use_index and self.message_index.is_complete(request.channel.id):
+                await self._cleanup_tracked(request, result)
+                result.messages_deleted = result.bulk_deleted + result.individually_deleted
+                result.success = True
+                logger.info(f"✅ CLEANUP SUCCESS: Channel {request.channel.id} - "
+                           f"Deleted {result.messages_deleted}/{result.messages_found} tracked messages "
+                           f"(Bulk: {result.bulk_deleted}, Individual: {result.individually_deleted})")
+                return result
+
             # Step 1: Collect target messages
             messages_to_delete = await self._collect_messages(request, result)
 
             if not messages_to_delete:
                 logger.info(f"🧹 CLEANUP: No messages found to delete in channel {request.channel.id}")
                 result.success = True
+                if request.use_index and self._history_exhausted(request, result):
+                    self.message_index.mark_complete(request.channel.id)
                 return result
 
             result.messages_found = len(messages_to_delete)
@@ -224,6 +271,11 @@ class ChannelCleanupService:
             # Step 3: Calculate results
             result.messages_deleted = result.bulk_deleted + result.individually_deleted + result.purge_deleted
             result.success = True
+            if request.use_index:
+                self.message_index.forget(request.channel.id, [m.id for m in messages_to_delete])
+                if self._history_exhausted(request, result):
+                    # Swept to the start of the channel; own messages posted from now on are all recorded
+                    self.message_index.mark_complete(request.channel.id)
 
             # Choose appropriate logging based on method used
             if result.purge_deleted > 0:
@@ -246,6 +298,84 @@ class ChannelCleanupService:
 
         return result
 
+    @staticmethod
+    def _history_exhausted(request: ChannelCleanupRequest, result: ChannelCleanupResult) -> bool:
+        """True if the history walk reached the start of the channel instead of ``message_limit``."""
+        return request.message_limit is None or result.messages_scanned < request.message_limit
+
+    async def _cleanup_tracked(self, request: ChannelCleanupRequest, result: ChannelCleanupResult) -> None:
+        """Delete the recorded own messages of an indexed channel - no history reads."""
+        channel = request.channel
+        # Like the history path, only a filtered cleanup spares Live Log / AAS messages
+        include_preserved = request.custom_filter is None
+        ids = self.message_index.message_ids(channel.id, max_age_seconds=request.max_age_days * 86400,
+                                             include_preserved=include_preserved)
+        result.method_used = "tracked message ids"
+        result.messages_found = len(ids)
+        if not include_preserved:
+            result.messages_preserved = self.message_index.preserved_count(channel.id)
+        if not ids:
+            return
+
+        bulk_cutoff = time.time() - BULK_DELETE_MAX_AGE_SECONDS
+        recent = [i for i in ids if snowflake_timestamp(i) > bulk_cutoff]
+        individual = [i for i in ids if snowflake_timestamp(i) <= bulk_cutoff]
+        deleted: List[int] = []
+
+        for start in range(0, len(recent), BULK_DELETE_BATCH_SIZE):
+            batch = recent[start:start + BULK_DELETE_BATCH_SIZE]
+            if len(batch) == 1:
+                individual.extend(batch)
+                continue
+            if start:
+                await asyncio.sleep(BULK_DELETE_PACING_SECONDS)
+            try:
+                await self._rate_limited(lambda b=batch: channel.delete_messages([discord.Object(id=i) for i in b]))
+                result.bulk_deleted += len(batch)
+                deleted.extend(batch)
+            except discord.Forbidden:
+                logger.warning(f"⚠️ CLEANUP: Missing 'Manage Messages' permission in channel {channel.id}")
+                result.permission_errors += 1
+                individual.extend(batch)
+            except discord.HTTPException as e:
+                # e.g. one id of the batch no longer exists -> delete this batch one by one
+                logger.warning(f"⚠️ CLEANUP: Bulk delete of tracked messages failed, deleting individually: {e}")
+                individual.extend(batch)
+
+        for position, message_id in enumerate(individual):
+            if position:
+                await asyncio.sleep(INDIVIDUAL_DELETE_PACING_SECONDS)
+            try:
+                await self._rate_limited(lambda m=message_id: channel.get_partial_message(m).delete())
+                result.individually_deleted += 1
+                deleted.append(message_id)
+            except discord.NotFound:
+                result.not_found_errors += 1
+                deleted.append(message_id)  # Already gone
+            except discord.Forbidden:
+                result.permission_errors += 1
+                logger.debug(f"No permission to delete message {message_id}")
+            except discord.HTTPException as e:
+                logger.debug(f"Failed to delete message {message_id}: {e}")
+
+        self.message_index.forget(channel.id, deleted)
+        logger.info(f"🧹 CLEANUP: Deleted {len(deleted)}/{len(ids)} tracked messages "
+                    f"with {len(recent) // BULK_DELETE_BATCH_SIZE + (1 if len(recent) % BULK_DELETE_BATCH_SIZE else 0)} "
+                    f"bulk call(s)")
+
+    @staticmethod
+    async def _rate_limited(call: Callable[[], Any]) -> Any:
+        """Run a delete call; on HTTP 429 wait for retry_after once and retry."""
+        try:
+            return await call()
+        except discord.HTTPException as e:
+            if getattr(e, 'status', None) != 429:
+                raise
+            retry_after = float(getattr(e, 'retry_after', None) or 1.0)
+            logger.info(f"🧹 CLEANUP: Rate limited, retrying in {retry_after:.1f}s")
+            await asyncio.sleep(retry_after)
+            return await call()
+
     async def _collect_messages(
         self,
         request: ChannelCleanupRequest,
@@ -256,6 +386,7 @@ class ChannelCleanupService:
         cutoff_date = datetime.now(timezone.utc) - timedelta(days=request.max_age_days)
 
         async for message in request.channel.history(limit=request.message_limit):
+            result.messages_scanned += 1
             # Check age limit
             if message.created_at < cutoff_date:
                 continue
@@ -372,6 +503,8 @@ class ChannelCleanupService:
             )
             result.purge_deleted = len(deleted)
             result.method_used = "Discord purge API"
+            if request.use_index:
+                self.message_index.forget(request.channel.id, [m.id for m in deleted])
             logger.info(f"🧹 CLEANUP: Purge deleted {result.purge_deleted} messages successfully")
 
         except asyncio.TimeoutError:
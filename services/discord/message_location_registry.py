@@ -0,0 +1,249 @@
+# -*- coding: utf-8 -*-
+# ============================================================================ #
+# DockerDiscordControl (DDC) - Message Location Registry                      #
+# https://ddc.bot                                                              #
+# Copyright (c) 2025 MAX                                                       #
+# Licensed under the MIT License                                               #
+# ============================================================================ #
+"""
+Durable (guild, channel, purpose) -> message id registry.
+
+Managed messages (overview, admin overview) are recorded when they are sent,
+so code that needs to edit one later resolves it with a single
+``fetch_message`` instead of scanning ``channel.history``. Only when the
+stored id is gone (message deleted, never recorded) does :meth:`resolve` fall
+back to a bounded history scan, and a message found that way is recorded
+again.
+
+Persisted to ``config/message_locations.json``; a save only happens when an
+entry actually changes.
+"""
+
+import json
+import os
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from threading import Lock
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+import discord
+
+from utils.logging_utils import get_module_logger
+
+logger = get_module_logger('message_location_registry')
+
+DEFAULT_SCAN_LIMIT = 50
+
+# Purposes of the single managed messages per channel
+OVERVIEW = 'overview'
+ADMIN_OVERVIEW = 'admin_overview'
+
+
+@dataclass(frozen=True)
+class MessageLocation:
+    """Where a managed message lives."""
+    guild_id: int
+    channel_id: int
+    purpose: str
+    message_id: int
+    updated_at: float = 0.0
+
+
+def _guild_id_of(channel: Any) -> Optional[int]:
+    guild = getattr(channel, 'guild', None)
+    return getattr(guild, 'id', None)
+
+
+class MessageLocationRegistry:
+    """Persistent registry of managed message locations."""
+
+    def __init__(self, state_file: Optional[Path] = None):
+        if state_file is None:
+            state_file = Path(__file__).parents[2] / "config" / "message_locations.json"
+        self.state_file = Path(state_file)
+        self._lock = Lock()
+        # Channel ids are unique across guilds, so (channel, purpose) identifies a location
+        self._locations: Dict[Tuple[int, str], MessageLocation] = {}
+        self._stats = {'fetches': 0, 'fetch_misses': 0, 'scans': 0, 'scanned_messages': 0}
+        self._load()
+
+    # ------------------------------------------------------------------
+    # Persistence
+    # ------------------------------------------------------------------
+    def _load(self) -> None:
+        if not self.state_file.exists():
+            return
+        try:
+            with open(self.state_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            for entry in data.get('locations', []):
+                try:
+                    location = MessageLocation(
+                        guild_id=int(entry.get('guild_id') or 0),
+                        channel_id=int(entry['channel_id']),
+                        purpose=str(entry['purpose']),
+                        message_id=int(entry['message_id']),
+                        updated_at=float(entry.get('updated_at') or 0.0),
+                    )
+                except (KeyError, TypeError, ValueError):
+                    logger.warning(f"Skipping invalid message location entry: {entry}")
+                    continue
+                self._locations[(location.channel_id, location.purpose)] = location
+            logger.info(f"Loaded {len(self._locations)} message location(s)")
+        except (OSError, json.JSONDecodeError, AttributeError) as e:
+            logger.error(f"Error loading message locations from {self.state_file}: {e}", exc_info=True)
+
+    def _save(self) -> None:
+        """Write all locations atomically (temp file + os.replace). Caller holds the lock."""
+        tmp_path = f"{self.state_file}.tmp.{os.getpid()}"
+        try:
+            self.state_file.parent.mkdir(parents=True, exist_ok=True)
+            data = {'locations': [asdict(loc) for loc in self._locations.values()]}
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(data, f, indent=2)
+            os.replace(tmp_path, self.state_file)
+        except (OSError, TypeError, ValueError) as e:
+            logger.error(f"Error saving message locations: {e}", exc_info=True)
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+
+    # ------------------------------------------------------------------
+    # Registry
+    # ------------------------------------------------------------------
+    def get(self, channel_id: int, purpose: str) -> Optional[int]:
+        """Return the recorded message id for ``purpose`` in a channel."""
+        location = self._locations.get((channel_id, purpose))
+        return location.message_id if location else None
+
+    def get_location(self, channel_id: int, purpose: str) -> Optional[MessageLocation]:
+        return self._locations.get((channel_id, purpose))
+
+    def locations(self, purpose: Optional[str] = None) -> List[MessageLocation]:
+        """All recorded locations, optionally only one purpose."""
+        return [loc for loc in self._locations.values() if purpose is None or loc.purpose == purpose]
+
+    def record(self, channel_id: int, purpose: str, message_id: int, guild_id: Optional[int] = None) -> None:
+        """Record the message sent for ``purpose``; persists only if something changed.
+
+        ``guild_id`` may be unknown (None); a previously recorded guild is kept then.
+        """
+        key = (int(channel_id), purpose)
+        with self._lock:
+            current = self._locations.get(key)
+            if guild_id is None:
+                guild_id = current.guild_id if current else 0
+            if current and current.message_id == message_id and current.guild_id == guild_id:
+                return
+            self._locations[key] = MessageLocation(int(guild_id), int(channel_id), purpose,
+                                                   int(message_id), time.time())
+            self._save()
+
+    def record_message(self, message: Any, purpose: str) -> None:
+        """Record a sent ``discord.Message``."""
+        self.record(message.channel.id, purpose, message.id, _guild_id_of(message.channel))
+
+    def forget(self, channel_id: int, purpose: Optional[str] = None) -> None:
+        """Drop one purpose of a channel, or every purpose when ``purpose`` is None."""
+        with self._lock:
+            keys = [k for k in self._locations if k[0] == channel_id and (purpose is None or k[1] == purpose)]
+            for key in keys:
+                del self._locations[key]
+            if keys:
+                self._save()
+
+    def forget_guild(self, guild_id: int) -> None:
+        """Drop every location of a guild (e.g. the bot was removed from it)."""
+        with self._lock:
+            keys = [k for k, loc in self._locations.items() if loc.guild_id == guild_id]
+            for key in keys:
+                del self._locations[key]
+            if keys:
+                self._save()
+
+    def sync(self, purposes: Iterable[str], current: Dict[int, Dict[str, int]],
+             guild_ids: Optional[Dict[int, Optional[int]]] = None) -> None:
+        """Make the recorded ``purposes`` match ``current`` (channel -> purpose -> id).
+
+        Entries of those purposes missing from ``current`` are dropped; other
+        purposes are left alone. One save at most.
+        """
+        purposes = set(purposes)
+        guild_ids = guild_ids or {}
+        with self._lock:
+            wanted: Dict[Tuple[int, str], int] = {}
+            for channel_id, messages in current.items():
+                for purpose, message_id in messages.items():
+                    if purpose in purposes and message_id:
+                        wanted[(int(channel_id), purpose)] = int(message_id)
+
+            changed = False
+            for key in [k for k in self._locations if k[1] in purposes and k not in wanted]:
+                del self._locations[key]
+                changed = True
+            for key, message_id in wanted.items():
+                existing = self._locations.get(key)
+                guild_id = guild_ids.get(key[0])
+                if guild_id is None:
+                    guild_id = existing.guild_id if existing else 0
+                if existing and existing.message_id == message_id and existing.guild_id == guild_id:
+                    continue
+                self._locations[key] = MessageLocation(int(guild_id), key[0], key[1], message_id, time.time())
+                changed = True
+            if changed:
+                self._save()
+
+    # ------------------------------------------------------------------
+    # Lookup
+    # ------------------------------------------------------------------
+    async def resolve(self, channel: Any, purpose: str,
+                      matcher: Optional[Callable[[Any], bool]] = None,
+                      scan_limit: int = DEFAULT_SCAN_LIMIT) -> Optional[Any]:
+        """Return the managed message for ``purpose`` in ``channel``, or None.
+
+        Tries the recorded id with one ``fetch_message``. If nothing is recorded
+        or the message is gone, scans at most ``scan_limit`` recent messages for
+        one ``matcher`` accepts and records it. Without a matcher there is no
+        scan. Permission or HTTP errors on the fetch return None without
+        scanning (the scan would hit the same error).
+        """
+        message_id = self.get(channel.id, purpose)
+        if message_id:
+            self._stats['fetches'] += 1
+            try:
+                return await channel.fetch_message(message_id)
+            except discord.NotFound:
+                self._stats['fetch_misses'] += 1
+                logger.info(f"Recorded '{purpose}' message {message_id} in channel {channel.id} is gone")
+                self.forget(channel.id, purpose)
+            except (discord.Forbidden, discord.HTTPException) as e:
+                logger.warning(f"Could not fetch '{purpose}' message {message_id} in channel {channel.id}: {e}")
+                return None
+
+        if matcher is None or scan_limit <= 0:
+            return None
+
+        self._stats['scans'] += 1
+        async for message in channel.history(limit=scan_limit):
+            self._stats['scanned_messages'] += 1
+            if matcher(message):
+                self.record(channel.id, purpose, message.id, _guild_id_of(channel))
+                return message
+        return None
+
+    def get_stats(self) -> Dict[str, Any]:
+        return dict(self._stats, locations=len(self._locations))
+
+
+# Global service instance
+_message_location_registry: Optional[MessageLocationRegistry] = None
+
+
+def get_message_location_registry() -> MessageLocationRegistry:
+    """Get the global message location registry."""
+    global _message_location_registry
+    if _message_location_registry is None:
+        _message_location_registry = MessageLocationRegistry()
+    return _message_location_registry
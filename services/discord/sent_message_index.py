@@ -0,0 +1,204 @@
+# -*- coding: utf-8 -*-
+# ============================================================================ #
+# DockerDiscordControl (DDC) - Sent Message Index                             #
+# https://ddc.bot                                                              #
+# Copyright (c) 2025 MAX                                                       #
+# Licensed under the MIT License                                               #
+# ============================================================================ #
+"""
+Compact per-channel index of the messages the bot itself posted.
+
+Lets channel cleanup delete exactly the bot's own messages by id instead of
+paging through channel history. Only message ids are stored - a Discord
+snowflake already encodes its creation time (see :func:`snowflake_timestamp`).
+Messages that cleanup must keep (Live Logs, AAS notifications) are stored
+in a separate list so they are never targeted.
+
+A channel is only *complete* - safe to clean from the index alone - after one
+history-based cleanup ran while the index was recording. Before that it may
+hold bot messages from older versions that were never recorded.
+
+Changes are applied in memory and written behind, at most once per debounce
+window, so a burst of posts or delete events costs one file write. Pending
+changes are flushed at interpreter exit (or explicitly via flush()).
+"""
+
+import atexit
+import json
+import os
+import time
+from pathlib import Path
+from threading import Lock, Timer
+from typing import Any, Dict, List, Optional, Set
+
+from utils.logging_utils import get_module_logger
+
+logger = get_module_logger('sent_message_index')
+
+DISCORD_EPOCH_MS = 1420070400000
+MAX_IDS_PER_CHANNEL = 2000
+SAVE_DEBOUNCE_SECONDS = 2.0
+
+
+def snowflake_timestamp(snowflake: int) -> float:
+    """Unix timestamp (seconds) at which a Discord snowflake was created."""
+    return ((int(snowflake) >> 22) + DISCORD_EPOCH_MS) / 1000.0
+
+
+class _ChannelEntry:
+    __slots__ = ('ids', 'preserved', 'complete')
+
+    def __init__(self, ids=(), preserved=(), complete: bool = False):
+        self.ids: Set[int] = set(ids)
+        self.preserved: Set[int] = set(preserved)
+        self.complete = complete
+
+
+class SentMessageIndex:
+    """Persistent channel -> own message ids index."""
+
+    save_debounce_seconds = SAVE_DEBOUNCE_SECONDS
+
+    def __init__(self, state_file: Optional[Path] = None):
+        if state_file is None:
+            state_file = Path(__file__).parents[2] / "config" / "sent_messages.json"
+        self.state_file = Path(state_file)
+        self._lock = Lock()
+        self._io_lock = Lock()  # Serializes file writes
+        self._dirty = False
+        self._save_timer: Optional[Timer] = None
+        self._channels: Dict[int, _ChannelEntry] = {}
+        self._load()
+        atexit.register(self.flush)
+
+    def _load(self) -> None:
+        if not self.state_file.exists():
+            return
+        try:
+            with open(self.state_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            for channel_id, entry in (data.get('channels') or {}).items():
+                self._channels[int(channel_id)] = _ChannelEntry(
+                    (int(i) for i in entry.get('ids', [])),
+                    (int(i) for i in entry.get('preserved', [])),
+                    bool(entry.get('complete', False)),
+                )
+        except (OSError, json.JSONDecodeError, AttributeError, TypeError, ValueError) as e:
+            logger.error(f"Error loading sent message index: {e}", exc_info=True)
+            self._channels = {}
+
+    def _schedule_save(self) -> None:
+        """Mark the index dirty; one write follows after the debounce window. Caller holds the lock."""
+        self._dirty = True
+        if self._save_timer is None:
+            timer = Timer(self.save_debounce_seconds, self.flush)
+            timer.daemon = True
+            self._save_timer = timer
+            timer.start()
+
+    def flush(self) -> bool:
+        """Write pending changes now. Returns True if something was written."""
+        # The snapshot is taken under the I/O lock so writes land in snapshot order
+        with self._io_lock:
+            with self._lock:
+                if self._save_timer is not None:
+                    self._save_timer.cancel()
+                    self._save_timer = None
+                if not self._dirty:
+                    return False
+                self._dirty = False
+                data = {'channels': {
+                    str(cid): {'ids': sorted(e.ids), 'preserved': sorted(e.preserved), 'complete': e.complete}
+                    for cid, e in self._channels.items() if e.ids or e.preserved or e.complete
+                }}
+            self._write(data)
+        return True
+
+    def _write(self, data: Dict[str, Any]) -> None:
+        """Atomic write of the whole index. Caller holds the I/O lock, not the state lock."""
+        tmp_path = f"{self.state_file}.tmp.{os.getpid()}"
+        try:
+            self.state_file.parent.mkdir(parents=True, exist_ok=True)
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(data, f, separators=(',', ':'))
+            os.replace(tmp_path, self.state_file)
+        except (OSError, TypeError, ValueError) as e:
+            logger.error(f"Error saving sent message index: {e}", exc_info=True)
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+
+    # ------------------------------------------------------------------
+    def record(self, channel_id: int, message_id: int, preserved: bool = False) -> None:
+        """Record a message the bot posted."""
+        with self._lock:
+            entry = self._channels.setdefault(int(channel_id), _ChannelEntry())
+            target = entry.preserved if preserved else entry.ids
+            if message_id in target:
+                return
+            target.add(int(message_id))
+            if len(entry.ids) > MAX_IDS_PER_CHANNEL:
+                # Drop the oldest; the channel can no longer be cleaned from the index alone
+                for old in sorted(entry.ids)[:len(entry.ids) - MAX_IDS_PER_CHANNEL]:
+                    entry.ids.discard(old)
+                entry.complete = False
+            self._schedule_save()
+
+    def forget(self, channel_id: int, message_ids) -> None:
+        """Remove deleted messages (own cleanup or a delete gateway event)."""
+        with self._lock:
+            entry = self._channels.get(int(channel_id))
+            if entry is None:
+                return
+            ids = {int(i) for i in message_ids}
+            if not (ids & entry.ids or ids & entry.preserved):
+                return
+            entry.ids -= ids
+            entry.preserved -= ids
+            self._schedule_save()
+
+    def forget_channel(self, channel_id: int) -> None:
+        with self._lock:
+            if self._channels.pop(int(channel_id), None) is not None:
+                self._schedule_save()
+
+    def mark_complete(self, channel_id: int) -> None:
+        """The channel was swept by history; from now on the index covers it."""
+        with self._lock:
+            entry = self._channels.setdefault(int(channel_id), _ChannelEntry())
+            if not entry.complete:
+                entry.complete = True
+                self._schedule_save()
+
+    def is_complete(self, channel_id: int) -> bool:
+        entry = self._channels.get(int(channel_id))
+        return bool(entry and entry.complete)
+
+    def message_ids(self, channel_id: int, max_age_seconds: Optional[float] = None,
+                    include_preserved: bool = False) -> List[int]:
+        """Own message ids of a channel, newest first; preserved ones only if asked for."""
+        entry = self._channels.get(int(channel_id))
+        if entry is None:
+            return []
+        ids = sorted(entry.ids | entry.preserved if include_preserved else entry.ids, reverse=True)
+        if max_age_seconds is not None:
+            cutoff = time.time() - max_age_seconds
+            ids = [i for i in ids if snowflake_timestamp(i) >= cutoff]
+        return ids
+
+    def preserved_count(self, channel_id: int) -> int:
+        entry = self._channels.get(int(channel_id))
+        return len(entry.preserved) if entry else 0
+
+
+# Global service instance
+_sent_message_index: Optional[SentMessageIndex] = None
+
+
+def get_sent_message_index() -> SentMessageIndex:
+    """Get the global sent message index."""
+    global _sent_message_index
+    if _sent_message_index is None:
+        _sent_message_index = SentMessageIndex()
+    return _sent_message_index
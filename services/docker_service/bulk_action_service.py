@@ -0,0 +1,326 @@
+# -*- coding: utf-8 -*-
+# ============================================================================ #
+# DockerDiscordControl (DDC) - Bulk Container Action Service                  #
+# https://ddc.bot                                                              #
+# Copyright (c) 2025 MAX                                                       #
+# Licensed under the MIT License                                               #
+# ============================================================================ #
+"""
+Concurrent start/stop/restart of many containers (admin "… all" buttons).
+
+Containers are processed in ordering groups: every container of one group
+finishes before the next group starts, and inside a group up to
+``max_parallel`` actions run at once. Groups come from the optional
+``bulk_group`` server setting (integer, default 0, lower first - e.g. 0 for
+databases, 10 for apps); ``stop`` walks the groups in reverse so dependants go
+down before what they depend on.
+
+Each container gets its own timeout. Operations can be cancelled: actions that
+already started finish, the rest are reported as cancelled. Instead of one
+global "bulk operation in progress" flag, containers are claimed per
+operation, so two bulk operations on different containers can run side by
+side while a container already being handled is skipped as busy.
+"""
+
+import asyncio
+import itertools
+import time
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+from utils.logging_utils import get_module_logger
+
+logger = get_module_logger('bulk_action_service')
+
+VALID_BULK_ACTIONS = ('start', 'stop', 'restart')
+DEFAULT_MAX_PARALLEL = 4
+DEFAULT_CONTAINER_TIMEOUT = 30.0
+
+# Outcome states
+SUCCEEDED = 'succeeded'
+FAILED = 'failed'
+TIMEOUT = 'timeout'
+CANCELLED = 'cancelled'
+BUSY = 'busy'
+
+# (container_name, action, timeout) -> (success, error_message)
+ActionExecutor = Callable[[str, str, float], Awaitable[Tuple[bool, Optional[str]]]]
+ProgressCallback = Callable[['BulkActionProgress'], Awaitable[None]]
+
+
+@dataclass(frozen=True)
+class BulkActionRequest:
+    """Request to run one action on many containers.
+
+    ``groups`` are processed in the given order; build them from server
+    configs with :func:`build_action_groups`.
+    """
+    action: str
+    groups: Tuple[Tuple[str, ...], ...]
+    max_parallel: int = DEFAULT_MAX_PARALLEL
+    timeout_per_container: float = DEFAULT_CONTAINER_TIMEOUT
+
+
+@dataclass(frozen=True)
+class ContainerActionOutcome:
+    """Result for one container of a bulk operation."""
+    container_name: str
+    status: str  # succeeded, failed, timeout, cancelled, busy
+    duration_ms: float = 0.0
+    error_message: Optional[str] = None
+
+    @property
+    def success(self) -> bool:
+        return self.status == SUCCEEDED
+
+
+@dataclass(frozen=True)
+class BulkActionProgress:
+    """Snapshot passed to progress callbacks after every finished container."""
+    operation_id: int
+    action: str
+    total: int
+    done: int
+    succeeded: int
+    failed: int
+    current_group: int
+    group_count: int
+    last: Optional[ContainerActionOutcome] = None
+    finished: bool = False
+    cancelled: bool = False
+
+
+@dataclass(frozen=True)
+class BulkActionResult:
+    """Outcome of a whole bulk operation."""
+    operation_id: int
+    action: str
+    outcomes: Tuple[ContainerActionOutcome, ...]
+    duration_ms: float
+    cancelled: bool = False
+
+    def _count(self, *statuses: str) -> int:
+        return sum(1 for o in self.outcomes if o.status in statuses)
+
+    @property
+    def succeeded(self) -> int:
+        return self._count(SUCCEEDED)
+
+    @property
+    def failed(self) -> int:
+        return self._count(FAILED, TIMEOUT)
+
+    @property
+    def skipped(self) -> int:
+        return self._count(CANCELLED, BUSY)
+
+
+@dataclass
+class BulkOperation:
+    """Handle of a running bulk operation."""
+    operation_id: int
+    request: BulkActionRequest
+    cancel_event: asyncio.Event = field(default_factory=asyncio.Event)
+    task: Optional['asyncio.Task[BulkActionResult]'] = None
+    claimed: Tuple[str, ...] = ()
+    busy: Tuple[str, ...] = ()
+
+    def cancel(self) -> None:
+        """Stop launching further actions; running ones complete."""
+        self.cancel_event.set()
+
+    @property
+    def cancelled(self) -> bool:
+        return self.cancel_event.is_set()
+
+    async def wait(self) -> BulkActionResult:
+        return await self.task
+
+
+def build_action_groups(servers: Iterable[Dict[str, Any]], action: str) -> Tuple[Tuple[str, ...], ...]:
+    """Group server docker names by their ``bulk_group`` setting.
+
+    Groups are ordered ascending (descending for ``stop``); order inside a
+    group follows ``servers``. Invalid group values fall back to 0.
+    """
+    groups: Dict[int, List[str]] = {}
+    for server in servers:
+        if not isinstance(server, dict):
+            continue
+        docker_name = server.get('docker_name')
+        if not docker_name or not isinstance(docker_name, str):
+            continue
+        try:
+            group = int(server.get('bulk_group', 0) or 0)
+        except (TypeError, ValueError):
+            group = 0
+        groups.setdefault(group, []).append(docker_name)
+    ordered = sorted(groups, reverse=(action == 'stop'))
+    return tuple(tuple(groups[g]) for g in ordered)
+
+
+async def _docker_action_executor(container_name: str, action: str, timeout: float) -> Tuple[bool, Optional[str]]:
+    """Default executor: the regular single-container Docker action path."""
+    from services.docker_service.docker_action_service import DockerActionRequest, get_docker_action_service
+
+    result = await get_docker_action_service().execute_docker_action(DockerActionRequest(
+        container_name=container_name,
+        action=action,
+        timeout_seconds=timeout,
+    ))
+    return result.success, result.error_message
+
+
+class BulkActionService:
+    """Runs bulk container actions with bounded parallelism."""
+
+    def __init__(self, executor: Optional[ActionExecutor] = None):
+        self.logger = logger.getChild(self.__class__.__name__)
+        self._executor = executor or _docker_action_executor
+        self._claimed: Set[str] = set()
+        self._operations: Dict[int, BulkOperation] = {}
+        self._ids = itertools.count(1)
+
+    def start(self, request: BulkActionRequest,
+              progress_callback: Optional[ProgressCallback] = None) -> BulkOperation:
+        """Start ``request`` in the background and return its handle.
+
+        Raises:
+            ValueError: If the action is unknown or ``max_parallel`` < 1.
+        """
+        if request.action not in VALID_BULK_ACTIONS:
+            raise ValueError(f"Invalid bulk action: {request.action}")
+        if request.max_parallel < 1:
+            raise ValueError("max_parallel must be at least 1")
+
+        # Claim containers synchronously; anything another operation holds is skipped
+        claimed: List[str] = []
+        busy: List[str] = []
+        for name in itertools.chain.from_iterable(request.groups):
+            (busy if name in self._claimed or name in claimed else claimed).append(name)
+        self._claimed.update(claimed)
+
+        operation = BulkOperation(operation_id=next(self._ids), request=request,
+                                  claimed=tuple(claimed), busy=tuple(busy))
+        self._operations[operation.operation_id] = operation
+        operation.task = asyncio.create_task(self._run(operation, progress_callback))
+        # Release on completion, also if the task is cancelled before it ever ran
+        operation.task.add_done_callback(lambda _task: self._release(operation))
+        return operation
+
+    def _release(self, operation: BulkOperation) -> None:
+        self._claimed.difference_update(operation.claimed)
+        self._operations.pop(operation.operation_id, None)
+
+    async def run(self, request: BulkActionRequest,
+                  progress_callback: Optional[ProgressCallback] = None) -> BulkActionResult:
+        """Run ``request`` and wait for its result."""
+        return await self.start(request, progress_callback).wait()
+
+    def get_operation(self, operation_id: int) -> Optional[BulkOperation]:
+        return self._operations.get(operation_id)
+
+    def cancel(self, operation_id: int) -> bool:
+        """Cancel a running operation; returns False if it is unknown or finished."""
+        operation = self._operations.get(operation_id)
+        if operation is None:
+            return False
+        operation.cancel()
+        return True
+
+    def is_busy(self, container_name: str) -> bool:
+        return container_name in self._claimed
+
+    @property
+    def active_operations(self) -> List[BulkOperation]:
+        return list(self._operations.values())
+
+    async def _run(self, operation: BulkOperation,
+                   progress_callback: Optional[ProgressCallback]) -> BulkActionResult:
+        request = operation.request
+        start = time.monotonic()
+        outcomes: List[ContainerActionOutcome] = []
+        total = sum(len(g) for g in request.groups)
+        group_count = len(request.groups)
+
+        outcomes.extend(ContainerActionOutcome(name, BUSY, error_message="Another bulk operation is handling this container")
+                        for name in operation.busy)
+        claimed = set(operation.claimed)
+        groups = [[name for name in group if name in claimed] for group in request.groups]
+
+        self.logger.info(f"Bulk {request.action} #{operation.operation_id}: {len(operation.claimed)} containers "
+                         f"in {group_count} group(s), parallel={request.max_parallel}")
+
+        async def _report(group_index: int, last: Optional[ContainerActionOutcome], finished: bool = False) -> None:
+            if progress_callback is None:
+                return
+            progress = BulkActionProgress(
+                operation_id=operation.operation_id,
+                action=request.action,
+                total=total,
+                done=len(outcomes),
+                succeeded=sum(1 for o in outcomes if o.status == SUCCEEDED),
+                failed=sum(1 for o in outcomes if o.status in (FAILED, TIMEOUT)),
+                current_group=group_index,
+                group_count=group_count,
+                last=last,
+                finished=finished,
+                cancelled=operation.cancelled,
+            )
+            try:
+                await progress_callback(progress)
+            except (RuntimeError, OSError, ValueError) as e:
+                self.logger.warning(f"Bulk progress callback failed: {e}")
+
+        semaphore = asyncio.Semaphore(request.max_parallel)
+
+        async def _one(name: str) -> ContainerActionOutcome:
+            async with semaphore:
+                if operation.cancelled:
+                    return ContainerActionOutcome(name, CANCELLED)
+                began = time.monotonic()
+                try:
+                    success, error = await asyncio.wait_for(
+                        self._executor(name, request.action, request.timeout_per_container),
+                        timeout=request.timeout_per_container,
+                    )
+                    status = SUCCEEDED if success else FAILED
+                except asyncio.TimeoutError:
+                    status, error = TIMEOUT, f"No response after {request.timeout_per_container:.0f}s"
+                except (RuntimeError, OSError, ValueError) as e:
+                    self.logger.error(f"Bulk {request.action} failed for {name}: {e}", exc_info=True)
+                    status, error = FAILED, str(e)
+                return ContainerActionOutcome(name, status, (time.monotonic() - began) * 1000, error)
+
+        for index, names in enumerate(groups, start=1):
+            if operation.cancelled:
+                outcomes.extend(ContainerActionOutcome(n, CANCELLED) for n in names)
+                continue
+            for finished_task in asyncio.as_completed([_one(n) for n in names]):
+                outcome = await finished_task
+                outcomes.append(outcome)
+                await _report(index, outcome)
+
+        result = BulkActionResult(
+            operation_id=operation.operation_id,
+            action=request.action,
+            outcomes=tuple(outcomes),
+            duration_ms=(time.monotonic() - start) * 1000,
+            cancelled=operation.cancelled,
+        )
+        await _report(group_count, None, finished=True)
+        self.logger.info(f"Bulk {request.action} #{operation.operation_id} finished in {result.duration_ms:.0f}ms: "
+                         f"{result.succeeded} ok, {result.failed} failed, {result.skipped} skipped")
+        return result
+
+
+# Global service instance
+_bulk_action_service: Optional[BulkActionService] = None
+
+
+def get_bulk_action_service() -> BulkActionService:
+    """Get the global bulk action service instance."""
+    global _bulk_action_service
+    if _bulk_action_service is None:
+        _bulk_action_service = BulkActionService()
+    return _bulk_action_service
@@ -0,0 +1,262 @@
+# -*- coding: utf-8 -*-
+# ============================================================================ #
+# DockerDiscordControl (DDC)                                                  #
+# https://ddc.bot                                                              #
+# Copyright (c) 2025 MAX                                                  #
+# Licensed under the MIT License                                               #
+# ============================================================================ #
+"""Shared container list snapshot for the bot and the Web UI.
+
+Both halves of DDC need the list of containers known to the Docker daemon.
+The bot fetches it through the pooled async client in
+:func:`services.docker_service.docker_utils.get_containers_data`, while the
+Web UI used to run its own background poller that opened a fresh
+``docker.from_env()`` client on every refresh.  This module holds the single
+process-wide snapshot both sides read from:
+
+* whoever queries the daemon publishes the result here, so a fresh list
+  fetched by one side is reused by the other instead of polling again;
+* refreshes are single-flight - concurrent callers wait for the query that
+  is already running instead of issuing their own;
+* running state reported by the bot's status loop
+  (:class:`~services.docker_service.status_cache_runtime.DockerStatusCacheRuntime`)
+  overrides older list data, so the Web UI and Discord agree on whether a
+  container is up.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from dataclasses import dataclass, replace
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+import docker
+
+logger = logging.getLogger("ddc.docker.container_snapshot")
+
+ContainerEntry = Dict[str, Any]
+
+
+def normalize_container_list(api_containers: Iterable[Dict[str, Any]]) -> List[ContainerEntry]:
+    """Convert ``client.api.containers(all=True)`` output into DDC entries.
+
+    Entries carry ``id``, ``name``, ``status``, ``running``, ``image`` and
+    ``created``; running containers also carry ``ports``. The result is
+    sorted by name (case-insensitive).
+    """
+    result: List[ContainerEntry] = []
+    for c_data in api_containers:
+        try:
+            name = (c_data.get('Names') or ['N/A'])[0].lstrip('/')  # Names can be a list
+            status = c_data.get('State', 'unknown').lower()
+            is_running = status == "running"
+            image_name = c_data.get('Image', 'N/A')
+            if '@sha256:' in image_name:  # often image name is with digest
+                image_name = image_name.split('@sha256:')[0]
+
+            container_info = {
+                "id": c_data.get('Id', 'N/A')[:12],
+                "name": name,
+                "status": status,
+                "running": is_running,
+                "image": image_name,
+                "created": datetime.fromtimestamp(c_data.get('Created', 0), timezone.utc).isoformat() if c_data.get('Created') else "N/A",
+            }
+            if is_running:
+                container_info["ports"] = c_data.get("Ports", {})
+            result.append(container_info)
+        except (AttributeError, KeyError, ValueError, TypeError) as e_inner:
+            logger.warning(f"Error processing individual container data for {c_data.get('Id', 'unknown_id')}: {e_inner}")
+            result.append({
+                "id": c_data.get('Id', 'unknown_id')[:12],
+                "name": (c_data.get('Names') or ['error'])[0].lstrip('/'),
+                "status": "error_processing",
+                "running": False,
+                "error": str(e_inner)
+            })
+    return sorted(result, key=lambda x: x.get("name", "").lower())
+
+
+def _fetch_from_daemon() -> List[ContainerEntry]:
+    """Default fetcher: list containers through the shared sync Docker client."""
+    from services.docker_service.docker_utils import get_docker_client
+
+    client = get_docker_client()
+    if client is None:
+        raise docker.errors.DockerException("Docker client unavailable")
+    return normalize_container_list(client.api.containers(all=True))
+
+
+@dataclass(frozen=True)
+class ContainerSnapshot:
+    """Immutable container list captured at ``timestamp`` (``time.time()``)."""
+
+    containers: Tuple[ContainerEntry, ...]
+    timestamp: float
+    source: str = "daemon"
+
+    def age(self, now: Optional[float] = None) -> float:
+        return (time.time() if now is None else now) - self.timestamp
+
+    def as_list(self) -> List[ContainerEntry]:
+        """Return shallow copies of the entries, safe for callers to mutate."""
+        return [dict(entry) for entry in self.containers]
+
+
+class ContainerSnapshotProvider:
+    """Process-wide owner of the container list snapshot."""
+
+    def __init__(self, fetcher: Optional[Callable[[], List[ContainerEntry]]] = None,
+                 status_runtime: Any = None):
+        self._fetcher = fetcher or _fetch_from_daemon
+        self._status_runtime = status_runtime
+        self._snapshot: Optional[ContainerSnapshot] = None
+        self._lock = threading.Lock()
+        self._refresh_lock = threading.Lock()
+        self._daemon_queries = 0
+        self._published = 0
+
+    # ------------------------------------------------------------------
+    # Publication
+    # ------------------------------------------------------------------
+    def publish(self, containers: Iterable[ContainerEntry], timestamp: Optional[float] = None,
+                source: str = "bot") -> ContainerSnapshot:
+        """Store a container list fetched elsewhere (e.g. by the bot)."""
+        snapshot = ContainerSnapshot(
+            containers=tuple(dict(entry) for entry in containers),
+            timestamp=time.time() if timestamp is None else timestamp,
+            source=source,
+        )
+        with self._lock:
+            # Never replace newer data with an older query that finished late
+            if self._snapshot is None or snapshot.timestamp >= self._snapshot.timestamp:
+                self._snapshot = snapshot
+                self._published += 1
+            else:
+                snapshot = self._snapshot
+        return snapshot
+
+    def clear(self) -> None:
+        with self._lock:
+            self._snapshot = None
+
+    # ------------------------------------------------------------------
+    # Reads
+    # ------------------------------------------------------------------
+    def current(self, max_age: Optional[float] = None) -> Optional[ContainerSnapshot]:
+        """Return the reconciled snapshot, or ``None`` if missing or older than ``max_age``."""
+        with self._lock:
+            snapshot = self._snapshot
+        if snapshot is None or (max_age is not None and snapshot.age() > max_age):
+            return None
+        return self._reconcile(snapshot)
+
+    def get(self, max_age: float) -> ContainerSnapshot:
+        """Return a snapshot no older than ``max_age`` seconds, querying the daemon if needed.
+
+        Only one caller queries the daemon at a time; callers arriving while a
+        query is running wait for it and reuse its result.
+
+        Raises:
+            docker.errors.DockerException: If the daemon query fails.
+        """
+        snapshot = self.current(max_age)
+        if snapshot is not None:
+            return snapshot
+
+        with self._refresh_lock:
+            # Another thread may have refreshed while we waited for the lock
+            snapshot = self.current(max_age)
+            if snapshot is not None:
+                return snapshot
+
+            started = time.time()
+            containers = self._fetcher()
+            with self._lock:
+                self._daemon_queries += 1
+            logger.debug(f"Container snapshot refreshed from daemon ({len(containers)} containers)")
+            return self._reconcile(self.publish(containers, timestamp=started, source="daemon"))
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            snapshot = self._snapshot
+            return {
+                'daemon_queries': self._daemon_queries,
+                'published': self._published,
+                'containers': len(snapshot.containers) if snapshot else 0,
+                'age_seconds': snapshot.age() if snapshot else None,
+                'source': snapshot.source if snapshot else None,
+            }
+
+    # ------------------------------------------------------------------
+    # Status runtime reconciliation
+    # ------------------------------------------------------------------
+    def _get_status_runtime(self):
+        if self._status_runtime is None:
+            from services.docker_service.status_cache_runtime import get_docker_status_cache_runtime
+            return get_docker_status_cache_runtime()
+        return self._status_runtime
+
+    def _reconcile(self, snapshot: ContainerSnapshot) -> ContainerSnapshot:
+        """Apply running state the bot observed after ``snapshot`` was taken."""
+        try:
+            live_states = dict(self._get_status_runtime().items())
+        except (RuntimeError, AttributeError, TypeError) as e:
+            logger.debug(f"Status runtime unavailable for snapshot reconciliation: {e}")
+            return snapshot
+        if not live_states:
+            return snapshot
+
+        changed = False
+        containers = []
+        for entry in snapshot.containers:
+            is_running = _newer_running_state(live_states.get(entry.get('name')), snapshot.timestamp)
+            if is_running is not None and is_running != (entry.get('status') == 'running'):
+                entry = dict(entry, status='running' if is_running else 'exited', running=is_running)
+                changed = True
+            containers.append(entry)
+        return replace(snapshot, containers=tuple(containers)) if changed else snapshot
+
+
+def _newer_running_state(status_entry: Any, snapshot_ts: float) -> Optional[bool]:
+    """Extract ``is_running`` from a bot status cache entry newer than ``snapshot_ts``."""
+    if not isinstance(status_entry, dict):
+        return None
+    data = status_entry.get('data')
+    timestamp = status_entry.get('timestamp')
+    if data is None or not isinstance(timestamp, datetime):
+        return None
+    if timestamp.timestamp() <= snapshot_ts:
+        return None
+    # Entries are either ContainerStatusResult objects or legacy tuples
+    # (display_name, is_running, cpu, ram, uptime, details_allowed)
+    if hasattr(data, 'is_running'):
+        if getattr(data, 'success', True) is False:
+            return None
+        return bool(data.is_running)
+    if isinstance(data, (tuple, list)) and len(data) > 1 and isinstance(data[1], bool):
+        return data[1]
+    return None
+
+
+_provider: Optional[ContainerSnapshotProvider] = None
+_provider_lock = threading.Lock()
+
+
+def get_container_snapshot_provider() -> ContainerSnapshotProvider:
+    """Return the singleton :class:`ContainerSnapshotProvider` instance."""
+    global _provider
+    if _provider is None:
+        with _provider_lock:
+            if _provider is None:
+                _provider = ContainerSnapshotProvider()
+    return _provider
+
+
+def reset_container_snapshot_provider() -> None:
+    """Reset the cached provider instance (useful for tests)."""
+    global _provider
+    _provider = None
@@ -173,6 +173,10 @@ class DockerActionService:
                     container_status_service.invalidate_container(request.container_name)
                     self.logger.debug(f"Invalidated ContainerStatusService cache for {request.container_name}")
 
+                    # 3. GameQueryService: resolved query target / winning port may change on restart
+                    from services.infrastructure.game_query_service import get_game_query_service
+                    get_game_query_service().forget_container(request.container_name)
+
                 except (AttributeError, ImportError, KeyError, ModuleNotFoundError, RuntimeError, TypeError, docker.errors.APIError, docker.errors.DockerException) as e:
                     # Don't fail the action if cache invalidation fails
                     self.logger.warning(f"Failed to invalidate cache for {request.container_name}: {e}")
@@ -19,6 +19,8 @@ from typing import Optional
 from contextlib import asynccontextmanager
 from dataclasses import dataclass, replace
 
+from utils.observability import metrics
+
 # Import custom exceptions
 from services.exceptions import (
     DockerServiceError, DockerConnectionError, DockerCommandTimeoutError,
@@ -161,6 +163,7 @@ class DockerClientService:
 
             # Update pool statistics
             queue_size = self._queue.qsize()
+            metrics.gauge("docker.client_pool.queue_depth", queue_size)
             self._queue_stats['total_requests'] += 1
 
             # Try immediate acquisition first (fast path)
@@ -388,6 +391,7 @@ class DockerClientService:
 
         # Update queue stats
         queue_size = self._queue.qsize()
+        metrics.gauge("docker.client_pool.queue_depth", queue_size)
         self._queue_stats['total_requests'] += 1
         self._queue_stats['queued_requests'] = queue_size + 1
         self._queue_stats['max_queue_size'] = max(
@@ -11,12 +11,12 @@ Docker utilities for container management
 
 import asyncio
 import logging
-from datetime import datetime, timezone
 from pathlib import Path
 from typing import Tuple, Optional, Dict, Any, List
 import docker
 import docker.client
 from utils.logging_utils import setup_logger
+from utils.observability import metrics
 import time
 import os
 import json
@@ -27,6 +27,7 @@ from services.exceptions import (
     DockerServiceError, DockerConnectionError, DockerCommandTimeoutError,
     ContainerNotFoundError, ContainerActionError, ConfigLoadError
 )
+from .container_snapshot import get_container_snapshot_provider, normalize_container_list
 
 # Logger for Docker utils
 logger = setup_logger('ddc.docker_utils', level=logging.INFO)
@@ -529,6 +530,7 @@ async def get_docker_stats(docker_container_name: str) -> Tuple[Optional[str], O
                 logger.debug(f"[get_docker_stats] {docker_container_name}: container.stats() took {stats_time:.1f}ms")
 
                 elapsed_time = (time.time() - start_time) * 1000
+                metrics.histogram("docker.fetch.stats.duration_ms", (time.time() - overall_start) * 1000)
                 if elapsed_time > 5000:  # Over 5 seconds - informational only
                     logger.info(f"Long stats call for {docker_container_name}: {elapsed_time:.1f}ms (but got real data)")
                 elif elapsed_time > 2000:  # Over 2 seconds
@@ -609,6 +611,7 @@ async def get_docker_info(docker_container_name: str) -> Optional[Dict[str, Any]
             )
             api_time = (time.time() - api_start) * 1000
             total_time = (time.time() - start_time) * 1000
+            metrics.histogram("docker.fetch.info.duration_ms", total_time)
 
             logger.debug(f"[get_docker_info] {docker_container_name}: API call took {api_time:.1f}ms, total {total_time:.1f}ms")
             return container.attrs
@@ -735,52 +738,30 @@ async def get_containers_data() -> List[Dict[str, Any]]:
             logger.debug("Using cached container data")
             return _containers_cache.copy()  # Return copy to avoid modification
 
+    # Reuse a list the Web UI fetched recently instead of querying the daemon again
+    snapshot_provider = get_container_snapshot_provider()
+    snapshot = snapshot_provider.current(max_age=_CACHE_TTL)
+    if snapshot is not None:
+        logger.debug(f"Using shared container snapshot (source: {snapshot.source}, age: {snapshot.age():.1f}s)")
+        shared_result = snapshot.as_list()
+        with _containers_cache_lock:
+            _containers_cache = shared_result
+            _cache_timestamp = snapshot.timestamp
+        return shared_result.copy()
+
     try:
         # 🔧 PERFORMANCE: Use Advanced Settings timeout (DDC_FAST_LIST_TIMEOUT) for container data retrieval
         async with get_docker_client_async(operation='list') as client:
+            list_start = time.time()
             containers_api_list = await asyncio.to_thread(client.api.containers, all=True, Lstat=True) # Use low-level API for more resilience
-            result = []
-            for c_data in containers_api_list:
-                try:
-                    name = (c_data.get('Names') or ['N/A'])[0].lstrip('/') # Names can be a list
-                    status = c_data.get('State', 'unknown').lower()
-                    is_running = status == "running"
-                    image_name = c_data.get('Image', 'N/A')
-                    if '@sha256:' in image_name: # often image name is with digest
-                        image_name = image_name.split('@sha256:')[0]
-
-                    container_info = {
-                        "id": c_data.get('Id', 'N/A')[:12],
-                        "name": name,
-                        "status": status,
-                        "running": is_running,
-                        "image": image_name,
-                        "created": datetime.fromtimestamp(c_data.get('Created', 0), timezone.utc).isoformat() if c_data.get('Created') else "N/A",
-                    }
-                    if is_running:
-                        ports_info = c_data.get("Ports", {})
-                        container_info["ports"] = ports_info
-                        state_detail = c_data.get("State", {})
-                        if state_detail:
-                            container_info["started_at"] = state_detail.get("StartedAt", "")
-                            # Health status is not directly in low-level API list, would need inspect
-                            # container_info["health"] = "unknown"
-                    result.append(container_info)
-                except (AttributeError, KeyError, ValueError, TypeError) as e_inner:
-                    logger.warning(f"Error processing individual container data for {c_data.get('Id', 'unknown_id')}: {e_inner}")
-                    result.append({
-                        "id": c_data.get('Id', 'unknown_id')[:12],
-                        "name": (c_data.get('Names') or ['error'])[0].lstrip('/'),
-                        "status": "error_processing",
-                        "running": False,
-                        "error": str(e_inner)
-                    })
-            sorted_result = sorted(result, key=lambda x: x.get("name", "").lower())
+            metrics.histogram("docker.fetch.list.duration_ms", (time.time() - list_start) * 1000)
+            sorted_result = normalize_container_list(containers_api_list)
 
             # Thread-safe cache update
             with _containers_cache_lock:
                 _containers_cache = sorted_result
                 _cache_timestamp = current_time
+            snapshot_provider.publish(sorted_result, timestamp=current_time, source="bot")
 
             return sorted_result
     except (docker.errors.DockerException, asyncio.TimeoutError, OSError, RuntimeError) as e:
@@ -18,6 +18,7 @@ from typing import Tuple, Any, Dict
 from services.infrastructure.container_status_service import get_docker_info_dict_service_first, get_docker_stats_service_first
 from services.docker_status import get_performance_service
 from utils.logging_utils import get_module_logger
+from utils.observability import metrics
 
 logger = get_module_logger('docker_fetch_service')
 
@@ -90,6 +91,7 @@ class DockerStatusFetchService:
                     perf_service.update_performance(docker_name, attempt_time, True)
 
                     total_time = (time.time() - start_time) * 1000
+                    metrics.histogram("docker.fetch.container.duration_ms", total_time)
                     if attempt > 0:
                         logger.info(f"Successfully fetched {docker_name} on attempt {attempt + 1} "
                                   f"(attempt: {attempt_time:.1f}ms, total: {total_time:.1f}ms)")
@@ -10,10 +10,11 @@ Donation Management Service - Clean service architecture for donation administra
 """
 
 from typing import List, Dict, Any, Optional
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass
 import json
 from utils.logging_utils import get_module_logger
 
+from services.donation.donation_projection import get_donation_projection
 from services.mech.progress_paths import get_progress_paths
 
 logger = get_module_logger('donation_management_service')
@@ -44,6 +45,21 @@ class DonationStats:
             average_donation=average_donation
         )
 
+    @classmethod
+    def from_summary(cls, summary: Dict[str, Any]) -> 'DonationStats':
+        """Create DonationStats from a donation projection summary.
+
+        Power counts ALL donation types (PowerGift, ExactHitBonus, ...), minus
+        deletions; only actual donations are counted, not deletions.
+        """
+        total_power = summary['total_power']
+        total_count = summary['entry_count']
+        return cls(
+            total_power=total_power,
+            total_donations=total_count,
+            average_donation=total_power / total_count if total_count > 0 else 0.0
+        )
+
 class DonationManagementService:
     """Clean service for managing donation administration with proper separation of concerns."""
 
@@ -55,10 +71,10 @@ class DonationManagementService:
         """Get donation history with statistics using MechService.
 
         Args:
-            limit: Maximum number of donations to return
+            limit: Maximum number of display rows to return (newest first)
 
         Returns:
-            ServiceResult with donation data and stats
+            ServiceResult with donation data, the total row count and stats
         """
         try:
             from services.mech.mech_service import get_mech_service, GetMechStateRequest
@@ -81,138 +97,18 @@ class DonationManagementService:
                     self.level = result.level
             mech_state = MechStateCompat(mech_state_result)
 
-            # Get donations AND deletions directly from Progress Service Event Log
-            all_events = []
-            event_log = get_progress_paths().event_log
-
-            if event_log.exists():
-                with open(event_log, 'r', encoding='utf-8') as f:
-                    for line in f:
-                        if not line.strip():
-                            continue
-                        event = json.loads(line)
-                        # Include ALL donation types for transparency
-                        if event.get('type') in ['DonationAdded', 'DonationDeleted', 'PowerGiftGranted', 'SystemDonationAdded', 'ExactHitBonusGranted']:
-                            all_events.append(event)
-
-            # Build nested structure: Donations with their deletion events
-            donations_map = {}  # seq -> donation data
-            deletions_map = {}  # deleted_seq -> deletion event
-
-            for event in all_events:
-                event_type = event.get('type')
-
-                if event_type == 'DonationAdded':
-                    seq = event.get('seq')
-                    payload = event.get('payload', {})
-                    donations_map[seq] = {
-                        'seq': seq,
-                        'donor_name': payload.get('donor', 'Anonymous'),
-                        'amount': payload.get('units', 0) / 100.0,  # cents → dollars
-                        'timestamp': event.get('ts', ''),
-                        'donation_type': 'manual',
-                        'is_deleted': False,
-                        'deletion_events': []  # List of deletion events for this donation
-                    }
-                elif event_type == 'PowerGiftGranted':
-                    seq = event.get('seq')
-                    payload = event.get('payload', {})
-                    campaign = payload.get('campaign_id', '')
-                    # Show appropriate name based on campaign
-                    if 'startup' in campaign.lower():
-                        gift_name = '🎁 Welcome Gift'
-                    else:
-                        gift_name = '🎁 Power Gift'
-                    donations_map[seq] = {
-                        'seq': seq,
-                        'donor_name': gift_name,
-                        'amount': payload.get('power_units', 0) / 100.0,  # cents → dollars
-                        'timestamp': event.get('ts', ''),
-                        'donation_type': 'power_gift',
-                        'is_deleted': False,
-                        'deletion_events': []
-                    }
-                elif event_type == 'SystemDonationAdded':
-                    seq = event.get('seq')
-                    payload = event.get('payload', {})
-                    donations_map[seq] = {
-                        'seq': seq,
-                        'donor_name': f"🤖 {payload.get('event_name', 'System Event')}",
-                        'amount': payload.get('power_units', 0) / 100.0,  # cents → dollars
-                        'timestamp': event.get('ts', ''),
-                        'donation_type': 'system',
-                        'is_deleted': False,
-                        'deletion_events': []
-                    }
-                elif event_type == 'ExactHitBonusGranted':
-                    seq = event.get('seq')
-                    payload = event.get('payload', {})
-                    from_level = payload.get('from_level', '?')
-                    to_level = payload.get('to_level', '?')
-                    donations_map[seq] = {
-                        'seq': seq,
-                        'donor_name': f"🎯 Exact Hit Bonus (Level {from_level} → {to_level})",
-                        'amount': payload.get('power_units', 0) / 100.0,  # cents → dollars
-                        'timestamp': event.get('ts', ''),
-                        'donation_type': 'exact_hit_bonus',
-                        'is_deleted': False,
-                        'deletion_events': []
-                    }
-                elif event.get('type') == 'DonationDeleted':
-                    deleted_seq = event.get('payload', {}).get('deleted_seq')
-                    if deleted_seq:
-                        deletion_event = {
-                            'seq': event.get('seq'),
-                            'deleted_seq': deleted_seq,
-                            'donor_name': event.get('payload', {}).get('donor', 'Unknown'),
-                            'amount': event.get('payload', {}).get('units', 0) / 100.0,
-                            'timestamp': event.get('ts', ''),
-                            'reason': event.get('payload', {}).get('reason', 'admin_deletion'),
-                            'donation_type': 'deletion',
-                            'is_deletion': True
-                        }
-                        # Track deletion by deleted_seq
-                        if deleted_seq not in deletions_map:
-                            deletions_map[deleted_seq] = []
-                        deletions_map[deleted_seq].append(deletion_event)
-
-            # Mark deleted donations using toggle pattern (odd count = deleted, even = active)
-            for deleted_seq, deletion_events in deletions_map.items():
-                if deleted_seq in donations_map:
-                    # Toggle: odd number of deletion events = currently deleted
-                    donations_map[deleted_seq]['is_deleted'] = len(deletion_events) % 2 == 1
-                    donations_map[deleted_seq]['deletion_events'] = deletion_events
-
-            # Convert to flat list for display (newest first, with nested deletions)
-            donations = []
-            for seq in reversed(sorted(donations_map.keys())):  # Newest first
-                donation = donations_map[seq]
-                donations.append(donation)
-                # Add deletion events right after the donation (indented)
-                for deletion in donation['deletion_events']:
-                    donations.append(deletion)
-
-            # Calculate total power from ALL events (including PowerGift, ExactHitBonus, etc.)
-            total_power = 0.0
-            for donation in donations_map.values():
-                if not donation.get('is_deleted', False):
-                    total_power += donation['amount']
-
-            total_count = len(donations_map)  # Only count actual donations, not deletions
-
-            # Create stats with power calculated from ALL donation types
-            stats = DonationStats(
-                total_power=total_power,
-                total_donations=total_count,
-                average_donation=total_power / total_count if total_count > 0 else 0.0
-            )
+            # Read from the incrementally maintained projection of the event log
+            projection = get_donation_projection(get_progress_paths().event_log)
+            donations, total = projection.query(limit=limit)
+            stats = DonationStats.from_summary(projection.summary())
 
             result_data = {
                 'donations': donations,
+                'total': total,
                 'stats': stats
             }
 
-            logger.debug(f"Retrieved {len(donations)} donations with total power: ${total_power:.2f}")
+            logger.debug(f"Retrieved {len(donations)}/{total} donations with total power: ${stats.total_power:.2f}")
             return ServiceResult(success=True, data=result_data)
 
         except (IOError, OSError) as e:
@@ -231,6 +127,79 @@ class DonationManagementService:
             logger.error(error_msg, exc_info=True)
             return ServiceResult(success=False, error=error_msg)
 
+    def get_donation_page(self, offset: int = 0, limit: int = 50, donor: Optional[str] = None,
+                          donation_type: Optional[str] = None, since: Optional[str] = None,
+                          until: Optional[str] = None) -> ServiceResult:
+        """Get one page of the donation display list, optionally filtered.
+
+        Args:
+            offset: Number of display rows to skip (newest first)
+            limit: Maximum number of display rows to return
+            donor: Exact donor name filter
+            donation_type: Donation type filter (manual, power_gift, system, exact_hit_bonus)
+            since: Inclusive lower bound on the ISO timestamp
+            until: Exclusive upper bound on the ISO timestamp
+
+        Returns:
+            ServiceResult with the page of donations, the total row count and
+            the (unfiltered) donation stats
+        """
+        try:
+            if offset < 0 or limit < 0:
+                raise ValueError("offset and limit must not be negative")
+
+            projection = get_donation_projection(get_progress_paths().event_log)
+            donations, total = projection.query(
+                offset=offset, limit=limit, donor=donor,
+                donation_type=donation_type, since=since, until=until
+            )
+            return ServiceResult(success=True, data={
+                'donations': donations,
+                'total': total,
+                'offset': offset,
+                'limit': limit,
+                'stats': asdict(DonationStats.from_summary(projection.summary()))
+            })
+
+        except (IOError, OSError) as e:
+            # File I/O errors (event log access)
+            error_msg = f"Error reading donation event log: {e}"
+            logger.error(error_msg, exc_info=True)
+            return ServiceResult(success=False, error=error_msg)
+        except ValueError as e:
+            # Invalid paging arguments or JSON parsing errors (JSONDecodeError is a ValueError)
+            error_msg = f"Error querying donation page: {e}"
+            logger.error(error_msg, exc_info=True)
+            return ServiceResult(success=False, error=error_msg)
+
+    def get_donation_aggregates(self, period: str = 'month') -> ServiceResult:
+        """Get per-donor totals and time-bucketed totals of active donations.
+
+        Args:
+            period: Bucket size, ``'day'`` or ``'month'``
+
+        Returns:
+            ServiceResult with ``donors`` and ``buckets`` dictionaries
+        """
+        try:
+            projection = get_donation_projection(get_progress_paths().event_log)
+            return ServiceResult(success=True, data={
+                'donors': projection.donor_totals(),
+                'buckets': projection.buckets(period),
+                'period': period
+            })
+
+        except (IOError, OSError) as e:
+            # File I/O errors (event log access)
+            error_msg = f"Error reading donation event log: {e}"
+            logger.error(error_msg, exc_info=True)
+            return ServiceResult(success=False, error=error_msg)
+        except ValueError as e:
+            # Unsupported period or JSON parsing errors
+            error_msg = f"Error computing donation aggregates: {e}"
+            logger.error(error_msg, exc_info=True)
+            return ServiceResult(success=False, error=error_msg)
+
     def delete_donation(self, index: int) -> ServiceResult:
         """
         Delete a donation OR restore a deleted donation using Event Sourcing compensation events.
@@ -248,66 +217,18 @@ class DonationManagementService:
             ServiceResult with success status
         """
         try:
-            # Get ALL events from event log (same logic as list_donations to get matching indices)
-            all_events = []
             event_log = get_progress_paths().event_log
 
             if not event_log.exists():
                 return ServiceResult(success=False, error="Event log not found")
 
-            with open(event_log, 'r', encoding='utf-8') as f:
-                for line in f:
-                    if not line.strip():
-                        continue
-                    event = json.loads(line)
-                    # Load ALL donation types (same as get_donation_history)
-                    if event.get('type') in ['DonationAdded', 'DonationDeleted', 'PowerGiftGranted', 'SystemDonationAdded', 'ExactHitBonusGranted']:
-                        all_events.append(event)
-
-            # Build the same nested structure as list_donations
-            donations_map = {}
-            deletions_map = {}
-
-            for event in all_events:
-                event_type = event.get('type')
-                if event_type in ['DonationAdded', 'PowerGiftGranted', 'SystemDonationAdded', 'ExactHitBonusGranted']:
-                    seq = event.get('seq')
-                    donations_map[seq] = {
-                        'seq': seq,
-                        'type': event_type,
-                        'deletion_events': []
-                    }
-                elif event_type == 'DonationDeleted':
-                    deleted_seq = event.get('payload', {}).get('deleted_seq')
-                    if deleted_seq:
-                        deletion_event = {
-                            'seq': event.get('seq'),
-                            'deleted_seq': deleted_seq,
-                            'type': 'DonationDeleted'
-                        }
-                        if deleted_seq not in deletions_map:
-                            deletions_map[deleted_seq] = []
-                        deletions_map[deleted_seq].append(deletion_event)
-
-            # Attach deletion events to donations
-            for deleted_seq, deletion_events in deletions_map.items():
-                if deleted_seq in donations_map:
-                    donations_map[deleted_seq]['deletion_events'] = deletion_events
-
-            # Build flat display list (same as UI)
-            display_list = []
-            for seq in reversed(sorted(donations_map.keys())):
-                display_list.append(donations_map[seq])
-                for deletion in donations_map[seq]['deletion_events']:
-                    display_list.append(deletion)
-
-            # Check if index is valid
-            if index < 0 or index >= len(display_list):
+            # Same newest-first display list the Web UI renders, so indices match
+            item = get_donation_projection(event_log).get_display_item(index)
+            if item is None:
                 return ServiceResult(success=False, error=f"Invalid index: {index}")
 
-            item = display_list[index]
             item_seq = item['seq']
-            item_type = item['type']
+            item_type = item['event_type']
 
             # Call progress service to delete
             from services.mech.progress_service import get_progress_service
@@ -382,41 +303,11 @@ class DonationManagementService:
                     data=None
                 )
 
-            # Get ALL donations directly from Progress Service Event Log
-            donations_map = {}
-            deletions_map = {}
-            event_log = get_progress_paths().event_log
-
-            if event_log.exists():
-                with open(event_log, 'r', encoding='utf-8') as f:
-                    for line in f:
-                        if not line.strip():
-                            continue
-                        event = json.loads(line)
-                        event_type = event.get('type')
-
-                        # Include ALL donation types
-                        if event_type in ['DonationAdded', 'PowerGiftGranted', 'SystemDonationAdded', 'ExactHitBonusGranted']:
-                            seq = event.get('seq')
-                            payload = event.get('payload', {})
-                            amount_key = 'units' if event_type == 'DonationAdded' else 'power_units'
-                            donations_map[seq] = {
-                                'amount': payload.get(amount_key, 0) / 100.0,
-                                'is_deleted': False
-                            }
-                        elif event_type == 'DonationDeleted':
-                            deleted_seq = event.get('payload', {}).get('deleted_seq')
-                            if deleted_seq:
-                                deletions_map[deleted_seq] = deletions_map.get(deleted_seq, 0) + 1
-
-            # Mark deleted donations using toggle pattern (odd count = deleted)
-            for deleted_seq, count in deletions_map.items():
-                if deleted_seq in donations_map:
-                    donations_map[deleted_seq]['is_deleted'] = count % 2 == 1
+            summary = get_donation_projection(get_progress_paths().event_log).summary()
 
             # Calculate total power from ALL event types (excluding deleted)
-            total_power = sum(d['amount'] for d in donations_map.values() if not d['is_deleted'])
-            total_count = sum(1 for d in donations_map.values() if not d['is_deleted'])
+            total_power = summary['total_power']
+            total_count = summary['active_count']
 
             stats = DonationStats(
                 total_power=total_power,
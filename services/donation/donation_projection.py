@@ -0,0 +1,441 @@
+# -*- coding: utf-8 -*-
+# ============================================================================ #
+# DockerDiscordControl (DDC)                                                  #
+# https://ddc.bot                                                              #
+# Copyright (c) 2026 MAX                                                       #
+# Licensed under the MIT License                                               #
+# ============================================================================ #
+"""
+Donation Projection - incrementally maintained read model of the mech event log.
+
+The projection keeps the donation list, per-donor totals and daily/monthly
+aggregates in memory. Each query ``stat()``s the event log and only parses the
+bytes appended since the last query, so page loads stay constant-time as the
+log grows. The state is checkpointed next to the event log so a restarted
+process can resume from the last consumed byte offset instead of replaying
+everything.
+"""
+
+from __future__ import annotations
+
+import bisect
+import json
+import os
+import tempfile
+import threading
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from utils.logging_utils import get_module_logger
+
+logger = get_module_logger('donation_projection')
+
+DONATION_EVENT_TYPES = frozenset({
+    'DonationAdded', 'PowerGiftGranted', 'SystemDonationAdded', 'ExactHitBonusGranted'
+})
+DELETION_EVENT_TYPE = 'DonationDeleted'
+
+CHECKPOINT_FILENAME = 'donation_projection.json'
+CHECKPOINT_VERSION = 1
+
+# Bytes just before the consumed offset; used to detect a rewritten/reset log
+PROBE_BYTES = 64
+
+
+def _donation_row(event: Dict[str, Any]) -> Dict[str, Any]:
+    """Build the display row for a donation-type event."""
+    event_type = event.get('type')
+    payload = event.get('payload', {})
+
+    if event_type == 'DonationAdded':
+        donor_name = payload.get('donor', 'Anonymous')
+        units = payload.get('units', 0)
+        donation_type = 'manual'
+    elif event_type == 'PowerGiftGranted':
+        campaign = payload.get('campaign_id', '')
+        # Show appropriate name based on campaign
+        donor_name = '🎁 Welcome Gift' if 'startup' in campaign.lower() else '🎁 Power Gift'
+        units = payload.get('power_units', 0)
+        donation_type = 'power_gift'
+    elif event_type == 'SystemDonationAdded':
+        donor_name = f"🤖 {payload.get('event_name', 'System Event')}"
+        units = payload.get('power_units', 0)
+        donation_type = 'system'
+    else:  # ExactHitBonusGranted
+        from_level = payload.get('from_level', '?')
+        to_level = payload.get('to_level', '?')
+        donor_name = f"🎯 Exact Hit Bonus (Level {from_level} → {to_level})"
+        units = payload.get('power_units', 0)
+        donation_type = 'exact_hit_bonus'
+
+    return {
+        'seq': event.get('seq'),
+        'event_type': event_type,
+        'donor_name': donor_name,
+        'units': units,
+        'amount': units / 100.0,  # cents → dollars
+        'timestamp': event.get('ts', ''),
+        'donation_type': donation_type,
+        'is_deleted': False,
+        'deletion_events': []
+    }
+
+
+def _deletion_row(event: Dict[str, Any], deleted_seq: int) -> Dict[str, Any]:
+    """Build the display row for a DonationDeleted event."""
+    payload = event.get('payload', {})
+    return {
+        'seq': event.get('seq'),
+        'deleted_seq': deleted_seq,
+        'donor_name': payload.get('donor', 'Unknown'),
+        'amount': payload.get('units', 0) / 100.0,
+        'timestamp': event.get('ts', ''),
+        'reason': payload.get('reason', 'admin_deletion'),
+        'donation_type': 'deletion',
+        'is_deletion': True
+    }
+
+
+def _public_row(row: Dict[str, Any]) -> Dict[str, Any]:
+    """Copy a stored donation row into the shape the Web UI expects."""
+    public = {k: v for k, v in row.items() if k not in ('units', 'event_type')}
+    public['deletion_events'] = list(row['deletion_events'])
+    return public
+
+
+class DonationProjection:
+    """Incrementally maintained donation read model for one event log file."""
+
+    def __init__(self, event_log: Path, checkpoint_path: Optional[Path] = None):
+        self.event_log = Path(event_log)
+        self.checkpoint_path = checkpoint_path or self.event_log.with_name(CHECKPOINT_FILENAME)
+        self._lock = threading.RLock()
+        self._reset()
+        self._load_checkpoint()
+
+    # ------------------------------------------------------------------
+    # State management
+    # ------------------------------------------------------------------
+
+    def _reset(self) -> None:
+        self._offset = 0
+        self._probe = b''
+        self._rows: Dict[int, Dict[str, Any]] = {}
+        self._order: List[int] = []  # donation seqs, ascending
+        self._deletions: Dict[int, List[Dict[str, Any]]] = {}
+        self._display_count = 0
+        self._active_units = 0
+        self._active_count = 0
+        self._donors: Dict[str, Dict[str, int]] = {}
+        self._buckets: Dict[str, Dict[str, Dict[str, int]]] = {'day': {}, 'month': {}}
+
+    def _contribute(self, row: Dict[str, Any], sign: int) -> None:
+        """Add (``sign=1``) or remove (``sign=-1``) an active row from the aggregates."""
+        units = row['units']
+        self._active_units += sign * units
+        self._active_count += sign
+
+        donor = self._donors.setdefault(row['donor_name'], {'total_units': 0, 'count': 0})
+        donor['total_units'] += sign * units
+        donor['count'] += sign
+        if donor['count'] == 0:
+            del self._donors[row['donor_name']]
+
+        timestamp = row['timestamp'] or ''
+        for period, key in (('day', timestamp[:10]), ('month', timestamp[:7])):
+            if not key:
+                continue
+            bucket = self._buckets[period].setdefault(key, {'total_units': 0, 'count': 0})
+            bucket['total_units'] += sign * units
+            bucket['count'] += sign
+            if bucket['count'] == 0:
+                del self._buckets[period][key]
+
+    def _apply(self, event: Dict[str, Any]) -> None:
+        """Fold a single event into the projection."""
+        event_type = event.get('type')
+
+        if event_type in DONATION_EVENT_TYPES:
+            seq = event.get('seq')
+            previous = self._rows.get(seq)
+            if previous is not None:
+                # Duplicate seq: the later event wins, as in a full replay
+                if not previous['is_deleted']:
+                    self._contribute(previous, -1)
+                self._display_count -= 1 + len(previous['deletion_events'])
+            else:
+                bisect.insort(self._order, seq)
+
+            row = _donation_row(event)
+            deletions = self._deletions.get(seq, [])
+            row['deletion_events'] = deletions
+            row['is_deleted'] = len(deletions) % 2 == 1
+            self._rows[seq] = row
+            self._display_count += 1 + len(deletions)
+            if not row['is_deleted']:
+                self._contribute(row, 1)
+
+        elif event_type == DELETION_EVENT_TYPE:
+            deleted_seq = event.get('payload', {}).get('deleted_seq')
+            if not deleted_seq:
+                return
+            deletions = self._deletions.setdefault(deleted_seq, [])
+            deletions.append(_deletion_row(event, deleted_seq))
+
+            row = self._rows.get(deleted_seq)
+            if row is not None:
+                row['deletion_events'] = deletions
+                self._display_count += 1
+                # Toggle pattern: odd number of deletion events = currently deleted
+                row['is_deleted'] = not row['is_deleted']
+                self._contribute(row, -1 if row['is_deleted'] else 1)
+
+    # ------------------------------------------------------------------
+    # Event log tailing
+    # ------------------------------------------------------------------
+
+    def _read_probe(self, f, offset: int) -> bytes:
+        start = max(0, offset - PROBE_BYTES)
+        f.seek(start)
+        return f.read(offset - start)
+
+    def refresh(self) -> None:
+        """
+        Consume any complete events appended to the log since the last call.
+
+        A trailing line without its newline is left for the next call. Rebuilds from scratch if the log shrank or its already-consumed bytes
+        changed (e.g. after a donation reset).
+
+        Raises:
+            OSError: If the event log cannot be read
+            json.JSONDecodeError: If an appended line is not valid JSON
+        """
+        with self._lock:
+            if not self.event_log.exists():
+                if self._offset:
+                    self._reset()
+                return
+
+            size = self.event_log.stat().st_size
+            with open(self.event_log, 'rb') as f:
+                if size < self._offset or self._read_probe(f, self._offset) != self._probe:
+                    logger.info("Donation event log was rewritten, rebuilding projection")
+                    self._reset()
+
+                if size == self._offset:
+                    return
+
+                f.seek(self._offset)
+                chunk = f.read(size - self._offset)
+
+            # A line still being appended has no newline yet; leave it for the next refresh
+            chunk = chunk[:chunk.rfind(b'\n') + 1]
+            if not chunk:
+                return
+
+            applied = 0
+            try:
+                for line in chunk.splitlines():
+                    if not line.strip():
+                        continue
+                    event = json.loads(line)
+                    if event.get('type') in DONATION_EVENT_TYPES or event.get('type') == DELETION_EVENT_TYPE:
+                        self._apply(event)
+                        applied += 1
+            except ValueError:
+                # Partially applied chunk: start over on the next refresh
+                self._reset()
+                raise
+
+            self._offset += len(chunk)
+            self._probe = (self._probe + chunk)[-PROBE_BYTES:]
+
+            if applied:
+                logger.debug(f"Donation projection applied {applied} new events (offset {self._offset})")
+                self._save_checkpoint()
+
+    # ------------------------------------------------------------------
+    # Checkpointing
+    # ------------------------------------------------------------------
+
+    def _save_checkpoint(self) -> None:
+        """Persist the projection atomically; failures only cost a replay on restart."""
+        data = {
+            'version': CHECKPOINT_VERSION,
+            'offset': self._offset,
+            'probe': self._probe.hex(),
+            'rows': [self._rows[seq] for seq in self._order],
+            'orphan_deletions': {
+                str(seq): deletions for seq, deletions in self._deletions.items()
+                if seq not in self._rows
+            },
+        }
+        try:
+            temp_fd, temp_path = tempfile.mkstemp(
+                dir=self.checkpoint_path.parent,
+                prefix=f".{self.checkpoint_path.name}.",
+                suffix=".tmp"
+            )
+            try:
+                with os.fdopen(temp_fd, 'w', encoding='utf-8') as f:
+                    json.dump(data, f, separators=(',', ':'))
+                os.replace(temp_path, self.checkpoint_path)
+            except (OSError, TypeError, ValueError):
+                try:
+                    os.unlink(temp_path)
+                except OSError:
+                    pass
+                raise
+        except (OSError, TypeError, ValueError) as e:
+            logger.debug(f"Could not write donation projection checkpoint: {e}")
+
+    def _load_checkpoint(self) -> None:
+        """Resume from the checkpoint if it still matches the event log."""
+        try:
+            if not self.checkpoint_path.exists() or not self.event_log.exists():
+                return
+            with open(self.checkpoint_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get('version') != CHECKPOINT_VERSION:
+                return
+
+            offset = int(data['offset'])
+            probe = bytes.fromhex(data['probe'])
+            if self.event_log.stat().st_size < offset:
+                return
+            with open(self.event_log, 'rb') as f:
+                if self._read_probe(f, offset) != probe:
+                    return
+
+            for seq, deletions in data.get('orphan_deletions', {}).items():
+                self._deletions[int(seq)] = deletions
+            for row in data['rows']:
+                seq = row['seq']
+                self._rows[seq] = row
+                self._order.append(seq)
+                self._deletions[seq] = row['deletion_events']
+                self._display_count += 1 + len(row['deletion_events'])
+                if not row['is_deleted']:
+                    self._contribute(row, 1)
+            self._order.sort()
+            self._offset = offset
+            self._probe = probe
+            logger.debug(f"Donation projection resumed from checkpoint at offset {offset}")
+        except (OSError, KeyError, TypeError, ValueError) as e:
+            logger.warning(f"Ignoring unusable donation projection checkpoint: {e}")
+            self._reset()
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def _iter_display(self, seqs: Iterator[int]) -> Iterator[Dict[str, Any]]:
+        for seq in seqs:
+            row = self._rows[seq]
+            yield row
+            yield from row['deletion_events']
+
+    def query(self, offset: int = 0, limit: Optional[int] = None, donor: Optional[str] = None,
+              donation_type: Optional[str] = None, since: Optional[str] = None,
+              until: Optional[str] = None) -> Tuple[List[Dict[str, Any]], int]:
+        """
+        Return one page of the newest-first display list and the total row count.
+
+        Deletion events follow the donation they belong to, exactly like the
+        Web UI table. Unfiltered pages cost O(offset + limit); filtered pages
+        scan the in-memory rows.
+
+        Args:
+            offset: Number of display rows to skip
+            limit: Maximum number of display rows to return (``None`` = all)
+            donor: Exact donor name filter
+            donation_type: Donation type filter (manual, power_gift, system, exact_hit_bonus)
+            since: Inclusive lower bound on the ISO timestamp
+            until: Exclusive upper bound on the ISO timestamp
+        """
+        with self._lock:
+            filtered = any(v is not None for v in (donor, donation_type, since, until))
+            seqs = reversed(self._order)
+            if filtered:
+                seqs = [
+                    seq for seq in seqs
+                    if (donor is None or self._rows[seq]['donor_name'] == donor)
+                    and (donation_type is None or self._rows[seq]['donation_type'] == donation_type)
+                    and (since is None or self._rows[seq]['timestamp'] >= since)
+                    and (until is None or self._rows[seq]['timestamp'] < until)
+                ]
+                total = sum(1 + len(self._rows[seq]['deletion_events']) for seq in seqs)
+            else:
+                total = self._display_count
+
+            page = []
+            for index, row in enumerate(self._iter_display(iter(seqs))):
+                if index < offset:
+                    continue
+                if limit is not None and len(page) >= limit:
+                    break
+                page.append(_public_row(row) if 'deletion_events' in row else dict(row))
+            return page, total
+
+    def get_display_item(self, index: int) -> Optional[Dict[str, Any]]:
+        """Return the row at ``index`` of the full newest-first display list."""
+        if index < 0:
+            return None
+        page, _ = self.query(offset=index, limit=1)
+        if not page:
+            return None
+        item = page[0]
+        if item.get('is_deletion'):
+            item['event_type'] = DELETION_EVENT_TYPE
+        else:
+            with self._lock:
+                item['event_type'] = self._rows[item['seq']]['event_type']
+        return item
+
+    def summary(self) -> Dict[str, Any]:
+        """Return running totals: active power/count and number of donation entries."""
+        with self._lock:
+            return {
+                'total_power': self._active_units / 100.0,
+                'active_count': self._active_count,
+                'entry_count': len(self._rows),
+            }
+
+    def donor_totals(self) -> Dict[str, Dict[str, Any]]:
+        """Return active totals per donor name."""
+        with self._lock:
+            return {
+                name: {'total_power': data['total_units'] / 100.0, 'count': data['count']}
+                for name, data in self._donors.items()
+            }
+
+    def buckets(self, period: str = 'day') -> Dict[str, Dict[str, Any]]:
+        """Return active totals grouped by ``'day'`` (YYYY-MM-DD) or ``'month'`` (YYYY-MM)."""
+        if period not in self._buckets:
+            raise ValueError(f"Unsupported bucket period: {period}")
+        with self._lock:
+            return {
+                key: {'total_power': data['total_units'] / 100.0, 'count': data['count']}
+                for key, data in sorted(self._buckets[period].items())
+            }
+
+
+_projections: Dict[Path, DonationProjection] = {}
+_projections_lock = threading.Lock()
+
+
+def get_donation_projection(event_log: Path) -> DonationProjection:
+    """Return the up-to-date projection for ``event_log``.
+
+    Raises:
+        OSError: If the event log cannot be read
+        json.JSONDecodeError: If the event log contains invalid JSON
+    """
+    key = Path(event_log)
+    with _projections_lock:
+        projection = _projections.get(key)
+        if projection is None:
+            projection = DonationProjection(key)
+            _projections[key] = projection
+    projection.refresh()
+    return projection
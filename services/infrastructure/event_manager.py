@@ -10,15 +10,32 @@
 """
 Event Manager - SERVICE FIRST compliant event system for decoupled service communication.
 Enables services to communicate without direct service-to-service calls.
+
+Events are dispatched asynchronously: ``emit_event`` only appends to the
+history and puts the event on one bounded queue per listener, so the emitter
+(e.g. donation processing) never waits on a slow subscriber. Each listener is
+served by its own worker thread, which keeps per-listener ordering and
+isolates failures. Coroutine listeners run on the event loop that was
+running when they registered (the bot loop), otherwise via ``asyncio.run``.
 """
 
+import asyncio
 import logging
-from typing import Dict, List, Callable, Any
+import queue
+import threading
+import time
+from collections import deque
+from typing import Deque, Dict, List, Callable, Any, Optional
 from dataclasses import dataclass
 from datetime import datetime, timezone
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_QUEUE_SIZE = 256
+DEFAULT_MAX_HISTORY = 100  # Keep last 100 events for debugging
+LATENCY_SAMPLES = 200  # Per event type, for the dispatch latency metrics
+ASYNC_LISTENER_TIMEOUT = 60.0
+
 
 @dataclass
 class EventData:
@@ -29,6 +46,65 @@ class EventData:
     data: Dict[str, Any]
 
 
+class _ListenerWorker:
+    """Bounded queue plus worker thread delivering events to one listener."""
+
+    def __init__(self, manager: 'EventManager', event_type: str, callback: Callable,
+                 queue_size: int, loop: Optional[asyncio.AbstractEventLoop]):
+        self.manager = manager
+        self.event_type = event_type
+        self.callback = callback
+        self.loop = loop
+        self.is_async = asyncio.iscoroutinefunction(callback)
+        self.queue: queue.Queue = queue.Queue(maxsize=queue_size)
+        self.thread = threading.Thread(
+            target=self._run,
+            name=f"ddc-event-{event_type}-{getattr(callback, '__name__', 'listener')}",
+            daemon=True,
+        )
+        self.thread.start()
+
+    def submit(self, event_data: EventData, emitted_at: float) -> bool:
+        try:
+            self.queue.put_nowait((event_data, emitted_at))
+            return True
+        except queue.Full:
+            return False
+
+    def stop(self) -> None:
+        try:
+            self.queue.put_nowait(None)
+        except queue.Full:
+            # Worker is busy draining; it exits on the sentinel once there is room
+            threading.Thread(target=self.queue.put, args=(None,), daemon=True).start()
+
+    def _run(self) -> None:
+        while True:
+            item = self.queue.get()
+            try:
+                if item is None:
+                    return
+                event_data, emitted_at = item
+                self._deliver(event_data, emitted_at)
+            finally:
+                self.queue.task_done()
+
+    def _deliver(self, event_data: EventData, emitted_at: float) -> None:
+        failed = False
+        try:
+            if not self.is_async:
+                self.callback(event_data)
+            elif self.loop is not None and self.loop.is_running():
+                future = asyncio.run_coroutine_threadsafe(self.callback(event_data), self.loop)
+                future.result(timeout=ASYNC_LISTENER_TIMEOUT)
+            else:
+                asyncio.run(self.callback(event_data))
+        except Exception as e:  # A failing listener must not affect the others
+            failed = True
+            self.manager.logger.error(f"Error in event listener for {self.event_type}: {e}", exc_info=True)
+        self.manager._record_dispatch(self.event_type, time.monotonic() - emitted_at, failed)
+
+
 class EventManager:
     """
     SERVICE FIRST Event Manager - enables decoupled service communication.
@@ -37,24 +113,42 @@ class EventManager:
     This maintains Service First principles by avoiding service-to-service calls.
     """
 
-    def __init__(self):
+    def __init__(self, queue_size: int = DEFAULT_QUEUE_SIZE, max_history: int = DEFAULT_MAX_HISTORY):
         self.logger = logger.getChild(self.__class__.__name__)
-        self._listeners: Dict[str, List[Callable]] = {}
-        self._event_history: List[EventData] = []
-        self._max_history = 100  # Keep last 100 events for debugging
+        self._lock = threading.Lock()
+        self._listeners: Dict[str, List[_ListenerWorker]] = {}
+        self._queue_size = queue_size
+        self._max_history = max_history
+        self._event_history: Deque[EventData] = deque(maxlen=max_history)
+        self._metrics: Dict[str, Dict[str, Any]] = {}
 
         self.logger.info("Service First Event Manager initialized")
 
-    def register_listener(self, event_type: str, callback: Callable[[EventData], None]):
-        """Register a callback function to listen for specific event types."""
-        if event_type not in self._listeners:
-            self._listeners[event_type] = []
+    def register_listener(self, event_type: str, callback: Callable[[EventData], Any]):
+        """Register a callback (plain function or coroutine function) for an event type."""
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            loop = None
 
-        self._listeners[event_type].append(callback)
+        worker = _ListenerWorker(self, event_type, callback, self._queue_size, loop)
+        with self._lock:
+            self._listeners.setdefault(event_type, []).append(worker)
         self.logger.debug(f"Registered listener for event type: {event_type}")
 
+    def unregister_listener(self, event_type: str, callback: Callable[[EventData], Any]) -> bool:
+        """Remove a listener; events already queued for it are still delivered."""
+        with self._lock:
+            workers = self._listeners.get(event_type, [])
+            for worker in workers:
+                if worker.callback == callback:
+                    workers.remove(worker)
+                    worker.stop()
+                    return True
+        return False
+
     def emit_event(self, event_type: str, source_service: str, data: Dict[str, Any] = None):
-        """Emit an event to all registered listeners."""
+        """Queue an event for all registered listeners; returns without waiting for them."""
         if data is None:
             data = {}
 
@@ -64,38 +158,102 @@ class EventManager:
             source_service=source_service,
             data=data
         )
+        emitted_at = time.monotonic()
 
-        # Store in history for debugging
-        self._event_history.append(event_data)
-        if len(self._event_history) > self._max_history:
-            self._event_history.pop(0)
+        with self._lock:
+            # Store in history for debugging (deque drops the oldest in O(1))
+            self._event_history.append(event_data)
+            workers = tuple(self._listeners.get(event_type, ()))
+            metrics = self._metrics_for(event_type)
+            metrics['emitted'] += 1
 
-        # Notify all listeners
-        if event_type in self._listeners:
-            for callback in self._listeners[event_type]:
-                try:
-                    callback(event_data)
-                except (RuntimeError) as e:
-                    self.logger.error(f"Error in event listener for {event_type}: {e}", exc_info=True)
+        for worker in workers:
+            if not worker.submit(event_data, emitted_at):
+                with self._lock:
+                    metrics['dropped'] += 1
+                self.logger.warning(
+                    f"Event queue full for listener {getattr(worker.callback, '__name__', worker.callback)} "
+                    f"({event_type}); event dropped"
+                )
 
         self.logger.debug(f"Event emitted: {event_type} from {source_service}")
 
+    def wait_until_idle(self, timeout: Optional[float] = None) -> bool:
+        """Block until every queued event was delivered (tests, shutdown). False on timeout."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._lock:
+            workers = [w for listeners in self._listeners.values() for w in listeners]
+        for worker in workers:
+            while worker.queue.unfinished_tasks:
+                if deadline is not None and time.monotonic() >= deadline:
+                    return False
+                time.sleep(0.005)
+        return True
+
+    def shutdown(self) -> None:
+        """Stop all listener workers after they drained their queues."""
+        with self._lock:
+            workers = [w for listeners in self._listeners.values() for w in listeners]
+            self._listeners.clear()
+        for worker in workers:
+            worker.stop()
+
+    def _metrics_for(self, event_type: str) -> Dict[str, Any]:
+        """Per event type counters; caller holds the lock."""
+        metrics = self._metrics.get(event_type)
+        if metrics is None:
+            metrics = {'emitted': 0, 'delivered': 0, 'failed': 0, 'dropped': 0,
+                       'latencies': deque(maxlen=LATENCY_SAMPLES)}
+            self._metrics[event_type] = metrics
+        return metrics
+
+    def _record_dispatch(self, event_type: str, latency: float, failed: bool) -> None:
+        with self._lock:
+            metrics = self._metrics_for(event_type)
+            metrics['failed' if failed else 'delivered'] += 1
+            metrics['latencies'].append(latency)
+
+    def get_dispatch_metrics(self) -> Dict[str, Dict[str, Any]]:
+        """Per event type counters and emit-to-handled latency (ms) of recent deliveries."""
+        with self._lock:
+            snapshot = {event_type: (dict(m), sorted(m['latencies'])) for event_type, m in self._metrics.items()}
+
+        result = {}
+        for event_type, (metrics, latencies) in snapshot.items():
+            entry = {key: metrics[key] for key in ('emitted', 'delivered', 'failed', 'dropped')}
+            if latencies:
+                entry.update(
+                    latency_avg_ms=round(sum(latencies) / len(latencies) * 1000, 3),
+                    latency_p95_ms=round(latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))] * 1000, 3),
+                    latency_max_ms=round(latencies[-1] * 1000, 3),
+                )
+            result[event_type] = entry
+        return result
+
     def get_event_stats(self) -> Dict[str, Any]:
         """Get event system statistics for monitoring."""
+        with self._lock:
+            listeners = {event_type: list(workers) for event_type, workers in self._listeners.items()}
+            history = list(self._event_history)
         return {
             'registered_listeners': {
-                event_type: len(listeners)
-                for event_type, listeners in self._listeners.items()
+                event_type: len(workers)
+                for event_type, workers in listeners.items()
+            },
+            'queued_events': {
+                event_type: sum(w.queue.qsize() for w in workers)
+                for event_type, workers in listeners.items()
             },
-            'event_history_count': len(self._event_history),
+            'event_history_count': len(history),
             'recent_events': [
                 {
                     'type': event.event_type,
                     'source': event.source_service,
                     'timestamp': event.timestamp.isoformat()
                 }
-                for event in self._event_history[-10:]  # Last 10 events
-            ]
+                for event in history[-10:]  # Last 10 events
+            ],
+            'dispatch': self.get_dispatch_metrics(),
         }
 
 
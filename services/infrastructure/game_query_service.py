@@ -21,7 +21,17 @@ Design guarantees (mirrors the existing status-fetch services):
   actually runs. When the feature is disabled the dependency is never touched and
   this module imports with zero cost (also keeps it unit-testable without opengsq).
 - **Per-container TTL cache** (shorter than the Docker status cache, since game
-  state changes faster) plus in-flight de-duplication.
+  state changes faster) plus in-flight de-duplication. The TTL adapts to how
+  volatile a server's player count is: every unchanged answer doubles it (up to
+  ``MAX_CACHE_TTL_SECONDS``), a change drops it back to the base TTL.
+- **Staggered port racing**: the primary port gets a short head start, then the
+  candidate ports join one by one (or immediately when the previous one fails);
+  the first answer wins and cancels the rest, so a dead primary costs
+  ``PORT_RACE_STAGGER_SECONDS`` instead of a whole timeout per port.
+- **Target memoization**: the resolved (host, ports) of a container and the port
+  that answered are remembered until the container is restarted/stopped
+  (``forget_container``), a query on the remembered port fails, or
+  ``TARGET_TTL_SECONDS`` passes - so steady-state queries need no Docker inspect.
 - Returns a ``GameQueryResult`` for every call - it never raises to the caller.
 """
 
@@ -37,8 +47,14 @@ logger = get_module_logger('game_query_service')
 # Default per-container cache TTL. Intentionally shorter than DDC_DOCKER_CACHE_DURATION
 # (game player counts change faster than container CPU/RAM).
 DEFAULT_CACHE_TTL_SECONDS = 10.0
+MAX_CACHE_TTL_SECONDS = 60.0
 DEFAULT_QUERY_TIMEOUT_SECONDS = 5.0
-DEFAULT_MAX_CONCURRENT = 3
+# UDP queries are cheap; a bulk refresh should fit in one timeout window
+DEFAULT_MAX_CONCURRENT = 32
+PORT_RACE_STAGGER_SECONDS = 0.25
+TARGET_TTL_SECONDS = 600.0
+_MAX_PROTOCOL_CLIENTS = 256
+PROBE_PREFIX = '__probe__:'
 
 # Whitelist of supported query protocols (also enforced by config validation).
 # - 'source'       Steam A2S - most Steam dedicated survival servers (Valheim,
@@ -79,6 +95,7 @@ class GameQueryResult:
     # 'timeout' | 'unreachable' | 'no_query' | 'disabled' | 'bad_config'
     error_type: Optional[str] = None
     error_message: Optional[str] = None
+    port: Optional[int] = None        # port that answered (successful live queries)
 
     @classmethod
     def disabled(cls, container_name: str) -> 'GameQueryResult':
@@ -98,6 +115,23 @@ class GameQueryService:
         # container_name -> (timestamp, GameQueryResult)
         self._cache: Dict[str, Tuple[float, GameQueryResult]] = {}
         self._in_flight: Dict[str, asyncio.Future] = {}
+        # container_name -> number of consecutive unchanged answers (adaptive TTL)
+        self._stable_streak: Dict[str, int] = {}
+        # (container, protocol, host override, port override) -> (timestamp, host, ports)
+        self._targets: Dict[Tuple[str, str, str, int], Tuple[float, str, List[int]]] = {}
+        # (container, protocol) -> port that answered last
+        self._winning_ports: Dict[Tuple[str, str], int] = {}
+        # (protocol, host, port, token, timeout) -> opengsq protocol object
+        self._clients: Dict[Tuple[str, str, int, str, float], object] = {}
+
+    def _client(self, key: Tuple[str, str, int, str, float], factory: Callable[[], object]) -> object:
+        """Reuse opengsq protocol objects per target instead of building one per query."""
+        client = self._clients.get(key)
+        if client is None:
+            if len(self._clients) >= _MAX_PROTOCOL_CLIENTS:
+                self._clients.clear()
+            client = self._clients[key] = factory()
+        return client
 
     # --- protocol dispatch -------------------------------------------------
 
@@ -109,15 +143,16 @@ class GameQueryService:
         zero-cost) when the dependency is absent / the feature is off. Raises on any
         protocol/network error - the caller wraps this in a timeout + try/except.
         """
+        key = (protocol, host, port, token or '', timeout)
         if protocol == 'source':
             from opengsq.protocols.source import Source  # lazy import
-            info = await Source(host=host, port=port, timeout=timeout).get_info()
+            info = await self._client(key, lambda: Source(host=host, port=port, timeout=timeout)).get_info()
             players = getattr(info, 'players', None)
             max_players = getattr(info, 'max_players', None)
             return players, max_players
         if protocol == 'minecraft':
             from opengsq.protocols.minecraft import Minecraft  # lazy import
-            status = await Minecraft(host=host, port=port, timeout=timeout).get_status()
+            status = await self._client(key, lambda: Minecraft(host=host, port=port, timeout=timeout)).get_status()
             players = (status or {}).get('players') or {}
             return players.get('online'), players.get('max')
         if protocol == 'satisfactory':
@@ -126,8 +161,8 @@ class GameQueryService:
             # from the authenticated HTTPS API (needs a token from the in-game Server
             # Manager) and only when a save is loaded (server_state == 3). Otherwise
             # opengsq returns 0/0 or "Not Available" -> we report no count rather than 0/0.
-            status = await Satisfactory(host=host, port=port,
-                                        app_token=(token or ''), timeout=timeout).get_status()
+            status = await self._client(key, lambda: Satisfactory(
+                host=host, port=port, app_token=(token or ''), timeout=timeout)).get_status()
             if status is None:
                 return None, None
             players = getattr(status, 'num_players', None)
@@ -141,8 +176,9 @@ class GameQueryService:
             from opengsq.protocols.palworld import Palworld  # lazy import
             # Palworld's REST API uses HTTP Basic auth with the fixed username "admin" and the
             # server's AdminPassword (passed here as the token). Default REST API port is 8212.
-            status = await Palworld(host=host, port=port, api_username='admin',
-                                    api_password=(token or ''), timeout=timeout).get_status()
+            status = await self._client(key, lambda: Palworld(
+                host=host, port=port, api_username='admin',
+                api_password=(token or ''), timeout=timeout)).get_status()
             if status is None:
                 return None, None
             players = getattr(status, 'num_players', None)
@@ -170,15 +206,32 @@ class GameQueryService:
             return cached
 
         result = await self._fetch(request)
+        self._track_volatility(request.container_name, result)
         self._cache[request.container_name] = (time.monotonic(), result)
         return result
 
+    def _track_volatility(self, container_name: str, result: GameQueryResult) -> None:
+        """Count consecutive answers with an unchanged player count."""
+        previous = self._cache.get(container_name)
+        if (result.success and previous is not None and previous[1].success
+                and previous[1].players_online == result.players_online):
+            self._stable_streak[container_name] = self._stable_streak.get(container_name, 0) + 1
+        else:
+            self._stable_streak[container_name] = 0
+
+    def effective_ttl(self, container_name: str) -> float:
+        """Cache TTL for a container: doubles per unchanged answer, capped."""
+        streak = self._stable_streak.get(container_name, 0)
+        if not streak or self._cache_ttl <= 0:
+            return self._cache_ttl
+        return min(self._cache_ttl * (2 ** min(streak, 8)), max(self._cache_ttl, MAX_CACHE_TTL_SECONDS))
+
     def _get_cached(self, container_name: str) -> Optional[GameQueryResult]:
         entry = self._cache.get(container_name)
         if entry is None:
             return None
         ts, result = entry
-        if (time.monotonic() - ts) >= self._cache_ttl:
+        if (time.monotonic() - ts) >= self.effective_ttl(container_name):
             return None
         # Return a shallow copy flagged as cached so callers can tell.
         return GameQueryResult(
@@ -186,24 +239,64 @@ class GameQueryService:
             players_online=result.players_online, max_players=result.max_players,
             query_duration_ms=result.query_duration_ms, cached=True,
             error_type=result.error_type, error_message=result.error_message,
+            port=result.port,
         )
 
     async def _fetch(self, request: GameQueryRequest) -> GameQueryResult:
-        """Query the primary port, falling back to candidate ports until one answers.
+        """Race the primary and candidate ports; the first answer wins.
 
         Many game servers publish BOTH a game port and a separate query port (e.g. Icarus
         17777 game + 27015 query); only the latter answers A2S. Candidate ports are already
-        ordered most-likely-first by _candidate_ports, so the primary usually succeeds with
-        no extra latency. Never raises; returns the first success or the last failure.
+        ordered most-likely-first by _candidate_ports. The primary gets a head start of
+        PORT_RACE_STAGGER_SECONDS; if it has not answered by then (or failed), the next
+        port joins the race, and so on. A port that answered before is queried alone.
+        Never raises; returns the first success or the primary's failure.
         """
+        memo_key = (request.container_name, request.protocol)
         ports_to_try = [request.port] + [p for p in request.candidate_ports if p != request.port]
-        last_result: Optional[GameQueryResult] = None
-        for port in ports_to_try:
-            result = await self._fetch_one(request, port)
-            if result.success:
-                return result
-            last_result = result
-        return last_result or GameQueryResult.no_query(request.container_name)
+        # Support probes always race every port
+        remember = not request.container_name.startswith(PROBE_PREFIX)
+        remembered = self._winning_ports.get(memo_key) if remember else None
+        if remembered in ports_to_try:
+            result = await self._fetch_one(request, remembered)
+            if not result.success:
+                self.forget_container(request.container_name, keep_cache=True)
+            return result
+
+        if len(ports_to_try) == 1:
+            result = await self._fetch_one(request, ports_to_try[0])
+        else:
+            result = await self._race_ports(request, ports_to_try)
+        if remember and result.success and result.port is not None:
+            self._winning_ports[memo_key] = result.port
+        return result
+
+    async def _race_ports(self, request: GameQueryRequest, ports: List[int]) -> GameQueryResult:
+        """Staggered race over ``ports`` (happy-eyeballs style)."""
+        pending: Dict[asyncio.Task, int] = {}
+        failures: Dict[int, GameQueryResult] = {}
+        next_index = 0
+        try:
+            while True:
+                if next_index < len(ports):
+                    port = ports[next_index]
+                    pending[asyncio.create_task(self._fetch_one(request, port))] = port
+                    next_index += 1
+                if not pending:
+                    break
+                stagger = PORT_RACE_STAGGER_SECONDS if next_index < len(ports) else None
+                done, _ = await asyncio.wait(pending, timeout=stagger, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    port = pending.pop(task)
+                    result = task.result()
+                    if result.success:
+                        return result
+                    failures[port] = result
+        finally:
+            for task in pending:
+                task.cancel()
+        return failures.get(ports[0]) or next(iter(failures.values()), None) \
+            or GameQueryResult.no_query(request.container_name)
 
     async def _fetch_one(self, request: GameQueryRequest, port: int) -> GameQueryResult:
         """Run a single query against one port with a hard timeout. Never raises."""
@@ -218,7 +311,7 @@ class GameQueryService:
             return GameQueryResult(
                 success=True, container_name=request.container_name,
                 players_online=players, max_players=max_players,
-                query_duration_ms=duration_ms,
+                query_duration_ms=duration_ms, port=port,
             )
         except asyncio.TimeoutError:
             logger.debug(f"[GAME_QUERY] Timeout querying {request.container_name} "
@@ -292,7 +385,7 @@ class GameQueryService:
             if not host or not ports:
                 continue
             req = GameQueryRequest(
-                container_name=f"__probe__:{container_name}", protocol=proto,
+                container_name=f"{PROBE_PREFIX}{container_name}", protocol=proto,
                 host=host, port=ports[0], candidate_ports=tuple(ports[1:]),
                 timeout_seconds=3.0)
             result = await self._fetch(req)  # bypasses the player-count cache by design
@@ -339,6 +432,12 @@ class GameQueryService:
         manual_port = int(configured_port) if configured_port and configured_port > 0 else None
         if host and manual_port:
             return host, [manual_port]
+
+        memo_key = (container_name, protocol, host or '', manual_port or 0)
+        memo = self._targets.get(memo_key)
+        if memo is not None and (time.monotonic() - memo[0]) < TARGET_TTL_SECONDS:
+            return memo[1], list(memo[2])
+
         ports: List[int] = []
         try:
             from services.docker_service.docker_client_pool import get_docker_client_async
@@ -353,6 +452,7 @@ class GameQueryService:
             logger.debug(f"[GAME_QUERY] Target autodiscovery failed for {container_name}: {e}")
             ports = [manual_port] if manual_port else []
         if host and ports:
+            self._targets[memo_key] = (time.monotonic(), host, list(ports))
             return host, ports
         return None, []
 
@@ -426,8 +526,26 @@ class GameQueryService:
 
     # --- maintenance -------------------------------------------------------
 
+    def forget_container(self, container_name: str, keep_cache: bool = False) -> None:
+        """Drop what is remembered about a container (call after a restart/stop).
+
+        Resolved targets and the winning port are dropped; with ``keep_cache=False``
+        the cached player count and its volatility streak too.
+        """
+        for key in [k for k in self._targets if k[0] == container_name]:
+            del self._targets[key]
+        for key in [k for k in self._winning_ports if k[0] == container_name]:
+            del self._winning_ports[key]
+        if not keep_cache:
+            self._cache.pop(container_name, None)
+            self._stable_streak.pop(container_name, None)
+
     def clear_cache(self) -> None:
         self._cache.clear()
+        self._stable_streak.clear()
+        self._targets.clear()
+        self._winning_ports.clear()
+        self._clients.clear()
 
 
 # --- Singleton -------------------------------------------------------------
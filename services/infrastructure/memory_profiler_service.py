@@ -0,0 +1,225 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ============================================================================ #
+# DockerDiscordControl (DDC) - Memory Profiler Service                        #
+# https://ddc.bot                                                              #
+# Copyright (c) 2025 MAX                                                       #
+# Licensed under the MIT License                                               #
+# ============================================================================ #
+
+"""
+Memory Profiler Service - opt-in tracemalloc profiling of the running process.
+
+Answers "what is growing?": a baseline snapshot is taken when tracing starts
+and later snapshots are diffed against it, with allocations grouped by the
+module (or top-level package) whose code allocated them. Objects allocated
+before tracing started are invisible, so cache turnover shows up as growth
+for a while; re-take the baseline once the process is warm.
+
+The bot and the Web UI (a waitress thread started by ``run.py``) share one
+interpreter, so one profiler covers both. Tracing costs CPU and memory, so it
+is off unless ``DDC_MEMORY_PROFILING=1`` is set (``run.py`` starts it at boot)
+or it is started from the Web UI.
+"""
+
+import logging
+import os
+import sys
+import threading
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+ENV_FLAG = 'DDC_MEMORY_PROFILING'
+ENV_FRAMES = 'DDC_MEMORY_PROFILING_FRAMES'
+DEFAULT_FRAMES = 1  # The allocating frame is all the module grouping needs
+DEFAULT_TOP = 20
+MAX_SNAPSHOTS = 5
+GROUP_BY = ('module', 'package')
+
+_SNAPSHOT_FILTERS = (
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    tracemalloc.Filter(False, __file__),  # Our own retained snapshots
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+    tracemalloc.Filter(False, "<unknown>"),
+)
+
+
+@dataclass
+class ModuleMemoryDiff:
+    """Memory growth attributed to one module (or package) since a baseline."""
+    name: str
+    size_diff: int
+    count_diff: int
+    size: int
+    count: int
+
+
+@lru_cache(maxsize=4096)
+def module_for_filename(filename: str) -> str:
+    """Dotted module name for a source file, e.g. ``services.mech.mech_service``."""
+    if filename.startswith('<'):
+        return filename
+    path = os.path.abspath(filename)
+    roots = sorted({os.path.abspath(p) for p in sys.path if p}, key=len, reverse=True)
+    for root in roots:
+        if path.startswith(root + os.sep):
+            relative = path[len(root) + 1:]
+            break
+    else:
+        relative = os.path.basename(path)
+    module = os.path.splitext(relative)[0].replace(os.sep, '.')
+    if module.endswith('.__init__'):
+        module = module[:-len('.__init__')]
+    return module
+
+
+def _group_name(filename: str, group_by: str) -> str:
+    module = module_for_filename(filename)
+    return module.split('.', 1)[0] if group_by == 'package' else module
+
+
+class MemoryProfilerService:
+    """tracemalloc wrapper with labelled snapshots and per-module diffs."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._snapshots: List[Tuple[str, float, tracemalloc.Snapshot]] = []
+        self._baseline: Optional[Tuple[str, float, tracemalloc.Snapshot]] = None
+        self._started_here = False
+
+    @property
+    def is_tracing(self) -> bool:
+        return tracemalloc.is_tracing()
+
+    def start(self, nframes: int = DEFAULT_FRAMES) -> bool:
+        """Start tracing and take the baseline. Returns False if already tracing."""
+        if tracemalloc.is_tracing():
+            if self._baseline is None:
+                self.set_baseline()
+            return False
+        tracemalloc.start(max(1, int(nframes)))
+        self._started_here = True
+        self.set_baseline()
+        logger.info(f"Memory profiling started (tracemalloc, {tracemalloc.get_traceback_limit()} frame(s))")
+        return True
+
+    def stop(self) -> None:
+        """Stop tracing (only if this service started it) and drop snapshots."""
+        with self._lock:
+            self._snapshots.clear()
+            self._baseline = None
+        if self._started_here and tracemalloc.is_tracing():
+            tracemalloc.stop()
+            logger.info("Memory profiling stopped")
+        self._started_here = False
+
+    def _take(self) -> tracemalloc.Snapshot:
+        if not tracemalloc.is_tracing():
+            raise RuntimeError("Memory profiling is not running")
+        return tracemalloc.take_snapshot().filter_traces(_SNAPSHOT_FILTERS)
+
+    def take_snapshot(self, label: Optional[str] = None) -> str:
+        """Keep a labelled snapshot (the last ``MAX_SNAPSHOTS`` are retained)."""
+        snapshot = self._take()
+        with self._lock:
+            label = label or f"snapshot-{len(self._snapshots) + 1}"
+            self._snapshots = [s for s in self._snapshots if s[0] != label][-(MAX_SNAPSHOTS - 1):]
+            self._snapshots.append((label, time.time(), snapshot))
+        return label
+
+    def set_baseline(self, label: str = 'baseline') -> str:
+        """Take a new baseline; later diffs measure growth from here."""
+        snapshot = self._take()
+        with self._lock:
+            self._baseline = (label, time.time(), snapshot)
+        return label
+
+    def _reference(self, since: Optional[str]) -> Tuple[str, float, tracemalloc.Snapshot]:
+        with self._lock:
+            if since is None:
+                if self._baseline is None:
+                    raise RuntimeError("No baseline snapshot taken")
+                return self._baseline
+            for entry in self._snapshots:
+                if entry[0] == since:
+                    return entry
+        raise KeyError(f"Unknown snapshot '{since}'")
+
+    def diff(self, since: Optional[str] = None, top: int = DEFAULT_TOP,
+             group_by: str = 'module') -> List[ModuleMemoryDiff]:
+        """Growth per module between ``since`` (default: baseline) and now, largest first."""
+        if group_by not in GROUP_BY:
+            raise ValueError(f"group_by must be one of {GROUP_BY}")
+        _, _, reference = self._reference(since)
+        current = self._take()
+        grouped: Dict[str, ModuleMemoryDiff] = {}
+        for stat in current.compare_to(reference, 'filename'):
+            name = _group_name(stat.traceback[0].filename, group_by)
+            entry = grouped.get(name)
+            if entry is None:
+                grouped[name] = ModuleMemoryDiff(name, stat.size_diff, stat.count_diff, stat.size, stat.count)
+            else:
+                entry.size_diff += stat.size_diff
+                entry.count_diff += stat.count_diff
+                entry.size += stat.size
+                entry.count += stat.count
+        ranked = sorted(grouped.values(), key=lambda d: d.size_diff, reverse=True)
+        return ranked[:top] if top else ranked
+
+    def get_report(self, top: int = DEFAULT_TOP, group_by: str = 'module',
+                   since: Optional[str] = None) -> Dict[str, Any]:
+        """JSON-serialisable status plus the top growing modules."""
+        report: Dict[str, Any] = {
+            'pid': os.getpid(),
+            'tracing': tracemalloc.is_tracing(),
+            'generated_at': time.time(),
+            'group_by': group_by,
+        }
+        if not report['tracing']:
+            return report
+
+        current, peak = tracemalloc.get_traced_memory()
+        with self._lock:
+            snapshots = [{'label': label, 'taken_at': taken_at} for label, taken_at, _ in self._snapshots]
+        report.update({
+            'frames': tracemalloc.get_traceback_limit(),
+            'traced_current_bytes': current,
+            'traced_peak_bytes': peak,
+            'tracemalloc_overhead_bytes': tracemalloc.get_tracemalloc_memory(),
+            'snapshots': snapshots,
+        })
+        try:
+            label, taken_at, _ = self._reference(since)
+            diffs = self.diff(since=since, top=0, group_by=group_by)
+        except (RuntimeError, KeyError) as e:
+            report['error'] = str(e)
+            return report
+        report.update({
+            'since': {'label': label, 'taken_at': taken_at},
+            'total_size_diff': sum(d.size_diff for d in diffs),
+            'total_count_diff': sum(d.count_diff for d in diffs),
+            'top': [asdict(d) for d in diffs[:top]],
+        })
+        return report
+
+
+def is_enabled() -> bool:
+    return os.environ.get(ENV_FLAG, '').strip().lower() in ('1', 'true', 'yes', 'on')
+
+
+# Global service instance
+_memory_profiler_service: Optional[MemoryProfilerService] = None
+
+
+def get_memory_profiler_service() -> MemoryProfilerService:
+    """Get the global memory profiler service instance."""
+    global _memory_profiler_service
+    if _memory_profiler_service is None:
+        _memory_profiler_service = MemoryProfilerService()
+    return _memory_profiler_service
@@ -10,6 +10,7 @@
 Animation Cache Service - Pre-generates and caches mech animations
 """
 
+import mmap
 import os
 import re
 import time
@@ -26,6 +27,12 @@ from utils.logging_utils import get_module_logger
 
 logger = get_module_logger('animation_cache_service')
 
+# Super simple XOR key - fast and effective for hiding content
+_XOR_KEY = b'MechAnimCache2024'
+# One 256-byte translation table per key position: XOR-ing every K-th byte
+# with the same key byte becomes a single C-level bytes.translate() call.
+_XOR_TABLES = tuple(bytes(value ^ key_byte for value in range(256)) for key_byte in _XOR_KEY)
+
 
 # ============================================================================
 # SERVICE FIRST REQUEST/RESULT PATTERNS
@@ -182,16 +189,36 @@ class AnimationCacheService:
 
     def _obfuscate_data(self, data: bytes) -> bytes:
         """Simple XOR obfuscation to make WebP files unrecognizable when browsing filesystem"""
-        # Super simple XOR key - fast and effective for hiding content
-        xor_key = b'MechAnimCache2024'
-        key_len = len(xor_key)
-        # XOR each byte with repeating key pattern
-        return bytes(data[i] ^ xor_key[i % key_len] for i in range(len(data)))
+        # XOR with repeating key pattern, vectorized per key position:
+        # data[j::key_len] all share key byte j, so translate them in one pass
+        key_len = len(_XOR_KEY)
+        result = bytearray(len(data))
+        for offset, table in enumerate(_XOR_TABLES):
+            result[offset::key_len] = data[offset::key_len].translate(table)
+        return bytes(result)
 
     def _deobfuscate_data(self, data: bytes) -> bytes:
         """Reverse the XOR obfuscation (XOR is symmetric)"""
         return self._obfuscate_data(data)  # XOR is its own inverse
 
+    def _read_obfuscated_file(self, path: Path) -> bytes:
+        """Read and deobfuscate a base cache file.
+
+        The file is memory-mapped so the XOR pass reads straight from the page
+        cache instead of first copying the whole file into a bytes object.
+        """
+        with open(path, 'rb') as f:
+            try:
+                if os.fstat(f.fileno()).st_size == 0:
+                    return b""
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                    return self._deobfuscate_data(mapped)
+            except (ValueError, OSError, TypeError) as e:
+                # mmap unsupported (special filesystem, file-like stand-in)
+                logger.debug(f"mmap unavailable for {path}, falling back to read(): {e}")
+                f.seek(0)
+                return self._deobfuscate_data(f.read())
+
     def get_expected_canvas_size(self, evolution_level: int, animation_type: str = "walk", resolution: str = "small") -> Tuple[int, int]:
         """Get expected canvas size for an evolution level using predefined heights"""
         # For big resolution, delegate to high-res service
@@ -977,9 +1004,7 @@ class AnimationCacheService:
             # Check if base file exists
             if base_cache_path.exists():
                 try:
-                    with open(base_cache_path, 'rb') as f:
-                        obfuscated_data = f.read()
-                    data = self._deobfuscate_data(obfuscated_data)
+                    data = self._read_obfuscated_file(base_cache_path)
                     
                     # Store in RAM Cache
                     self._store_in_ram_cache(cache_key, data)
@@ -1012,8 +1037,7 @@ class AnimationCacheService:
             self.pre_generate_animation(evolution_level, animation_type, resolution)
             
         if base_cache_path.exists():
-            with open(base_cache_path, 'rb') as f:
-                base_data = self._deobfuscate_data(f.read())
+            base_data = self._read_obfuscated_file(base_cache_path)
         else:
             logger.error(f"Failed to generate/find base animation for {evolution_level}")
             return b"" # Should return error or placeholder
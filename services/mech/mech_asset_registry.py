@@ -0,0 +1,149 @@
+# -*- coding: utf-8 -*-
+# ============================================================================ #
+# DockerDiscordControl (DDC)                                                  #
+# https://ddc.bot                                                              #
+# Copyright (c) 2025 MAX                                                  #
+# Licensed under the MIT License                                               #
+# ============================================================================ #
+
+"""
+Mech Asset Registry - In-memory, content-addressed store for served mech images.
+
+Keeps the bytes of pre-rendered display images and generated animations in
+memory together with a strong ETag derived from their content, so the Web UI
+can answer ``If-None-Match`` with 304 and serve repeat requests without
+touching the disk. File-backed assets are revalidated with a single ``stat``
+call, which picks up re-renders by MechDisplayCacheService immediately.
+"""
+
+import hashlib
+import logging
+import os
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+# Display images are ~50-300 KB each; 22 images plus a few animations fit easily.
+DEFAULT_MAX_BYTES = 32 * 1024 * 1024
+
+
+def compute_etag(data: bytes) -> str:
+    """Return the content hash used as (unquoted) strong ETag for ``data``."""
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+@dataclass(frozen=True)
+class MechAsset:
+    """A served asset and its content-derived ETag."""
+    data: bytes
+    etag: str
+    # (st_mtime_ns, st_size, st_ino) for file-backed assets, None for generated bytes
+    signature: Optional[Tuple[int, int, int]] = None
+
+    @property
+    def size(self) -> int:
+        return len(self.data)
+
+
+class MechAssetRegistry:
+    """LRU-bounded registry of mech assets keyed by file path or logical name."""
+
+    def __init__(self, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self._assets: "OrderedDict[str, MechAsset]" = OrderedDict()
+        self._total_bytes = 0
+        self._lock = threading.Lock()
+
+    def get_file(self, path: Union[str, Path]) -> MechAsset:
+        """Return the asset for ``path``, reading the file only if it changed.
+
+        Raises:
+            OSError: If the file cannot be stat'ed or read.
+        """
+        key = str(path)
+        stat = os.stat(key)
+        signature = (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+
+        with self._lock:
+            asset = self._assets.get(key)
+            if asset is not None and asset.signature == signature:
+                self._assets.move_to_end(key)
+                return asset
+
+        with open(key, 'rb') as f:
+            data = f.read()
+        asset = MechAsset(data=data, etag=compute_etag(data), signature=signature)
+        self._store(key, asset)
+        logger.debug(f"Registered mech asset {key} ({asset.size} bytes, etag {asset.etag})")
+        return asset
+
+    def register_bytes(self, key: str, data: bytes) -> MechAsset:
+        """Register generated bytes under a logical ``key``.
+
+        Re-registering the same bytes object is free; different content under
+        the same key replaces the previous asset and yields a new ETag.
+        """
+        with self._lock:
+            asset = self._assets.get(key)
+            if asset is not None and asset.data is data:
+                self._assets.move_to_end(key)
+                return asset
+
+        asset = MechAsset(data=data, etag=compute_etag(data))
+        self._store(key, asset)
+        return asset
+
+    def invalidate(self, key: Union[str, Path]) -> None:
+        """Drop a single asset (e.g. after its file was rewritten or deleted)."""
+        with self._lock:
+            asset = self._assets.pop(str(key), None)
+            if asset is not None:
+                self._total_bytes -= asset.size
+
+    def clear(self) -> None:
+        with self._lock:
+            self._assets.clear()
+            self._total_bytes = 0
+
+    def get_stats(self) -> dict:
+        with self._lock:
+            return {
+                'assets': len(self._assets),
+                'total_bytes': self._total_bytes,
+                'max_bytes': self.max_bytes,
+            }
+
+    def _store(self, key: str, asset: MechAsset) -> None:
+        with self._lock:
+            previous = self._assets.pop(key, None)
+            if previous is not None:
+                self._total_bytes -= previous.size
+            if asset.size > self.max_bytes:
+                # Too large to keep; still returned to the caller
+                return
+            self._assets[key] = asset
+            self._total_bytes += asset.size
+            while self._total_bytes > self.max_bytes:
+                _, evicted = self._assets.popitem(last=False)
+                self._total_bytes -= evicted.size
+
+
+# Singleton instance
+_mech_asset_registry: Optional[MechAssetRegistry] = None
+_registry_lock = threading.Lock()
+
+
+def get_mech_asset_registry() -> MechAssetRegistry:
+    """Get the singleton MechAssetRegistry instance."""
+    global _mech_asset_registry
+
+    if _mech_asset_registry is None:
+        with _registry_lock:
+            if _mech_asset_registry is None:
+                _mech_asset_registry = MechAssetRegistry()
+
+    return _mech_asset_registry
@@ -12,16 +12,37 @@ Mech Display Cache Service - Pre-renders all mech display images for instant Dis
 Prevents Discord interaction timeouts by pre-generating:
 1. Shadow silhouettes for locked mechs (levels 1-11)
 2. Display animations for unlocked mechs (with consistent speed/power)
+
+Rendering is incremental: a manifest in the cache directory records the
+content hash of the sources each image was rendered from, so only images
+whose sources changed (or whose output is missing) are rendered again.
+Levels that need work are rendered in a bounded process pool.
 """
 
 import io
+import json
 import logging
+import os
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from multiprocessing import get_context
 from pathlib import Path
-from typing import Optional
-from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
+from dataclasses import dataclass, field
+
+from services.mech.mech_asset_registry import compute_etag, get_mech_asset_registry
 
 logger = logging.getLogger(__name__)
 
+IMAGE_TYPES = ('shadow', 'unlocked')
+MANIFEST_FILENAME = "display_manifest.json"
+MANIFEST_VERSION = 1
+
+# Renders are CPU-bound (WebP decode/encode); more workers than this only
+# adds memory pressure on small NAS boxes. Override via DDC_DISPLAY_RENDER_WORKERS.
+MAX_RENDER_WORKERS = 4
+
 
 @dataclass(frozen=True)
 class MechDisplayCacheRequest:
@@ -36,6 +57,16 @@ class MechDisplayCacheResult:
     success: bool
     message: str
     levels_processed: int = 0
+    level_timings: Dict[int, float] = field(default_factory=dict)  # Render seconds per rendered level
+
+
+@dataclass(frozen=True)
+class LevelRenderReport:
+    """Outcome of rendering the images of one evolution level."""
+    level: int
+    rendered: Tuple[str, ...] = ()
+    failed: Tuple[str, ...] = ()
+    seconds: float = 0.0
 
 
 @dataclass(frozen=True)
@@ -52,15 +83,30 @@ class MechDisplayImageResult:
     image_bytes: Optional[bytes] = None
     filename: Optional[str] = None
     error_message: Optional[str] = None
+    etag: Optional[str] = None  # Content hash of image_bytes
+
+
+def _render_level_in_worker(cache_dir: str, evolution_level: int, image_types: Tuple[str, ...]) -> LevelRenderReport:
+    """Process pool entry point: render one level with a worker-local service."""
+    return MechDisplayCacheService(cache_dir=Path(cache_dir))._render_level(evolution_level, image_types)
+
+
+def _file_signature(path: Path) -> Optional[List[int]]:
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return [stat.st_mtime_ns, stat.st_size]
 
 
 class MechDisplayCacheService:
     """Service for pre-rendering and serving mech display images."""
 
-    def __init__(self):
+    def __init__(self, cache_dir: Optional[Path] = None):
+        if cache_dir is not None:
+            self.cache_dir = cache_dir
         # Use correct path for Docker vs Local (consistent with AnimationCacheService)
-        import os
-        if os.path.exists("/app/cached_animations"):
+        elif os.path.exists("/app/cached_animations"):
             # Docker environment - V2.0 cache-only mode
             self.cache_dir = Path("/app/cached_displays")
         else:
@@ -70,55 +116,20 @@ class MechDisplayCacheService:
         # Create cache directory for display images
         self.cache_dir.mkdir(exist_ok=True)
 
+        # One pre-render run at a time (manifest is read-modify-write)
+        self._render_lock = threading.Lock()
+
         logger.info(f"MechDisplayCacheService initialized with cache dir: {self.cache_dir}")
 
     def pre_render_all_displays(self, request: MechDisplayCacheRequest) -> MechDisplayCacheResult:
-        """Pre-render all mech display images for instant loading."""
-        try:
-            levels_to_process = [request.evolution_level] if request.evolution_level else list(range(1, 12))
-            processed_count = 0
-            skipped_count = 0
-
-            logger.info(f"Pre-rendering mech display images for levels: {levels_to_process}")
-
-            for level in levels_to_process:
-                # Check if pre-rendering is needed
-                shadow_needed = self._is_pre_rendering_needed(level, 'shadow', request.force_regenerate)
-                unlocked_needed = self._is_pre_rendering_needed(level, 'unlocked', request.force_regenerate)
-
-                if not shadow_needed and not unlocked_needed:
-                    logger.debug(f"Level {level} display images already cached and up-to-date")
-                    skipped_count += 1
-                    processed_count += 1  # Count as processed since it's available
-                    continue
-
-                # Pre-render only what's needed
-                shadow_success = True
-                unlocked_success = True
-
-                if shadow_needed:
-                    shadow_success = self._pre_render_shadow_image(level, force=True)
-
-                if unlocked_needed:
-                    unlocked_success = self._pre_render_unlocked_image(level, force=True)
-
-                if shadow_success and unlocked_success:
-                    processed_count += 1
-                    logger.debug(f"Successfully pre-rendered Level {level} display images")
-                else:
-                    logger.warning(f"Failed to pre-render some images for Level {level}")
-
-            if skipped_count > 0:
-                message = f"Pre-rendered display images for {processed_count}/{len(levels_to_process)} levels ({skipped_count} already cached)"
-            else:
-                message = f"Pre-rendered display images for {processed_count}/{len(levels_to_process)} levels"
-            logger.info(message)
+        """Pre-render all mech display images for instant loading.
 
-            return MechDisplayCacheResult(
-                success=processed_count > 0,
-                message=message,
-                levels_processed=processed_count
-            )
+        Only images whose sources changed since the last render (or whose
+        output is missing) are rendered; levels are rendered in parallel.
+        """
+        try:
+            with self._render_lock:
+                return self._pre_render(request)
 
         except (RuntimeError, AttributeError) as e:
             # Orchestration errors (method call failures, service access)
@@ -137,48 +148,242 @@ class MechDisplayCacheService:
                 message=error_msg
             )
 
-    def _is_pre_rendering_needed(self, evolution_level: int, image_type: str, force_regenerate: bool) -> bool:
+    def _pre_render(self, request: MechDisplayCacheRequest) -> MechDisplayCacheResult:
+        levels_to_process = [request.evolution_level] if request.evolution_level else list(range(1, 12))
+        manifest = self._load_manifest()
+
+        logger.info(f"Pre-rendering mech display images for levels: {levels_to_process}")
+
+        # Plan: which images of which levels need rendering
+        plan: Dict[int, Tuple[str, ...]] = {}
+        for level in levels_to_process:
+            needed = tuple(
+                image_type for image_type in IMAGE_TYPES
+                if self._is_pre_rendering_needed(level, image_type, request.force_regenerate, manifest)
+            )
+            for image_type in IMAGE_TYPES:
+                if image_type not in needed and self._manifest_entry(manifest, level, image_type) is None:
+                    # Up-to-date image from before the manifest existed: adopt it
+                    self._record_render(manifest, level, image_type)
+            if needed:
+                plan[level] = needed
+            else:
+                logger.debug(f"Level {level} display images already cached and up-to-date")
+
+        skipped_count = len(levels_to_process) - len(plan)
+        processed_count = skipped_count  # Cached levels count as processed since they're available
+        level_timings: Dict[int, float] = {}
+
+        for report in self._render_levels(plan):
+            for image_type in report.rendered:
+                self._record_render(manifest, report.level, image_type)
+            level_timings[report.level] = report.seconds
+            if report.failed:
+                logger.warning(f"Failed to pre-render {', '.join(report.failed)} image(s) for Level {report.level}")
+            else:
+                processed_count += 1
+                logger.info(f"Pre-rendered Level {report.level} ({', '.join(report.rendered)}) in {report.seconds:.2f}s")
+
+        self._save_manifest(manifest)
+
+        if skipped_count > 0:
+            message = f"Pre-rendered display images for {processed_count}/{len(levels_to_process)} levels ({skipped_count} already cached)"
+        else:
+            message = f"Pre-rendered display images for {processed_count}/{len(levels_to_process)} levels"
+        if level_timings:
+            message += f" in {sum(level_timings.values()):.2f}s render time"
+        logger.info(message)
+
+        return MechDisplayCacheResult(
+            success=processed_count > 0,
+            message=message,
+            levels_processed=processed_count,
+            level_timings=level_timings
+        )
+
+    # ------------------------------------------------------------------
+    # Rendering
+    # ------------------------------------------------------------------
+    def _render_worker_count(self, jobs: int) -> int:
+        try:
+            configured = int(os.environ.get("DDC_DISPLAY_RENDER_WORKERS", "0"))
+        except (TypeError, ValueError):
+            configured = 0
+        limit = configured if configured > 0 else min(MAX_RENDER_WORKERS, os.cpu_count() or 1)
+        return max(1, min(limit, jobs))
+
+    def _render_levels(self, plan: Dict[int, Tuple[str, ...]]) -> List[LevelRenderReport]:
+        """Render the planned levels, in a process pool when more than one worker helps."""
+        if not plan:
+            return []
+
+        workers = self._render_worker_count(len(plan))
+        if workers == 1:
+            return [self._render_level(level, image_types) for level, image_types in plan.items()]
+
+        reports: List[LevelRenderReport] = []
+        try:
+            # spawn: forking a process that runs threads/gevent can deadlock the child
+            with ProcessPoolExecutor(max_workers=workers, mp_context=get_context("spawn")) as pool:
+                futures = [
+                    pool.submit(_render_level_in_worker, str(self.cache_dir), level, image_types)
+                    for level, image_types in plan.items()
+                ]
+                for future in as_completed(futures):
+                    reports.append(future.result())
+        except (OSError, RuntimeError) as e:
+            # Pool unavailable or broken (BrokenProcessPool is a RuntimeError): finish serially
+            logger.warning(f"Parallel display rendering failed, continuing serially: {e}")
+            done = {report.level for report in reports}
+            reports.extend(
+                self._render_level(level, image_types)
+                for level, image_types in plan.items() if level not in done
+            )
+        return sorted(reports, key=lambda report: report.level)
+
+    def _render_level(self, evolution_level: int, image_types: Tuple[str, ...]) -> LevelRenderReport:
+        """Render the given images of one level and time it."""
+        started = time.perf_counter()
+        rendered, failed = [], []
+        for image_type in image_types:
+            if image_type == 'shadow':
+                success = self._pre_render_shadow_image(evolution_level, force=True)
+            else:
+                success = self._pre_render_unlocked_image(evolution_level, force=True)
+            (rendered if success else failed).append(image_type)
+        return LevelRenderReport(
+            level=evolution_level,
+            rendered=tuple(rendered),
+            failed=tuple(failed),
+            seconds=time.perf_counter() - started
+        )
+
+    # ------------------------------------------------------------------
+    # Manifest
+    # ------------------------------------------------------------------
+    def _image_path(self, evolution_level: int, image_type: str) -> Path:
+        return self.cache_dir / f"mech_{evolution_level}_{image_type}.webp"
+
+    def _load_manifest(self) -> Dict[str, Any]:
+        manifest_path = self.cache_dir / MANIFEST_FILENAME
+        try:
+            with open(manifest_path, 'r', encoding='utf-8') as f:
+                manifest = json.load(f)
+            if isinstance(manifest, dict) and manifest.get('version') == MANIFEST_VERSION:
+                manifest.setdefault('levels', {})
+                manifest.setdefault('files', {})
+                return manifest
+            logger.info(f"Ignoring display manifest with unknown format: {manifest_path}")
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError) as e:
+            logger.warning(f"Could not read display manifest {manifest_path}: {e}")
+        return {'version': MANIFEST_VERSION, 'levels': {}, 'files': {}}
+
+    def _save_manifest(self, manifest: Dict[str, Any]) -> None:
+        manifest_path = self.cache_dir / MANIFEST_FILENAME
+        tmp_path = manifest_path.with_suffix('.tmp')
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(manifest, f, indent=2, sort_keys=True)
+            os.replace(tmp_path, manifest_path)
+        except (OSError, TypeError, ValueError) as e:
+            logger.warning(f"Could not write display manifest {manifest_path}: {e}")
+
+    def _manifest_entry(self, manifest: Dict[str, Any], evolution_level: int, image_type: str) -> Optional[Dict[str, Any]]:
+        return manifest.get('levels', {}).get(str(evolution_level), {}).get(image_type)
+
+    def _record_render(self, manifest: Dict[str, Any], evolution_level: int, image_type: str) -> None:
+        output_signature = _file_signature(self._image_path(evolution_level, image_type))
+        if output_signature is None:
+            return
+        manifest.setdefault('levels', {}).setdefault(str(evolution_level), {})[image_type] = {
+            'source_hash': self._source_hash(evolution_level, image_type, manifest),
+            'output': output_signature,
+        }
+
+    def _source_files(self, evolution_level: int, image_type: str) -> List[Path]:
+        """Files an image is rendered from: the base animation cache plus PNG sources (dev only)."""
+        try:
+            from services.mech.animation_cache_service import get_animation_cache_service
+            cache_service = get_animation_cache_service()
+            resolution = 'small' if image_type == 'shadow' else 'big'
+            files = [Path(cache_service.get_cached_animation_path(evolution_level, 'walk', resolution))]
+        except (ImportError, AttributeError, TypeError, ValueError, OSError) as e:
+            # Service dependency errors (animation cache service unavailable)
+            logger.debug(f"Service dependency error resolving display sources for Level {evolution_level}: {e}")
+            return []
+
+        try:
+            source_folder = Path(cache_service._get_actual_mech_folder(evolution_level))
+            if source_folder.exists():
+                files.extend(sorted(source_folder.glob(f"{evolution_level}_*.png")))
+        except (AttributeError, TypeError, ValueError, OSError) as e:
+            # No PNG sources (V2.0 cache-only containers)
+            logger.debug(f"No PNG sources for Level {evolution_level}: {e}")
+
+        return [f for f in files if f.exists()]
+
+    def _source_hash(self, evolution_level: int, image_type: str, manifest: Dict[str, Any]) -> Optional[str]:
+        """Combined content hash of an image's sources; per-file hashes are reused while unchanged."""
+        file_hashes = manifest.setdefault('files', {})
+        parts = []
+        for path in self._source_files(evolution_level, image_type):
+            signature = _file_signature(path)
+            if signature is None:
+                continue
+            cached = file_hashes.get(str(path))
+            if cached is None or cached.get('signature') != signature:
+                try:
+                    cached = {'signature': signature, 'hash': compute_etag(path.read_bytes())}
+                except OSError as e:
+                    logger.debug(f"Could not hash display source {path}: {e}")
+                    continue
+                file_hashes[str(path)] = cached
+            parts.append(f"{path.name}:{cached['hash']}")
+        if not parts:
+            return None
+        return compute_etag("\n".join(parts).encode('utf-8'))
+
+    def _is_pre_rendering_needed(self, evolution_level: int, image_type: str, force_regenerate: bool,
+                                 manifest: Optional[Dict[str, Any]] = None) -> bool:
         """Check if pre-rendering is needed for a specific level and image type."""
         if force_regenerate:
             return True
 
-        # Check if cache file exists
-        if image_type == 'shadow':
-            cache_path = self.cache_dir / f"mech_{evolution_level}_shadow.webp"
-        else:  # unlocked
-            cache_path = self.cache_dir / f"mech_{evolution_level}_unlocked.webp"
-
+        cache_path = self._image_path(evolution_level, image_type)
         if not cache_path.exists():
             logger.debug(f"Pre-rendering needed for Level {evolution_level} {image_type}: file missing")
             return True
 
-        # Check if source files are newer (optional optimization for future updates)
-        try:
-            from services.mech.animation_cache_service import get_animation_cache_service
-            cache_service = get_animation_cache_service()
+        if manifest is None:
+            manifest = self._load_manifest()
+        entry = self._manifest_entry(manifest, evolution_level, image_type)
 
-            # Get source PNG folder for this level
-            source_folder = cache_service._get_actual_mech_folder(evolution_level)
+        try:
+            if entry is not None:
+                if entry.get('output') != _file_signature(cache_path):
+                    logger.debug(f"Pre-rendering needed for Level {evolution_level} {image_type}: output replaced")
+                    return True
+                source_hash = self._source_hash(evolution_level, image_type, manifest)
+                if source_hash is not None and source_hash != entry.get('source_hash'):
+                    logger.debug(f"Pre-rendering needed for Level {evolution_level} {image_type}: sources changed")
+                    return True
+                return False
 
-            if source_folder.exists():
-                # Find the newest PNG file
-                png_files = list(source_folder.glob(f"{evolution_level}_*.png"))
-                if png_files:
-                    newest_png_time = max(f.stat().st_mtime for f in png_files)
-                    cache_time = cache_path.stat().st_mtime
-
-                    if newest_png_time > cache_time:
-                        logger.debug(f"Pre-rendering needed for Level {evolution_level} {image_type}: source files newer")
-                        return True
+            # Not in the manifest yet: fall back to comparing modification times
+            source_files = self._source_files(evolution_level, image_type)
+            if source_files:
+                newest_source_time = max(f.stat().st_mtime for f in source_files)
+                if newest_source_time > cache_path.stat().st_mtime:
+                    logger.debug(f"Pre-rendering needed for Level {evolution_level} {image_type}: source files newer")
+                    return True
         except (IOError, OSError) as e:
             # File system errors (stat, path access)
-            logger.debug(f"File system error checking source file timestamps: {e}")
-        except (ImportError, AttributeError) as e:
-            # Service dependency errors (animation cache service unavailable)
-            logger.debug(f"Service dependency error checking source file timestamps: {e}")
+            logger.debug(f"File system error checking display sources: {e}")
         except (ValueError, TypeError) as e:
-            # Data processing errors (timestamp comparison)
-            logger.debug(f"Data error checking source file timestamps: {e}")
+            # Data processing errors (manifest contents, timestamp comparison)
+            logger.debug(f"Data error checking display sources: {e}")
 
         return False
 
@@ -189,51 +394,43 @@ class MechDisplayCacheService:
             from services.mech.animation_cache_service import get_animation_cache_service
 
             cache_service = get_animation_cache_service()
-            shadow_path = self.cache_dir / f"mech_{evolution_level}_shadow.webp"
+            shadow_path = self._image_path(evolution_level, 'shadow')
 
             # Skip if already exists and not forced
             if shadow_path.exists() and not force:
                 logger.debug(f"Shadow image already exists for Level {evolution_level}")
                 return True
 
-            # Get the cached WebP animation
-            webp_bytes = cache_service.get_animation_with_speed(evolution_level, 100.0)
+            # Base-speed animation: served straight from the base cache without
+            # re-encoding; speed only changes frame durations, not the first frame
+            webp_bytes = cache_service.get_animation_with_speed(evolution_level, 50.0)
 
             if not webp_bytes:
                 logger.error(f"No animation data for Level {evolution_level}")
                 return False
 
-            # Load the first frame from WebP bytes
+            # Only the first frame is decoded
             with Image.open(io.BytesIO(webp_bytes)) as cached_webp:
                 # Get first frame (already perfectly cropped and sized!)
-                first_frame = cached_webp.copy().convert('RGBA')
-
-                # Create silhouette: keep transparent pixels transparent, make all others black
-                silhouette_data = []
-                for pixel in first_frame.getdata():
-                    r, g, b, a = pixel
-                    if a == 0:
-                        # Keep transparent pixels transparent
-                        silhouette_data.append((0, 0, 0, 0))
-                    else:
-                        # Make all non-transparent pixels black
-                        silhouette_data.append((0, 0, 0, min(180, a)))  # Semi-transparent black
-
-                # Create silhouette image (same size as cached WebP!)
-                silhouette_img = Image.new('RGBA', first_frame.size)
-                silhouette_img.putdata(silhouette_data)
-
-                # Save as static WebP to cache
-                silhouette_img.save(
-                    shadow_path,
-                    format='WebP',
-                    lossless=True,
-                    quality=100,
-                    method=6  # Maximum compression quality
-                )
+                first_frame = cached_webp.convert('RGBA')
+
+            # Silhouette: transparent pixels stay transparent, all others become
+            # semi-transparent black (alpha capped at 180)
+            alpha = first_frame.getchannel('A').point(lambda a: min(180, a))
+            black = Image.new('L', first_frame.size, 0)
+            silhouette_img = Image.merge('RGBA', (black, black, black, alpha))
+
+            # Save as static WebP to cache
+            silhouette_img.save(
+                shadow_path,
+                format='WebP',
+                lossless=True,
+                quality=100,
+                method=6  # Maximum compression quality
+            )
 
-                logger.debug(f"Pre-rendered shadow image: {shadow_path}")
-                return True
+            logger.debug(f"Pre-rendered shadow image: {shadow_path}")
+            return True
 
         except (ImportError, AttributeError) as e:
             # Service dependency errors (PIL, animation cache service unavailable)
@@ -255,7 +452,7 @@ class MechDisplayCacheService:
             from services.mech.animation_cache_service import get_animation_cache_service
 
             animation_service = get_animation_cache_service()
-            unlocked_path = self.cache_dir / f"mech_{evolution_level}_unlocked.webp"
+            unlocked_path = self._image_path(evolution_level, 'unlocked')
 
             # Skip if already exists and not forced
             if unlocked_path.exists() and not force:
@@ -269,9 +466,11 @@ class MechDisplayCacheService:
                 logger.error(f"No pre-rendered big animation for Level {evolution_level}")
                 return False
 
-            # Save pre-rendered animation to cache
-            with open(unlocked_path, 'wb') as f:
+            # Save pre-rendered animation to cache (atomically: the Web UI may be serving it)
+            tmp_path = unlocked_path.with_suffix('.tmp')
+            with open(tmp_path, 'wb') as f:
                 f.write(animation_bytes)
+            os.replace(tmp_path, unlocked_path)
 
             logger.debug(f"Pre-rendered unlocked image: {unlocked_path}")
             return True
@@ -317,14 +516,14 @@ class MechDisplayCacheService:
                             error_message=f"Failed to generate unlocked for Level {request.evolution_level}"
                         )
 
-            # Load pre-rendered image
-            with open(image_path, 'rb') as f:
-                image_bytes = f.read()
+            # Served from the in-memory registry; the file is only re-read after a re-render
+            asset = get_mech_asset_registry().get_file(image_path)
 
             return MechDisplayImageResult(
                 success=True,
-                image_bytes=image_bytes,
-                filename=filename
+                image_bytes=asset.data,
+                filename=filename,
+                etag=asset.etag
             )
 
         except (IOError, OSError) as e:
@@ -349,8 +548,10 @@ class MechDisplayCacheService:
         try:
             deleted_count = 0
 
+            registry = get_mech_asset_registry()
             for image_file in self.cache_dir.glob("mech_*_*.webp"):
                 image_file.unlink()
+                registry.invalidate(image_file)
                 deleted_count += 1
 
             message = f"Cleared {deleted_count} pre-rendered display images"
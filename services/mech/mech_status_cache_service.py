@@ -9,15 +9,19 @@
 
 """
 Mech Status Cache Service - Provides high-performance cached access to mech status
-with background refresh loop for instant Discord and Web UI responses.
+for instant Discord and Web UI responses.
+
+The cache holds one computed mech state. Donation events and progress
+snapshot changes mark it stale, and the next read recomputes it once. Between
+changes, power decay is derived analytically from the progress service's
+decay anchor at read time, so there is no TTL and no polling loop.
 """
 
 import logging
-import asyncio
 import threading
 import time
 from typing import Dict, Any, Optional
-from dataclasses import dataclass
+from dataclasses import dataclass, is_dataclass, replace
 from datetime import datetime, timezone
 
 logger = logging.getLogger(__name__)
@@ -59,30 +63,37 @@ class MechStatusCacheResult:
     error_message: Optional[str] = None
 
 
+@dataclass(frozen=True)
+class _CachedMechState:
+    """Computed mech state plus what is needed to derive power over time."""
+    result: MechStatusCacheResult
+    anchor: Optional[Any]  # progress_service.DecayAnchor
+    computed_at: float
+    generation: int
+
+
 class MechStatusCacheService:
     """
-    High-performance mech status cache with background refresh loop.
+    Push-invalidated mech status cache.
 
     Features:
-    - 30-second background refresh loop
-    - 45-second TTL for cache entries
-    - Instant response for Discord/Web UI
+    - Single computed state shared by the decimal and non-decimal views
+    - Invalidated by donation events and progress snapshot changes
+    - Power decay derived on read from the last state change
     - Thread-safe cache access
-    - Fallback to direct service calls
     """
 
     def __init__(self):
         self.logger = logger.getChild(self.__class__.__name__)
 
         # Cache storage
-        self._cache: Dict[str, Any] = {}
+        self._state: Optional[_CachedMechState] = None
         self._cache_lock = threading.RLock()
-        self._cache_ttl = 45.0  # 45 seconds TTL
-
-        # Background loop control
-        self._loop_task: Optional[asyncio.Task] = None
-        self._loop_running = False
-        self._refresh_interval = 30.0  # 30 seconds refresh
+        self._refresh_lock = threading.Lock()
+        self._generation = 0
+        self._refresh_count = 0
+        # Speed info depends on power only; reuse it while power is unchanged
+        self._derived: Dict[int, MechStatusCacheResult] = {}
 
         # SERVICE FIRST: Event-based cache invalidation setup
         self._setup_event_listeners()
@@ -91,7 +102,7 @@ class MechStatusCacheService:
 
     def get_cached_status(self, request: MechStatusCacheRequest) -> MechStatusCacheResult:
         """
-        Get mech status from cache with fallback to direct service call.
+        Get mech status from cache, recomputing it only after a state change.
 
         Args:
             request: MechStatusCacheRequest with configuration
@@ -100,21 +111,10 @@ class MechStatusCacheService:
             MechStatusCacheResult with cached or fresh data
         """
         try:
-            # Check cache first (unless force refresh)
-            if not request.force_refresh:
-                cached_result = self._get_from_cache(request.include_decimals)
-                if cached_result:
-                    self.logger.debug(f"Cache hit: age {cached_result.cache_age_seconds:.1f}s")
-                    return cached_result
-
-            # Cache miss or force refresh - get fresh data
-            self.logger.debug("Cache miss or force refresh - fetching fresh data")
-            fresh_result = self._fetch_fresh_status(request.include_decimals)
-
-            # Store in cache
-            self._store_in_cache(fresh_result, request.include_decimals)
-
-            return fresh_result
+            state = self._get_state(force_refresh=request.force_refresh)
+            if not state.result.success:
+                return state.result
+            return self._derive_result(state, request.include_decimals)
 
         except (ImportError, AttributeError) as e:
             # Service dependency errors (data store unavailable)
@@ -131,41 +131,85 @@ class MechStatusCacheService:
                 error_message=f"Data processing error: {str(e)}"
             )
 
-    def _get_from_cache(self, include_decimals: bool) -> Optional[MechStatusCacheResult]:
-        """Get status from cache if valid."""
-        cache_key = f"mech_status_{include_decimals}"
-
+    def _get_state(self, force_refresh: bool = False) -> _CachedMechState:
+        """Return the cached state, recomputing it if missing or invalidated."""
         with self._cache_lock:
-            cache_entry = self._cache.get(cache_key)
-            if not cache_entry:
-                return None
-
-            # Check TTL
-            cache_age = time.time() - cache_entry['timestamp']
-            if cache_age > self._cache_ttl:
-                self.logger.debug(f"Cache expired: {cache_age:.1f}s > {self._cache_ttl}s")
-                del self._cache[cache_key]
-                return None
-
-            # Return cached result with age metadata
-            result = cache_entry['result']
-            result.cache_age_seconds = cache_age
-            return result
-
-    def _store_in_cache(self, result: MechStatusCacheResult, include_decimals: bool):
-        """Store result in cache with timestamp."""
-        cache_key = f"mech_status_{include_decimals}"
+            state = self._state
+            if state is not None and not force_refresh and state.generation == self._generation:
+                return state
+
+        with self._refresh_lock:
+            with self._cache_lock:
+                state = self._state
+                generation = self._generation
+                if state is not None and not force_refresh and state.generation == generation:
+                    return state
+
+            # The data store already returns full precision; both views share it
+            result = self._fetch_fresh_status(True)
+            anchor = self._fetch_decay_anchor() if result.success else None
+            state = _CachedMechState(result=result, anchor=anchor,
+                                     computed_at=time.time(), generation=generation)
+            with self._cache_lock:
+                self._refresh_count += 1
+                self._derived = {}
+                # Failures are returned but not kept, so the next read retries
+                if result.success:
+                    self._state = state
+            self.logger.debug(f"Mech state recomputed (generation {generation})")
+            return state
+
+    def _fetch_decay_anchor(self):
+        """Get the decay anchor from the progress service (None if unavailable)."""
+        try:
+            from services.mech.progress_service import get_progress_service
+            return get_progress_service().get_decay_anchor()
+        except (ImportError, AttributeError, RuntimeError, OSError, ValueError) as e:
+            # Without an anchor the cached power is served as-is until the next change
+            self.logger.warning(f"Could not get mech decay anchor: {e}")
+            return None
+
+    def _derive_result(self, state: _CachedMechState, include_decimals: bool) -> MechStatusCacheResult:
+        """Build the response for ``now`` from the cached state."""
+        now = time.time()
+        base = state.result
+        power = base.power
+        if state.anchor is not None:
+            power = state.anchor.power_at(now) / 100.0
+        power_cents = int(round(power * 100))
 
         with self._cache_lock:
-            result.cached_at = datetime.now(timezone.utc)
-            result.cache_age_seconds = 0.0
-
-            self._cache[cache_key] = {
-                'result': result,
-                'timestamp': time.time()
-            }
-
-            self.logger.debug(f"Stored in cache: {cache_key}")
+            derived = self._derived.get(power_cents)
+        if derived is None:
+            derived = base if power_cents == int(round(base.power * 100)) else self._with_power(base, power)
+            with self._cache_lock:
+                # One entry is enough: power only ever moves forward in time
+                self._derived = {power_cents: derived}
+
+        return replace(
+            derived,
+            cached_at=datetime.fromtimestamp(state.computed_at, timezone.utc),
+            cache_age_seconds=now - state.computed_at,
+        )
+
+    def _with_power(self, base: MechStatusCacheResult, power: float) -> MechStatusCacheResult:
+        """Copy ``base`` with decayed ``power`` and the matching speed info."""
+        from services.mech.speed_levels import get_combined_mech_status
+
+        combined_status = get_combined_mech_status(
+            Power_amount=power,
+            total_donations_received=base.total_donated
+        )
+        bars = base.bars
+        if bars is not None and is_dataclass(bars):
+            bars = replace(bars, Power_current=power)
+        return replace(
+            base,
+            power=power,
+            bars=bars,
+            speed_description=combined_status['speed']['description'],
+            speed_color=combined_status['speed']['color'],
+        )
 
     def _fetch_fresh_status(self, include_decimals: bool) -> MechStatusCacheResult:
         """Fetch fresh mech status directly from progress service."""
@@ -184,7 +228,7 @@ class MechStatusCacheService:
                 language = 'de'  # Fallback to German
 
             data_store = get_mech_data_store()
-            data_request = MechDataRequest(include_decimals=include_decimals, language=language)
+            data_request = MechDataRequest(include_decimals=include_decimals, language=language, force_refresh=True)
             data_result = data_store.get_comprehensive_data(data_request)
 
             if not data_result.success:
@@ -235,84 +279,6 @@ class MechStatusCacheService:
                 error_message=f"Data processing error: {str(e)}"
             )
 
-    async def start_background_loop(self):
-        """Start the background cache refresh loop."""
-        if self._loop_running:
-            self.logger.warning("Background loop already running")
-            return
-
-        self._loop_running = True
-        self.logger.info(f"Starting mech status cache loop (interval: {self._refresh_interval}s, TTL: {self._cache_ttl}s)")
-
-        try:
-            while self._loop_running:
-                await self._background_refresh()
-                await asyncio.sleep(self._refresh_interval)
-
-        except asyncio.CancelledError:
-            self.logger.info("Background loop cancelled")
-        except (ImportError, AttributeError, RuntimeError) as e:
-            # Service errors or asyncio runtime errors
-            self.logger.error(f"Background loop error: {e}", exc_info=True)
-        finally:
-            self._loop_running = False
-            self.logger.info("Background loop stopped")
-
-    async def _background_refresh(self):
-        """
-        Perform background cache refresh AND mech decay calculation.
-
-        CRITICAL: This is the SINGLE POINT OF TRUTH for mech power decay.
-        By calling get_state() here, we ensure power can decay to $0 even
-        without user interaction, enabling offline mech animations.
-        """
-        try:
-            self.logger.debug("Background cache refresh starting...")
-
-            # CRITICAL: Trigger mech decay calculation FIRST
-            # This ensures Power can decay to $0 without user interaction
-            try:
-                from services.mech.progress_service import get_progress_service
-                mech_service = get_progress_service()
-
-                # get_state() triggers apply_decay_on_demand()
-                loop = asyncio.get_running_loop()
-                mech_state = await loop.run_in_executor(None, mech_service.get_state)
-
-                # Log if offline (Power = 0) for debugging
-                if mech_state.is_offline:
-                    self.logger.info(f"[CACHE_REFRESH] Mech is OFFLINE (Power: $0.00) - offline animation active")
-                else:
-                    self.logger.debug(f"[CACHE_REFRESH] Power decay calculated: ${mech_state.power_current:.2f}")
-            except (ImportError, AttributeError, RuntimeError) as decay_error:
-                # Service errors (progress service unavailable, asyncio errors)
-                self.logger.warning(f"[CACHE_REFRESH] Failed to calculate mech decay: {decay_error}")
-
-            # Refresh both decimal variants of cache
-            for include_decimals in [False, True]:
-                request = MechStatusCacheRequest(
-                    include_decimals=include_decimals,
-                    force_refresh=True
-                )
-
-                # Run in thread pool to avoid blocking
-                loop = asyncio.get_running_loop()
-                await loop.run_in_executor(None, self.get_cached_status, request)
-
-            self.logger.debug("Background cache refresh completed")
-
-        except (ImportError, AttributeError, RuntimeError, asyncio.CancelledError) as e:
-            # Service errors, asyncio errors
-            self.logger.error(f"Background refresh error: {e}", exc_info=True)
-
-    def stop_background_loop(self):
-        """Stop the background cache refresh loop."""
-        self._loop_running = False
-        if self._loop_task:
-            self._loop_task.cancel()
-            self._loop_task = None
-        self.logger.info("Background loop stop requested")
-
     def _setup_event_listeners(self):
         """Set up Service First event listeners for cache invalidation."""
         try:
@@ -331,6 +297,14 @@ class MechStatusCacheService:
             # Event manager setup errors (import failure, manager unavailable)
             self.logger.error(f"Failed to setup event listeners: {e}", exc_info=True)
 
+        try:
+            # Snapshot changes that do not go through the donation flow
+            # (power gifts, system donations, deletions, rebuilds)
+            from services.mech.progress import get_progress_runtime
+            get_progress_runtime().add_state_listener(self._handle_progress_state_change)
+        except (ImportError, AttributeError, RuntimeError) as e:
+            self.logger.error(f"Failed to register progress state listener: {e}", exc_info=True)
+
     def _handle_donation_event(self, event_data):
         """Handle donation completion events for immediate cache invalidation."""
         try:
@@ -384,35 +358,38 @@ class MechStatusCacheService:
             # Event data parsing errors
             self.logger.error(f"Error handling state change event: {e}", exc_info=True)
 
+    def _handle_progress_state_change(self, mech_id: str):
+        """Progress snapshot changed - runs under the progress lock, so only mark stale."""
+        self.invalidate()
+        self.logger.debug(f"Mech status cache invalidated by progress state change ({mech_id})")
+
+    def invalidate(self):
+        """Mark the cached state stale; the next read recomputes it."""
+        with self._cache_lock:
+            self._generation += 1
+
     def clear_cache(self):
         """Clear all cached data."""
         with self._cache_lock:
-            cache_count = len(self._cache)
-            self._cache.clear()
-            self.logger.info(f"Cache cleared: {cache_count} entries removed")
+            had_state = self._state is not None
+            self._generation += 1
+            self._state = None
+            self._derived = {}
+            self.logger.info(f"Cache cleared: {int(had_state)} entries removed")
 
     def get_cache_stats(self) -> Dict[str, Any]:
         """Get cache statistics."""
         with self._cache_lock:
-            stats = {
-                'entries': len(self._cache),
-                'ttl_seconds': self._cache_ttl,
-                'refresh_interval_seconds': self._refresh_interval,
-                'loop_running': self._loop_running,
-                'entries_detail': {}
+            state = self._state
+            return {
+                'entries': 1 if state is not None else 0,
+                'stale': state is None or state.generation != self._generation,
+                'generation': self._generation,
+                'refresh_count': self._refresh_count,
+                'age_seconds': round(time.time() - state.computed_at, 1) if state else None,
+                'analytic_decay': state is not None and state.anchor is not None,
             }
 
-            # Add entry details
-            for key, entry in self._cache.items():
-                age = time.time() - entry['timestamp']
-                stats['entries_detail'][key] = {
-                    'age_seconds': round(age, 1),
-                    'expires_in_seconds': round(self._cache_ttl - age, 1),
-                    'is_expired': age > self._cache_ttl
-                }
-
-            return stats
-
 
 # Singleton instance
 _mech_status_cache_service = None
@@ -21,7 +21,7 @@ import json
 import logging
 from dataclasses import dataclass, field
 from threading import RLock
-from typing import Dict, Optional
+from typing import Callable, Dict, Hashable, List, Optional
 from zoneinfo import ZoneInfo
 
 from services.mech.progress_paths import ProgressPaths, clear_progress_paths_cache, get_progress_paths
@@ -38,6 +38,8 @@ class ProgressRuntime:
     _default_config: Optional[Dict[str, object]] = field(default=None, init=False, repr=False)
     _config_cache: Optional[Dict[str, object]] = field(default=None, init=False, repr=False)
     _timezone: Optional[ZoneInfo] = field(default=None, init=False, repr=False)
+    _state_listeners: List[Callable[[str], None]] = field(default_factory=list, init=False, repr=False)
+    _state_fingerprints: Dict[str, Hashable] = field(default_factory=dict, init=False, repr=False)
 
     def configure_defaults(self, default_config: Dict[str, object]) -> None:
         """Register the default configuration used to seed new installs."""
@@ -133,6 +135,47 @@ class ProgressRuntime:
                 self._timezone = ZoneInfo(default_tz)
         return self._timezone
 
+    # ------------------------------------------------------------------
+    # State change notification
+    # ------------------------------------------------------------------
+    def add_state_listener(self, callback: Callable[[str], None]) -> None:
+        """Register ``callback(mech_id)`` to run whenever a snapshot changes.
+
+        Callbacks run on the persisting thread while the progress lock is
+        held, so they must be cheap and must not call back into the progress
+        service (mark state dirty, wake a loop, ...).
+        """
+
+        with self.lock:
+            if callback not in self._state_listeners:
+                self._state_listeners.append(callback)
+
+    def remove_state_listener(self, callback: Callable[[str], None]) -> None:
+        with self.lock:
+            if callback in self._state_listeners:
+                self._state_listeners.remove(callback)
+
+    def record_state(self, mech_id: str, fingerprint: Hashable, *, notify: bool) -> None:
+        """Remember the fingerprint of ``mech_id``'s snapshot.
+
+        Listeners are invoked when ``notify`` is set and the fingerprint
+        differs from the last recorded one, so re-persisting an unchanged
+        snapshot (as ``get_state`` does) stays silent.
+        """
+
+        with self.lock:
+            previous = self._state_fingerprints.get(mech_id)
+            self._state_fingerprints[mech_id] = fingerprint
+            if not notify or previous == fingerprint:
+                return
+            listeners = list(self._state_listeners)
+
+        for callback in listeners:
+            try:
+                callback(mech_id)
+            except (RuntimeError, AttributeError, TypeError, ValueError) as exc:
+                logger.warning("Progress state listener failed: %s", exc, exc_info=True)
+
 
 _runtime: Optional[ProgressRuntime] = None
 
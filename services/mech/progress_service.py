@@ -239,7 +239,9 @@ def load_snapshot(mech_id: str) -> Snapshot:
     if p.exists():
         try:
             with open(p, "r", encoding="utf-8") as f:
-                return Snapshot.from_json(json.load(f))
+                snap = Snapshot.from_json(json.load(f))
+            runtime.record_state(mech_id, state_fingerprint(snap), notify=False)
+            return snap
         except (json.JSONDecodeError, ValueError, KeyError) as e:
             # Corrupted snapshot file - log warning and recreate from events
             logger.warning(f"Corrupted snapshot file detected ({e}), rebuilding from events...")
@@ -294,6 +296,15 @@ def persist_snapshot(snap: Snapshot) -> None:
             pass
         raise  # Re-raise original exception
 
+    runtime.record_state(snap.mech_id, state_fingerprint(snap), notify=True)
+
+
+def state_fingerprint(snap: Snapshot) -> Tuple[Any, ...]:
+    """Fields whose change alters the UI state (decay is derived from them)."""
+    return (snap.version, snap.last_event_seq, snap.level, snap.power_acc, snap.evo_acc,
+            snap.goal_requirement, snap.goal_started_at, snap.cumulative_donations_cents,
+            snap.difficulty_bin)
+
 
 # ---------------------
 # Domain utils
@@ -557,27 +568,41 @@ def set_new_goal_for_next_level(snap: Snapshot, user_count: int) -> None:
                 f"bin={b}, users={user_count})")
 
 
+@dataclass(frozen=True)
+class DecayAnchor:
+    """Inputs of the continuous power decay, so power can be derived for any time."""
+    power_acc: int  # cents accumulated at started_ts
+    started_ts: Optional[float]  # epoch seconds of goal start, None = no decay
+    decay_per_day: int  # cents
+
+    def power_at(self, ts: float) -> int:
+        """Power in cents at epoch ``ts``.
+
+        Formula: current_power = power_acc - (elapsed_seconds / 86400) * decay_per_day
+        """
+        if self.started_ts is None:
+            return self.power_acc
+        decay_amount = ((ts - self.started_ts) / 86400.0) * self.decay_per_day
+        return max(0, self.power_acc - int(decay_amount))
+
+
+def decay_anchor(snap: Snapshot) -> DecayAnchor:
+    """Build the :class:`DecayAnchor` for ``snap``."""
+    if not snap.goal_started_at:
+        return DecayAnchor(power_acc=snap.power_acc, started_ts=None, decay_per_day=0)
+    try:
+        goal_time = datetime.fromisoformat(snap.goal_started_at.replace('Z', '+00:00'))
+        return DecayAnchor(power_acc=snap.power_acc, started_ts=goal_time.timestamp(),
+                           decay_per_day=decay_per_day(snap.level))
+    except (ValueError, TypeError, KeyError) as e:
+        # Data processing errors (datetime parsing, attribute access, calculations)
+        logger.warning(f"Data error calculating continuous decay: {e}")
+        return DecayAnchor(power_acc=snap.power_acc, started_ts=None, decay_per_day=0)
+
+
 def compute_ui_state(snap: Snapshot) -> ProgressState:
     # Calculate CONTINUOUS power decay based on elapsed time
-    # Formula: current_power = power_acc - (elapsed_seconds / 86400) * decay_per_day
-    power_acc_with_decay = snap.power_acc
-    if snap.goal_started_at:
-        try:
-            from datetime import datetime
-            from zoneinfo import ZoneInfo
-            goal_time = datetime.fromisoformat(snap.goal_started_at.replace('Z', '+00:00'))
-            now = datetime.now(ZoneInfo("UTC"))
-            elapsed_seconds = (now - goal_time).total_seconds()
-
-            dpp = decay_per_day(snap.level)
-            decay_amount = (elapsed_seconds / 86400.0) * dpp
-            power_acc_with_decay = max(0, snap.power_acc - int(decay_amount))
-        except ImportError as e:
-            # Import errors (zoneinfo module not available)
-            logger.warning(f"Import error calculating continuous decay: {e}")
-        except (ValueError, TypeError, KeyError) as e:
-            # Data processing errors (datetime parsing, attribute access, calculations)
-            logger.warning(f"Data error calculating continuous decay: {e}")
+    power_acc_with_decay = decay_anchor(snap).power_at(time.time())
 
     power_max_cents = snap.goal_requirement + 100 if snap.goal_requirement > 0 else 100  # +$1
     power_percent = int((power_acc_with_decay * 100) // power_max_cents)
@@ -749,6 +774,11 @@ class ProgressService:
             persist_snapshot(snap)
             return compute_ui_state(snap)
 
+    def get_decay_anchor(self) -> DecayAnchor:
+        """Current :class:`DecayAnchor`, for callers that derive power on read."""
+        with LOCK:
+            return decay_anchor(load_snapshot(self.mech_id))
+
     def add_donation(self, amount_dollars: float, donor: Optional[str] = None,
                     channel_id: Optional[str] = None, idempotency_key: Optional[str] = None) -> ProgressState:
         """Add a donation and return updated state"""
@@ -8,9 +8,11 @@
 
 """Public entry points for member count helpers."""
 
+from .membership_index import MembershipIndex
 from .service import MemberCountService, get_member_count_service, reset_member_count_service
 
 __all__ = [
+    "MembershipIndex",
     "MemberCountService",
     "get_member_count_service",
     "reset_member_count_service",
@@ -0,0 +1,175 @@
+# -*- coding: utf-8 -*-
+# ============================================================================ #
+# DockerDiscordControl (DDC)                                                  #
+# https://ddc.bot                                                              #
+# Copyright (c) 2025 MAX                                                  #
+# Licensed under the MIT License                                               #
+# ============================================================================ #
+
+"""Incrementally maintained index of who can see the status channels."""
+
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, Optional, Set, Tuple
+
+from utils.logging_utils import get_module_logger
+
+# Full rebuild at least this often, in case a gateway event was missed
+DEFAULT_RECONCILE_INTERVAL_SECONDS = 6 * 60 * 60
+
+
+def is_countable_member(member: Any) -> bool:
+    """Bots and system users are never counted."""
+
+    return not getattr(member, "bot", False) and not getattr(member, "system", False)
+
+
+def can_view_channel(channel: Any, member: Any) -> bool:
+    """Return whether *member* can see *channel*.
+
+    Uses ``channel.permissions_for`` when available (what ``channel.members``
+    is computed from), otherwise membership in ``channel.members``.
+    """
+
+    permissions_for = getattr(channel, "permissions_for", None)
+    if callable(permissions_for):
+        try:
+            permissions = permissions_for(member)
+            return bool(getattr(permissions, "view_channel", getattr(permissions, "read_messages", False)))
+        except (AttributeError, TypeError, ValueError):
+            pass
+    return any(getattr(m, "id", None) == getattr(member, "id", None) for m in getattr(channel, "members", []))
+
+
+@dataclass(slots=True)
+class _GuildIndex:
+    channel_ids: Tuple[int, ...]
+    channel_members: Dict[int, Set[int]] = field(default_factory=dict)
+    # member id -> number of indexed channels the member can see
+    ref_counts: Dict[int, int] = field(default_factory=dict)
+    built_at: float = 0.0
+
+
+class MembershipIndex:
+    """Per-guild visibility sets for the status channels.
+
+    :meth:`rebuild` walks ``channel.members`` once (O(channels x members));
+    afterwards join/leave/role/overwrite events adjust the sets and
+    :meth:`unique_count` is O(1). A guild whose channel set changed, or whose
+    last rebuild is older than the reconcile interval, reports itself as not
+    current so the caller rebuilds it.
+    """
+
+    def __init__(self, reconcile_interval: float = DEFAULT_RECONCILE_INTERVAL_SECONDS) -> None:
+        self._logger = get_module_logger("member_count.index")
+        self._reconcile_interval = reconcile_interval
+        self._guilds: Dict[int, _GuildIndex] = {}
+
+    # ------------------------------------------------------------------
+    # Build / query
+    # ------------------------------------------------------------------
+    def is_current(self, guild_id: int, channel_ids: Iterable[int]) -> bool:
+        index = self._guilds.get(guild_id)
+        if index is None or index.channel_ids != tuple(sorted(channel_ids)):
+            return False
+        return (time.monotonic() - index.built_at) < self._reconcile_interval
+
+    def rebuild(self, guild_id: int, channels: Iterable[Any]) -> int:
+        """Index *channels* from their member lists; return how many could be read."""
+
+        channels = list(channels)
+        index = _GuildIndex(channel_ids=tuple(sorted(c.id for c in channels)), built_at=time.monotonic())
+        processed = 0
+        for channel in channels:
+            if not hasattr(channel, "members"):
+                self._logger.warning(
+                    "Channel %s has no members attribute (Members Intent required)",
+                    getattr(channel, "name", "?"),
+                )
+                continue
+            members = {m.id for m in getattr(channel, "members", []) if is_countable_member(m)}
+            index.channel_members[channel.id] = members
+            for member_id in members:
+                index.ref_counts[member_id] = index.ref_counts.get(member_id, 0) + 1
+            processed += 1
+            self._logger.debug("  └─ #%s: %s non-bot members", getattr(channel, "name", "?"), len(members))
+
+        self._guilds[guild_id] = index
+        return processed
+
+    def unique_count(self, guild_id: int) -> Optional[int]:
+        index = self._guilds.get(guild_id)
+        return len(index.ref_counts) if index is not None else None
+
+    def forget_guild(self, guild_id: int) -> None:
+        self._guilds.pop(guild_id, None)
+
+    def invalidate(self) -> None:
+        """Force a rebuild of every guild on the next count (e.g. config change)."""
+
+        self._guilds.clear()
+
+    # ------------------------------------------------------------------
+    # Incremental updates (gateway events)
+    # ------------------------------------------------------------------
+    def _set_visible(self, index: _GuildIndex, channel_id: int, member_id: int, visible: bool) -> None:
+        members = index.channel_members.get(channel_id)
+        if members is None:
+            return
+        if visible and member_id not in members:
+            members.add(member_id)
+            index.ref_counts[member_id] = index.ref_counts.get(member_id, 0) + 1
+        elif not visible and member_id in members:
+            members.discard(member_id)
+            remaining = index.ref_counts.get(member_id, 0) - 1
+            if remaining > 0:
+                index.ref_counts[member_id] = remaining
+            else:
+                index.ref_counts.pop(member_id, None)
+
+    def update_member(self, guild: Any, member: Any) -> None:
+        """Re-evaluate one member against every indexed channel (join, role change)."""
+
+        index = self._guilds.get(getattr(guild, "id", None))
+        if index is None:
+            return
+        if not is_countable_member(member):
+            return
+        for channel_id in index.channel_members:
+            channel = guild.get_channel(channel_id)
+            if channel is None:
+                continue
+            self._set_visible(index, channel_id, member.id, can_view_channel(channel, member))
+
+    def remove_member(self, guild_id: int, member_id: int) -> None:
+        index = self._guilds.get(guild_id)
+        if index is None:
+            return
+        for channel_id in index.channel_members:
+            self._set_visible(index, channel_id, member_id, False)
+
+    def refresh_channel(self, guild_id: int, channel: Any) -> None:
+        """Re-read one indexed channel (its permission overwrites changed)."""
+
+        index = self._guilds.get(guild_id)
+        if index is None or channel.id not in index.channel_members:
+            return
+        current = {m.id for m in getattr(channel, "members", []) if is_countable_member(m)}
+        previous = index.channel_members[channel.id]
+        for member_id in previous - current:
+            self._set_visible(index, channel.id, member_id, False)
+        for member_id in current - previous:
+            self._set_visible(index, channel.id, member_id, True)
+
+    def refresh_guild(self, guild: Any) -> None:
+        """Re-read every indexed channel of *guild* (a role's permissions changed)."""
+
+        index = self._guilds.get(getattr(guild, "id", None))
+        if index is None:
+            return
+        for channel_id in list(index.channel_members):
+            channel = guild.get_channel(channel_id)
+            if channel is not None:
+                self.refresh_channel(guild.id, channel)
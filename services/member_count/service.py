@@ -13,7 +13,7 @@ from __future__ import annotations
 import json
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from typing import Any, Dict, Iterable, Optional, Set, Tuple
+from typing import Any, Dict, Iterable, Optional, Tuple
 
 try:
     import discord
@@ -23,6 +23,8 @@ except ImportError:
 from services.mech.progress_paths import get_progress_paths
 from utils.logging_utils import get_module_logger
 
+from .membership_index import MembershipIndex
+
 
 @dataclass(slots=True)
 class _ChannelPermissionsCache:
@@ -39,6 +41,13 @@ class MemberCountService:
         self._logger = get_module_logger("member_count.service")
         self._paths = get_progress_paths()
         self._channel_perms = _ChannelPermissionsCache()
+        self._index = MembershipIndex()
+
+    @property
+    def membership_index(self) -> MembershipIndex:
+        """Index kept current by the member count monitor cog's gateway listeners."""
+
+        return self._index
 
     # ------------------------------------------------------------------
     # Guild helpers
@@ -111,20 +120,19 @@ class MemberCountService:
                 self._logger.info("No valid status channels found, using fallback member count")
                 return fallback_count
 
-            unique_members: Set[int] = set()
-            channels_processed = 0
-
-            for channel in status_channels:
-                processed = self._collect_channel_members(channel, unique_members)
-                channels_processed += int(processed)
-
-            if channels_processed == 0:
-                self._logger.warning(
-                    "Could not process any status channels, using fallback member count"
-                )
-                return fallback_count
-
-            unique_count = len(unique_members)
+            guild_id = getattr(guild, "id", None)
+            channel_ids = [channel.id for channel in status_channels]
+            if not self._index.is_current(guild_id, channel_ids):
+                # First count, changed channel set or periodic reconciliation: full scan
+                channels_processed = self._index.rebuild(guild_id, status_channels)
+                if channels_processed == 0:
+                    self._index.forget_guild(guild_id)
+                    self._logger.warning(
+                        "Could not process any status channels, using fallback member count"
+                    )
+                    return fallback_count
+
+            unique_count = self._index.unique_count(guild_id) or 0
             if unique_count == 0:
                 self._logger.warning(
                     "No unique members detected in status channels; using fallback count %s",
@@ -181,6 +189,7 @@ class MemberCountService:
         """Clear cached configuration so it is reloaded on the next access."""
 
         self._channel_perms = _ChannelPermissionsCache()
+        self._index.invalidate()
 
     def _load_channel_permissions(self) -> Dict[str, Dict[str, Any]]:
         if self._channel_perms.loaded:
@@ -235,30 +244,6 @@ class MemberCountService:
             )
             yield channel
 
-    def _collect_channel_members(self, channel: Any, unique_members: Set[int]) -> bool:
-        if not hasattr(channel, "members"):
-            self._logger.warning(
-                "Channel %s has no members attribute (Members Intent required)",
-                getattr(channel, "name", "?"),
-            )
-            return False
-
-        member_count = 0
-        for member in getattr(channel, "members", []):
-            try:
-                if getattr(member, "bot", False):
-                    continue
-                if hasattr(member, "system") and getattr(member, "system"):
-                    continue
-
-                unique_members.add(member.id)
-                member_count += 1
-            except (RuntimeError, ValueError, TypeError) as e:
-                self._logger.debug("Error processing member: %s", e)
-
-        self._logger.debug("  └─ #%s: %s non-bot members", getattr(channel, "name", "?"), member_count)
-        return True
-
     def _resolve_fallback_count(self, guild: Any, fallback: Optional[int]) -> int:
         if fallback is not None and fallback > 0:
             return fallback
@@ -25,6 +25,7 @@ from typing import Dict, List, Optional
 
 import pytz
 
+from services.scheduling.task_store import TaskStore
 from utils.logging_utils import get_module_logger
 
 logger = get_module_logger("scheduler.runtime")
@@ -40,6 +41,7 @@ class _SchedulerRuntimeState:
     last_modified_time: float = 0.0
     last_file_size: int = 0
     timezone_cache: Dict[str, object] = field(default_factory=dict)
+    task_store: TaskStore = field(default_factory=TaskStore)
 
 
 class SchedulerRuntime:
@@ -105,6 +107,11 @@ class SchedulerRuntime:
         self._state.container_cache.clear()
         self._state.container_cache_timestamp = 0.0
 
+    @property
+    def task_store(self) -> TaskStore:
+        """Heap-indexed view of the loaded tasks used by the scheduler loop."""
+        return self._state.task_store
+
     def invalidate_caches(self) -> None:
         self.clear_tasks_cache()
         self.clear_container_cache()
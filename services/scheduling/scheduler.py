@@ -21,6 +21,7 @@ from utils.time_utils import get_datetime_imports, get_current_time, get_utc_tim
 from utils.logging_utils import get_module_logger
 from services.config.config_service import load_config
 from services.scheduling.runtime import get_scheduler_runtime
+from services.scheduling.task_store import TaskStore
 # SERVICE FIRST: Use new Docker Action Service
 from services.docker_service.docker_action_service import docker_action_service_first
 from services.infrastructure.action_logger import log_user_action, user_action_logger
@@ -1126,14 +1127,60 @@ def load_tasks() -> List[ScheduledTask]:
 
     # Merge system tasks with user tasks, avoiding duplicates
     all_tasks = valid_tasks.copy()
+    known_ids = {task.task_id for task in all_tasks}
     for system_task in system_tasks:
         # Only add if not already present (by task_id)
-        if not any(task.task_id == system_task.task_id for task in all_tasks):
+        if system_task.task_id not in known_ids:
             all_tasks.append(system_task)
+            known_ids.add(system_task.task_id)
             logger.debug(f"Added system task: {system_task.task_id}")
 
+    # Rebuild the heap/slot index the scheduler loop works from
+    _runtime.task_store.replace(all_tasks)
+
     return all_tasks
 
+def refresh_task_store(force: bool = False) -> TaskStore:
+    """Return the in-memory task store, reloading tasks.json only when it changed.
+
+    The store is updated incrementally by add/update/delete_task, so a full
+    reload is only needed on first use or after an external edit of the file.
+    """
+    store = _runtime.task_store
+    if force or not store.loaded or _is_tasks_file_modified():
+        load_tasks()
+    return store
+
+def expire_missed_once_tasks(store: TaskStore, now: Optional[float] = None,
+                             grace_seconds: float = 0.0) -> int:
+    """Deactivate one-time tasks that can no longer run and persist the change.
+
+    A one-time task is expired once it has no next run, is completed, or its
+    scheduled time lies more than ``grace_seconds`` in the past (i.e. it
+    missed the scheduler's execution window). Returns the number of tasks
+    that were deactivated.
+    """
+    now = time.time() if now is None else now
+    expired = []
+    for task in store.tasks():
+        if not task.is_active or task.cycle != CYCLE_ONCE or task.is_system_task():
+            continue
+        if (task.next_run_ts is None or task.status == "completed"
+                or task.next_run_ts < now - grace_seconds):
+            expired.append(task)
+
+    if not expired:
+        return 0
+
+    for task in expired:
+        task.is_active = False
+        store.upsert(task)
+        logger.info(f"Task {task.task_id} is expired (one-time task past its run) and was deactivated")
+
+    if not _write_tasks(store.tasks()):
+        logger.error(f"Failed to persist deactivation of {len(expired)} expired tasks")
+    return len(expired)
+
 @lru_cache(maxsize=8)
 def _get_task_grouping_key(task):
     """Helper function to generate a key for task grouping in save_tasks.
@@ -1143,6 +1190,14 @@ def _get_task_grouping_key(task):
 def save_tasks(tasks: List[ScheduledTask]) -> bool:
     """Save all ScheduledTask objects to tasks.json."""
 
+    success = _write_tasks(tasks)
+    if success:
+        _runtime.task_store.replace(tasks)
+    return success
+
+def _write_tasks(tasks: List[ScheduledTask]) -> bool:
+    """Serialize ``tasks`` to tasks.json and refresh the id cache."""
+
     # Filter out system tasks - they should never be saved to file
     user_tasks = [task for task in tasks if not task.is_system_task()]
     logger.debug(f"Saving {len(user_tasks)} user tasks (filtered out {len(tasks) - len(user_tasks)} system tasks)")
@@ -1255,7 +1310,15 @@ def check_task_time_collision(container_name: str, new_task_next_run_ts: float,
     within a 10-minute window.
     """
     if existing_tasks_for_container is None:
-        existing_tasks_for_container = get_tasks_for_container(container_name)
+        # Slot index lookup: only the neighbouring 10-minute slots are inspected
+        conflict = refresh_task_store().find_collision(
+            container_name, new_task_next_run_ts,
+            ignore_task_id=task_id_to_ignore, interval=MIN_TASK_INTERVAL_SECONDS
+        )
+        if conflict is not None:
+            logger.warning(f"Task time collision for container '{container_name}'. New at {new_task_next_run_ts} vs existing {conflict.task_id} at {conflict.next_run_ts}")
+            return True
+        return False
 
     for existing_task in existing_tasks_for_container:
         if task_id_to_ignore and existing_task.task_id == task_id_to_ignore:
@@ -1283,22 +1346,23 @@ def add_task(task: ScheduledTask) -> bool:
              logger.error(f"Task {task.task_id} still has no next_run_ts after recalculation. Cannot add.")
              return False
 
-    tasks = load_tasks()
-    if any(t.task_id == task.task_id for t in tasks):
+    store = refresh_task_store()
+    if task.task_id in store:
         logger.warning(f"Task with ID {task.task_id} already exists. Not adding.")
         return False
 
     # BUGFIX: Check collision only for the same container, not all tasks
     if task.next_run_ts is not None:
-        # Get only tasks for the same container for collision check
-        existing_tasks_for_same_container = [t for t in tasks if t.container_name == task.container_name]
-        if check_task_time_collision(task.container_name, task.next_run_ts, existing_tasks_for_container=existing_tasks_for_same_container):
+        if check_task_time_collision(task.container_name, task.next_run_ts):
             logger.warning(f"Failed to add task {task.task_id} due to time collision with another task for container '{task.container_name}'.")
             return False
 
-    tasks.append(task)
-    logger.info(f"Task {task.task_id} ({task.container_name} - {task.action}) added. Total tasks: {len(tasks)}")
-    return save_tasks(tasks)
+    store.upsert(task)
+    if not _write_tasks(store.tasks()):
+        store.remove(task.task_id)
+        return False
+    logger.info(f"Task {task.task_id} ({task.container_name} - {task.action}) added. Total tasks: {len(store)}")
+    return True
 
 def update_task(task_to_update: ScheduledTask) -> bool:
     # Prevent updating system tasks
@@ -1321,27 +1385,25 @@ def update_task(task_to_update: ScheduledTask) -> bool:
             logger.error(f"Cannot update recurring task {task_to_update.task_id} as next_run_ts is still None after recalculation.")
             return False
 
-    tasks = load_tasks()
-    task_found = False
-    for i, t in enumerate(tasks):
-        if t.task_id == task_to_update.task_id:
-            # BUGFIX: Check for collisions before update (only for the same container, ignore the task itself)
-            if task_to_update.next_run_ts is not None:
-                # Get only tasks for the same container, excluding the task being updated
-                existing_tasks_for_same_container = [ex_task for ex_task in tasks
-                                                   if ex_task.container_name == task_to_update.container_name
-                                                   and ex_task.task_id != task_to_update.task_id]
-                if check_task_time_collision(task_to_update.container_name, task_to_update.next_run_ts,
-                                           existing_tasks_for_container=existing_tasks_for_same_container):
-                    logger.warning(f"Update for task {task_to_update.task_id} aborted due to time collision with another task for container '{task_to_update.container_name}'.")
-                    return False
-            tasks[i] = task_to_update
-            task_found = True
-            break
-    if not task_found:
+    store = refresh_task_store()
+    previous = store.get(task_to_update.task_id)
+    if previous is None:
         logger.warning(f"Task with ID {task_to_update.task_id} not found for update.")
         return False
-    return save_tasks(tasks)
+
+    # BUGFIX: Check for collisions before update (only for the same container, ignore the task itself)
+    if task_to_update.next_run_ts is not None:
+        if check_task_time_collision(task_to_update.container_name, task_to_update.next_run_ts,
+                                     task_id_to_ignore=task_to_update.task_id):
+            logger.warning(f"Update for task {task_to_update.task_id} aborted due to time collision with another task for container '{task_to_update.container_name}'.")
+            return False
+
+    store.upsert(task_to_update)
+    if not _write_tasks(store.tasks()):
+        if previous is not task_to_update:
+            store.upsert(previous)
+        return False
+    return True
 
 def delete_task(task_id: str) -> bool:
     # Prevent deletion of system tasks
@@ -1349,13 +1411,15 @@ def delete_task(task_id: str) -> bool:
         logger.warning(f"Cannot delete system task: {task_id}")
         return False
 
-    tasks = load_tasks()
-    original_count = len(tasks)
-    tasks = [t for t in tasks if t.task_id != task_id]
-    if len(tasks) == original_count:
+    store = refresh_task_store()
+    removed = store.remove(task_id)
+    if removed is None:
         logger.warning(f"Task with ID {task_id} not found for deletion.")
         return False
-    return save_tasks(tasks)
+    if not _write_tasks(store.tasks()):
+        store.upsert(removed)
+        return False
+    return True
 
 def get_tasks_in_timeframe(start_time: float, end_time: float) -> List[ScheduledTask]:
     """Get all tasks scheduled within a specific timeframe, using cache when possible."""
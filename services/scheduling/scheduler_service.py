@@ -11,18 +11,19 @@ import json
 import logging
 import time
 import sys
-from datetime import datetime, timedelta
+from datetime import datetime
 import threading
 from typing import Dict, List, Optional, Any
 import traceback
 import os
 
 from .scheduler import (
-    load_tasks,
     update_task,
     execute_task,
     ScheduledTask,
-    find_task_by_id
+    find_task_by_id,
+    refresh_task_store,
+    expire_missed_once_tasks
 )
 from utils.logging_utils import setup_logger
 
@@ -44,6 +45,10 @@ def _get_config_value(key: str, default_value: str) -> int:
 # Scheduler check interval - runs every minute for precise task execution
 CHECK_INTERVAL = _get_config_value('DDC_SCHEDULER_CHECK_INTERVAL', '60')  # 1 minute default
 
+# Upper bound for an idle sleep. In-process task edits wake the loop directly,
+# so this only bounds how long an external edit of tasks.json goes unnoticed.
+FILE_POLL_INTERVAL = _get_config_value('DDC_SCHEDULER_FILE_POLL_INTERVAL', '300')
+
 # CPU-OPTIMIZED: Batch processing settings
 MAX_CONCURRENT_TASKS = _get_config_value('DDC_MAX_CONCURRENT_TASKS', '3')  # Limit concurrent task execution
 TASK_BATCH_SIZE = _get_config_value('DDC_TASK_BATCH_SIZE', '5')  # Process tasks in batches
@@ -74,11 +79,16 @@ class SchedulerService:
         # loop instead of in its own thread. Lets stop() cancel cleanly.
         self._service_task = None
         self._owns_event_loop = False
+        # Heap-indexed task store the loop pops due tasks from, and the event
+        # used to wake the loop early when that store changes.
+        self._task_store = None
+        self._wakeup = None
         self.task_execution_stats = {
             'total_executed': 0,
             'total_skipped': 0,
             'last_batch_size': 0,
-            'avg_execution_time': 0.0
+            'avg_execution_time': 0.0,
+            'wakeups': 0
         }
 
     def start(self):
@@ -247,33 +257,80 @@ class SchedulerService:
             self.running = False
 
     async def _service_loop(self):
-        """Main loop of the service with CPU optimization."""
-        logger.info(f"CPU-optimized Scheduler Service loop started (interval: {CHECK_INTERVAL}s)")
-
-        while self.running:
-            try:
-                start_time = time.time()
-                await self._check_and_execute_tasks()
-                execution_time = time.time() - start_time
-
-                # Update statistics
-                self.task_execution_stats['avg_execution_time'] = (
-                    (self.task_execution_stats['avg_execution_time'] * 0.9) + (execution_time * 0.1)
-                )
+        """Main loop of the service with CPU optimization.
 
-                self.last_check_time = time.time()
+        Instead of polling every ``CHECK_INTERVAL`` the loop sleeps until the
+        next due task in the task store, until the store changes, or at most
+        ``FILE_POLL_INTERVAL`` seconds to pick up external edits of tasks.json.
+        """
+        logger.info(f"CPU-optimized Scheduler Service loop started (interval: {CHECK_INTERVAL}s)")
+        self._wakeup = asyncio.Event()
 
-                # CPU-OPTIMIZED: Dynamic sleep interval based on load
-                sleep_interval = self._calculate_optimal_sleep_interval(execution_time)
-                logger.debug(f"Scheduler check completed in {execution_time:.2f}s, sleeping for {sleep_interval}s")
+        try:
+            while self.running:
+                try:
+                    start_time = time.time()
+                    self.task_execution_stats['wakeups'] += 1
+                    await self._check_and_execute_tasks()
+                    execution_time = time.time() - start_time
+
+                    # Update statistics
+                    self.task_execution_stats['avg_execution_time'] = (
+                        (self.task_execution_stats['avg_execution_time'] * 0.9) + (execution_time * 0.1)
+                    )
+
+                    self.last_check_time = time.time()
+
+                    if not self.running:
+                        break
+
+                    sleep_interval = self._calculate_next_wakeup(execution_time)
+                    logger.debug(f"Scheduler check completed in {execution_time:.2f}s, sleeping for {sleep_interval:.1f}s")
+
+                    await self._wait_for_wakeup(sleep_interval)
+                except (ImportError, RuntimeError, OSError, AttributeError, TypeError, ValueError, KeyError) as e:
+                    # Task execution errors (import failures, runtime issues, I/O errors, attribute/type/value/key errors)
+                    logger.error(f"Error checking or executing tasks: {e}", exc_info=True)
+                    logger.error(traceback.format_exc())
+                    # CPU-OPTIMIZED: Longer sleep on error to prevent error loops
+                    await asyncio.sleep(min(CHECK_INTERVAL * 2, 300))  # Max 5 minutes
+        finally:
+            if self._task_store is not None:
+                self._task_store.remove_listener(self._on_tasks_changed)
+                self._task_store = None
+            self._wakeup = None
+
+    def _calculate_next_wakeup(self, last_execution_time: float) -> float:
+        """Seconds to sleep until the next due task (bounded by the file poll interval)."""
+        sleep_interval = self._calculate_optimal_sleep_interval(last_execution_time)
+        if sleep_interval > CHECK_INTERVAL:
+            # Back off while overloaded, regardless of what is due
+            return sleep_interval
+
+        next_due = self._task_store.next_due_ts() if self._task_store is not None else None
+        if next_due is None:
+            return FILE_POLL_INTERVAL
+        return min(max(next_due - time.time(), 0.0), FILE_POLL_INTERVAL)
+
+    async def _wait_for_wakeup(self, timeout: float):
+        """Sleep for ``timeout`` seconds or until the task store signals a change."""
+        wakeup = self._wakeup
+        if wakeup is None:
+            await asyncio.sleep(timeout)
+            return
+        try:
+            await asyncio.wait_for(wakeup.wait(), timeout=timeout)
+        except asyncio.TimeoutError:
+            pass
+        finally:
+            wakeup.clear()
 
-                await asyncio.sleep(sleep_interval)
-            except (ImportError, RuntimeError, OSError, AttributeError, TypeError, ValueError, KeyError) as e:
-                # Task execution errors (import failures, runtime issues, I/O errors, attribute/type/value/key errors)
-                logger.error(f"Error checking or executing tasks: {e}", exc_info=True)
-                logger.error(traceback.format_exc())
-                # CPU-OPTIMIZED: Longer sleep on error to prevent error loops
-                await asyncio.sleep(min(CHECK_INTERVAL * 2, 300))  # Max 5 minutes
+    def _on_tasks_changed(self):
+        """Task store listener; may be called from Web UI threads."""
+        loop = self.event_loop
+        wakeup = self._wakeup
+        if loop is not None and wakeup is not None and not loop.is_closed():
+            loop.call_soon_threadsafe(wakeup.set)
 
     def _calculate_optimal_sleep_interval(self, last_execution_time: float) -> int:
         """
@@ -312,36 +369,30 @@ class SchedulerService:
             # Check system tasks (like donations) first
             await self._check_system_tasks()
 
-            tasks = load_tasks()
-            if not tasks:
-                return
+            store = refresh_task_store()
+            if store is not self._task_store:
+                if self._task_store is not None:
+                    self._task_store.remove_listener(self._on_tasks_changed)
+                store.add_listener(self._on_tasks_changed)
+                self._task_store = store
 
-            current_time = datetime.now()
+            # Task is "due" if its scheduled time has passed, within a window so a
+            # delayed wakeup still catches it without running stale tasks
+            time_window = CHECK_INTERVAL * 1.5  # 90 seconds for 1-minute checks
             due_tasks = []
-
-            # First pass: Find all due tasks
-            for task in tasks:
-                if not task.is_active:  # Fixed: was task.enabled
+            for task in store.pop_due(time.time(), time_window):
+                # Skip if task is already running
+                if task.task_id in self.active_tasks:
+                    logger.debug(f"Task {task.container_name} (ID: {task.task_id}) is already running, skipping")
+                    self.task_execution_stats['total_skipped'] += 1
                     continue
 
-                if task.next_run_ts:
-                    task_time = datetime.fromtimestamp(task.next_run_ts)
-
-                    # Create a time window: task is "due" if scheduled time has passed
-                    # Use CHECK_INTERVAL as the window to ensure we catch tasks even if scheduler is delayed
-                    time_window = timedelta(seconds=CHECK_INTERVAL * 1.5)  # 90 seconds for 1-minute checks
-
-                    # Task is due if it's scheduled before now and within the time window
-                    # This prevents tasks from running too early while ensuring we don't miss delayed checks
-                    if task_time <= current_time < (task_time + time_window):
-                        # Skip if task is already running
-                        if task.task_id in self.active_tasks:
-                            logger.debug(f"Task {task.container_name} (ID: {task.task_id}) is already running, skipping")
-                            self.task_execution_stats['total_skipped'] += 1
-                            continue
+                due_tasks.append(task)
+                logger.debug(f"Task {task.task_id} is due (scheduled: {datetime.fromtimestamp(task.next_run_ts)})")
 
-                        due_tasks.append(task)
-                        logger.debug(f"Task {task.task_id} is due (scheduled: {task_time}, window: ±{time_window})")
+            # One-time tasks that missed their window are deactivated here, so the
+            # Web UI task list never has to write while rendering
+            expire_missed_once_tasks(store, time.time(), time_window)
 
             if not due_tasks:
                 logger.debug("No tasks due for execution")
@@ -355,10 +406,14 @@ class SchedulerService:
                 available_slots = MAX_CONCURRENT_TASKS - len(self.active_tasks)
                 if available_slots <= 0:
                     logger.info(f"Maximum concurrent tasks ({MAX_CONCURRENT_TASKS}) reached, deferring {len(due_tasks) - i} tasks")
+                    for deferred in due_tasks[i:]:
+                        store.requeue(deferred)
                     break
 
                 # Execute batch with concurrency limit
                 batch_to_execute = batch[:available_slots]
+                for deferred in batch[available_slots:]:
+                    store.requeue(deferred)
                 self.task_execution_stats['last_batch_size'] = len(batch_to_execute)
 
                 logger.info(f"Executing batch of {len(batch_to_execute)} tasks (active: {len(self.active_tasks)})")
@@ -408,6 +463,10 @@ class SchedulerService:
                 logger.error(traceback.format_exc())
             finally:
                 self.active_tasks.discard(task.task_id)
+                # System tasks are not persisted through update_task, so re-index
+                # their in-place rescheduled next_run_ts explicitly
+                if self._task_store is not None:
+                    self._task_store.reschedule(task.task_id)
 
         # Execute all tasks in the batch concurrently
         if tasks:
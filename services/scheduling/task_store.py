@@ -0,0 +1,311 @@
+# -*- coding: utf-8 -*-
+# ============================================================================ #
+# DockerDiscordControl (DDC)                                                  #
+# https://ddc.bot                                                              #
+# Copyright (c) 2025 MAX                                                  #
+# Licensed under the MIT License                                               #
+# ============================================================================ #
+
+"""In-memory index of scheduled tasks.
+
+The :class:`TaskStore` keeps every loaded task in a dictionary and maintains
+two secondary structures on top of it:
+
+* a min-heap keyed on ``next_run_ts`` so the scheduler loop can ask for the
+  next due timestamp and pop due tasks in ``O(log n)``;
+* a per-container time-slot index (slot width = collision interval) so the
+  ten-minute collision check only inspects the three neighbouring slots
+  instead of every task of the container.
+
+Heap entries are invalidated lazily: each task remembers the timestamp it is
+queued under and stale entries are discarded when they reach the top.  A task
+fires at most once per scheduled timestamp; it is only queued again once its
+``next_run_ts`` changes (normally via ``update_after_execution``).
+
+The store is duck-typed on ``task_id``, ``container_name``, ``next_run_ts``
+and ``is_active`` and never touches the filesystem - persistence stays in
+:mod:`services.scheduling.scheduler`.
+"""
+
+from __future__ import annotations
+
+import heapq
+import itertools
+import threading
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+from utils.logging_utils import get_module_logger
+
+logger = get_module_logger("scheduler.task_store")
+
+# Must match ``MIN_TASK_INTERVAL_SECONDS`` in the scheduler module.
+DEFAULT_SLOT_SECONDS = 10 * 60
+
+SlotKey = Tuple[str, int]
+
+
+class TaskStore:
+    """Heap- and slot-indexed collection of scheduled tasks."""
+
+    def __init__(self, slot_seconds: int = DEFAULT_SLOT_SECONDS) -> None:
+        self._slot_seconds = slot_seconds
+        self._lock = threading.RLock()
+        self._tasks: Dict[str, object] = {}
+        self._by_container: Dict[str, Dict[str, object]] = {}
+        self._slots: Dict[SlotKey, Set[str]] = {}
+        self._indexed_ts: Dict[str, float] = {}
+        self._heap: List[Tuple[float, int, str]] = []
+        self._queued: Dict[str, float] = {}
+        self._fired: Dict[str, float] = {}
+        self._counter = itertools.count()
+        self._listeners: List[Callable[[], None]] = []
+        self._loaded = False
+        self._version = 0
+
+    # ------------------------------------------------------------------
+    # Introspection
+    # ------------------------------------------------------------------
+    @property
+    def loaded(self) -> bool:
+        """``True`` once :meth:`replace` populated the store."""
+        return self._loaded
+
+    @property
+    def version(self) -> int:
+        """Monotonic counter bumped on every mutation."""
+        return self._version
+
+    def __len__(self) -> int:
+        return len(self._tasks)
+
+    def __contains__(self, task_id: object) -> bool:
+        return task_id in self._tasks
+
+    def get(self, task_id: str) -> Optional[object]:
+        return self._tasks.get(task_id)
+
+    def tasks(self) -> List[object]:
+        with self._lock:
+            return list(self._tasks.values())
+
+    def for_container(self, container_name: str) -> List[object]:
+        with self._lock:
+            return list(self._by_container.get(container_name, {}).values())
+
+    # ------------------------------------------------------------------
+    # Change notification
+    # ------------------------------------------------------------------
+    def add_listener(self, callback: Callable[[], None]) -> None:
+        """Register ``callback`` to be invoked after every mutation.
+
+        Callbacks run on the mutating thread and must be cheap; the scheduler
+        service only uses them to wake its event loop.
+        """
+        with self._lock:
+            if callback not in self._listeners:
+                self._listeners.append(callback)
+
+    def remove_listener(self, callback: Callable[[], None]) -> None:
+        with self._lock:
+            if callback in self._listeners:
+                self._listeners.remove(callback)
+
+    def _notify(self) -> None:
+        self._version += 1
+        for callback in list(self._listeners):
+            try:
+                callback()
+            except (RuntimeError, AttributeError, TypeError) as e:
+                # Listener errors (closed event loop, stale bound method)
+                logger.debug(f"Task store listener failed: {e}", exc_info=True)
+
+    # ------------------------------------------------------------------
+    # Mutation
+    # ------------------------------------------------------------------
+    def replace(self, tasks: Iterable[object]) -> None:
+        """Rebuild the store from a freshly loaded task list."""
+        with self._lock:
+            self._tasks = {}
+            self._by_container = {}
+            self._slots = {}
+            self._indexed_ts = {}
+            self._queued = {}
+            heap: List[Tuple[float, int, str]] = []
+
+            for task in tasks:
+                task_id = task.task_id
+                self._tasks[task_id] = task
+                self._by_container.setdefault(task.container_name, {})[task_id] = task
+                ts = task.next_run_ts
+                if ts is None:
+                    continue
+                self._index_slot(task.container_name, task_id, ts)
+                if task.is_active and self._fired.get(task_id) != ts:
+                    heap.append((ts, next(self._counter), task_id))
+                    self._queued[task_id] = ts
+
+            heapq.heapify(heap)
+            self._heap = heap
+            # Keep "already fired" markers only for tasks that still exist
+            self._fired = {tid: ts for tid, ts in self._fired.items() if tid in self._tasks}
+            self._loaded = True
+            self._notify()
+
+    def upsert(self, task: object) -> None:
+        """Insert ``task`` or replace the stored task with the same id."""
+        with self._lock:
+            task_id = task.task_id
+            previous = self._tasks.get(task_id)
+            if previous is not None and previous.container_name != task.container_name:
+                self._unindex(previous.container_name, task_id)
+                self._by_container.get(previous.container_name, {}).pop(task_id, None)
+            self._tasks[task_id] = task
+            self._by_container.setdefault(task.container_name, {})[task_id] = task
+            self._sync(task)
+            self._notify()
+
+    def remove(self, task_id: str) -> Optional[object]:
+        """Remove a task; its heap entry is discarded lazily."""
+        with self._lock:
+            task = self._tasks.pop(task_id, None)
+            if task is None:
+                return None
+            self._unindex(task.container_name, task_id)
+            container_tasks = self._by_container.get(task.container_name)
+            if container_tasks is not None:
+                container_tasks.pop(task_id, None)
+                if not container_tasks:
+                    del self._by_container[task.container_name]
+            self._queued.pop(task_id, None)
+            self._fired.pop(task_id, None)
+            self._notify()
+            return task
+
+    def reschedule(self, task_id: str) -> bool:
+        """Re-index a task whose object was mutated in place.
+
+        Returns ``True`` when the task's schedule changed.
+        """
+        with self._lock:
+            task = self._tasks.get(task_id)
+            if task is None:
+                return False
+            changed = self._sync(task)
+            if changed:
+                self._notify()
+            return changed
+
+    def requeue(self, task: object) -> None:
+        """Put a popped-but-not-executed task back into the heap."""
+        with self._lock:
+            if self._tasks.get(task.task_id) is not task:
+                return
+            self._fired.pop(task.task_id, None)
+            self._queued.pop(task.task_id, None)
+            self._sync(task)
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+    def find_collision(self, container_name: str, next_run_ts: Optional[float],
+                       ignore_task_id: Optional[str] = None,
+                       interval: Optional[float] = None) -> Optional[object]:
+        """Return a task of ``container_name`` scheduled within ``interval``."""
+        if next_run_ts is None:
+            return None
+        interval = self._slot_seconds if interval is None else interval
+        with self._lock:
+            slot = self._slot_of(next_run_ts)
+            reach = int(interval // self._slot_seconds) + 1
+            for key_slot in range(slot - reach, slot + reach + 1):
+                for task_id in self._slots.get((container_name, key_slot), ()):
+                    if task_id == ignore_task_id:
+                        continue
+                    if abs(self._indexed_ts[task_id] - next_run_ts) < interval:
+                        return self._tasks[task_id]
+        return None
+
+    def next_due_ts(self) -> Optional[float]:
+        """Timestamp of the earliest queued task, or ``None`` when idle."""
+        with self._lock:
+            self._discard_stale_top()
+            return self._heap[0][0] if self._heap else None
+
+    def pop_due(self, now: float, window: float) -> List[object]:
+        """Pop every task whose ``next_run_ts`` is ``<= now``.
+
+        Tasks older than ``window`` seconds are considered missed and are
+        dropped without being returned (matching the scheduler's historical
+        execution window).
+        """
+        due: List[object] = []
+        with self._lock:
+            while True:
+                self._discard_stale_top()
+                if not self._heap or self._heap[0][0] > now:
+                    break
+                ts, _, task_id = heapq.heappop(self._heap)
+                del self._queued[task_id]
+                self._fired[task_id] = ts
+                if now - ts < window:
+                    due.append(self._tasks[task_id])
+                else:
+                    logger.debug(f"Task {task_id} missed its execution window (scheduled {ts}), skipping")
+        return due
+
+    # ------------------------------------------------------------------
+    # Internal helpers
+    # ------------------------------------------------------------------
+    def _slot_of(self, ts: float) -> int:
+        return int(ts // self._slot_seconds)
+
+    def _index_slot(self, container_name: str, task_id: str, ts: float) -> None:
+        self._indexed_ts[task_id] = ts
+        self._slots.setdefault((container_name, self._slot_of(ts)), set()).add(task_id)
+
+    def _unindex(self, container_name: str, task_id: str) -> None:
+        ts = self._indexed_ts.pop(task_id, None)
+        if ts is None:
+            return
+        key = (container_name, self._slot_of(ts))
+        bucket = self._slots.get(key)
+        if bucket is not None:
+            bucket.discard(task_id)
+            if not bucket:
+                del self._slots[key]
+
+    def _sync(self, task: object) -> bool:
+        """Bring the slot index and heap in line with ``task``'s fields."""
+        task_id = task.task_id
+        ts = task.next_run_ts
+        changed = self._indexed_ts.get(task_id) != ts
+        if changed:
+            self._unindex(task.container_name, task_id)
+            if ts is not None:
+                self._index_slot(task.container_name, task_id, ts)
+
+        wants_queue = bool(task.is_active) and ts is not None and self._fired.get(task_id) != ts
+        if not wants_queue:
+            if self._queued.pop(task_id, None) is not None:
+                changed = True
+        elif self._queued.get(task_id) != ts:
+            heapq.heappush(self._heap, (ts, next(self._counter), task_id))
+            self._queued[task_id] = ts
+            changed = True
+        return changed
+
+    def _discard_stale_top(self) -> None:
+        heap = self._heap
+        while heap:
+            ts, _, task_id = heap[0]
+            task = self._tasks.get(task_id)
+            if task is None or self._queued.get(task_id) != ts:
+                heapq.heappop(heap)
+                continue
+            if not task.is_active or task.next_run_ts != ts:
+                # Object was mutated without going through upsert/reschedule
+                heapq.heappop(heap)
+                self._queued.pop(task_id, None)
+                self._sync(task)
+                continue
+            break
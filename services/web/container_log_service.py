@@ -15,7 +15,9 @@ for various log types including container logs, bot logs, Discord logs, and acti
 import os
 import logging
 import asyncio
-from typing import Dict, Any, Optional, List
+from collections import deque
+from datetime import datetime, timezone
+from typing import Dict, Any, Optional, List, BinaryIO, Deque
 from dataclasses import dataclass
 from enum import Enum
 
@@ -69,6 +71,96 @@ class LogResult:
     status_code: int = 200
 
 
+TAIL_BLOCK_SIZE = 64 * 1024
+
+
+def read_tail_lines(f: BinaryIO, max_lines: int, block_size: int = TAIL_BLOCK_SIZE) -> bytes:
+    """
+    Return the last ``max_lines`` lines of a binary file object.
+
+    Seeks backwards from the end in ``block_size`` chunks and stops as soon
+    as enough newlines have been seen, so the cost depends on the size of
+    the tail rather than the size of the file.
+    """
+    if max_lines <= 0:
+        return b''
+
+    f.seek(0, os.SEEK_END)
+    position = f.tell()
+    blocks: List[bytes] = []
+    newlines = 0
+
+    # One newline more than requested guarantees the first kept line is complete
+    while position > 0 and newlines <= max_lines:
+        read_size = min(block_size, position)
+        position -= read_size
+        f.seek(position)
+        block = f.read(read_size)
+        blocks.append(block)
+        newlines += block.count(b'\n')
+
+    data = b''.join(reversed(blocks))
+    lines = data.splitlines(keepends=True)
+    return b''.join(lines[-max_lines:])
+
+
+class ContainerLogCursor:
+    """
+    Per-viewer cursor for incremental streaming of a container's logs.
+
+    The first poll fetches the last ``max_lines`` lines; later polls only
+    ask Docker for lines newer than the cursor (``since=``) and append them
+    to a bounded window. Lines must be fetched with ``timestamps=True`` so
+    that lines sharing the cursor second can be de-duplicated.
+    """
+
+    def __init__(self, container_name: str, max_lines: int = 50):
+        self.container_name = container_name
+        self.max_lines = max_lines
+        self.last_timestamp: Optional[str] = None
+        self.lines: Deque[str] = deque(maxlen=max_lines)
+
+    @staticmethod
+    def _since_epoch(timestamp: str) -> int:
+        """Convert Docker's RFC3339Nano timestamp to whole UTC epoch seconds."""
+        parsed = datetime.strptime(timestamp[:19], '%Y-%m-%dT%H:%M:%S')
+        return int(parsed.replace(tzinfo=timezone.utc).timestamp())
+
+    def poll(self, container) -> List[str]:
+        """
+        Fetch log lines newer than the cursor from a Docker container object.
+
+        Returns only the lines that were not seen before and advances the cursor.
+        """
+        kwargs: Dict[str, Any] = {'tail': self.max_lines, 'timestamps': True}
+        if self.last_timestamp:
+            # ``since`` is inclusive at second granularity; duplicates are dropped below
+            kwargs['since'] = self._since_epoch(self.last_timestamp)
+
+        raw = container.logs(**kwargs).decode('utf-8', errors='replace')
+        return self.feed(raw)
+
+    def feed(self, raw: str) -> List[str]:
+        """Append timestamped log text to the window and return the new lines."""
+        new_lines = []
+        for line in raw.splitlines():
+            if not line:
+                continue
+            timestamp = line.split(' ', 1)[0]
+            # Docker uses fixed-width RFC3339Nano, so string order is time order
+            if self.last_timestamp and timestamp <= self.last_timestamp:
+                continue
+            new_lines.append(line)
+            self.last_timestamp = timestamp
+
+        self.lines.extend(new_lines)
+        return new_lines
+
+    def render(self) -> str:
+        """Return the current window as a single string."""
+        return '\n'.join(self.lines)
+
+
 class ContainerLogService:
     """Service for comprehensive container and application log management."""
 
@@ -408,16 +500,14 @@ class ContainerLogService:
             raise
 
     def _read_log_file(self, file_path: str, max_lines: int) -> Optional[str]:
-        """Read log file with line limiting."""
+        """Read the last ``max_lines`` lines of a log file without loading all of it."""
         try:
             if not os.path.exists(file_path):
                 return None
 
-            with open(file_path, 'r', encoding='utf-8', errors='replace') as f:
-                lines = f.readlines()
-                # Get last max_lines
-                recent_lines = lines[-max_lines:] if len(lines) > max_lines else lines
-                return ''.join(recent_lines)
+            with open(file_path, 'rb') as f:
+                tail = read_tail_lines(f, max_lines)
+            return tail.decode('utf-8', errors='replace')
 
         except (IOError, OSError, PermissionError, UnicodeDecodeError) as e:
             # File I/O errors (read errors, permissions, decode errors)
@@ -60,6 +60,7 @@ class MechAnimationResult:
     cache_headers: Optional[Dict[str, str]] = None
     error: Optional[str] = None
     status_code: int = 200
+    etag: Optional[str] = None  # Content hash of animation_bytes
 
 
 @dataclass
@@ -155,14 +156,18 @@ class MechWebService:
                 self.logger.debug(f"Using small animation for resolution: {request.resolution}")
 
             if animation_bytes:
-                # TEMPORARY: Disable caching to force browser to load fresh animations after cache regeneration
-                cache_headers = {'Cache-Control': 'no-cache, no-store, must-revalidate', 'Pragma': 'no-cache', 'Expires': '0'}
+                # Content-addressed ETag: browsers revalidate every time (no-cache) and get a
+                # 304 until the level/speed changes or the animation cache is regenerated
+                from services.mech.mech_asset_registry import get_mech_asset_registry
+                asset = get_mech_asset_registry().register_bytes(f"live_animation/{request.resolution}", animation_bytes)
+                cache_headers = {'Cache-Control': 'no-cache'}
 
                 return MechAnimationResult(
                     success=True,
-                    animation_bytes=animation_bytes,
+                    animation_bytes=asset.data,
                     content_type='image/webp',
-                    cache_headers=cache_headers
+                    cache_headers=cache_headers,
+                    etag=asset.etag
                 )
             else:
                 # Animation generation failed - this should rarely happen with cache system
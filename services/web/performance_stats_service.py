@@ -56,6 +56,7 @@ class PerformanceStatsService:
             performance_data['scheduler'] = self._get_scheduler_stats()
             performance_data['system_memory'] = self._get_system_memory_stats()
             performance_data['process_memory'] = self._get_process_memory_stats()
+            performance_data['event_dispatch'] = self._get_event_dispatch_stats()
 
             # Add timestamp information
             performance_data['timestamp'] = time.time()
@@ -125,6 +126,15 @@ class PerformanceStatsService:
             self.logger.warning(f"Could not get scheduler stats: {e}")
             return {'error': str(e)}
 
+    def _get_event_dispatch_stats(self) -> Dict[str, Any]:
+        """Get per event type dispatch counters and latency of the event manager."""
+        try:
+            from services.infrastructure.event_manager import get_event_manager
+            return get_event_manager().get_dispatch_metrics()
+        except (AttributeError, ImportError, RuntimeError) as e:
+            self.logger.warning(f"Could not get event dispatch stats: {e}")
+            return {'error': str(e)}
+
     def _get_system_memory_stats(self) -> Dict[str, Any]:
         """Get system memory information."""
         try:
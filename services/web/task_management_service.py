@@ -14,8 +14,9 @@ creation, validation, scheduling, status management, and lifecycle operations.
 
 import time
 import logging
+import threading
 from datetime import datetime
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Tuple
 from dataclasses import dataclass
 
 logger = logging.getLogger(__name__)
@@ -56,6 +57,22 @@ class ListTasksResult:
     error: Optional[str] = None
 
 
+@dataclass(frozen=True)
+class TaskListView:
+    """Precomputed frontend rows for one task store version and timezone."""
+    store_id: int
+    store_version: int
+    timezone_str: str
+    valid_until: float  # Next next_run_ts after build time; is_in_past/expired flip there
+    tasks: Tuple[Dict[str, Any], ...]
+
+    def is_current(self, store, timezone_str: str, current_time: float) -> bool:
+        return (self.store_id == id(store)
+                and self.store_version == store.version
+                and self.timezone_str == timezone_str
+                and current_time < self.valid_until)
+
+
 @dataclass
 class UpdateTaskStatusRequest:
     """Represents a task status update request."""
@@ -123,6 +140,8 @@ class TaskManagementService:
 
     def __init__(self):
         self.logger = logger
+        self._task_view: Optional[TaskListView] = None
+        self._task_view_lock = threading.Lock()
 
     def add_task(self, request: AddTaskRequest) -> AddTaskResult:
         """
@@ -191,7 +210,12 @@ class TaskManagementService:
 
     def list_tasks(self, request: ListTasksRequest) -> ListTasksResult:
         """
-        List all tasks with status calculations and automatic cleanup.
+        List all tasks with frontend status and local-time formatting.
+
+        This is a pure read: rows are served from a precomputed view that is
+        rebuilt only when the scheduler's task store changes, the timezone
+        differs, or a task's scheduled time passes. Deactivating expired
+        one-time tasks is done by the scheduler service, not here.
 
         Args:
             request: ListTasksRequest with optional timezone
@@ -200,31 +224,20 @@ class TaskManagementService:
             ListTasksResult with tasks list or error information
         """
         try:
-            # Step 1: Load tasks and configuration
-            scheduled_tasks = self._load_tasks_from_scheduler()
+            store = self._get_task_store()
             timezone_str = self._determine_timezone(request.timezone_str)
-
-            # Step 2: Process each task for frontend display
-            tasks_list = []
-            tasks_to_update = []
             current_time = time.time()
 
-            for task in scheduled_tasks:
-                task_data = self._process_task_for_frontend(task, timezone_str, current_time)
-
-                # Check if task needs updating (expired, etc.)
-                if task_data.get('needs_update'):
-                    tasks_to_update.append(task)
-                    del task_data['needs_update']  # Remove internal flag
-
-                tasks_list.append(task_data)
-
-            # Step 3: Save changes for tasks that need updating
-            self._save_updated_tasks(tasks_to_update)
+            with self._task_view_lock:
+                view = self._task_view
+                if view is None or not view.is_current(store, timezone_str, current_time):
+                    view = self._build_task_view(store, timezone_str, current_time)
+                    self._task_view = view
 
+            # Shallow copies so callers cannot mutate the cached rows
             return ListTasksResult(
                 success=True,
-                tasks=tasks_list
+                tasks=[dict(task_data) for task_data in view.tasks]
             )
 
         except (ImportError, AttributeError, RuntimeError) as e:
@@ -655,10 +668,29 @@ class TaskManagementService:
             # Data errors (task attribute access)
             self.logger.error(f"Data error logging task creation: {e}", exc_info=True)
 
-    def _load_tasks_from_scheduler(self):
-        """Load all tasks from scheduler."""
-        from services.scheduling.scheduler import load_tasks
-        return load_tasks()
+    def _get_task_store(self):
+        """Return the scheduler's task store (reloaded only if tasks.json changed)."""
+        from services.scheduling.scheduler import refresh_task_store
+        return refresh_task_store()
+
+    def _build_task_view(self, store, timezone_str: str, current_time: float) -> TaskListView:
+        """Render every task of ``store`` for the frontend."""
+        # Read the version first: a concurrent mutation then only causes one extra rebuild
+        store_version = store.version
+        rows = []
+        valid_until = float('inf')
+        for task in store.tasks():
+            rows.append(self._process_task_for_frontend(task, timezone_str, current_time))
+            if task.next_run_ts and task.next_run_ts > current_time:
+                valid_until = min(valid_until, task.next_run_ts)
+
+        return TaskListView(
+            store_id=id(store),
+            store_version=store_version,
+            timezone_str=timezone_str,
+            valid_until=valid_until,
+            tasks=tuple(rows)
+        )
 
     def _process_task_for_frontend(self, task, timezone_str: str, current_time: float) -> Dict[str, Any]:
         """Process task data for frontend display with status calculations."""
@@ -677,55 +709,31 @@ class TaskManagementService:
         if task.next_run_ts:
             task_dict["next_run_local"] = self._format_timestamp_local(task.next_run_ts, timezone_str)
 
-        # Calculate frontend status and handle expired tasks
-        frontend_status, needs_update = self._calculate_frontend_status(task, current_time)
-        task_dict["frontend_status"] = frontend_status
+        # Calculate frontend status (read-only; the scheduler deactivates expired tasks)
+        task_dict["frontend_status"] = self._calculate_frontend_status(task, current_time)
         task_dict["is_in_past"] = task.next_run_ts and task.next_run_ts < current_time
 
-        if needs_update:
-            task_dict["needs_update"] = True
-
         return task_dict
 
-    def _calculate_frontend_status(self, task, current_time: float):
-        """Calculate frontend status and determine if task needs updating."""
+    def _calculate_frontend_status(self, task, current_time: float) -> str:
+        """Calculate the status shown in the frontend without modifying the task."""
         from services.scheduling.scheduler import CYCLE_ONCE
 
-        needs_update = False
-
-        # Check various expiration conditions
-        if task.next_run_ts is None and task.cycle == CYCLE_ONCE:
-            frontend_status = "expired"
-            if task.is_active:
-                task.is_active = False
-                needs_update = True
-                self.logger.info(f"Task {task.task_id} is marked as expired (no next_run_ts) and deactivated")
-
-        elif task.cycle == CYCLE_ONCE and task.status == "completed":
-            frontend_status = "expired"
-            if task.is_active:
-                task.is_active = False
-                needs_update = True
-                self.logger.info(f"Task {task.task_id} is marked as expired (status completed) and deactivated")
+        # One-time tasks that ran, were completed or whose time has passed
+        if task.cycle == CYCLE_ONCE and (
+                task.next_run_ts is None
+                or task.status == "completed"
+                or task.next_run_ts < current_time):
+            return "expired"
 
-        elif task.cycle == CYCLE_ONCE and task.next_run_ts and task.next_run_ts < current_time:
-            frontend_status = "expired"
-            if task.is_active:
-                task.is_active = False
-                needs_update = True
-                self.logger.info(f"Task {task.task_id} is marked as expired (time in past) and deactivated")
-
-        elif task.next_run_ts is None:
-            frontend_status = "deactivated" if not task.is_active else "expired"
+        if task.next_run_ts is None:
             self.logger.warning(f"Task {task.task_id} ({task.cycle}) has no next_run_ts")
+            return "deactivated" if not task.is_active else "expired"
 
-        elif not task.is_active:
-            frontend_status = "deactivated"
-
-        else:
-            frontend_status = "active"
+        if not task.is_active:
+            return "deactivated"
 
-        return frontend_status, needs_update
+        return "active"
 
     def _format_timestamp_local(self, timestamp: float, timezone_str: str) -> str:
         """Format timestamp in local timezone."""
@@ -743,23 +751,6 @@ class TaskManagementService:
             self.logger.error(f"Error formatting timestamp: {e}", exc_info=True)
             return datetime.fromtimestamp(timestamp).strftime("%Y-%m-%d %H:%M:%S")
 
-    def _save_updated_tasks(self, tasks_to_update: List):
-        """Save multiple updated tasks."""
-        if not tasks_to_update:
-            return
-
-        try:
-            from services.scheduling.scheduler import update_task
-            for task in tasks_to_update:
-                update_task(task)
-                self.logger.info(f"Task {task.task_id} was marked as expired and deactivated. Changes saved.")
-        except (ImportError, AttributeError, RuntimeError) as e:
-            # Service dependency errors (scheduler update_task unavailable)
-            self.logger.error(f"Service dependency error saving updated tasks: {e}", exc_info=True)
-        except (ValueError, TypeError) as e:
-            # Data errors (task update failed)
-            self.logger.error(f"Data error saving updated tasks: {e}", exc_info=True)
-
     def _find_task_by_id(self, task_id: str):
         """Find task by ID using scheduler."""
         try:
@@ -0,0 +1,56 @@
+# -*- coding: utf-8 -*-
+# ============================================================================ #
+# DockerDiscordControl (DDC) - Performance Test Fixtures                      #
+# https://ddc.bot                                                              #
+# Copyright (c) 2025 MAX                                                       #
+# Licensed under the MIT License                                               #
+# ============================================================================ #
+"""
+Fixtures shared by the performance suites that run against the fake Docker daemon.
+"""
+
+import tempfile
+from pathlib import Path
+from typing import List
+
+import pytest
+
+from tests.performance.fake_docker_daemon import FakeDockerDaemon
+
+
+@pytest.fixture
+def socket_path():
+    # AF_UNIX paths are limited to ~108 bytes, pytest's tmp_path can be longer
+    with tempfile.TemporaryDirectory(prefix="ddc-fd-") as tmp:
+        yield str(Path(tmp) / "docker.sock")
+
+
+@pytest.fixture
+def use_daemon(socket_path, monkeypatch):
+    """Start a daemon on the socket and route DDC's Docker clients to it."""
+    import services.config.config_service as config_service
+    from services.docker_status.fetch_service import get_fetch_service
+    from services.infrastructure.container_status_service import get_container_status_service
+
+    config = {"docker_config": {"docker_socket_path": socket_path}}
+    monkeypatch.setattr(config_service, "load_config", lambda *a, **k: config)
+    monkeypatch.setenv("DOCKER_HOST", f"unix://{socket_path}")
+    monkeypatch.setenv("DDC_ENABLE_OPENGSQ", "false")
+
+    fetch_service = get_fetch_service()
+    cooldown = fetch_service.get_query_cooldown()
+    fetch_service.set_query_cooldown(0)
+    started: List[FakeDockerDaemon] = []
+
+    def _start(**kwargs) -> FakeDockerDaemon:
+        daemon = FakeDockerDaemon(socket_path, **kwargs).start()
+        started.append(daemon)
+        return daemon
+
+    yield _start
+
+    for daemon in started:
+        daemon.stop()
+    fetch_service.set_query_cooldown(cooldown)
+    fetch_service.clear_query_history()
+    get_container_status_service().clear_cache()
@@ -0,0 +1,469 @@
+# -*- coding: utf-8 -*-
+# ============================================================================ #
+# DockerDiscordControl (DDC) - Fake Docker Engine API Daemon                  #
+# https://ddc.bot                                                              #
+# Copyright (c) 2025 MAX                                                       #
+# Licensed under the MIT License                                               #
+# ============================================================================ #
+"""
+Stand-in Docker Engine API server on a unix socket.
+
+Speaks enough of the Engine API for docker-py and DDC's status paths:
+``/_ping``, ``/version``, ``/info``, ``/containers/json``,
+``/containers/{id}/json``, ``/containers/{id}/stats``,
+``/containers/{id}/{start,stop,restart,kill}``, ``/images/{id}/json`` and a
+chunked ``/events`` stream. It simulates any number of containers and can
+inject per-request latency, slow ``stats`` calls and errors, and counts every
+call so benchmarks can report daemon calls per refresh cycle.
+
+Point DDC at it with ``DOCKER_HOST=unix://<socket>`` or the
+``docker_socket_path`` setting. Standalone::
+
+    python -m tests.performance.fake_docker_daemon --socket /tmp/fake-docker.sock \\
+        --containers 300 --latency 0.005 --stats-latency 0.25 --error-rate 0.01
+
+Deviations from a real daemon: ``stats`` always answers with a single sample
+(docker-py hands it out once, which is all DDC reads), query filters are
+ignored, and ``/events`` only supports ``until``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import os
+import queue
+import random
+import re
+import socketserver
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler
+from typing import Any, Dict, Iterable, List, Optional
+from urllib.parse import parse_qs, urlsplit
+
+API_VERSION = "1.43"
+
+_VERSION_PREFIX = re.compile(r"^/v\d+\.\d+")
+_CONTAINER_ROUTE = re.compile(r"^/containers/([^/]+)/(json|stats|start|stop|restart|kill)$")
+_IMAGE_ROUTE = re.compile(r"^/images/(.+)/json$")
+
+
+def _iso(ts: float) -> str:
+    return datetime.fromtimestamp(ts, timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.%fZ")
+
+
+@dataclass
+class FakeContainer:
+    """One simulated container."""
+
+    name: str
+    image: str = "ghcr.io/ddc/fake:latest"
+    running: bool = True
+    created: float = field(default_factory=lambda: time.time() - 86400)
+    started_at: float = field(default_factory=lambda: time.time() - 3600)
+    memory_limit: int = 2 * 1024 ** 3
+
+    @property
+    def id(self) -> str:
+        return hashlib.sha256(self.name.encode("utf-8")).hexdigest()
+
+    @property
+    def image_id(self) -> str:
+        return hashlib.sha256(self.image.encode("utf-8")).hexdigest()
+
+    @property
+    def state(self) -> str:
+        return "running" if self.running else "exited"
+
+    def summary(self) -> Dict[str, Any]:
+        return {
+            "Id": self.id,
+            "Names": [f"/{self.name}"],
+            "Image": self.image,
+            "ImageID": f"sha256:{self.image_id}",
+            "Command": "/entrypoint.sh",
+            "Created": int(self.created),
+            "State": self.state,
+            "Status": "Up 1 hour" if self.running else "Exited (0) 1 hour ago",
+            "Ports": [{"IP": "0.0.0.0", "PrivatePort": 80, "PublicPort": 8080, "Type": "tcp"}] if self.running else [],
+            "Labels": {},
+        }
+
+    def inspect(self) -> Dict[str, Any]:
+        return {
+            "Id": self.id,
+            "Name": f"/{self.name}",
+            "Created": _iso(self.created),
+            "Image": f"sha256:{self.image_id}",
+            "State": {
+                "Status": self.state,
+                "Running": self.running,
+                "Paused": False,
+                "Restarting": False,
+                "ExitCode": 0,
+                "StartedAt": _iso(self.started_at) if self.running else "0001-01-01T00:00:00Z",
+            },
+            "Config": {"Image": self.image, "Labels": {}},
+            "HostConfig": {"RestartPolicy": {"Name": "unless-stopped"}},
+            "NetworkSettings": {
+                "Ports": {"80/tcp": [{"HostIp": "0.0.0.0", "HostPort": "8080"}]} if self.running else {},
+            },
+        }
+
+    def stats(self) -> Dict[str, Any]:
+        now = time.time()
+        uptime_ns = int(max(0.0, now - self.started_at) * 1e9)
+        usage = uptime_ns // 20 if self.running else 0
+        return {
+            "read": _iso(now),
+            "preread": _iso(now - 1),
+            "cpu_stats": {
+                "cpu_usage": {"total_usage": usage + 10_000_000},
+                "system_cpu_usage": int(now * 1e9) * 4,
+                "online_cpus": 4,
+            },
+            "precpu_stats": {
+                "cpu_usage": {"total_usage": usage},
+                "system_cpu_usage": int((now - 1) * 1e9) * 4,
+                "online_cpus": 4,
+            },
+            "memory_stats": {"usage": 128 * 1024 ** 2 if self.running else 0, "limit": self.memory_limit},
+        }
+
+
+class FakeDockerDaemon:
+    """Threaded Engine API server bound to a unix socket.
+
+    Args:
+        socket_path: Where to create the socket (removed again on stop).
+        containers: Number of containers to simulate, or explicit containers.
+        latency: Seconds added to every response.
+        stats_latency: Extra seconds added to ``stats`` responses.
+        action_latency: Extra seconds added to start/stop/restart/kill.
+        error_rate: Probability that a container request fails with HTTP 500.
+        failing: Container names whose requests always fail with HTTP 500.
+        running_ratio: Share of generated containers that are running.
+        seed: Seed for the error-injection random generator.
+    """
+
+    def __init__(self, socket_path: str, containers: Any = 100, latency: float = 0.0,
+                 stats_latency: float = 0.0, error_rate: float = 0.0,
+                 failing: Iterable[str] = (), running_ratio: float = 0.8, seed: int = 0,
+                 action_latency: float = 0.0):
+        self.socket_path = socket_path
+        self.latency = latency
+        self.stats_latency = stats_latency
+        self.action_latency = action_latency
+        self.error_rate = error_rate
+        self.failing = set(failing)
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._calls: Counter = Counter()
+        self._subscribers: List[queue.Queue] = []
+        self._server: Optional[socketserver.ThreadingUnixStreamServer] = None
+        self._thread: Optional[threading.Thread] = None
+
+        if isinstance(containers, int):
+            running_count = int(round(containers * running_ratio))
+            containers = [FakeContainer(name=f"fake-{i:04d}", running=i < running_count)
+                          for i in range(containers)]
+        self._containers: Dict[str, FakeContainer] = {c.name: c for c in containers}
+        self._by_id: Dict[str, FakeContainer] = {c.id: c for c in containers}
+
+    # ------------------------------------------------------------------
+    # Lifecycle
+    # ------------------------------------------------------------------
+    @property
+    def base_url(self) -> str:
+        return f"unix://{self.socket_path}"
+
+    def start(self) -> "FakeDockerDaemon":
+        if os.path.exists(self.socket_path):
+            os.unlink(self.socket_path)
+        self._server = _Server(self.socket_path, _Handler)
+        self._server.daemon = self
+        self._thread = threading.Thread(target=self._server.serve_forever, name="fake-docker-daemon", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        with self._lock:
+            subscribers, self._subscribers = self._subscribers, []
+        for subscriber in subscribers:
+            subscriber.put(None)
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+        if os.path.exists(self.socket_path):
+            os.unlink(self.socket_path)
+
+    def __enter__(self) -> "FakeDockerDaemon":
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+    # ------------------------------------------------------------------
+    # Inspection and control for benchmarks
+    # ------------------------------------------------------------------
+    @property
+    def container_names(self) -> List[str]:
+        return list(self._containers)
+
+    def calls(self) -> Counter:
+        """Calls per endpoint (e.g. ``GET /containers/{id}/json``) since the last reset."""
+        with self._lock:
+            return Counter(self._calls)
+
+    def total_calls(self) -> int:
+        with self._lock:
+            return sum(self._calls.values())
+
+    def reset_calls(self) -> None:
+        with self._lock:
+            self._calls.clear()
+
+    def emit_event(self, container: FakeContainer, action: str) -> None:
+        """Publish a container event to every open ``/events`` stream."""
+        now = time.time()
+        event = {
+            "status": action, "id": container.id, "from": container.image,
+            "Type": "container", "Action": action,
+            "Actor": {"ID": container.id, "Attributes": {"name": container.name, "image": container.image}},
+            "scope": "local", "time": int(now), "timeNano": int(now * 1e9),
+        }
+        with self._lock:
+            subscribers = list(self._subscribers)
+        for subscriber in subscribers:
+            subscriber.put(event)
+
+    # ------------------------------------------------------------------
+    # Request handling (called from handler threads)
+    # ------------------------------------------------------------------
+    def _record(self, key: str) -> None:
+        with self._lock:
+            self._calls[key] += 1
+
+    def _find(self, ref: str) -> Optional[FakeContainer]:
+        container = self._containers.get(ref) or self._by_id.get(ref)
+        if container is None and len(ref) >= 12:
+            container = next((c for cid, c in self._by_id.items() if cid.startswith(ref)), None)
+        return container
+
+    def _should_fail(self, container: FakeContainer) -> bool:
+        if container.name in self.failing:
+            return True
+        if self.error_rate <= 0:
+            return False
+        with self._lock:
+            return self._random.random() < self.error_rate
+
+    def _subscribe(self) -> queue.Queue:
+        subscriber: queue.Queue = queue.Queue()
+        with self._lock:
+            self._subscribers.append(subscriber)
+        return subscriber
+
+    def _unsubscribe(self, subscriber: queue.Queue) -> None:
+        with self._lock:
+            if subscriber in self._subscribers:
+                self._subscribers.remove(subscriber)
+
+
+class _Server(socketserver.ThreadingUnixStreamServer):
+    daemon_threads = True
+    daemon: FakeDockerDaemon
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    server: _Server
+
+    # Unix sockets have no peer address; BaseHTTPRequestHandler would index into ''
+    def address_string(self) -> str:
+        return "unix"
+
+    def log_message(self, format: str, *args) -> None:
+        pass
+
+    def do_GET(self) -> None:
+        self._dispatch("GET")
+
+    def do_HEAD(self) -> None:
+        self._dispatch("HEAD")
+
+    def do_POST(self) -> None:
+        self._dispatch("POST")
+
+    # ------------------------------------------------------------------
+    def _dispatch(self, method: str) -> None:
+        daemon = self.server.daemon
+        parts = urlsplit(self.path)
+        path = _VERSION_PREFIX.sub("", parts.path)
+        params = {k: v[-1] for k, v in parse_qs(parts.query).items()}
+
+        length = int(self.headers.get("Content-Length") or 0)
+        if length:
+            self.rfile.read(length)
+
+        container_match = _CONTAINER_ROUTE.match(path)
+        image_match = _IMAGE_ROUTE.match(path)
+        if container_match:
+            key = f"{method} /containers/{{id}}/{container_match.group(2)}"
+        elif image_match:
+            key = f"{method} /images/{{id}}/json"
+        else:
+            key = f"{method} {path}"
+        daemon._record(key)
+
+        if daemon.latency:
+            time.sleep(daemon.latency)
+
+        if path == "/_ping":
+            return self._send(200, b"OK", content_type="text/plain", head=method == "HEAD")
+        if path == "/version" and method == "GET":
+            return self._json(200, {"ApiVersion": API_VERSION, "MinAPIVersion": "1.12",
+                                    "Version": "24.0.0-fake", "Os": "linux", "Arch": "amd64"})
+        if path == "/info" and method == "GET":
+            containers = list(daemon._containers.values())
+            running = sum(1 for c in containers if c.running)
+            return self._json(200, {"Containers": len(containers), "ContainersRunning": running,
+                                    "ContainersStopped": len(containers) - running,
+                                    "ServerVersion": "24.0.0-fake", "NCPU": 4})
+        if path == "/containers/json" and method == "GET":
+            show_all = params.get("all") in ("1", "true", "True")
+            containers = [c.summary() for c in daemon._containers.values() if show_all or c.running]
+            return self._json(200, containers)
+        if path == "/events" and method == "GET":
+            return self._stream_events(params)
+        if image_match and method == "GET":
+            return self._image(image_match.group(1))
+        if container_match:
+            return self._container(method, container_match.group(1), container_match.group(2))
+        return self._json(404, {"message": f"page not found: {method} {path}"})
+
+    def _container(self, method: str, ref: str, action: str) -> None:
+        daemon = self.server.daemon
+        container = daemon._find(ref)
+        if container is None:
+            return self._json(404, {"message": f"No such container: {ref}"})
+        if daemon._should_fail(container):
+            return self._json(500, {"message": f"fake daemon error for {container.name}"})
+
+        if action == "json" and method == "GET":
+            return self._json(200, container.inspect())
+        if action == "stats" and method == "GET":
+            if daemon.stats_latency:
+                time.sleep(daemon.stats_latency)
+            return self._json(200, container.stats())
+        if method == "POST" and action in ("start", "stop", "restart", "kill"):
+            if daemon.action_latency:
+                time.sleep(daemon.action_latency)
+            should_run = action in ("start", "restart")
+            if action == "start" and container.running:
+                return self._send(304, b"")
+            container.running = should_run
+            if should_run:
+                container.started_at = time.time()
+            daemon.emit_event(container, {"kill": "die"}.get(action, action))
+            return self._send(204, b"")
+        return self._json(404, {"message": f"page not found: {method} {action}"})
+
+    def _image(self, ref: str) -> None:
+        daemon = self.server.daemon
+        ref = ref.split("sha256:")[-1]
+        for container in daemon._containers.values():
+            if ref in (container.image_id, container.image) or container.image_id.startswith(ref):
+                return self._json(200, {"Id": f"sha256:{container.image_id}", "RepoTags": [container.image],
+                                        "Created": _iso(container.created)})
+        return self._json(404, {"message": f"No such image: {ref}"})
+
+    def _stream_events(self, params: Dict[str, str]) -> None:
+        daemon = self.server.daemon
+        until = float(params["until"]) if params.get("until") else None
+        subscriber = daemon._subscribe()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.send_header("Api-Version", API_VERSION)
+        self.end_headers()
+        try:
+            while until is None or time.time() < until:
+                try:
+                    event = subscriber.get(timeout=0.2)
+                except queue.Empty:
+                    continue
+                if event is None:
+                    break
+                self._chunk(json.dumps(event).encode("utf-8") + b"\n")
+            self._chunk(b"")
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+        finally:
+            daemon._unsubscribe(subscriber)
+            self.close_connection = True
+
+    # ------------------------------------------------------------------
+    def _chunk(self, data: bytes) -> None:
+        self.wfile.write(f"{len(data):X}\r\n".encode("ascii") + data + b"\r\n")
+        self.wfile.flush()
+
+    def _json(self, status: int, payload: Any) -> None:
+        self._send(status, json.dumps(payload).encode("utf-8"), content_type="application/json")
+
+    def _send(self, status: int, body: bytes, content_type: str = "application/json", head: bool = False) -> None:
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Api-Version", API_VERSION)
+        if status not in (204, 304):
+            self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        if body and not head and status not in (204, 304):
+            self.wfile.write(body)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Fake Docker Engine API daemon for DDC benchmarks")
+    parser.add_argument("--socket", default="/tmp/ddc-fake-docker.sock")
+    parser.add_argument("--containers", type=int, default=100)
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds added to every response")
+    parser.add_argument("--stats-latency", type=float, default=0.0, help="extra seconds for stats responses")
+    parser.add_argument("--action-latency", type=float, default=0.0,
+                        help="extra seconds for start/stop/restart responses")
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--running-ratio", type=float, default=0.8)
+    parser.add_argument("--event-interval", type=float, default=0.0,
+                        help="restart a random container every N seconds (0 = off)")
+    args = parser.parse_args(argv)
+
+    daemon = FakeDockerDaemon(args.socket, containers=args.containers, latency=args.latency,
+                              stats_latency=args.stats_latency, error_rate=args.error_rate,
+                              running_ratio=args.running_ratio,
+                              action_latency=args.action_latency).start()
+    print(f"Fake Docker daemon with {args.containers} containers on {daemon.base_url} (Ctrl+C to stop)")
+    try:
+        names = daemon.container_names
+        while True:
+            if args.event_interval > 0:
+                time.sleep(args.event_interval)
+                container = daemon._containers[random.choice(names)]
+                container.started_at = time.time()
+                daemon.emit_event(container, "restart")
+            else:
+                time.sleep(3600)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        print(f"Calls served: {dict(daemon.calls())}")
+        daemon.stop()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
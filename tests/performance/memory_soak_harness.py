@@ -0,0 +1,227 @@
+# -*- coding: utf-8 -*-
+# ============================================================================ #
+# DockerDiscordControl (DDC) - Memory Soak Harness                            #
+# https://ddc.bot                                                              #
+# Copyright (c) 2025 MAX                                                       #
+# Licensed under the MIT License                                               #
+# ============================================================================ #
+"""
+Long-running workloads with tracemalloc growth measurement.
+
+Each workload runs a warm-up (so caches are filled and lazy imports are
+done), takes a baseline with
+:class:`~services.infrastructure.memory_profiler_service.MemoryProfilerService`,
+runs ``cycles`` more iterations and reports the memory retained since the
+baseline and over the second half of the run, grouped by module:
+
+* ``refresh`` - status refresh cycles
+  (``StatusHandlersMixin.bulk_fetch_container_status``) against
+  :class:`~tests.performance.fake_docker_daemon.FakeDockerDaemon`
+* ``animation`` - mech animation requests (small and big; rest, base and a
+  re-encoded speed) served by ``AnimationCacheService`` from a copy of the
+  shipped ``cached_animations``
+* ``donation`` - donations through ``UnifiedDonationService`` into the
+  event-sourced progress store
+
+Donations write to the progress data directory, so run the harness in a
+fresh interpreter with ``DDC_PROGRESS_DATA_DIR`` and ``DDC_CONFIG_DIR``
+pointing at scratch directories (``tests/performance/test_memory_soak.py``
+does this)::
+
+    DDC_PROGRESS_DATA_DIR=/tmp/p DDC_CONFIG_DIR=/tmp/c \\
+        python -m tests.performance.memory_soak_harness --workloads refresh,donation
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import gc
+import json
+import os
+import shutil
+import sys
+import tempfile
+import time
+from contextlib import ExitStack
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any, Callable, Dict, List
+from unittest.mock import patch
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+WORKLOADS = ("refresh", "animation", "donation")
+# Refresh cycles cost tens of ms against the fake daemon, donations rewrite the event log
+DEFAULT_CYCLES = {"refresh": 1000, "animation": 5000, "donation": 1000}
+DEFAULT_WARMUP = 100
+REFRESH_FLEET = 5
+REFRESH_COLD_EVERY = 10
+ANIMATION_LEVEL = 1
+# Rest, base and one re-encoded speed; re-encoded variants come from the disk speed cache after warm-up
+SPEED_LEVELS = (0.0, 50.0, 100.0)
+
+
+def _refresh_workload(stack: ExitStack) -> Callable[[int], None]:
+    from cogs.status_handlers import StatusHandlersMixin
+    from services.docker_status.fetch_service import get_fetch_service
+    from services.infrastructure.container_status_service import get_container_status_service
+    from tests.performance.fake_docker_daemon import FakeDockerDaemon
+
+    tmp = stack.enter_context(tempfile.TemporaryDirectory(prefix="ddc-soak-"))
+    socket_path = str(Path(tmp) / "docker.sock")
+    daemon = FakeDockerDaemon(socket_path, containers=REFRESH_FLEET).start()
+    stack.callback(daemon.stop)
+
+    config = {"docker_config": {"docker_socket_path": socket_path}}
+    stack.enter_context(patch("services.config.config_service.load_config", lambda *a, **k: config))
+    stack.enter_context(patch.dict(os.environ, {"DOCKER_HOST": f"unix://{socket_path}",
+                                                "DDC_ENABLE_OPENGSQ": "false"}))
+    names = daemon.container_names
+    servers = [{"docker_name": n, "name": n.upper(), "allow_detailed_status": True} for n in names]
+    # Plain stand-ins: a MagicMock would retain every call it receives
+    config_service = SimpleNamespace(get_all_servers=lambda: servers)
+    stack.enter_context(patch("cogs.status_handlers.get_server_config_service", lambda: config_service))
+    stack.enter_context(patch.object(StatusHandlersMixin, "_schedule_support_probes", lambda *a, **k: None))
+
+    fetch_service = get_fetch_service()
+    fetch_service.set_query_cooldown(0)
+    handler = StatusHandlersMixin()
+    loop = asyncio.new_event_loop()
+    stack.callback(loop.close)
+
+    def run(cycles: int) -> None:
+        for i in range(cycles):
+            fetch_service.clear_query_history()
+            if i % REFRESH_COLD_EVERY == 0:
+                # Cold cycle: every container goes to the daemon, the rest are served from cache
+                get_container_status_service().clear_cache()
+            results = loop.run_until_complete(handler.bulk_fetch_container_status(names))
+            assert len(results) == REFRESH_FLEET
+            daemon.reset_calls()
+
+    return run
+
+
+def _animation_workload(stack: ExitStack) -> Callable[[int], None]:
+    from services.mech.animation_cache_service import AnimationCacheService
+
+    cache_dir = Path(stack.enter_context(tempfile.TemporaryDirectory(prefix="ddc-soak-anim-")))
+    for cache_file in (REPO_ROOT / "cached_animations").glob(f"mech_{ANIMATION_LEVEL}_*.cache"):
+        shutil.copy2(cache_file, cache_dir / cache_file.name)
+
+    with patch.object(AnimationCacheService, "_setup_event_listeners", lambda self: None), \
+            patch.object(Path, "mkdir"):
+        service = AnimationCacheService()
+    service.cache_dir = cache_dir
+    service._focused_cache.clear()
+
+    def run(cycles: int) -> None:
+        # One cycle requests every speed in both sizes, so each cycle ends in the same cache state
+        for _ in range(cycles):
+            for speed in SPEED_LEVELS:
+                power = 0.0 if speed == 0.0 else 10.0
+                small = service.get_animation_with_speed_and_power(ANIMATION_LEVEL, speed, power)
+                big = service.get_animation_with_speed_and_power_big(ANIMATION_LEVEL, speed, power)
+                assert small[:4] == big[:4] == b"RIFF"
+
+    return run
+
+
+def _donation_workload(stack: ExitStack) -> Callable[[int], None]:
+    if not os.environ.get("DDC_PROGRESS_DATA_DIR"):
+        raise RuntimeError("donation workload needs DDC_PROGRESS_DATA_DIR (scratch progress store)")
+    from services.donation.unified.models import DonationRequest
+    from services.donation.unified.service import get_unified_donation_service
+    from services.infrastructure.event_manager import get_event_manager
+
+    service = get_unified_donation_service()
+    counter = iter(range(sys.maxsize))
+
+    def run(cycles: int) -> None:
+        for _ in range(cycles):
+            n = next(counter)
+            result = service.process_donation(DonationRequest(
+                donor_name=f"Soak Donor {n % 50}", amount=1.0 + (n % 5), source="test"))
+            assert result.success, result.error_message
+        get_event_manager().wait_until_idle(timeout=10)
+
+    return run
+
+
+_FACTORIES: Dict[str, Callable[[ExitStack], Callable[[int], None]]] = {
+    "refresh": _refresh_workload,
+    "animation": _animation_workload,
+    "donation": _donation_workload,
+}
+
+
+def soak(workload: str, cycles: int, warmup: int, top: int = 10) -> Dict[str, Any]:
+    """Run one workload and return its retained-memory report.
+
+    ``retained`` is measured from the post-warm-up baseline; ``growth`` only
+    over the second half of the cycles, after any remaining one-time cache
+    fills, and is the number that reveals a per-cycle leak.
+    """
+    from services.infrastructure.memory_profiler_service import get_memory_profiler_service
+
+    profiler = get_memory_profiler_service()
+    with ExitStack() as stack:
+        run = _FACTORIES[workload](stack)
+        # Trace the warm-up too: cache entries allocated before tracing starts are
+        # invisible, and replacing them later would look like growth
+        profiler.start()
+        try:
+            run(warmup)
+            gc.collect()
+            profiler.set_baseline()
+            started = time.perf_counter()
+            run(cycles // 2)
+            gc.collect()
+            profiler.take_snapshot("midpoint")
+            run(cycles - cycles // 2)
+            elapsed = time.perf_counter() - started
+            gc.collect()
+            retained = profiler.get_report(top=top)
+            growth = profiler.get_report(top=top, since="midpoint")
+        finally:
+            profiler.stop()
+    return {
+        "workload": workload,
+        "cycles": cycles,
+        "seconds": elapsed,
+        "retained_bytes": retained["total_size_diff"],
+        "growth_bytes": growth["total_size_diff"],
+        "growth_blocks": growth["total_count_diff"],
+        "top": growth["top"],
+    }
+
+
+def format_result(result: Dict[str, Any]) -> str:
+    lines = [f"{result['workload']}: {result['cycles']} cycles in {result['seconds']:.1f}s, "
+             f"retained {result['retained_bytes'] / 1024:+.1f} KiB, second half "
+             f"{result['growth_bytes'] / 1024:+.1f} KiB ({result['growth_blocks']:+d} blocks)"]
+    for entry in result["top"][:5]:
+        lines.append(f"    {entry['size_diff'] / 1024:+9.1f} KiB {entry['count_diff']:+7d}  {entry['name']}")
+    return "\n".join(lines)
+
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--workloads", default=",".join(WORKLOADS))
+    parser.add_argument("--cycles", type=int, default=None, help="per workload (default: DEFAULT_CYCLES)")
+    parser.add_argument("--warmup", type=int, default=DEFAULT_WARMUP)
+    parser.add_argument("--json", action="store_true", help="print results as one JSON line")
+    args = parser.parse_args(argv)
+
+    workloads = [w.strip() for w in args.workloads.split(",") if w.strip()]
+    results = [soak(w, args.cycles or DEFAULT_CYCLES[w], args.warmup) for w in workloads]
+    if args.json:
+        print(json.dumps(results))
+    else:
+        for result in results:
+            print(format_result(result))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
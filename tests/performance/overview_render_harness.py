@@ -0,0 +1,315 @@
+# -*- coding: utf-8 -*-
+# ============================================================================ #
+# DockerDiscordControl (DDC) - Overview Render Benchmark Harness              #
+# https://ddc.bot                                                              #
+# Copyright (c) 2025 MAX                                                       #
+# Licensed under the MIT License                                               #
+# ============================================================================ #
+"""
+Reproducible render benchmarks for the overview, admin overview and control embeds.
+
+Builds a :class:`~cogs.docker_control.DockerControlCog` without its
+``__init__`` (no bot, no Discord connection), fills the real status cache with
+a synthetic fleet and calls the real embed builders:
+
+* ``overview_expanded`` - ``_create_overview_embed_expanded``
+* ``overview_collapsed`` - ``_create_overview_embed_collapsed``
+* ``admin_overview`` - ``_create_admin_overview_embed``
+* ``control`` - ``_generate_status_embed_and_view`` for every container
+  (embed plus ``ControlView``), as a control channel refresh does
+
+The mech/donation section is switched off (``is_donations_disabled``) so the
+numbers measure per-container work only; it costs the same for every fleet
+size and has its own benchmarks. Everything else - translations, config
+reads, container info lookups, the status cache - is the production code.
+
+Besides wall-clock timings the harness writes a cProfile dump (``.prof``,
+open with ``snakeviz`` or :mod:`pstats`) and a flame graph in folded-stack format
+(``.folded``, one ``frame;frame;frame microseconds`` line per stack, readable
+by ``flamegraph.pl``, speedscope or inferno), recorded with
+:func:`sys.setprofile` so no extra dependency is needed.
+
+Standalone::
+
+    python -m tests.performance.overview_render_harness --fleets 10,100,500 \\
+        --profile-dir /tmp/ddc-render-profile
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import cProfile
+import pstats
+import sys
+import time
+from collections import Counter
+from contextlib import ExitStack, contextmanager
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+from unittest.mock import MagicMock, patch
+
+SCENARIOS = ("overview_expanded", "overview_collapsed", "admin_overview", "control")
+CONTROL_CHANNEL_ID = 424242
+
+BENCH_CONFIG: Dict[str, Any] = {
+    "language": "en",
+    "timezone": "Europe/Berlin",
+    "timezone_str": "Europe/Berlin",
+    "channel_permissions": {
+        str(CONTROL_CHANNEL_ID): {"commands": {"control": True, "serverstatus": True}},
+    },
+}
+
+
+@dataclass(frozen=True)
+class RenderTiming:
+    """Timing of one scenario for one fleet size."""
+
+    scenario: str
+    fleet: int
+    rounds: int
+    p50_ms: float
+    max_ms: float
+
+    @property
+    def per_container_ms(self) -> float:
+        return self.p50_ms / self.fleet if self.fleet else 0.0
+
+
+def synthetic_fleet(size: int) -> List[Dict[str, Any]]:
+    """Server configs with a mix of names, rights and detail settings."""
+    servers = []
+    for i in range(size):
+        servers.append({
+            "docker_name": f"bench-{i:04d}",
+            "name": f"Bench Server {i:04d}",
+            "display_name": f"Bench Server {i:04d}" + (" with a long name" if i % 7 == 0 else ""),
+            "allowed_actions": ["status", "start", "stop", "restart"] if i % 3 else ["status"],
+            "allow_detailed_status": i % 5 != 0,
+            "order": i,
+        })
+    return servers
+
+
+def _status_results(servers: List[Dict[str, Any]]):
+    from services.docker_status.models import ContainerStatusResult
+
+    results = {}
+    for i, server in enumerate(servers):
+        running = i % 4 != 3
+        results[server["docker_name"]] = ContainerStatusResult.success_result(
+            docker_name=server["docker_name"],
+            display_name=server["display_name"],
+            is_running=running,
+            cpu=f"{(i * 7) % 100 + 0.5:.1f}%" if running else "N/A",
+            ram=f"{256 + (i * 37) % 4096}MB" if running else "N/A",
+            uptime=f"{i % 30}d {i % 24}h" if running else "N/A",
+            details_allowed=server["allow_detailed_status"],
+        )
+    return results
+
+
+def make_cog(servers: List[Dict[str, Any]]):
+    """Return a DockerControlCog stub whose status cache holds ``servers``."""
+    from cogs.docker_control import DockerControlCog
+    from services.status.status_cache_service import StatusCacheService
+
+    cog = object.__new__(DockerControlCog)
+    cog.bot = MagicMock()
+    cog.status_cache_service = StatusCacheService()
+    cog.pending_actions = {}
+    cog.expanded_states = {s["docker_name"]: True for s in servers[::2]}
+    cog.cache_ttl_seconds = 75
+    cog.channel_server_message_ids = {}
+    cog.mech_state_manager = MagicMock()
+
+    now = datetime.now(timezone.utc)
+    for docker_name, result in _status_results(servers).items():
+        cog.status_cache_service.set(docker_name, result, now)
+    return cog
+
+
+@contextmanager
+def render_environment(servers: List[Dict[str, Any]]) -> Iterator[None]:
+    """Patch the process-wide lookups the builders make for the synthetic fleet."""
+    from services.config.config_cache_service import ConfigSnapshot, freeze_config
+
+    config_service = MagicMock()
+    config_service.get_all_servers.return_value = servers
+    snapshot = ConfigSnapshot(version=1, config=freeze_config(BENCH_CONFIG))
+    with ExitStack() as stack:
+        stack.enter_context(patch("cogs.docker_control.load_config", return_value=BENCH_CONFIG))
+        stack.enter_context(patch("cogs.docker_control.load_config_snapshot", return_value=snapshot))
+        stack.enter_context(patch("cogs.control_helpers.load_config_snapshot", return_value=snapshot))
+        stack.enter_context(patch("cogs.status_handlers.get_server_config_service", return_value=config_service))
+        stack.enter_context(patch("services.donation.donation_utils.is_donations_disabled", return_value=True))
+        try:
+            yield
+        finally:
+            from services.infrastructure.container_status_service import get_container_status_service
+            get_container_status_service().clear_cache()
+
+
+async def render_once(cog, scenario: str, servers: List[Dict[str, Any]]) -> Any:
+    """Render one scenario over the whole fleet."""
+    if scenario == "overview_expanded":
+        return await cog._create_overview_embed_expanded(servers, BENCH_CONFIG)
+    if scenario == "overview_collapsed":
+        return await cog._create_overview_embed_collapsed(servers, BENCH_CONFIG)
+    if scenario == "admin_overview":
+        return await cog._create_admin_overview_embed(servers, BENCH_CONFIG)
+    if scenario == "control":
+        rendered = []
+        for server in servers:
+            conf = dict(server, _is_admin_control=True)
+            rendered.append(await cog._generate_status_embed_and_view(
+                CONTROL_CHANNEL_ID, server["display_name"], conf, BENCH_CONFIG))
+        return rendered
+    raise ValueError(f"unknown scenario: {scenario}")
+
+
+def _median(values: List[float]) -> float:
+    ordered = sorted(values)
+    mid = len(ordered) // 2
+    return ordered[mid] if len(ordered) % 2 else (ordered[mid - 1] + ordered[mid]) / 2
+
+
+def benchmark(scenario: str, fleet: int, rounds: int = 5, warmup: int = 1) -> RenderTiming:
+    """Time ``rounds`` renders of ``scenario`` for a fleet of ``fleet`` containers."""
+    servers = synthetic_fleet(fleet)
+    samples: List[float] = []
+
+    async def _run():
+        cog = make_cog(servers)
+        for _ in range(warmup):
+            await render_once(cog, scenario, servers)
+        for _ in range(rounds):
+            start = time.perf_counter()
+            await render_once(cog, scenario, servers)
+            samples.append((time.perf_counter() - start) * 1000)
+
+    with render_environment(servers):
+        asyncio.run(_run())
+    return RenderTiming(scenario, fleet, rounds, _median(samples), max(samples))
+
+
+class FoldedStackProfiler:
+    """Tracing profiler that records self time per call stack in folded format.
+
+    Uses :func:`sys.setprofile`, so every Python and C call is seen and the
+    totals are exact (at the cost of tracing overhead, like cProfile).
+    Counts are microseconds of self time; stacks start at the frame that
+    enabled the profiler.
+    """
+
+    def __init__(self):
+        self.stacks: Counter = Counter()
+        self._stack: List[list] = []
+
+    def __enter__(self) -> "FoldedStackProfiler":
+        sys.setprofile(self._callback)
+        return self
+
+    def __exit__(self, *exc) -> None:
+        sys.setprofile(None)
+        self._stack.clear()
+
+    def _callback(self, frame, event: str, arg: Any) -> None:
+        now = time.perf_counter_ns()
+        if event == "call":
+            code = frame.f_code
+            self._stack.append([f"{code.co_name} ({Path(code.co_filename).name}:{code.co_firstlineno})", now, 0])
+        elif event == "c_call":
+            self._stack.append([getattr(arg, "__qualname__", None) or getattr(arg, "__name__", repr(arg)), now, 0])
+        elif self._stack:  # return, c_return, c_exception
+            elapsed = now - self._stack[-1][1]
+            self_time = elapsed - self._stack[-1][2]
+            key = ";".join(entry[0] for entry in self._stack)
+            self._stack.pop()
+            self.stacks[key] += self_time // 1000
+            if self._stack:
+                self._stack[-1][2] += elapsed
+
+    def write_folded(self, path: Path) -> None:
+        with open(path, "w", encoding="utf-8") as handle:
+            for stack, micros in self.stacks.most_common():
+                if micros:
+                    handle.write(f"{stack} {micros}\n")
+
+
+def profile(scenario: str, fleet: int, out_dir: Path, rounds: int = 5) -> Dict[str, Path]:
+    """Profile ``rounds`` renders and write ``.prof``, ``.txt`` and ``.folded`` files."""
+    out_dir = Path(out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    stem = out_dir / f"{scenario}_{fleet}"
+    servers = synthetic_fleet(fleet)
+    profiler = cProfile.Profile()
+
+    async def _run():
+        cog = make_cog(servers)
+        await render_once(cog, scenario, servers)
+        profiler.enable()
+        try:
+            for _ in range(rounds):
+                await render_once(cog, scenario, servers)
+        finally:
+            profiler.disable()
+
+    async def _traced():
+        cog = make_cog(servers)
+        await render_once(cog, scenario, servers)
+        with FoldedStackProfiler() as tracer:
+            for _ in range(rounds):
+                await render_once(cog, scenario, servers)
+        return tracer
+
+    with render_environment(servers):
+        asyncio.run(_run())
+        # Separate run: two profilers hooked at once would time each other
+        tracer = asyncio.run(_traced())
+
+    paths = {"prof": stem.with_suffix(".prof"), "txt": stem.with_suffix(".txt"),
+             "folded": stem.with_suffix(".folded")}
+    profiler.dump_stats(str(paths["prof"]))
+    with open(paths["txt"], "w", encoding="utf-8") as handle:
+        pstats.Stats(profiler, stream=handle).sort_stats("cumulative").print_stats(40)
+    tracer.write_folded(paths["folded"])
+    return paths
+
+
+def format_table(timings: List[RenderTiming]) -> str:
+    lines = [f"{'scenario':<20} {'fleet':>6} {'p50 ms':>10} {'max ms':>10} {'ms/container':>13}"]
+    for t in timings:
+        lines.append(f"{t.scenario:<20} {t.fleet:>6} {t.p50_ms:>10.2f} {t.max_ms:>10.2f} {t.per_container_ms:>13.4f}")
+    return "\n".join(lines)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark DDC overview/control embed rendering")
+    parser.add_argument("--fleets", default="10,100,500")
+    parser.add_argument("--scenarios", default=",".join(SCENARIOS))
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("--profile-dir", type=Path, default=None,
+                        help="write cProfile and folded flame-graph stacks here")
+    args = parser.parse_args(argv)
+
+    import logging
+    logging.disable(logging.INFO)
+
+    fleets = [int(n) for n in args.fleets.split(",") if n.strip()]
+    scenarios = [s for s in args.scenarios.split(",") if s.strip()]
+    timings = [benchmark(s, n, rounds=args.rounds) for s in scenarios for n in fleets]
+    print(format_table(timings))
+
+    if args.profile_dir:
+        for scenario in scenarios:
+            paths = profile(scenario, max(fleets), args.profile_dir, rounds=args.rounds)
+            print(f"{scenario}: {paths['prof']} {paths['folded']}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
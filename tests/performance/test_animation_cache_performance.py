@@ -0,0 +1,138 @@
+# -*- coding: utf-8 -*-
+# ============================================================================ #
+# DockerDiscordControl (DDC) - Animation Cache Performance Tests              #
+# https://ddc.bot                                                              #
+# Copyright (c) 2025 MAX                                                       #
+# Licensed under the MIT License                                               #
+# ============================================================================ #
+"""
+Benchmarks for AnimationCacheService cache loads.
+
+Covers the small, big and status-overview variants across every quantized
+speed level, measuring a cold load (base cache read + deobfuscation and, for
+non-base speeds, re-encoding) against a warm load from the disk speed cache.
+The pre-generated ``cached_animations/*.cache`` files shipped with the repo
+are copied to a temporary directory so the run never touches the real cache.
+
+Run with ``pytest tests/performance/test_animation_cache_performance.py -s``
+to see the timing table.
+"""
+
+import os
+import shutil
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from services.mech.animation_cache_service import AnimationCacheService, _XOR_KEY
+
+REPO_CACHE_DIR = Path(__file__).resolve().parents[2] / "cached_animations"
+SPEED_LEVELS = [0.0] + [float(s) for s in range(5, 101, 5)] + [101.0]
+BENCH_LEVEL = int(os.environ.get("DDC_BENCH_MECH_LEVEL", "5"))
+
+pytestmark = [
+    pytest.mark.performance,
+    pytest.mark.slow,
+    pytest.mark.skipif(
+        not (REPO_CACHE_DIR / f"mech_{BENCH_LEVEL}_100speed_big.cache").exists(),
+        reason="pre-generated animation cache files not available",
+    ),
+]
+
+
+def _reference_xor(data: bytes) -> bytes:
+    """Per-byte XOR loop the service used before vectorization."""
+    key_len = len(_XOR_KEY)
+    return bytes(data[i] ^ _XOR_KEY[i % key_len] for i in range(len(data)))
+
+
+@pytest.fixture(scope="module")
+def cache_dir(tmp_path_factory):
+    target = tmp_path_factory.mktemp("anim_cache")
+    for cache_file in REPO_CACHE_DIR.glob("*.cache"):
+        shutil.copy2(cache_file, target / cache_file.name)
+    return target
+
+
+@pytest.fixture
+def svc(cache_dir):
+    with patch.object(AnimationCacheService, "_setup_event_listeners", lambda self: None), \
+         patch.object(Path, "mkdir"), \
+         patch.dict(os.environ, {"DDC_ANIM_DISK_LIMIT_MB": "0"}):
+        service = AnimationCacheService()
+    service.cache_dir = cache_dir
+    service._focused_cache.clear()
+    # Each test starts without speed-adjusted files from earlier runs
+    for webp in cache_dir.glob("*.webp"):
+        webp.unlink()
+    return service
+
+
+def _timed(func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    return result, (time.perf_counter() - start) * 1000
+
+
+def _load(svc, variant, speed):
+    power = 0.0 if speed == 0.0 else 10.0
+    if variant == "small":
+        return svc.get_animation_with_speed_and_power(BENCH_LEVEL, speed, power)
+    if variant == "big":
+        return svc.get_animation_with_speed_and_power_big(BENCH_LEVEL, speed, power)
+    speed_status = {"speed": {"level": speed}}
+    with patch("services.mech.speed_levels.get_combined_mech_status", return_value=speed_status):
+        return svc.get_status_overview_animation(BENCH_LEVEL, power)
+
+
+class TestDeobfuscationPerformance:
+    """Vectorized XOR against the per-byte reference loop."""
+
+    def test_vectorized_xor_matches_reference_on_all_cache_files(self, svc, cache_dir):
+        for cache_file in sorted(cache_dir.glob("*.cache")):
+            raw = cache_file.read_bytes()
+            assert svc._deobfuscate_data(raw) == _reference_xor(raw), cache_file.name
+
+    def test_vectorized_xor_is_faster_than_reference(self, svc, cache_dir):
+        raw = max(cache_dir.glob("*.cache"), key=lambda p: p.stat().st_size).read_bytes()
+
+        _, reference_ms = _timed(_reference_xor, raw)
+        vectorized_ms = min(_timed(svc._deobfuscate_data, raw)[1] for _ in range(5))
+
+        print(f"\nXOR {len(raw):,} bytes: reference {reference_ms:.2f}ms, vectorized {vectorized_ms:.3f}ms")
+        assert vectorized_ms * 10 < reference_ms
+
+    def test_mmap_read_matches_plain_read(self, svc, cache_dir):
+        for cache_file in sorted(cache_dir.glob("*.cache")):
+            expected = _reference_xor(cache_file.read_bytes())
+            assert svc._read_obfuscated_file(cache_file) == expected
+
+
+class TestAnimationLoadBenchmark:
+    """Cold vs. warm loads for every variant and speed level."""
+
+    @pytest.mark.parametrize("variant", ["small", "big", "status_overview"])
+    def test_all_speed_levels(self, svc, variant):
+        rows = []
+        for speed in SPEED_LEVELS:
+            svc._focused_cache.clear()
+            cold, cold_ms = _timed(_load, svc, variant, speed)
+
+            svc._focused_cache.clear()
+            warm, warm_ms = _timed(_load, svc, variant, speed)
+
+            assert cold[:4] == b"RIFF" and cold[8:12] == b"WEBP"
+            assert warm == cold
+            rows.append((speed, cold_ms, warm_ms, len(cold)))
+
+        print(f"\n{variant} (level {BENCH_LEVEL})")
+        print(f"{'speed':>6} {'cold ms':>9} {'warm ms':>9} {'bytes':>9}")
+        for speed, cold_ms, warm_ms, size in rows:
+            print(f"{speed:>6.0f} {cold_ms:>9.2f} {warm_ms:>9.2f} {size:>9,}")
+
+        if variant != "status_overview":
+            # Re-encoded speeds are served from the disk speed cache afterwards
+            reencoded = [r for r in rows if r[0] not in (0.0, 50.0)]
+            assert sum(r[2] for r in reencoded) < sum(r[1] for r in reencoded)
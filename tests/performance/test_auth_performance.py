@@ -0,0 +1,75 @@
+# -*- coding: utf-8 -*-
+# ============================================================================ #
+# DockerDiscordControl (DDC) - Web UI Auth Performance Tests                  #
+# https://ddc.bot                                                              #
+# Copyright (c) 2025 MAX                                                       #
+# Licensed under the MIT License                                               #
+# ============================================================================ #
+"""
+Benchmark for authenticated Web UI requests.
+
+Uses the same ``pbkdf2:sha256:600000`` hash the setup page writes and compares
+authenticated requests/sec with the verified-credential cache disabled
+(every request runs ``check_password_hash``) against the cached path.
+
+Run with ``pytest tests/performance/test_auth_performance.py -s`` to see the
+numbers.
+"""
+
+import base64
+import time
+
+import pytest
+from flask import Flask
+from werkzeug.security import generate_password_hash
+
+from app import auth as auth_module
+from app.auth import VerifiedCredentialCache, auth
+
+PASSWORD = "Bench-Password-42"
+REQUESTS = 20
+
+
+@pytest.fixture(scope="module")
+def password_hash():
+    return generate_password_hash(PASSWORD, method="pbkdf2:sha256:600000")
+
+
+@pytest.fixture
+def client(monkeypatch, password_hash):
+    config = {"web_ui_user": "admin", "web_ui_password_hash": password_hash}
+    monkeypatch.setattr(auth_module, "load_config", lambda: config)
+
+    app = Flask(__name__)
+    app.secret_key = "bench"
+
+    @app.route("/api/poll")
+    @auth.login_required
+    def poll():
+        return "ok"
+
+    return app.test_client()
+
+
+def _requests_per_second(client, count=REQUESTS):
+    token = base64.b64encode(f"admin:{PASSWORD}".encode()).decode()
+    headers = {"Authorization": f"Basic {token}"}
+    start = time.perf_counter()
+    for _ in range(count):
+        assert client.get("/api/poll", headers=headers).status_code == 200
+    return count / (time.perf_counter() - start)
+
+
+@pytest.mark.performance
+@pytest.mark.slow
+class TestAuthThroughput:
+    def test_cached_credentials_increase_throughput(self, client, monkeypatch):
+        monkeypatch.setattr(auth_module, "credential_cache", VerifiedCredentialCache(ttl_seconds=0))
+        uncached = _requests_per_second(client)
+
+        monkeypatch.setattr(auth_module, "credential_cache", VerifiedCredentialCache(ttl_seconds=60))
+        cached = _requests_per_second(client, count=REQUESTS * 50)
+
+        print(f"\nAuthenticated req/s: uncached {uncached:.1f}, cached {cached:.1f} "
+              f"({cached / uncached:.0f}x)")
+        assert cached > uncached * 10
@@ -0,0 +1,110 @@
+# -*- coding: utf-8 -*-
+# ============================================================================ #
+# DockerDiscordControl (DDC) - Bot Cold Start Benchmark                       #
+# https://ddc.bot                                                              #
+# Copyright (c) 2025 MAX                                                       #
+# Licensed under the MIT License                                               #
+# ============================================================================ #
+"""
+Cold start regression test for the bot.
+
+A fresh interpreter imports ``discord``, builds a bot that never connects and
+loads every startup extension against an empty config directory, with the
+built-in import profiler (:mod:`utils.import_profiler`) running. Fails when the
+cold start exceeds its time budget or when a subsystem that is meant to load
+on first use (mech image tooling, game-query protocols, non-English locales)
+is pulled in at startup. Run with ``-s`` to see the import report.
+"""
+
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+pytestmark = [pytest.mark.performance, pytest.mark.slow]
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+# Some services persist to fixed paths under the repo, whatever DDC_CONFIG_DIR says
+RUNTIME_DIRS = (REPO_ROOT / "config", REPO_ROOT / "logs")
+COLD_START_BUDGET_SECONDS = float(os.environ.get("DDC_COLD_START_BUDGET", "5.0"))
+LAZY_MODULES = ("PIL", "opengsq", "services.mech.animation_cache_service")
+
+_SCRIPT = """
+import asyncio, json, sys, time
+from utils import import_profiler
+
+profiler = import_profiler.start()
+started = time.perf_counter()
+
+import discord
+
+EXTENSIONS = ["cogs.docker_control", "cogs.auto_action_monitor",
+              "cogs.translation_monitor", "cogs.member_count_monitor"]
+
+async def main():
+    bot = discord.Bot(intents=discord.Intents.default())
+    for ext in EXTENSIONS:
+        bot.load_extension(ext)
+    await bot.close()
+
+asyncio.run(main())
+elapsed = time.perf_counter() - started
+profiler.stop()
+
+from cogs.translation_manager import get_translations, translation_manager
+print("\\n".join(profiler.format_report(top=15)), file=sys.stderr)
+print(json.dumps({
+    "elapsed": elapsed,
+    "modules": sorted(sys.modules),
+    "loaded_locales": sorted(get_translations()),
+    "available_locales": translation_manager.get_available_languages(),
+}))
+"""
+
+
+def _runtime_paths():
+    return {path for root in RUNTIME_DIRS for path in root.rglob("*")}
+
+
+def _remove_created(existing):
+    """Delete the state files the cold start created in the repo, deepest first."""
+    for path in sorted(_runtime_paths() - existing, reverse=True):
+        if path.is_dir():
+            path.rmdir()
+        else:
+            path.unlink()
+
+
+@pytest.fixture(scope="module")
+def cold_start(tmp_path_factory):
+    env = dict(os.environ, PYTHONPATH=str(REPO_ROOT),
+               DDC_CONFIG_DIR=str(tmp_path_factory.mktemp("ddc_config")))
+    env.pop("DDC_PROFILE_IMPORTS", None)
+    existing = _runtime_paths()
+    try:
+        completed = subprocess.run([sys.executable, "-c", _SCRIPT], cwd=REPO_ROOT, env=env,
+                                   capture_output=True, text=True, timeout=120)
+    finally:
+        _remove_created(existing)
+    assert completed.returncode == 0, completed.stderr[-4000:]
+    report = completed.stderr.splitlines()
+    print("\n" + "\n".join(line for line in report if not line.startswith("20")))
+    return json.loads(completed.stdout.strip().splitlines()[-1])
+
+
+def test_cold_start_within_budget(cold_start):
+    print(f"\ncold start: {cold_start['elapsed']:.3f}s (budget {COLD_START_BUDGET_SECONDS:.1f}s)")
+    assert cold_start["elapsed"] < COLD_START_BUDGET_SECONDS
+
+
+def test_rarely_used_subsystems_load_on_first_use(cold_start):
+    loaded = set(cold_start["modules"])
+    assert not [m for m in LAZY_MODULES if m in loaded]
+
+
+def test_only_fallback_locale_parsed_at_startup(cold_start):
+    assert len(cold_start["available_locales"]) > 1
+    assert cold_start["loaded_locales"] == ["en"]
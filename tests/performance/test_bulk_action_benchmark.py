@@ -0,0 +1,52 @@
+# -*- coding: utf-8 -*-
+# ============================================================================ #
+# DockerDiscordControl (DDC) - Bulk Action Benchmarks                         #
+# https://ddc.bot                                                              #
+# Copyright (c) 2025 MAX                                                       #
+# Licensed under the MIT License                                               #
+# ============================================================================ #
+"""
+Wall-clock comparison of sequential and parallel bulk restarts.
+
+Runs :class:`~services.docker_service.bulk_action_service.BulkActionService`
+with its real executor (``DockerActionService`` -> docker-py -> socket)
+against :class:`~tests.performance.fake_docker_daemon.FakeDockerDaemon`, whose
+restart responses are delayed by ``ACTION_LATENCY`` to stand in for container
+shutdown/startup time. The daemon fixtures live in ``conftest.py``. Run with
+``-s`` to see the timings.
+"""
+
+import asyncio
+import time
+
+import pytest
+
+from services.docker_service.bulk_action_service import BulkActionRequest, BulkActionService
+
+pytestmark = [pytest.mark.performance, pytest.mark.slow]
+
+FLEET = 24
+ACTION_LATENCY = 0.1
+
+
+def _bulk_restart(names, parallel):
+    request = BulkActionRequest(action="restart", groups=(tuple(names),),
+                                max_parallel=parallel, timeout_per_container=10.0)
+    start = time.perf_counter()
+    result = asyncio.run(BulkActionService().run(request))
+    return result, time.perf_counter() - start
+
+
+def test_parallel_bulk_restart_beats_sequential(use_daemon):
+    daemon = use_daemon(containers=FLEET, action_latency=ACTION_LATENCY)
+    names = daemon.container_names
+
+    sequential, sequential_s = _bulk_restart(names, parallel=1)
+    parallel, parallel_s = _bulk_restart(names, parallel=8)
+
+    print(f"\nbulk restart of {FLEET} containers ({ACTION_LATENCY * 1000:.0f}ms each): "
+          f"sequential {sequential_s:.2f}s, parallel=8 {parallel_s:.2f}s "
+          f"({sequential_s / parallel_s:.1f}x)")
+    assert sequential.succeeded == FLEET and parallel.succeeded == FLEET
+    assert daemon.calls()["POST /containers/{id}/restart"] == 2 * FLEET
+    assert parallel_s < sequential_s / 2
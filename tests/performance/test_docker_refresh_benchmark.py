@@ -0,0 +1,226 @@
+# -*- coding: utf-8 -*-
+# ============================================================================ #
+# DockerDiscordControl (DDC) - Docker Refresh Cycle Benchmarks                #
+# https://ddc.bot                                                              #
+# Copyright (c) 2025 MAX                                                       #
+# Licensed under the MIT License                                               #
+# ============================================================================ #
+"""
+End-to-end benchmarks of the status refresh loop against a fake Docker daemon.
+
+Every test starts :class:`~tests.performance.fake_docker_daemon.FakeDockerDaemon`
+on a temporary unix socket (``use_daemon`` fixture in ``conftest.py``), points the Docker client configuration at it and
+drives full refresh cycles through the real code path
+(``StatusHandlersMixin.bulk_fetch_container_status`` -> fetch service ->
+``ContainerStatusService`` -> docker-py -> socket). Caches and the fetch
+cooldown are cleared between cycles so each cycle is a cold refresh.
+
+Reported per fleet size: p50/p99 cycle latency and daemon calls per cycle
+and per container. The call ceilings below are the baseline measured with
+this suite; a change that adds round trips per container fails here before
+it reaches a user's daemon.
+
+Run with ``pytest tests/performance/test_docker_refresh_benchmark.py -s`` to
+see the tables. ``DDC_BENCH_FLEETS`` overrides the fleet sizes (e.g.
+``10,100,500``).
+"""
+
+import asyncio
+import os
+import statistics
+import time
+from typing import Dict, List
+from unittest.mock import MagicMock, patch
+
+import docker
+import pytest
+
+from tests.performance.fake_docker_daemon import FakeDockerDaemon
+
+pytestmark = [pytest.mark.performance, pytest.mark.slow]
+
+FLEETS = [int(n) for n in os.environ.get("DDC_BENCH_FLEETS", "10,100,300").split(",") if n.strip()]
+CYCLES = int(os.environ.get("DDC_BENCH_CYCLES", "5"))
+
+# Upper bound of daemon round trips per container in one cold cycle. Measured
+# baseline: info and stats are fetched by two concurrent requests that both miss
+# the status cache, and each opens a client (version + ping), inspects the
+# container, resolves its image twice and reads stats when running -> ~11.6.
+MAX_CALLS_PER_CONTAINER = 12
+
+
+def _percentile(samples: List[float], pct: float) -> float:
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, max(0, int(round(pct / 100.0 * (len(ordered) - 1)))))
+    return ordered[index]
+
+
+def _report(title: str, rows: List[Dict]) -> None:
+    print(f"\n{title}")
+    print(f"{'fleet':>6} {'p50 ms':>10} {'p99 ms':>10} {'calls/cycle':>12} {'calls/ctr':>10}")
+    for row in rows:
+        print(f"{row['fleet']:>6} {row['p50']:>10.1f} {row['p99']:>10.1f} "
+              f"{row['calls']:>12.1f} {row['per_container']:>10.2f}")
+
+
+def _servers(names: List[str]) -> List[Dict]:
+    return [{"docker_name": n, "name": n.upper(), "allow_detailed_status": True} for n in names]
+
+
+def _refresh_cycles(daemon: FakeDockerDaemon, names: List[str], cycles: int = CYCLES):
+    """Run ``cycles`` cold refresh cycles; return (latencies_ms, calls_per_cycle, last_results)."""
+    from cogs.status_handlers import StatusHandlersMixin
+    from services.docker_status.fetch_service import get_fetch_service
+    from services.infrastructure.container_status_service import get_container_status_service
+
+    handler = StatusHandlersMixin()
+    config_service = MagicMock()
+    config_service.get_all_servers.return_value = _servers(names)
+
+    latencies: List[float] = []
+    calls: List[int] = []
+    results = {}
+
+    async def _run():
+        nonlocal results
+        for _ in range(cycles):
+            get_container_status_service().clear_cache()
+            get_fetch_service().clear_query_history()
+            daemon.reset_calls()
+            start = time.perf_counter()
+            results = await handler.bulk_fetch_container_status(names)
+            latencies.append((time.perf_counter() - start) * 1000)
+            calls.append(daemon.total_calls())
+
+    with patch("cogs.status_handlers.get_server_config_service", return_value=config_service), \
+            patch.object(StatusHandlersMixin, "_schedule_support_probes"):
+        asyncio.run(_run())
+    return latencies, calls, results
+
+
+def _row(fleet: int, latencies: List[float], calls: List[int]) -> Dict:
+    per_cycle = statistics.mean(calls)
+    return {"fleet": fleet, "p50": _percentile(latencies, 50), "p99": _percentile(latencies, 99),
+            "calls": per_cycle, "per_container": per_cycle / fleet}
+
+
+class TestRefreshCycle:
+    def test_cold_refresh_scales_with_fleet(self, use_daemon):
+        rows = []
+        for fleet in FLEETS:
+            daemon = use_daemon(containers=fleet)
+            names = daemon.container_names
+            latencies, calls, results = _refresh_cycles(daemon, names)
+            daemon.stop()
+
+            assert sorted(results) == sorted(names)
+            assert all(r.success for r in results.values())
+            running = sum(1 for r in results.values() if r.is_running)
+            assert running == int(round(fleet * 0.8))
+            rows.append(_row(fleet, latencies, calls))
+
+        _report("Cold refresh cycle (bulk_fetch_container_status)", rows)
+        for row in rows:
+            assert row["per_container"] <= MAX_CALLS_PER_CONTAINER, row
+
+    def test_warm_cycle_is_served_from_cache(self, use_daemon):
+        from cogs.status_handlers import StatusHandlersMixin
+        from services.docker_status.fetch_service import get_fetch_service
+
+        daemon = use_daemon(containers=20)
+        names = daemon.container_names
+        handler = StatusHandlersMixin()
+        config_service = MagicMock()
+        config_service.get_all_servers.return_value = _servers(names)
+
+        async def _run():
+            await handler.bulk_fetch_container_status(names)
+            get_fetch_service().clear_query_history()
+            daemon.reset_calls()
+            await handler.bulk_fetch_container_status(names)
+
+        with patch("cogs.status_handlers.get_server_config_service", return_value=config_service), \
+                patch.object(StatusHandlersMixin, "_schedule_support_probes"):
+            asyncio.run(_run())
+
+        # Only the connectivity check reaches the daemon while the status cache is fresh
+        assert set(daemon.calls()) <= {"GET /_ping", "GET /version"}
+
+
+class TestDegradedDaemon:
+    def test_slow_stats_dominate_cycle_latency(self, use_daemon):
+        fleet = 20
+        fast = use_daemon(containers=fleet)
+        fast_latencies, _, _ = _refresh_cycles(fast, fast.container_names, cycles=2)
+        fast.stop()
+
+        slow = use_daemon(containers=fleet, stats_latency=0.02)
+        slow_latencies, _, results = _refresh_cycles(slow, slow.container_names, cycles=2)
+
+        assert all(r.success for r in results.values())
+        _report("Slow stats (20ms per stats call)", [_row(fleet, fast_latencies, [1]),
+                                                     _row(fleet, slow_latencies, [1])])
+        # 16 running containers each pay the stats delay at least once
+        assert statistics.median(slow_latencies) > statistics.median(fast_latencies)
+
+    def test_failing_containers_do_not_fail_the_cycle(self, use_daemon):
+        daemon = use_daemon(containers=30, failing={"fake-0003", "fake-0017"}, error_rate=0.02, seed=7)
+        names = daemon.container_names
+        latencies, calls, results = _refresh_cycles(daemon, names, cycles=2)
+
+        assert sorted(results) == sorted(names)
+        # Failed lookups degrade to an offline status instead of dropping the container
+        assert results["fake-0003"].is_running is False
+        assert results["fake-0017"].is_running is False
+        assert sum(1 for r in results.values() if r.is_running) >= 20
+        _report("Error injection (2 failing + 2% random 500s)", [_row(len(names), latencies, calls)])
+
+
+class TestContainerList:
+    def test_snapshot_refresh_is_one_daemon_call(self, use_daemon, socket_path):
+        from services.docker_service import docker_utils
+        from services.docker_service.container_snapshot import ContainerSnapshotProvider
+
+        rows = []
+        for fleet in FLEETS:
+            daemon = use_daemon(containers=fleet)
+            client = docker.DockerClient(base_url=daemon.base_url)
+            provider = ContainerSnapshotProvider()
+            latencies, calls = [], []
+            try:
+                with patch.object(docker_utils, "get_docker_client", return_value=client):
+                    for _ in range(CYCLES):
+                        provider.clear()
+                        daemon.reset_calls()
+                        start = time.perf_counter()
+                        containers = provider.get(max_age=60).containers
+                        latencies.append((time.perf_counter() - start) * 1000)
+                        calls.append(daemon.total_calls())
+            finally:
+                client.close()
+                daemon.stop()
+
+            assert len(containers) == fleet
+            assert max(calls) == 1
+            rows.append(_row(fleet, latencies, calls))
+
+        _report("Container list refresh (ContainerSnapshotProvider)", rows)
+
+
+class TestEventStream:
+    def test_docker_py_receives_container_events(self, use_daemon):
+        daemon = use_daemon(containers=3)
+        client = docker.DockerClient(base_url=daemon.base_url)
+        try:
+            events = client.events(decode=True, until=time.time() + 5)
+            time.sleep(0.2)
+            client.containers.get("fake-0001").stop()
+            event = next(iter(events))
+            events.close()
+        finally:
+            client.close()
+
+        assert event["Type"] == "container"
+        assert event["Action"] == "stop"
+        assert event["Actor"]["Attributes"]["name"] == "fake-0001"
+        assert daemon.calls()["POST /containers/{id}/stop"] == 1
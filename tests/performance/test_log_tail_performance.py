@@ -0,0 +1,78 @@
+# -*- coding: utf-8 -*-
+# ============================================================================ #
+# DockerDiscordControl (DDC) - Log Tail Reader Performance Tests              #
+# https://ddc.bot                                                              #
+# Copyright (c) 2026 MAX                                                       #
+# Licensed under the MIT License                                               #
+# ============================================================================ #
+"""
+Performance tests for the reverse-seeking log tail reader.
+
+Builds a 500 MB log file and compares ``ContainerLogService._read_log_file``
+against the previous ``readlines()`` implementation.
+"""
+
+import time
+
+import pytest
+
+from services.web.container_log_service import ContainerLogService
+
+LOG_SIZE_BYTES = 500 * 1024 * 1024
+LINE = b"2025-01-01 00:00:00,000 - ddc.bot - INFO - Heartbeat: all containers refreshed\n"
+
+
+@pytest.fixture(scope="module")
+def huge_log(tmp_path_factory):
+    """Write a ~500 MB log file once for the whole module."""
+    path = tmp_path_factory.mktemp("logs") / "bot.log"
+    chunk = LINE * (1024 * 1024 // len(LINE))
+    with open(path, "wb") as f:
+        written = 0
+        while written < LOG_SIZE_BYTES:
+            f.write(chunk)
+            written += len(chunk)
+        f.write(b"final line\n")
+    return path
+
+
+def _readlines_tail(path, max_lines):
+    """The former implementation, kept for comparison."""
+    with open(path, "r", encoding="utf-8", errors="replace") as f:
+        lines = f.readlines()
+        return "".join(lines[-max_lines:])
+
+
+@pytest.mark.performance
+@pytest.mark.slow
+class TestLogTailPerformance:
+    """Benchmarks tail reads on a 500 MB log file."""
+
+    def test_tail_read_is_independent_of_file_size(self, huge_log):
+        service = ContainerLogService()
+
+        start = time.perf_counter()
+        content = service._read_log_file(str(huge_log), 500)
+        elapsed = time.perf_counter() - start
+
+        lines = content.splitlines()
+        assert len(lines) == 500
+        assert lines[-1] == "final line"
+        print(f"\nReverse-seek tail (500 lines of 500 MB): {elapsed * 1000:.2f}ms")
+        assert elapsed < 0.05, f"Tail read took {elapsed:.3f}s"
+
+    def test_tail_read_beats_readlines(self, huge_log):
+        service = ContainerLogService()
+
+        start = time.perf_counter()
+        expected = _readlines_tail(huge_log, 500)
+        baseline = time.perf_counter() - start
+
+        start = time.perf_counter()
+        content = service._read_log_file(str(huge_log), 500)
+        optimized = time.perf_counter() - start
+
+        assert content == expected
+        print(f"\nreadlines(): {baseline * 1000:.1f}ms, reverse-seek: {optimized * 1000:.2f}ms "
+              f"({baseline / max(optimized, 1e-9):.0f}x)")
+        assert optimized * 10 < baseline
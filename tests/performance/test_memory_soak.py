@@ -0,0 +1,70 @@
+# -*- coding: utf-8 -*-
+# ============================================================================ #
+# DockerDiscordControl (DDC) - Memory Soak Tests                              #
+# https://ddc.bot                                                              #
+# Copyright (c) 2025 MAX                                                       #
+# Licensed under the MIT License                                               #
+# ============================================================================ #
+"""
+Leak regression suite: thousands of refresh cycles, animation requests and
+donations against local stand-ins, with tracemalloc watching.
+
+Each workload runs in a fresh interpreter
+(:mod:`tests.performance.memory_soak_harness`) with scratch config and
+progress directories, so donations never touch the real event log. A workload
+fails when the memory it retains over the second half of its cycles - after
+caches are warm - exceeds ``MAX_GROWTH_KIB``; the failure message lists the
+modules that grew. Run with ``-s`` to see the per-module table.
+"""
+
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from tests.performance import memory_soak_harness as harness
+
+pytestmark = [pytest.mark.performance, pytest.mark.slow]
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+MAX_GROWTH_KIB = float(os.environ.get("DDC_SOAK_MAX_GROWTH_KIB", "256"))
+CYCLES = os.environ.get("DDC_SOAK_CYCLES")
+
+
+def _run_soak(workload, tmp_path):
+    env = dict(os.environ, PYTHONPATH=str(REPO_ROOT),
+               DDC_CONFIG_DIR=str(tmp_path / "config"),
+               DDC_PROGRESS_DATA_DIR=str(tmp_path / "progress"))
+    env.pop("DDC_MEMORY_PROFILING", None)
+    cmd = [sys.executable, "-m", "tests.performance.memory_soak_harness",
+           "--workloads", workload, "--json"]
+    if CYCLES:
+        cmd += ["--cycles", CYCLES]
+    completed = subprocess.run(cmd, cwd=REPO_ROOT, env=env, capture_output=True, text=True, timeout=900)
+    assert completed.returncode == 0, completed.stderr[-4000:]
+    return json.loads(completed.stdout.strip().splitlines()[-1])[0]
+
+
+@pytest.mark.parametrize("workload", harness.WORKLOADS)
+def test_workload_does_not_leak(workload, tmp_path):
+    result = _run_soak(workload, tmp_path)
+    print("\n" + harness.format_result(result))
+
+    assert result["cycles"] >= 1000
+    assert result["growth_bytes"] < MAX_GROWTH_KIB * 1024, harness.format_result(result)
+
+
+def test_soak_detects_a_leak(monkeypatch):
+    leaked = []
+
+    def _leaky(stack):
+        return lambda cycles: leaked.extend(bytearray(1024) for _ in range(cycles))
+
+    monkeypatch.setitem(harness._FACTORIES, "leaky", _leaky)
+    result = harness.soak("leaky", cycles=1000, warmup=10)
+
+    assert result["growth_bytes"] >= 500 * 1024
+    assert result["top"][0]["name"] == "tests.performance.test_memory_soak"
@@ -0,0 +1,81 @@
+# -*- coding: utf-8 -*-
+# ============================================================================ #
+# DockerDiscordControl (DDC) - Overview Render Performance Tests              #
+# https://ddc.bot                                                              #
+# Copyright (c) 2025 MAX                                                       #
+# Licensed under the MIT License                                               #
+# ============================================================================ #
+"""
+Render cost budgets for the overview, admin overview and control embeds.
+
+Uses :mod:`tests.performance.overview_render_harness` with synthetic fleets of
+10, 100 and 500 containers. Rendering must stay below
+``RENDER_BUDGET_MS_PER_CONTAINER`` per container and scale linearly with the
+fleet. Run with ``-s`` to see the timing table; for profiles use the harness
+directly (``python -m tests.performance.overview_render_harness --profile-dir ...``).
+"""
+
+import os
+
+import pytest
+
+from tests.performance import overview_render_harness as harness
+
+pytestmark = [pytest.mark.performance, pytest.mark.slow]
+
+FLEETS = (10, 100, 500)
+
+# Measured baseline is 0.1-0.3 ms per container; the budget leaves room for slow CI hosts
+RENDER_BUDGET_MS_PER_CONTAINER = float(os.environ.get("DDC_RENDER_BUDGET_MS", "2.0"))
+
+
+@pytest.fixture(scope="module")
+def timings():
+    return {(s, n): harness.benchmark(s, n, rounds=3) for s in harness.SCENARIOS for n in FLEETS}
+
+
+@pytest.mark.parametrize("scenario", harness.SCENARIOS)
+def test_render_cost_per_container_within_budget(timings, scenario):
+    rows = [timings[(scenario, n)] for n in FLEETS]
+    print("\n" + harness.format_table(rows))
+    for row in rows:
+        assert row.per_container_ms < RENDER_BUDGET_MS_PER_CONTAINER, row
+
+
+@pytest.mark.parametrize("scenario", harness.SCENARIOS)
+def test_render_cost_scales_linearly(timings, scenario):
+    small, large = timings[(scenario, 100)], timings[(scenario, 500)]
+    # 5x the containers must not cost more than ~10x (no quadratic lookups per container)
+    assert large.p50_ms < small.p50_ms * 10 + 5, (small, large)
+
+
+def test_renders_every_container():
+    import asyncio
+
+    servers = harness.synthetic_fleet(25)
+
+    async def _render():
+        cog = harness.make_cog(servers)
+        admin = await harness.render_once(cog, "admin_overview", servers)
+        control = await harness.render_once(cog, "control", servers)
+        return admin, control
+
+    with harness.render_environment(servers):
+        (admin_embed, _, has_running), control = asyncio.run(_render())
+
+    assert has_running is True
+    assert admin_embed.description.count("\n") >= 25
+    assert len(control) == 25
+    assert all(embed is not None for embed, _, _ in control)
+
+
+def test_profile_writes_cprofile_and_folded_stacks(tmp_path):
+    paths = harness.profile("admin_overview", 10, tmp_path, rounds=2)
+
+    assert paths["prof"].stat().st_size > 0
+    assert "_create_admin_overview_embed" in paths["txt"].read_text()
+    folded = paths["folded"].read_text().splitlines()
+    assert folded
+    stack, micros = folded[0].rsplit(" ", 1)
+    assert int(micros) > 0
+    assert any("_create_admin_overview_embed" in line for line in folded)
@@ -137,3 +137,91 @@ def test_persist_member_count_snapshot_writes_file(tmp_path, monkeypatch):
     assert payload["source"] == "status_channels"
     assert payload["description"] == "Unit test"
     assert payload["note"] == "Only a drill"
+
+
+class _PermChannel(_DummyChannel):
+    """Channel whose visibility is decided by a set of allowed member ids."""
+
+    def __init__(self, channel_id, name, guild_members, allowed):
+        super().__init__(channel_id, name, [])
+        self._guild_members = guild_members
+        self.allowed = set(allowed)
+
+    @property
+    def members(self):
+        return [m for m in self._guild_members if m.id in self.allowed]
+
+    @members.setter
+    def members(self, value):
+        pass
+
+    def permissions_for(self, member):
+        return type("Perms", (), {"view_channel": member.id in self.allowed})()
+
+
+def _indexed_setup(monkeypatch):
+    _configure_channel_permissions(
+        monkeypatch,
+        {
+            "channel_permissions": {
+                "100": {"commands": {"serverstatus": True}},
+                "200": {"commands": {"serverstatus": True}},
+            }
+        },
+    )
+    members = [_DummyMember(i) for i in range(1, 6)] + [_DummyMember(99, bot=True)]
+    channel_a = _PermChannel(100, "a", members, {1, 2, 3, 99})
+    channel_b = _PermChannel(200, "b", members, {3, 4})
+    guild = _DummyGuild(member_count=6, channels=[channel_a, channel_b])
+    guild.id = 1
+    return members, channel_a, channel_b, guild
+
+
+def test_index_answers_repeated_counts_without_rescanning(monkeypatch):
+    members, channel_a, channel_b, guild = _indexed_setup(monkeypatch)
+    service = MemberCountService()
+    assert service.compute_unique_member_count(guild) == 4
+
+    rebuilds = []
+    original = service.membership_index.rebuild
+    monkeypatch.setattr(service.membership_index, "rebuild",
+                        lambda *a: rebuilds.append(a) or original(*a))
+    assert service.compute_unique_member_count(guild) == 4
+    assert rebuilds == []
+
+
+def test_index_follows_join_leave_and_permission_events(monkeypatch):
+    members, channel_a, channel_b, guild = _indexed_setup(monkeypatch)
+    service = MemberCountService()
+    index = service.membership_index
+    service.compute_unique_member_count(guild)
+
+    newcomer = _DummyMember(6)
+    members.append(newcomer)
+    channel_b.allowed.add(6)
+    index.update_member(guild, newcomer)  # on_member_join
+    assert index.unique_count(1) == 5
+
+    index.remove_member(1, 3)  # on_member_remove; 3 saw both channels
+    members[:] = [m for m in members if m.id != 3]
+    assert index.unique_count(1) == 4
+
+    channel_a.allowed.discard(1)  # overwrite change hides the channel from member 1
+    index.refresh_channel(1, channel_a)
+    assert index.unique_count(1) == 3
+
+    channel_b.allowed.add(5)  # role change grants member 5 access
+    index.update_member(guild, next(m for m in members if m.id == 5))
+    assert service.compute_unique_member_count(guild) == 4
+
+
+def test_index_reconciles_after_interval(monkeypatch):
+    members, channel_a, channel_b, guild = _indexed_setup(monkeypatch)
+    service = MemberCountService()
+    service.compute_unique_member_count(guild)
+
+    channel_b.allowed.add(5)  # change without an event (missed gateway event)
+    assert service.compute_unique_member_count(guild) == 4
+
+    service.membership_index._reconcile_interval = 0
+    assert service.compute_unique_member_count(guild) == 5
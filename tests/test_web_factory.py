@@ -25,3 +25,13 @@ def test_create_app_returns_flask_instance(monkeypatch):
 
     assert response.status_code in {200, 500}
     assert "Content-Security-Policy" in response.headers
+
+
+def test_metrics_endpoint_requires_auth(monkeypatch):
+    monkeypatch.setenv("DDC_ENABLE_BACKGROUND_REFRESH", "false")
+    monkeypatch.setenv("DDC_ENABLE_MECH_DECAY", "false")
+
+    app = create_app({"TESTING": True})
+    response = app.test_client().get("/metrics")
+
+    assert response.status_code == 401
@@ -330,6 +330,79 @@ class TestPerformanceStats:
         assert body["success"] is False
 
 
+# ---- /api/memory-profile -----------------------------------------------------
+
+
+class TestMemoryProfile:
+    @pytest.fixture
+    def profiler(self, monkeypatch):
+        svc = MagicMock()
+        svc.is_tracing = True
+        svc.get_report.return_value = {"tracing": True, "top": [{"name": "cogs.docker_control"}]}
+        monkeypatch.setattr(
+            "services.infrastructure.memory_profiler_service.get_memory_profiler_service",
+            lambda: svc,
+        )
+        return svc
+
+    @pytest.fixture
+    def log_calls(self, monkeypatch):
+        # Capture log_user_action so we don't touch real logger.
+        calls = []
+        monkeypatch.setattr(
+            "app.blueprints.main_routes.log_user_action",
+            lambda **kw: calls.append(kw),
+        )
+        return calls
+
+    def test_unauthenticated_returns_401(self, main_app):
+        resp = main_app.test_client().get("/api/memory-profile")
+        assert resp.status_code == 401
+
+    def test_get_returns_report(self, main_app, profiler):
+        resp = main_app.test_client().get(
+            "/api/memory-profile?top=5&group_by=package", headers=_AUTH_HEADER
+        )
+        assert resp.status_code == 200
+        body = resp.get_json()
+        assert body["success"] is True
+        assert body["report"]["top"] == [{"name": "cogs.docker_control"}]
+        profiler.get_report.assert_called_once_with(top=5, group_by="package", since=None)
+
+    def test_invalid_group_by_returns_400(self, main_app, profiler):
+        resp = main_app.test_client().get(
+            "/api/memory-profile?group_by=line", headers=_AUTH_HEADER
+        )
+        assert resp.status_code == 400
+
+    def test_post_start_and_snapshot(self, main_app, profiler, log_calls):
+        client = main_app.test_client()
+        resp = client.post("/api/memory-profile", json={"action": "start", "frames": 3},
+                           headers=_AUTH_HEADER)
+        assert resp.status_code == 200
+        profiler.start.assert_called_once_with(3)
+
+        resp = client.post("/api/memory-profile", json={"action": "snapshot", "label": "before"},
+                           headers=_AUTH_HEADER)
+        assert resp.status_code == 200
+        profiler.take_snapshot.assert_called_once_with("before")
+        assert [c["details"] for c in log_calls] == ["Action: start", "Action: snapshot"]
+
+    def test_post_snapshot_when_not_tracing_returns_409(self, main_app, profiler, log_calls):
+        profiler.is_tracing = False
+        resp = main_app.test_client().post(
+            "/api/memory-profile", json={"action": "snapshot"}, headers=_AUTH_HEADER
+        )
+        assert resp.status_code == 409
+        profiler.take_snapshot.assert_not_called()
+
+    def test_post_unknown_action_returns_400(self, main_app, profiler, log_calls):
+        resp = main_app.test_client().post(
+            "/api/memory-profile", json={"action": "explode"}, headers=_AUTH_HEADER
+        )
+        assert resp.status_code == 400
+
+
 # ---- /refresh_containers -----------------------------------------------------
 
 
@@ -850,6 +923,34 @@ class TestDonationsApi:
         assert body["stats"]["total_donations"] == 1
 
 
+    def test_paginated_request_returns_page_with_stats(self, main_app, monkeypatch):
+        svc = MagicMock()
+        svc.get_donation_page.return_value = SimpleNamespace(
+            success=True,
+            data={
+                "donations": [{"id": 51}],
+                "total": 51,
+                "offset": 50,
+                "limit": 50,
+                "stats": {"total_power": 10, "total_donations": 51, "average_donation": 0.2},
+            },
+            error=None,
+        )
+        monkeypatch.setattr(
+            "services.donation.donation_management_service.get_donation_management_service",
+            lambda: svc,
+        )
+        resp = main_app.test_client().get(
+            "/api/donations/list?offset=50&limit=50", headers=_AUTH_HEADER
+        )
+        assert resp.status_code == 200
+        body = resp.get_json()
+        assert body["total"] == 51
+        assert body["stats"]["total_donations"] == 51
+        svc.get_donation_history.assert_not_called()
+        assert svc.get_donation_page.call_args.kwargs["offset"] == 50
+
+
 # ---- /api/donations/delete/<int:index> --------------------------------------
 
 
@@ -0,0 +1,98 @@
+# -*- coding: utf-8 -*-
+"""
+Unit tests for the indexed autocomplete handlers:
+- container names come from the config index, rebuilt only on config reload
+- task IDs match ID or description, skipping expired one-time tasks
+- translated month/weekday choices without per-choice translation calls
+"""
+import time
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+
+from cogs import autocomplete_handlers as handlers
+from cogs import control_helpers
+from services.scheduling.task_store import TaskStore
+from utils.autocomplete_index import get_autocomplete_index_cache
+
+
+def _ctx(value):
+    return SimpleNamespace(value=value)
+
+
+def _task(task_id, container, cycle="daily", next_run_ts=None, active=True, status="pending"):
+    return SimpleNamespace(task_id=task_id, container_name=container, action="restart",
+                           cycle=cycle, next_run_ts=next_run_ts, is_active=active, status=status)
+
+
+@pytest.fixture(autouse=True)
+def _fresh_index_cache():
+    get_autocomplete_index_cache().invalidate()
+    yield
+    get_autocomplete_index_cache().invalidate()
+
+
+class TestContainerSelect:
+    @pytest.mark.asyncio
+    async def test_index_is_reused_until_servers_change(self):
+        servers = [{"docker_name": "plex"}, {"docker_name": "nginx"}, {"docker_name": "plex"}, {}]
+        with patch.object(control_helpers, "get_cached_servers", return_value=servers):
+            assert await handlers.schedule_container_select(_ctx("")) == ["nginx", "plex"]
+            assert await control_helpers.container_select(None, _ctx("PL")) == ["plex"]
+        builds = get_autocomplete_index_cache().get_stats()["builds"]
+        assert builds == 1
+
+        with patch.object(control_helpers, "get_cached_servers", return_value=[{"docker_name": "valheim"}]):
+            assert await handlers.schedule_container_select(_ctx("v")) == ["valheim"]
+
+
+class TestTaskIdSelect:
+    @pytest.mark.asyncio
+    async def test_matches_id_and_description_and_skips_expired(self):
+        now = time.time()
+        store = TaskStore()
+        store.replace([
+            _task("t-web", "nginx"),
+            _task("t-once", "plex", cycle="once", next_run_ts=now + 3600),
+            _task("t-past", "plex", cycle="once", next_run_ts=now - 3600),
+            _task("t-off", "plex", active=False),
+        ])
+        with patch("services.scheduling.scheduler.refresh_task_store", return_value=store):
+            assert await handlers.schedule_task_id_select(_ctx("")) == ["t-web", "t-once"]
+            assert await handlers.schedule_task_id_select(_ctx("plex")) == ["t-once"]
+            assert await handlers.schedule_task_id_select(_ctx("t-w")) == ["t-web"]
+
+            # Store mutations bump its version and rebuild the index
+            store.remove("t-web")
+            assert await handlers.schedule_task_id_select(_ctx("nginx")) == []
+
+
+class TestTranslatedChoices:
+    @pytest.mark.asyncio
+    async def test_month_matches_number_and_name(self):
+        from cogs.translation_manager import translation_manager
+
+        with patch.object(translation_manager, "get_current_language", return_value="en"):
+            assert await handlers.schedule_month_select(_ctx("mar")) == ["03"]
+            assert await handlers.schedule_month_select(_ctx("12")) == ["12"]
+            assert len(await handlers.schedule_month_select(_ctx(""))) == 12
+
+    @pytest.mark.asyncio
+    async def test_weekday_returns_english_values_in_week_order(self):
+        from cogs.translation_manager import translation_manager
+
+        with patch.object(translation_manager, "get_current_language", return_value="de"):
+            assert await handlers.schedule_weekday_select(_ctx("mitt")) == ["Wednesday"]
+            assert await handlers.schedule_weekday_select(_ctx("day")) == [
+                "Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"]
+
+    def test_current_language_reads_config_snapshot(self):
+        from cogs.translation_manager import translation_manager
+        from services.config.config_cache_service import ConfigSnapshot, freeze_config
+
+        snapshot = ConfigSnapshot(version=1, config=freeze_config({"language": "de"}))
+        with patch("cogs.translation_manager.load_config_snapshot", return_value=snapshot):
+            assert translation_manager.get_current_language() == "de"
+        with patch("cogs.translation_manager.load_config_snapshot", side_effect=OSError("unreadable")):
+            assert translation_manager.get_current_language() == "en"
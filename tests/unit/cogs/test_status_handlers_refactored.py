@@ -421,6 +421,41 @@ class TestStatusHandlersRefactored:
             assert view is None  # No view during pending
             assert running is False  # Running status should be False during pending
 
+    @pytest.mark.asyncio
+    async def test_generate_embed_running_with_details_builds_control_view(self, mixin):
+        """Running container with details gets a ControlView (permission lookup by 'control' key)"""
+        server_conf = {
+            'name': 'Test Server',
+            'docker_name': 'test_container',
+            'allow_detailed_status': True,
+            'allowed_actions': ['start', 'stop']
+        }
+        current_config = {
+            'language': 'en',
+            'timezone_str': 'Europe/Berlin',
+            'channel_permissions': {'123456': {'commands': {'control': True}}}
+        }
+        mixin.status_cache_service.get.return_value = {
+            'data': ContainerStatusResult.success_result(
+                docker_name='test_container', display_name='Test Server', is_running=True,
+                cpu='5%', ram='100MB', uptime='1h', details_allowed=True),
+            'timestamp': datetime.now(timezone.utc)
+        }
+
+        with patch('cogs.status_handlers.get_server_config_service') as mock_config:
+            mock_config.return_value.get_all_servers.return_value = [server_conf]
+
+            embed, view, running = await mixin._generate_status_embed_and_view(
+                channel_id=123456,
+                display_name='Test Server',
+                server_conf=server_conf,
+                current_config=current_config
+            )
+
+        assert running is True
+        assert embed is not None
+        assert view is not None
+
     @pytest.mark.asyncio
     async def test_pending_status_timeout_with_action_success(self, mixin):
         """Test pending timeout when action succeeds"""
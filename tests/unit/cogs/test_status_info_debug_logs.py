@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Unit tests for the admin "Debug Logs" button in cogs/status_info_integration.
+
+DebugLogsButton.callback fetches the initial log window through a fresh
+ContainerLogCursor and hands that cursor to the LiveLogView it sends, so the
+view's refreshes continue from the lines already shown.
+"""
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from cogs.status_info_integration import DebugLogsButton, LiveLogView
+
+
+LOG_OUTPUT = (
+    b"2025-01-01T10:00:00.000000001Z first line\n"
+    b"2025-01-01T10:00:01.000000001Z second line\n"
+)
+
+
+def _make_interaction():
+    interaction = MagicMock()
+    interaction.user.id = 42
+    interaction.response.defer = AsyncMock()
+    interaction.response.is_done.return_value = True
+    interaction.followup.send = AsyncMock(return_value=MagicMock())
+    return interaction
+
+
+def _docker_client(container):
+    client = MagicMock()
+    client.containers.get.return_value = container
+    return client
+
+
+@pytest.fixture
+def no_spam_protection():
+    spam = MagicMock()
+    spam.is_enabled.return_value = False
+    with patch("services.infrastructure.spam_protection_service.get_spam_protection_service",
+               return_value=spam):
+        yield
+
+
+class TestDebugLogsButtonCallback:
+    @pytest.mark.asyncio
+    async def test_sends_initial_logs_with_view_sharing_the_cursor(self, no_spam_protection, monkeypatch):
+        monkeypatch.delenv("DDC_LIVE_LOGS_AUTO_START", raising=False)
+        container = MagicMock()
+        container.logs.return_value = LOG_OUTPUT
+        button = DebugLogsButton(MagicMock(), {"docker_name": "web", "name": "Web"})
+        interaction = _make_interaction()
+
+        with patch("docker.from_env", return_value=_docker_client(container)):
+            await button.callback(interaction)
+
+        container.logs.assert_called_once_with(tail=50, timestamps=True)
+        kwargs = interaction.followup.send.await_args.kwargs
+        assert "second line" in kwargs["embed"].description
+        view = kwargs["view"]
+        assert isinstance(view, LiveLogView)
+        assert list(view.log_cursor.lines) == LOG_OUTPUT.decode().splitlines()
+        assert view.log_cursor.last_timestamp == "2025-01-01T10:00:01.000000001Z"
+        view.recreation_task.cancel()
+
+    @pytest.mark.asyncio
+    async def test_missing_container_reports_not_found(self, no_spam_protection):
+        import docker
+
+        client = MagicMock()
+        client.containers.get.side_effect = docker.errors.NotFound("gone")
+        button = DebugLogsButton(MagicMock(), {"docker_name": "web", "name": "Web"})
+        interaction = _make_interaction()
+
+        with patch("docker.from_env", return_value=client):
+            await button.callback(interaction)
+
+        kwargs = interaction.followup.send.await_args.kwargs
+        assert "not found" in kwargs["embed"].description
+        kwargs["view"].recreation_task.cancel()
@@ -201,27 +201,36 @@ class TestWebHelpersCleanupCache:
 
 
 class TestUpdateDockerCache:
-    """Cover update_docker_cache via mocked docker.from_env."""
+    """Cover update_docker_cache via a stubbed shared container snapshot."""
+
+    def _api_container(self, name, state="running", image="nginx"):
+        return {
+            "Id": "abcdef0123456789abcdef0123456789",
+            "Names": ["/" + name],
+            "State": state,
+            "Image": image,
+            "Created": 1700000000,
+        }
+
+    def _use_provider(self, monkeypatch, fetcher):
+        from services.docker_service.container_snapshot import ContainerSnapshotProvider
+        from services.docker_service.status_cache_runtime import DockerStatusCacheRuntime
 
-    def _build_fake_container(self, name, status="running", image_tag="nginx"):
-        c = MagicMock()
-        c.id = "abcdef0123456789abcdef0123456789"
-        c.name = name
-        c.status = status
-        c.image.tags = [image_tag] if image_tag else []
-        c.image.id = "sha256:" + ("0" * 64)
-        return c
+        provider = ContainerSnapshotProvider(fetcher=fetcher, status_runtime=DockerStatusCacheRuntime())
+        monkeypatch.setattr(
+            "services.docker_service.container_snapshot.get_container_snapshot_provider",
+            lambda: provider,
+        )
+        return provider
 
     def test_update_cache_populates_containers(self, monkeypatch):
         import app.utils.web_helpers as wh
+        from services.docker_service.container_snapshot import normalize_container_list
 
-        client = MagicMock()
-        client.containers.list.return_value = [
-            self._build_fake_container("zeta"),
-            self._build_fake_container("alpha"),
-        ]
-        client.close = MagicMock()
-        monkeypatch.setattr("app.utils.web_helpers.docker.from_env", lambda **kw: client)
+        self._use_provider(monkeypatch, lambda: normalize_container_list([
+            self._api_container("zeta"),
+            self._api_container("alpha"),
+        ]))
 
         # Reset cache state
         with wh.cache_lock:
@@ -234,9 +243,23 @@ class TestUpdateDockerCache:
         # Sorted alphabetically
         names = [c["name"] for c in wh.docker_cache["containers"]]
         assert names == ["alpha", "zeta"]
+        assert wh.docker_cache["containers"][0] == {
+            "id": "abcdef012345", "name": "alpha", "status": "running", "image": "nginx",
+        }
         assert wh.docker_cache["global_timestamp"] is not None
         assert wh.docker_cache["error"] is None
 
+    def test_update_cache_reuses_snapshot_published_by_bot(self, monkeypatch):
+        import app.utils.web_helpers as wh
+
+        fetcher = MagicMock(return_value=[])
+        provider = self._use_provider(monkeypatch, fetcher)
+        provider.publish([{"id": "1", "name": "from_bot", "status": "exited", "image": "x"}])
+
+        wh.update_docker_cache(logging.getLogger("t"), max_age=30)
+        fetcher.assert_not_called()
+        assert [c["name"] for c in wh.docker_cache["containers"]] == ["from_bot"]
+
     def test_update_cache_handles_docker_exception(self, monkeypatch):
         import importlib
         import sys
@@ -258,11 +281,10 @@ class TestUpdateDockerCache:
             app_utils_pkg = importlib.import_module("app.utils")
             app_utils_pkg.web_helpers = wh
 
-            def _raise(**kw):
+            def _raise():
                 raise docker_mod.errors.DockerException("daemon down")
 
-            # Patch via the live module attribute (not via dotted string).
-            monkeypatch.setattr(wh.docker, "from_env", _raise)
+            self._use_provider(monkeypatch, _raise)
 
             # Reset cache state so we deterministically observe the error
             # written by this exception path.
@@ -284,12 +306,10 @@ class TestUpdateDockerCache:
     def test_update_cache_handles_timeout_message(self, monkeypatch):
         import app.utils.web_helpers as wh
 
-        client = MagicMock()
-        client.containers.list.side_effect = Exception(
-            "Read timed out after 30 seconds"
-        )
-        client.close = MagicMock()
-        monkeypatch.setattr("app.utils.web_helpers.docker.from_env", lambda **kw: client)
+        def _timeout():
+            raise Exception("Read timed out after 30 seconds")
+
+        self._use_provider(monkeypatch, _timeout)
 
         with wh.cache_lock:
             wh.docker_cache["containers"] = []
@@ -298,29 +318,21 @@ class TestUpdateDockerCache:
         wh.update_docker_cache(logging.getLogger("t"))
         assert wh.docker_cache["containers"] == []
 
-    def test_update_cache_image_id_fallback_when_no_tags(self, monkeypatch):
-        """No tags -> image field uses id[:12]."""
+    def test_update_cache_strips_image_digest(self, monkeypatch):
+        """Digest-pinned images are shown by their tag."""
         import app.utils.web_helpers as wh
+        from services.docker_service.container_snapshot import normalize_container_list
 
-        c = MagicMock()
-        c.id = "deadbeefcafe0011223344556677889900"
-        c.name = "no_tags"
-        c.status = "running"
-        c.image.tags = []
-        c.image.id = "sha256:deadbeefcafe0011223344"
-
-        client = MagicMock()
-        client.containers.list.return_value = [c]
-        client.close = MagicMock()
-        monkeypatch.setattr("app.utils.web_helpers.docker.from_env", lambda **kw: client)
+        self._use_provider(monkeypatch, lambda: normalize_container_list([
+            self._api_container("pinned", image="nginx:1.25@sha256:deadbeef"),
+        ]))
 
         with wh.cache_lock:
             wh.docker_cache["containers"] = []
 
         wh.update_docker_cache(logging.getLogger("t"))
-        result = [c for c in wh.docker_cache["containers"] if c["name"] == "no_tags"][0]
-        # First 12 chars of the image *id* string
-        assert result["image"] == "sha256:deadb"
+        result = [c for c in wh.docker_cache["containers"] if c["name"] == "pinned"][0]
+        assert result["image"] == "nginx:1.25"
 
 
 class TestGetDockerContainersLive:
@@ -616,7 +628,7 @@ class TestBackgroundRefreshWorker:
 
         # Stub update_docker_cache so we don't hit real Docker
         monkeypatch.setattr(
-            wh, "update_docker_cache", lambda logger: None
+            wh, "update_docker_cache", lambda logger, max_age=None: None
         )
         # Make sleep return immediately
         monkeypatch.setattr(wh, "HAS_GEVENT", False)
@@ -637,7 +649,7 @@ class TestBackgroundRefreshWorker:
 
         called = {"n": 0}
 
-        def fake_update(logger):
+        def fake_update(logger, max_age=None):
             called["n"] += 1
             # First call raises, then set the stop event so the loop exits
             if called["n"] == 1:
@@ -2317,6 +2329,31 @@ class TestMainRoutesAdditional:
         assert resp.data == b"FAKEWEBP"
         assert resp.headers["Content-Type"] == "image/webp"
 
+    def test_get_mech_display_image_conditional_get(self, main_app, monkeypatch):
+        svc = MagicMock()
+        svc.get_mech_display_image.return_value = _ns(
+            success=True,
+            image_bytes=b"FAKEWEBP",
+            filename="mech_5_shadow.webp",
+            error_message=None,
+            etag="abc123",
+        )
+        monkeypatch.setattr(
+            "services.mech.mech_display_cache_service.get_mech_display_cache_service",
+            lambda: svc,
+        )
+        client = main_app.test_client()
+        first = client.get("/api/mech/display/5/shadow")
+        assert first.headers["ETag"] == '"abc123"'
+
+        resp = client.get("/api/mech/display/5/shadow", headers={"If-None-Match": '"abc123"'})
+        assert resp.status_code == 304
+        assert resp.data == b""
+
+        resp = client.get("/api/mech/display/5/shadow", headers={"If-None-Match": '"stale"'})
+        assert resp.status_code == 200
+        assert resp.data == b"FAKEWEBP"
+
     def test_get_mech_display_image_not_found(self, main_app, monkeypatch):
         svc = MagicMock()
         svc.get_mech_display_image.return_value = _ns(
@@ -765,7 +765,7 @@ class TestDonationStatsBranches:
         mech = MagicMock()
         mech.get_mech_state_service.return_value = _mech_state_result(0.0)
         patch_mech_service.return_value = mech
-        event_log_path.write_text("{not-json")
+        event_log_path.write_text("{not-json\n")
         result = DonationManagementService().get_donation_stats()
         assert result.success is False
 
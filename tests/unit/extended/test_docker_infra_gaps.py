@@ -37,6 +37,7 @@ import docker.errors
 import pytest
 
 from services.docker_service import docker_utils
+from services.docker_service.container_snapshot import reset_container_snapshot_provider
 from services.docker_service import docker_client_pool as dcp_mod
 from services.docker_service.docker_client_pool import (
     DockerClientService,
@@ -92,6 +93,7 @@ def _reset_docker_utils_globals():
     docker_utils._cache_timestamp = 0
     docker_utils._custom_timeout_config = None
     docker_utils._custom_config_loaded = False
+    reset_container_snapshot_provider()
     yield
 
 
@@ -427,19 +429,14 @@ class TestDockerUtilsListTimeout:
 
 
 class TestDockerUtilsContainersDataRunningBranch:
-    """Lines 761-765: get_containers_data running-state with valid State."""
+    """get_containers_data running-state with valid State."""
 
     @pytest.mark.asyncio
-    async def test_running_state_with_string_state_keeps_started_at(
+    async def test_running_state_with_string_state_is_reported_running(
         self, monkeypatch
     ):
-        # Production reads c_data['State'] as string for ``.lower()``;
-        # then if running, again as dict for ``.get('StartedAt')``.
-        # That double-typed lookup means a single dict can never go through
-        # both branches cleanly: with a string, ``.get`` raises AttributeError
-        # caught by the outer except handler.
-        # However, producing a "running" status DOES exercise the running
-        # branch up until the AttributeError, covering lines 760-765.
+        # The list API reports State as a plain string; running containers
+        # must come back as running (with their ports), not error_processing.
         client = MagicMock()
         client.api.containers.return_value = [
             {
@@ -459,11 +456,10 @@ class TestDockerUtilsContainersDataRunningBranch:
         docker_utils._containers_cache = None
         docker_utils._cache_timestamp = 0
         result = await docker_utils.get_containers_data()
-        # The running branch attempts state_detail.get(...) on a string,
-        # which raises AttributeError caught by inner except -> entry
-        # becomes ``error_processing``.
         assert len(result) == 1
-        assert result[0]["status"] == "error_processing"
+        assert result[0]["status"] == "running"
+        assert result[0]["running"] is True
+        assert result[0]["ports"] == [{"PrivatePort": 80}]
 
 
 class TestDockerUtilsCacheTtlLoader:
@@ -2862,33 +2862,6 @@ class TestTaskManagementGaps:
         assert isinstance(result, str)
         assert len(result) > 0
 
-    def test_save_updated_tasks_no_tasks_returns_immediately(self):
-        from services.web.task_management_service import TaskManagementService
-
-        svc = TaskManagementService()
-        # Should return without any error
-        svc._save_updated_tasks([])
-
-    def test_save_updated_tasks_handles_scheduler_error(self):
-        from services.web.task_management_service import TaskManagementService
-
-        svc = TaskManagementService()
-        with patch(
-            "services.scheduling.scheduler.update_task",
-            side_effect=ImportError("no scheduler"),
-        ):
-            svc._save_updated_tasks([_FakeTaskTms()])
-
-    def test_save_updated_tasks_handles_data_error(self):
-        from services.web.task_management_service import TaskManagementService
-
-        svc = TaskManagementService()
-        with patch(
-            "services.scheduling.scheduler.update_task",
-            side_effect=ValueError("bad"),
-        ):
-            svc._save_updated_tasks([_FakeTaskTms()])
-
     def test_find_task_by_id_handles_service_error(self):
         from services.web.task_management_service import TaskManagementService
 
@@ -2936,10 +2909,9 @@ class TestTaskManagementGaps:
 
         svc = TaskManagementService()
         task = _FakeTaskTms(cycle="once", is_active=True, next_run_ts=None)
-        status, needs_update = svc._calculate_frontend_status(task, time.time())
+        status = svc._calculate_frontend_status(task, time.time())
         assert status == "expired"
-        assert needs_update is True
-        assert task.is_active is False
+        assert task.is_active is True
 
     def test_calculate_frontend_status_expired_status_completed(self):
         from services.web.task_management_service import TaskManagementService
@@ -2951,7 +2923,7 @@ class TestTaskManagementGaps:
             next_run_ts=1_700_000_000.0,
             status="completed",
         )
-        status, needs_update = svc._calculate_frontend_status(task, time.time())
+        status = svc._calculate_frontend_status(task, time.time())
         assert status == "expired"
 
     def test_calculate_frontend_status_expired_time_in_past(self):
@@ -2961,7 +2933,7 @@ class TestTaskManagementGaps:
         task = _FakeTaskTms(
             cycle="once", is_active=True, next_run_ts=1_000_000.0
         )
-        status, needs_update = svc._calculate_frontend_status(task, time.time())
+        status = svc._calculate_frontend_status(task, time.time())
         assert status == "expired"
 
     def test_calculate_frontend_status_no_next_run_deactivated(self):
@@ -2969,7 +2941,7 @@ class TestTaskManagementGaps:
 
         svc = TaskManagementService()
         task = _FakeTaskTms(cycle="daily", is_active=False, next_run_ts=None)
-        status, _ = svc._calculate_frontend_status(task, time.time())
+        status = svc._calculate_frontend_status(task, time.time())
         assert status == "deactivated"
 
     def test_calculate_frontend_status_inactive_returns_deactivated(self):
@@ -2979,7 +2951,7 @@ class TestTaskManagementGaps:
         task = _FakeTaskTms(
             cycle="daily", is_active=False, next_run_ts=time.time() + 3600
         )
-        status, _ = svc._calculate_frontend_status(task, time.time())
+        status = svc._calculate_frontend_status(task, time.time())
         assert status == "deactivated"
 
     def test_update_task_schedule_details_cron(self):
@@ -61,24 +61,27 @@ import pytest
 class TestUpdateDockerCacheBranches:
     """Cover update_docker_cache timeout & re-raise branches."""
 
-    def test_update_cache_handles_unix_http_pool_timeout(self, monkeypatch):
-        """Lines 272-274: 'UnixHTTPConnectionPool' substring triggers timeout path."""
-        from app.utils import web_helpers as wh
+    @staticmethod
+    def _use_fetcher(monkeypatch, fetcher):
+        from services.docker_service.container_snapshot import ContainerSnapshotProvider
+        from services.docker_service.status_cache_runtime import DockerStatusCacheRuntime
 
-        class _FakeContainers:
-            def list(self, all=True):
-                raise RuntimeError(
-                    "UnixHTTPConnectionPool(host='localhost', port=2375): boom"
-                )
+        provider = ContainerSnapshotProvider(fetcher=fetcher, status_runtime=DockerStatusCacheRuntime())
+        monkeypatch.setattr(
+            "services.docker_service.container_snapshot.get_container_snapshot_provider",
+            lambda: provider,
+        )
 
-        class _FakeClient:
-            def __init__(self, *a, **k):
-                self.containers = _FakeContainers()
+    def test_update_cache_handles_unix_http_pool_timeout(self, monkeypatch):
+        """'UnixHTTPConnectionPool' substring triggers timeout path."""
+        from app.utils import web_helpers as wh
 
-            def close(self):
-                pass
+        def _fetch():
+            raise RuntimeError(
+                "UnixHTTPConnectionPool(host='localhost', port=2375): boom"
+            )
 
-        monkeypatch.setattr(wh.docker, "from_env", lambda **k: _FakeClient())
+        self._use_fetcher(monkeypatch, _fetch)
 
         logger = MagicMock()
         # Should NOT raise - the timeout path swallows the error
@@ -87,25 +90,13 @@ class TestUpdateDockerCacheBranches:
         assert wh.docker_cache["error"] is None
 
     def test_update_cache_reraises_unexpected_runtime_error(self, monkeypatch):
-        """Line 276: non-timeout exceptions get re-raised and caught by outer."""
+        """Non-timeout exceptions get re-raised and caught by the outer handler."""
         from app.utils import web_helpers as wh
 
-        class _FakeContainers:
-            def list(self, all=True):
-                # Non-timeout RuntimeError gets re-raised (line 276) then
-                # the outer exception block (line 362-374) catches it
-                # because it matches (RuntimeError is not in that tuple,
-                # so this should actually propagate up).
-                raise ValueError("totally unrelated parser error")
-
-        class _FakeClient:
-            def __init__(self, *a, **k):
-                self.containers = _FakeContainers()
-
-            def close(self):
-                pass
+        def _fetch():
+            raise ValueError("totally unrelated parser error")
 
-        monkeypatch.setattr(wh.docker, "from_env", lambda **k: _FakeClient())
+        self._use_fetcher(monkeypatch, _fetch)
         logger = MagicMock()
         # ValueError is in the (ValueError, TypeError, KeyError, AttributeError)
         # except block, so it's caught and stored in cache['error']
@@ -0,0 +1,105 @@
+# -*- coding: utf-8 -*-
+# ============================================================================ #
+# DockerDiscordControl (DDC) - Verified Credential Cache Tests                #
+# https://ddc.bot                                                              #
+# Copyright (c) 2025 MAX                                                       #
+# Licensed under the MIT License                                               #
+# ============================================================================ #
+"""Unit tests for the Basic-auth verified-credential cache in app/auth.py."""
+
+from __future__ import annotations
+
+from unittest.mock import patch
+
+import pytest
+from flask import Flask
+from werkzeug.security import generate_password_hash
+
+from app import auth as auth_module
+from app.auth import VerifiedCredentialCache, verify_password
+
+# Cheap hash so the suite stays fast; the cache logic is method-agnostic.
+FAST_HASH = generate_password_hash("correct-horse", method="pbkdf2:sha256:1000")
+
+
+@pytest.fixture
+def config_state():
+    return {"web_ui_user": "admin", "web_ui_password_hash": FAST_HASH}
+
+
+@pytest.fixture
+def app_ctx(monkeypatch, config_state):
+    monkeypatch.setattr(auth_module, "load_config", lambda: config_state)
+    monkeypatch.setattr(auth_module, "credential_cache", VerifiedCredentialCache(ttl_seconds=60))
+    app = Flask(__name__)
+    app.secret_key = "test"
+    with app.test_request_context("/"):
+        yield
+
+
+class TestVerifiedCredentialCache:
+    def test_entries_never_contain_plaintext(self):
+        cache = VerifiedCredentialCache(ttl_seconds=60)
+        cache.remember("admin", "correct-horse", "admin", FAST_HASH)
+        for digest in cache._entries:
+            assert b"correct-horse" not in digest
+            assert len(digest) == 32
+
+    def test_digest_is_keyed_per_instance(self):
+        a = VerifiedCredentialCache()
+        b = VerifiedCredentialCache()
+        assert a._digest("admin", "pw") != b._digest("admin", "pw")
+
+    def test_hit_until_expiry(self):
+        cache = VerifiedCredentialCache(ttl_seconds=60)
+        with patch("app.auth.time.monotonic", return_value=1000.0):
+            cache.remember("admin", "pw", "admin", FAST_HASH)
+        with patch("app.auth.time.monotonic", return_value=1059.0):
+            assert cache.is_verified("admin", "pw", "admin", FAST_HASH) is True
+        with patch("app.auth.time.monotonic", return_value=1060.0):
+            assert cache.is_verified("admin", "pw", "admin", FAST_HASH) is False
+
+    def test_config_change_invalidates(self):
+        cache = VerifiedCredentialCache(ttl_seconds=60)
+        cache.remember("admin", "pw", "admin", FAST_HASH)
+        assert cache.is_verified("admin", "pw", "admin", "other-hash") is False
+        # Switching back does not resurrect dropped entries
+        assert cache.is_verified("admin", "pw", "admin", FAST_HASH) is False
+
+    def test_ttl_zero_disables_cache(self):
+        cache = VerifiedCredentialCache(ttl_seconds=0)
+        cache.remember("admin", "pw", "admin", FAST_HASH)
+        assert cache.is_verified("admin", "pw", "admin", FAST_HASH) is False
+
+    def test_size_is_bounded(self):
+        cache = VerifiedCredentialCache(ttl_seconds=60, max_entries=4)
+        for i in range(10):
+            cache.remember("admin", f"pw{i}", "admin", FAST_HASH)
+        assert len(cache._entries) == 4
+        assert cache.is_verified("admin", "pw9", "admin", FAST_HASH) is True
+
+
+class TestVerifyPasswordCaching:
+    def test_second_request_skips_hash_check(self, app_ctx):
+        with patch("app.auth.check_password_hash", wraps=auth_module.check_password_hash) as check:
+            assert verify_password("admin", "correct-horse") == "admin"
+            assert verify_password("admin", "correct-horse") == "admin"
+        assert check.call_count == 1
+
+    def test_wrong_password_is_not_cached(self, app_ctx):
+        with patch("app.auth.check_password_hash", wraps=auth_module.check_password_hash) as check:
+            assert verify_password("admin", "wrong") is None
+            assert verify_password("admin", "wrong") is None
+        assert check.call_count == 2
+
+    def test_password_change_takes_effect_immediately(self, app_ctx, config_state):
+        assert verify_password("admin", "correct-horse") == "admin"
+        config_state["web_ui_password_hash"] = generate_password_hash("new-secret", method="pbkdf2:sha256:1000")
+        assert verify_password("admin", "correct-horse") is None
+        assert verify_password("admin", "new-secret") == "admin"
+
+    def test_username_change_takes_effect_immediately(self, app_ctx, config_state):
+        assert verify_password("admin", "correct-horse") == "admin"
+        config_state["web_ui_user"] = "operator"
+        assert verify_password("admin", "correct-horse") is None
+        assert verify_password("operator", "correct-horse") == "operator"
@@ -20,7 +20,6 @@ from __future__ import annotations
 import base64
 import importlib
 import time
-from datetime import datetime, timedelta, timezone
 
 import pytest
 
@@ -355,21 +354,52 @@ class TestSetupRateLimiter:
         """After window expires, prior timestamps are pruned and limit resets."""
         limiter = self._make()
         ip = "198.51.100.7"
+        clock = [1000.0]
+        monkeypatch.setattr("app.auth.time.monotonic", lambda: clock[0])
 
         # Fill the bucket "now".
         for _ in range(5):
             assert limiter.is_rate_limited(ip) is False
         assert limiter.is_rate_limited(ip) is True
 
-        # Simulate time advancing past the 60-second window by rewriting the
-        # stored timestamps to be older than `window`.
-        old = datetime.now(timezone.utc) - timedelta(seconds=120)
-        with limiter.lock:
-            limiter.ip_dict[ip] = [old for _ in limiter.ip_dict[ip]]
+        # Advance past the 60-second window.
+        clock[0] += 120
 
-        # cleanup happens inside is_rate_limited — old entries should be purged.
+        # Expiry happens lazily inside is_rate_limited.
         assert limiter.is_rate_limited(ip) is False
 
+    def test_window_slides_per_request(self, monkeypatch):
+        """Only requests older than the window free up capacity."""
+        limiter = self._make()
+        ip = "198.51.100.8"
+        clock = [1000.0]
+        monkeypatch.setattr("app.auth.time.monotonic", lambda: clock[0])
+
+        for _ in range(4):
+            assert limiter.is_rate_limited(ip) is False
+        clock[0] += 30
+        assert limiter.is_rate_limited(ip) is False
+        assert limiter.is_rate_limited(ip) is True
+
+        # First four requests expire, the one at t+30 is still counted.
+        clock[0] += 31
+        for _ in range(4):
+            assert limiter.is_rate_limited(ip) is False
+        assert limiter.is_rate_limited(ip) is True
+
+    def test_idle_ips_are_evicted_lazily(self, monkeypatch):
+        limiter = self._make()
+        clock = [1000.0]
+        monkeypatch.setattr("app.auth.time.monotonic", lambda: clock[0])
+
+        for i in range(100):
+            limiter.is_rate_limited(f"10.1.0.{i}")
+        assert len(limiter.ip_dict) == 100
+
+        clock[0] += 61
+        limiter.is_rate_limited("10.2.0.1")
+        assert list(limiter.ip_dict) == ["10.2.0.1"]
+
     def test_module_level_setup_limiter_is_5_per_60(self):
         """Production constant must remain tight (5 req/min) for /setup."""
         from app.auth import setup_limiter
@@ -28,6 +28,7 @@ from __future__ import annotations
 import asyncio
 import json
 import re
+import threading
 import time
 from pathlib import Path
 from typing import Any, Dict, List, Optional
@@ -91,6 +92,9 @@ def state_service(sandbox_config_dir: Path) -> AutoActionStateService:
     svc.base_dir = sandbox_config_dir
     svc.state_file = sandbox_config_dir / "config" / "auto_actions_state.json"
     svc._lock = Lock()
+    svc._io_lock = Lock()
+    svc._dirty = False
+    svc._save_timer = None
     svc.global_last_triggered = 0.0
     svc.rule_cooldowns = {}
     svc.container_cooldowns = {}
@@ -577,7 +581,71 @@ class TestStateService:
         # Cooldowns confirmed
         assert state_service.container_cooldowns["nginx"] > 0
         assert state_service.rule_cooldowns["r1"] > 0
-        # File written
+        # File written (behind; flush forces the pending write)
+        assert state_service.flush() is True
+        assert state_service.state_file.exists()
+        on_disk = json.loads(state_service.state_file.read_text())
+        assert on_disk["trigger_history"]["nginx"][0]["result"] == "SUCCESS"
+
+    def test_trigger_burst_is_written_once(
+        self, state_service: AutoActionStateService, monkeypatch
+    ):
+        writes = []
+        monkeypatch.setattr(state_service, "_write_state", writes.append)
+        state_service.save_debounce_seconds = 60
+
+        for i in range(25):
+            state_service.record_trigger(
+                f"r{i}", "Rule", "nginx", "RESTART", "SUCCESS", str(i)
+            )
+        assert writes == []
+
+        state_service.flush()
+        assert len(writes) == 1
+        assert len(writes[0]["trigger_history"]["nginx"]) == 25
+        # Nothing pending any more
+        assert state_service.flush() is False
+
+    def test_overlapping_flushes_write_in_snapshot_order(
+        self, state_service: AutoActionStateService, monkeypatch
+    ):
+        writes = []
+        started = []
+        first_write_started = threading.Event()
+        release_first_write = threading.Event()
+
+        def slow_write(data):
+            started.append(data)
+            if len(started) == 1:
+                first_write_started.set()
+                release_first_write.wait(2)
+            writes.append(data)
+
+        monkeypatch.setattr(state_service, "_write_state", slow_write)
+        state_service.save_debounce_seconds = 60
+        state_service.record_trigger("r1", "Rule", "nginx", "RESTART", "SUCCESS", "old")
+        first = threading.Thread(target=state_service.flush)
+        first.start()
+        assert first_write_started.wait(2)
+
+        state_service.record_trigger("r2", "Rule", "nginx", "RESTART", "SUCCESS", "new")
+        second = threading.Thread(target=state_service.flush)
+        second.start()
+        release_first_write.set()
+        first.join(2)
+        second.join(2)
+
+        assert [len(w["trigger_history"]["nginx"]) for w in writes] == [1, 2]
+
+    def test_debounced_write_happens_without_flush(
+        self, state_service: AutoActionStateService
+    ):
+        state_service.save_debounce_seconds = 0.01
+        state_service.record_trigger("r1", "Restart", "nginx", "RESTART", "SUCCESS")
+
+        deadline = time.time() + 2
+        while not state_service.state_file.exists() and time.time() < deadline:
+            time.sleep(0.01)
         assert state_service.state_file.exists()
 
     def test_record_trigger_failed_releases_cooldowns(
@@ -637,6 +705,9 @@ class TestStateService:
         svc.base_dir = sandbox_config_dir
         svc.state_file = state_file
         svc._lock = Lock()
+        svc._io_lock = Lock()
+        svc._dirty = False
+        svc._save_timer = None
         svc.global_last_triggered = 0.0
         svc.rule_cooldowns = {}
         svc.container_cooldowns = {}
@@ -993,6 +993,17 @@ class TestServerConfigService:
         assert len(servers) == 1
         assert servers[0]["docker_name"] == "nginx"
 
+    def test_get_all_servers_does_not_share_nested_values(self, tmp_path, temp_config_dir, monkeypatch):
+        self._patch_server_service_paths(monkeypatch, tmp_path)
+        (temp_config_dir / "containers" / "nginx.json").write_text(json.dumps({
+            "container_name": "nginx", "allowed_actions": ["status", "start"],
+        }))
+
+        svc = ServerConfigService()
+        svc.get_all_servers()[0]["allowed_actions"].append("stop")
+
+        assert svc.get_all_servers()[0]["allowed_actions"] == ["status", "start"]
+
     def test_get_ordered_servers(self, tmp_path, temp_config_dir, monkeypatch):
         self._patch_server_service_paths(monkeypatch, tmp_path)
         containers = temp_config_dir / "containers"
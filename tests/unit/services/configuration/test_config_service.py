@@ -331,6 +331,50 @@ class TestConfigServiceCacheInvalidation:
         config2 = service.get_config(force_reload=True)
         assert config2["language"] == "en"
 
+    def test_container_file_edit_invalidates_without_force(self, temp_config_dir):
+        """Edits inside containers/ are detected (they don't touch config/'s mtime)."""
+        service = _redirect_service(get_config_service(), temp_config_dir)
+        assert service.get_config()["servers"] == []
+
+        (temp_config_dir / "containers" / "_placeholder.json").write_text(json.dumps({
+            "container_name": "_placeholder",
+            "active": True,
+        }))
+
+        servers = service.get_config()["servers"]
+        assert [s["container_name"] for s in servers] == ["_placeholder"]
+
+    def test_unrelated_file_keeps_snapshot(self, temp_config_dir):
+        """Runtime state files next to the config don't invalidate it."""
+        service = _redirect_service(get_config_service(), temp_config_dir)
+        snapshot = service.get_config_snapshot()
+
+        (temp_config_dir / "mech_state.json").write_text("{}")
+
+        assert service.get_config_snapshot() is snapshot
+
+    def test_snapshot_is_immutable_and_versioned(self, temp_config_dir):
+        service = _redirect_service(get_config_service(), temp_config_dir)
+        snapshot = service.get_config_snapshot()
+
+        with pytest.raises(TypeError):
+            snapshot.config["language"] = "en"
+        assert isinstance(snapshot["servers"], tuple)
+        assert snapshot.thaw()["language"] == "de"
+        assert set(snapshot) == set(snapshot.config) and len(snapshot) == len(snapshot.config)
+
+        # Same content reloaded -> same version
+        service.get_config(force_reload=True)
+        assert service.get_config_snapshot().version == snapshot.version
+
+        (temp_config_dir / "config.json").write_text(json.dumps({
+            "language": "en",
+            "debug_mode": False,
+        }))
+        updated = service.get_config_snapshot()
+        assert updated["language"] == "en"
+        assert updated.version == snapshot.version + 1
+
     def test_singleton_returns_same_instance(self):
         """get_config_service returns the same singleton instance."""
         service1 = get_config_service()
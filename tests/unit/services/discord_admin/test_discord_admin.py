@@ -43,6 +43,8 @@ from services.discord.channel_cleanup_service import (
     get_channel_cleanup_service,
     reset_channel_cleanup_service,
 )
+from services.discord import channel_cleanup_service as cleanup_module
+from services.discord.sent_message_index import DISCORD_EPOCH_MS, SentMessageIndex
 from services.discord import status_overview_service as sov_module
 from services.discord.status_overview_service import (
     StatusOverviewService,
@@ -126,6 +128,20 @@ def _make_bot(user_id: int = 999):
     return bot
 
 
+@pytest.fixture(autouse=True)
+def _isolated_sent_message_index(tmp_path, monkeypatch):
+    """Keep the cleanup service off the real config/sent_messages.json."""
+    index = SentMessageIndex(tmp_path / "sent_messages.json")
+    monkeypatch.setattr(cleanup_module, "get_sent_message_index", lambda: index)
+    return index
+
+
+def _snowflake(age_seconds: float) -> int:
+    """A message id created ``age_seconds`` ago."""
+    created_ms = int((datetime.now(timezone.utc).timestamp() - age_seconds) * 1000)
+    return (created_ms - DISCORD_EPOCH_MS) << 22
+
+
 # ===========================================================================
 # ChannelCleanupRequest / ChannelCleanupResult dataclass-ish smoke
 # ===========================================================================
@@ -619,6 +635,195 @@ class TestChannelCleanupSingleton:
         assert a is b
 
 
+# ===========================================================================
+# Tracked-message cleanup (SentMessageIndex)
+# ===========================================================================
+class TestTrackedMessageCleanup:
+    @pytest.fixture(autouse=True)
+    def _no_pacing(self, monkeypatch):
+        monkeypatch.setattr(cleanup_module.asyncio, "sleep", AsyncMock())
+
+    def test_record_sent_message_keeps_preserved_apart(self, _isolated_sent_message_index):
+        bot = _make_bot()
+        svc = ChannelCleanupService(bot)
+        ch = _make_channel()
+        plain = _make_message(msg_id=_snowflake(60), author=bot.user, content="hello")
+        plain.channel = ch
+        aas = _make_message(msg_id=_snowflake(30), author=bot.user,
+                            content="⚡ `start` **container** — *RuleName*")
+        aas.channel = ch
+
+        svc.record_sent_message(plain)
+        svc.record_sent_message(aas)
+
+        assert _isolated_sent_message_index.message_ids(ch.id) == [plain.id]
+        assert _isolated_sent_message_index.preserved_count(ch.id) == 1
+
+    def test_index_changes_are_written_behind_in_one_write(self, tmp_path, monkeypatch):
+        index = SentMessageIndex(tmp_path / "sent_messages.json")
+        index.save_debounce_seconds = 60
+        writes = []
+        monkeypatch.setattr(index, "_write", writes.append)
+
+        ids = [_snowflake(60 + i) for i in range(50)]
+        for message_id in ids:
+            index.record(111, message_id)
+        index.forget(111, ids[:1])
+        assert writes == []
+
+        assert index.flush() is True
+        assert len(writes) == 1
+        assert len(writes[0]["channels"]["111"]["ids"]) == 49
+        assert index.flush() is False
+
+    def test_flushed_index_is_reloaded(self, tmp_path):
+        path = tmp_path / "sent_messages.json"
+        index = SentMessageIndex(path)
+        index.record(111, 5)
+        index.record(111, 6, preserved=True)
+        index.mark_complete(111)
+        index.flush()
+
+        reloaded = SentMessageIndex(path)
+        assert reloaded.message_ids(111) == [5]
+        assert reloaded.preserved_count(111) == 1
+        assert reloaded.is_complete(111)
+
+    @pytest.mark.asyncio
+    async def test_first_cleanup_sweeps_history_then_marks_complete(self, _isolated_sent_message_index):
+        bot = _make_bot()
+        old = _make_message(msg_id=_snowflake(3600), author=bot.user, content="legacy")
+        ch = _make_channel(messages=[old])
+        svc = ChannelCleanupService(bot)
+
+        result = await svc.clean_sweep_bot_messages(ch, reason="first")
+
+        assert result.success is True
+        ch.history.assert_called()
+        assert _isolated_sent_message_index.is_complete(ch.id)
+
+    @pytest.mark.asyncio
+    async def test_history_cut_short_by_limit_does_not_mark_complete(self, _isolated_sent_message_index):
+        bot = _make_bot()
+        messages = [_make_message(msg_id=_snowflake(3600 + i), author=bot.user) for i in range(3)]
+        ch = _make_channel(messages=messages)
+        svc = ChannelCleanupService(bot)
+
+        result = await svc.clean_sweep_bot_messages(ch, reason="window", message_limit=3)
+
+        assert result.messages_scanned == 3
+        assert not _isolated_sent_message_index.is_complete(ch.id)
+
+        await svc.clean_sweep_bot_messages(ch, reason="window", message_limit=4)
+        assert _isolated_sent_message_index.is_complete(ch.id)
+
+    @pytest.mark.asyncio
+    async def test_clean_sweep_of_indexed_channel_deletes_preserved_messages(self, _isolated_sent_message_index):
+        bot = _make_bot()
+        ch = _make_channel()
+        plain_id, live_log_id = _snowflake(60), _snowflake(30)
+        _isolated_sent_message_index.record(ch.id, plain_id)
+        _isolated_sent_message_index.record(ch.id, live_log_id, preserved=True)
+        _isolated_sent_message_index.mark_complete(ch.id)
+        svc = ChannelCleanupService(bot)
+
+        result = await svc.clean_sweep_bot_messages(ch, reason="recovery")
+
+        deleted = [obj.id for obj in ch.delete_messages.await_args.args[0]]
+        assert deleted == [live_log_id, plain_id]
+        assert result.messages_preserved == 0
+        assert _isolated_sent_message_index.preserved_count(ch.id) == 0
+
+    @pytest.mark.asyncio
+    async def test_preserving_cleanup_of_indexed_channel_keeps_preserved_messages(self, _isolated_sent_message_index):
+        bot = _make_bot()
+        ch = _make_channel()
+        ch.get_partial_message = MagicMock(return_value=MagicMock(delete=AsyncMock()))
+        plain_id, live_log_id = _snowflake(60), _snowflake(30)
+        _isolated_sent_message_index.record(ch.id, plain_id)
+        _isolated_sent_message_index.record(ch.id, live_log_id, preserved=True)
+        _isolated_sent_message_index.mark_complete(ch.id)
+        svc = ChannelCleanupService(bot)
+
+        result = await svc.delete_bot_messages_preserve_live_logs(ch, reason="refresh")
+
+        ch.get_partial_message.assert_called_once_with(plain_id)
+        assert result.messages_preserved == 1
+        assert _isolated_sent_message_index.preserved_count(ch.id) == 1
+
+    @pytest.mark.asyncio
+    async def test_indexed_channel_bulk_deletes_in_batches_of_100(self, _isolated_sent_message_index):
+        bot = _make_bot()
+        ch = _make_channel()
+        ch.get_partial_message = MagicMock()
+        ids = [_snowflake(3600 + i) for i in range(250)]
+        for message_id in ids:
+            _isolated_sent_message_index.record(ch.id, message_id)
+        _isolated_sent_message_index.mark_complete(ch.id)
+        svc = ChannelCleanupService(bot)
+
+        result = await svc.clean_sweep_bot_messages(ch, reason="tracked")
+
+        assert result.success is True
+        assert result.method_used == "tracked message ids"
+        ch.history.assert_not_called()
+        batch_sizes = [len(call.args[0]) for call in ch.delete_messages.await_args_list]
+        assert batch_sizes == [100, 100, 50]
+        assert result.bulk_deleted == 250
+        assert _isolated_sent_message_index.message_ids(ch.id) == []
+
+    @pytest.mark.asyncio
+    async def test_old_and_missing_messages_are_deleted_individually(self, _isolated_sent_message_index):
+        bot = _make_bot()
+        ch = _make_channel()
+        old_id = _snowflake(20 * 24 * 3600)
+        gone_id = _snowflake(21 * 24 * 3600)
+        partials = {old_id: MagicMock(delete=AsyncMock()),
+                    gone_id: MagicMock(delete=AsyncMock(
+                        side_effect=discord.NotFound(MagicMock(status=404), "Unknown Message")))}
+        ch.get_partial_message = MagicMock(side_effect=lambda mid: partials[mid])
+        for message_id in (old_id, gone_id):
+            _isolated_sent_message_index.record(ch.id, message_id)
+        _isolated_sent_message_index.mark_complete(ch.id)
+        svc = ChannelCleanupService(bot)
+
+        result = await svc.clean_sweep_bot_messages(ch, reason="old")
+
+        ch.delete_messages.assert_not_awaited()
+        assert result.individually_deleted == 1
+        assert result.not_found_errors == 1
+        assert _isolated_sent_message_index.message_ids(ch.id) == []
+
+    @pytest.mark.asyncio
+    async def test_rate_limited_bulk_delete_waits_and_retries(self, _isolated_sent_message_index):
+        bot = _make_bot()
+        ch = _make_channel()
+        rate_limited = discord.HTTPException(MagicMock(status=429), "rate limited")
+        rate_limited.retry_after = 2.5
+        ch.delete_messages = AsyncMock(side_effect=[rate_limited, None])
+        for i in range(3):
+            _isolated_sent_message_index.record(ch.id, _snowflake(60 + i))
+        _isolated_sent_message_index.mark_complete(ch.id)
+        svc = ChannelCleanupService(bot)
+
+        result = await svc.clean_sweep_bot_messages(ch, reason="429")
+
+        assert ch.delete_messages.await_count == 2
+        cleanup_module.asyncio.sleep.assert_any_await(2.5)
+        assert result.bulk_deleted == 3
+
+    @pytest.mark.asyncio
+    async def test_explicit_request_without_index_scans_history(self, _isolated_sent_message_index):
+        bot = _make_bot()
+        ch = _make_channel()
+        _isolated_sent_message_index.mark_complete(ch.id)
+        svc = ChannelCleanupService(bot)
+
+        await svc.cleanup_channel(ChannelCleanupRequest(channel=ch, reason="plain"))
+
+        ch.history.assert_called()
+
+
 # ===========================================================================
 # StatusOverviewService
 # ===========================================================================
@@ -0,0 +1,161 @@
+# -*- coding: utf-8 -*-
+"""
+Unit tests for the concurrent bulk container action engine.
+"""
+
+import asyncio
+import time
+
+import pytest
+
+from services.docker_service.bulk_action_service import (
+    BUSY,
+    CANCELLED,
+    FAILED,
+    SUCCEEDED,
+    TIMEOUT,
+    BulkActionRequest,
+    BulkActionService,
+    build_action_groups,
+)
+
+
+class FakeExecutor:
+    """Records calls and concurrency; per-container delay and result."""
+
+    def __init__(self, delay=0.01, delays=None, failing=()):
+        self.delay = delay
+        self.delays = delays or {}
+        self.failing = set(failing)
+        self.calls = []
+        self.running = 0
+        self.max_running = 0
+
+    async def __call__(self, name, action, timeout):
+        self.calls.append((name, action))
+        self.running += 1
+        self.max_running = max(self.max_running, self.running)
+        try:
+            await asyncio.sleep(self.delays.get(name, self.delay))
+        finally:
+            self.running -= 1
+        if name in self.failing:
+            return False, "boom"
+        return True, None
+
+
+def _request(*groups, action="restart", parallel=4, timeout=5.0):
+    return BulkActionRequest(action=action, groups=tuple(tuple(g) for g in groups),
+                             max_parallel=parallel, timeout_per_container=timeout)
+
+
+class TestBuildGroups:
+    def test_groups_by_bulk_group_and_reverses_for_stop(self):
+        servers = [
+            {"docker_name": "web", "bulk_group": 10},
+            {"docker_name": "db"},
+            {"docker_name": "cache", "bulk_group": "0"},
+            {"docker_name": "worker", "bulk_group": "bad"},
+            {"name": "no-docker-name"},
+            "garbage",
+        ]
+        assert build_action_groups(servers, "restart") == (("db", "cache", "worker"), ("web",))
+        assert build_action_groups(servers, "stop") == (("web",), ("db", "cache", "worker"))
+
+
+class TestBulkActionService:
+    @pytest.mark.asyncio
+    async def test_runs_in_parallel_up_to_limit(self):
+        executor = FakeExecutor(delay=0.05)
+        service = BulkActionService(executor=executor)
+        names = [f"c{i}" for i in range(12)]
+
+        start = time.monotonic()
+        result = await service.run(_request(names, parallel=4))
+        elapsed = time.monotonic() - start
+
+        assert result.succeeded == 12 and result.failed == 0
+        assert executor.max_running == 4
+        assert elapsed < 0.05 * 12 / 2  # well below sequential
+        assert {o.status for o in result.outcomes} == {SUCCEEDED}
+
+    @pytest.mark.asyncio
+    async def test_groups_run_one_after_another(self):
+        executor = FakeExecutor(delays={"db": 0.05})
+        service = BulkActionService(executor=executor)
+
+        await service.run(_request(["db"], ["app1", "app2"], parallel=8))
+
+        assert executor.calls[0] == ("db", "restart")
+        assert {c[0] for c in executor.calls[1:]} == {"app1", "app2"}
+
+    @pytest.mark.asyncio
+    async def test_failures_and_timeouts_are_reported_per_container(self):
+        executor = FakeExecutor(delays={"slow": 1.0}, failing={"bad"})
+        service = BulkActionService(executor=executor)
+
+        result = await service.run(_request(["ok", "bad", "slow"], timeout=0.1))
+
+        status = {o.container_name: o.status for o in result.outcomes}
+        assert status == {"ok": SUCCEEDED, "bad": FAILED, "slow": TIMEOUT}
+        assert result.failed == 2
+        assert next(o for o in result.outcomes if o.container_name == "bad").error_message == "boom"
+
+    @pytest.mark.asyncio
+    async def test_cancel_skips_pending_containers_and_later_groups(self):
+        executor = FakeExecutor(delay=0.05)
+        service = BulkActionService(executor=executor)
+        progress = []
+
+        async def _on_progress(p):
+            progress.append(p)
+            if p.done == 1:
+                service.cancel(p.operation_id)
+
+        result = await service.run(_request([f"a{i}" for i in range(6)], ["b1", "b2"], parallel=2),
+                                   progress_callback=_on_progress)
+
+        assert result.cancelled is True
+        # Actions already running when cancel hit complete, nothing new starts
+        started = len(executor.calls)
+        assert started < 6
+        assert result.succeeded == started
+        assert sum(1 for o in result.outcomes if o.status == CANCELLED) == 8 - started
+        assert all(name.startswith("a") for name, _ in executor.calls)
+        assert progress[-1].finished is True and progress[-1].cancelled is True
+
+    @pytest.mark.asyncio
+    async def test_overlapping_operations_skip_busy_containers(self):
+        executor = FakeExecutor(delay=0.05)
+        service = BulkActionService(executor=executor)
+
+        first = service.start(_request(["a", "b"]))
+        assert service.is_busy("a")
+        second = service.start(_request(["b", "c"], action="stop"))
+        first_result, second_result = await asyncio.gather(first.wait(), second.wait())
+
+        assert first_result.succeeded == 2
+        assert {o.container_name: o.status for o in second_result.outcomes} == {"b": BUSY, "c": SUCCEEDED}
+        assert not service.is_busy("a") and service.active_operations == []
+
+    @pytest.mark.asyncio
+    async def test_progress_reports_every_container(self):
+        service = BulkActionService(executor=FakeExecutor(failing={"x"}))
+        progress = []
+
+        async def _on_progress(p):
+            progress.append(p)
+
+        await service.run(_request(["x", "y"], ["z"]), progress_callback=_on_progress)
+
+        assert [p.done for p in progress] == [1, 2, 3, 3]
+        assert progress[-1].finished and progress[-1].succeeded == 2 and progress[-1].failed == 1
+        assert progress[2].current_group == 2 and progress[2].group_count == 2
+
+    @pytest.mark.asyncio
+    async def test_invalid_requests_are_rejected(self):
+        service = BulkActionService(executor=FakeExecutor())
+        with pytest.raises(ValueError):
+            service.start(_request(["a"], action="delete"))
+        with pytest.raises(ValueError):
+            service.start(_request(["a"], parallel=0))
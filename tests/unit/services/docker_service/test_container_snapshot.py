@@ -0,0 +1,133 @@
+# -*- coding: utf-8 -*-
+"""
+Unit tests for the container snapshot shared by the bot and the Web UI.
+"""
+
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from unittest.mock import MagicMock
+
+import docker.errors
+import pytest
+
+from services.docker_service.container_snapshot import (
+    ContainerSnapshotProvider,
+    normalize_container_list,
+)
+from services.docker_service.status_cache_runtime import DockerStatusCacheRuntime
+from services.infrastructure.container_status_service import ContainerStatusResult
+
+
+def _entry(name, status="running"):
+    return {"id": name[:12], "name": name, "status": status,
+            "running": status == "running", "image": "img"}
+
+
+@pytest.fixture
+def runtime():
+    return DockerStatusCacheRuntime()
+
+
+@pytest.fixture
+def fetcher():
+    return MagicMock(return_value=[_entry("alpha"), _entry("beta", "exited")])
+
+
+@pytest.fixture
+def provider(fetcher, runtime):
+    return ContainerSnapshotProvider(fetcher=fetcher, status_runtime=runtime)
+
+
+class TestNormalize:
+    def test_running_string_state_and_digest(self):
+        result = normalize_container_list([
+            {"Id": "0123456789abcdef", "Names": ["/Web"], "State": "running",
+             "Image": "nginx:1@sha256:abc", "Created": 1700000000, "Ports": [{"PrivatePort": 80}]},
+            {"Id": "fedcba9876543210", "Names": ["/app"], "State": "exited", "Image": "alpine"},
+        ])
+        assert [c["name"] for c in result] == ["app", "Web"]
+        web = result[1]
+        assert web["running"] is True and web["status"] == "running"
+        assert web["image"] == "nginx:1" and web["ports"] == [{"PrivatePort": 80}]
+        assert result[0]["created"] == "N/A"
+
+    def test_malformed_entry_is_marked(self):
+        result = normalize_container_list([{"Id": "x", "Names": ["/bad"], "State": {"Status": "running"}}])
+        assert result[0]["status"] == "error_processing"
+
+
+class TestProvider:
+    def test_fresh_snapshot_is_reused(self, provider, fetcher):
+        first = provider.get(max_age=30)
+        second = provider.get(max_age=30)
+        assert fetcher.call_count == 1
+        assert second.containers == first.containers
+
+    def test_published_snapshot_avoids_daemon_query(self, provider, fetcher):
+        provider.publish([_entry("gamma")], source="bot")
+        snapshot = provider.get(max_age=30)
+        fetcher.assert_not_called()
+        assert snapshot.source == "bot"
+        assert [c["name"] for c in snapshot.containers] == ["gamma"]
+
+    def test_stale_snapshot_is_refreshed(self, provider, fetcher):
+        provider.publish([_entry("old")], timestamp=time.time() - 120)
+        snapshot = provider.get(max_age=30)
+        assert fetcher.call_count == 1
+        assert snapshot.source == "daemon"
+
+    def test_older_publication_does_not_replace_newer(self, provider):
+        provider.publish([_entry("new")])
+        provider.publish([_entry("late")], timestamp=time.time() - 60)
+        assert [c["name"] for c in provider.current().containers] == ["new"]
+
+    def test_fetch_errors_propagate_and_keep_previous(self, runtime):
+        provider = ContainerSnapshotProvider(
+            fetcher=MagicMock(side_effect=docker.errors.DockerException("down")),
+            status_runtime=runtime,
+        )
+        provider.publish([_entry("kept")], timestamp=time.time() - 120)
+        with pytest.raises(docker.errors.DockerException):
+            provider.get(max_age=30)
+        assert [c["name"] for c in provider.current().containers] == ["kept"]
+
+    def test_concurrent_refreshes_query_daemon_once(self, runtime):
+        calls = []
+
+        def _slow_fetch():
+            calls.append(1)
+            time.sleep(0.05)
+            return [_entry("alpha")]
+
+        provider = ContainerSnapshotProvider(fetcher=_slow_fetch, status_runtime=runtime)
+        threads = [threading.Thread(target=provider.get, kwargs={"max_age": 30}) for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert len(calls) == 1
+        assert provider.get_stats()["daemon_queries"] == 1
+
+
+class TestStatusReconciliation:
+    def test_newer_bot_status_overrides_list_state(self, provider, runtime):
+        provider.publish([_entry("alpha"), _entry("beta", "exited")], timestamp=time.time() - 10)
+        now = datetime.now(timezone.utc)
+        runtime.publish({
+            "alpha": {"data": ("Alpha", False, "0", "0", "", True), "timestamp": now},
+            "beta": {"data": ContainerStatusResult(success=True, container_name="beta", is_running=True),
+                     "timestamp": now},
+        })
+        states = {c["name"]: (c["status"], c["running"]) for c in provider.current().containers}
+        assert states == {"alpha": ("exited", False), "beta": ("running", True)}
+
+    def test_older_bot_status_is_ignored(self, provider, runtime):
+        provider.publish([_entry("alpha")])
+        runtime.publish({"alpha": {"data": ("Alpha", False), "timestamp": datetime.now(timezone.utc) - timedelta(minutes=5)}})
+        assert provider.current().containers[0]["status"] == "running"
+
+    def test_error_entries_are_ignored(self, provider, runtime):
+        provider.publish([_entry("alpha")], timestamp=time.time() - 10)
+        runtime.publish({"alpha": {"data": None, "timestamp": datetime.now(timezone.utc), "error": "boom"}})
+        assert provider.current().containers[0]["status"] == "running"
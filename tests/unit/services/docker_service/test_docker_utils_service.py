@@ -32,6 +32,7 @@ from unittest.mock import AsyncMock, MagicMock, patch
 import pytest
 
 from services.docker_service import docker_utils
+from services.docker_service.container_snapshot import reset_container_snapshot_provider
 from services.docker_service.docker_action_service import (
     DockerActionRequest,
     DockerActionResult,
@@ -89,6 +90,7 @@ def _clear_module_globals():
     docker_utils._cache_timestamp = 0
     docker_utils._custom_timeout_config = None
     docker_utils._custom_config_loaded = False
+    reset_container_snapshot_provider()
     yield
 
 
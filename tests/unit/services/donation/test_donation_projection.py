@@ -0,0 +1,170 @@
+# -*- coding: utf-8 -*-
+# ============================================================================ #
+# DockerDiscordControl (DDC) - Donation Projection Tests                      #
+# https://ddc.bot                                                              #
+# Copyright (c) 2026 MAX                                                       #
+# Licensed under the MIT License                                               #
+# ============================================================================ #
+"""
+Unit tests for ``services.donation.donation_projection``.
+
+The projection tails the mech event log by byte offset; these tests append
+to a real JSONL file under ``tmp_path`` and check that only new bytes are
+consumed, that resets are detected and that checkpoints are resumed.
+"""
+
+import json
+from unittest.mock import patch
+
+import pytest
+
+from services.donation.donation_projection import (
+    CHECKPOINT_FILENAME,
+    DonationProjection,
+)
+
+
+def _donation(seq, donor, units, ts="2025-01-01T10:00:00Z"):
+    return {"seq": seq, "type": "DonationAdded", "ts": ts,
+            "payload": {"donor": donor, "units": units}}
+
+
+def _deletion(seq, deleted_seq, ts="2025-01-02T10:00:00Z"):
+    return {"seq": seq, "type": "DonationDeleted", "ts": ts,
+            "payload": {"deleted_seq": deleted_seq, "donor": "x", "units": 0}}
+
+
+def _append(path, *events):
+    with open(path, "a", encoding="utf-8") as fh:
+        for event in events:
+            fh.write(json.dumps(event) + "\n")
+
+
+@pytest.fixture
+def event_log(tmp_path):
+    path = tmp_path / "events.jsonl"
+    path.touch()
+    return path
+
+
+class TestIncrementalUpdates:
+    def test_appended_events_are_applied_without_rereading(self, event_log):
+        projection = DonationProjection(event_log)
+        _append(event_log, _donation(1, "Alice", 5000))
+        projection.refresh()
+        assert projection.summary()["total_power"] == pytest.approx(50.0)
+
+        _append(event_log, _donation(2, "Bob", 2500), {"seq": 3, "type": "PowerDecayed", "payload": {}})
+        with patch("services.donation.donation_projection.json.loads", wraps=json.loads) as loads:
+            projection.refresh()
+        # Only the two new lines are parsed
+        assert loads.call_count == 2
+        assert projection.summary() == {"total_power": 75.0, "active_count": 2, "entry_count": 2}
+
+    def test_corrupt_line_raises_and_rebuilds_next_time(self, event_log):
+        projection = DonationProjection(event_log)
+        _append(event_log, _donation(1, "Alice", 100))
+        with open(event_log, "a", encoding="utf-8") as fh:
+            fh.write("{not-json\n")
+        with pytest.raises(json.JSONDecodeError):
+            projection.refresh()
+
+        event_log.write_text(json.dumps(_donation(1, "Alice", 100)) + "\n", encoding="utf-8")
+        projection.refresh()
+        assert projection.summary()["entry_count"] == 1
+
+    def test_partially_written_line_waits_for_next_refresh(self, event_log):
+        projection = DonationProjection(event_log)
+        line = json.dumps(_donation(2, "Bob", 2500))
+        _append(event_log, _donation(1, "Alice", 5000))
+        with open(event_log, "a", encoding="utf-8") as fh:
+            fh.write(line[:20])
+        projection.refresh()
+        assert projection.summary()["entry_count"] == 1
+
+        with open(event_log, "a", encoding="utf-8") as fh:
+            fh.write(line[20:] + "\n")
+        projection.refresh()
+        assert projection.summary() == {"total_power": 75.0, "active_count": 2, "entry_count": 2}
+
+    def test_deletion_toggle_updates_aggregates(self, event_log):
+        projection = DonationProjection(event_log)
+        _append(event_log, _donation(1, "Alice", 5000), _deletion(2, 1))
+        projection.refresh()
+        assert projection.summary()["active_count"] == 0
+        assert projection.donor_totals() == {}
+
+        _append(event_log, _deletion(3, 1))
+        projection.refresh()
+        assert projection.donor_totals() == {"Alice": {"total_power": 50.0, "count": 1}}
+
+    def test_reset_log_triggers_rebuild(self, event_log):
+        projection = DonationProjection(event_log)
+        _append(event_log, _donation(1, "Alice", 5000), _donation(2, "Bob", 5000))
+        projection.refresh()
+
+        # Donation reset truncates the log, then new events arrive
+        event_log.write_text("", encoding="utf-8")
+        _append(event_log, _donation(1, "Carol", 100), _donation(2, "Dave", 100), _donation(3, "Eve", 100))
+        projection.refresh()
+
+        rows, total = projection.query()
+        assert total == 3
+        assert [r["donor_name"] for r in rows] == ["Eve", "Dave", "Carol"]
+
+
+class TestQueries:
+    def test_pagination_keeps_deletions_next_to_their_donation(self, event_log):
+        projection = DonationProjection(event_log)
+        _append(event_log, *[_donation(i, f"User{i}", 100) for i in range(1, 6)], _deletion(6, 4))
+        projection.refresh()
+
+        rows, total = projection.query(offset=1, limit=3)
+        assert total == 6
+        assert [(r["seq"], r.get("is_deletion", False)) for r in rows] == [
+            (4, False), (6, True), (3, False)
+        ]
+
+    def test_filters_and_buckets(self, event_log):
+        projection = DonationProjection(event_log)
+        _append(
+            event_log,
+            _donation(1, "Alice", 1000, ts="2025-01-05T10:00:00Z"),
+            _donation(2, "Bob", 2000, ts="2025-02-01T10:00:00Z"),
+            _donation(3, "Alice", 3000, ts="2025-02-03T10:00:00Z"),
+        )
+        projection.refresh()
+
+        rows, total = projection.query(donor="Alice", since="2025-02-01")
+        assert total == 1 and rows[0]["seq"] == 3
+        assert projection.buckets("month") == {
+            "2025-01": {"total_power": 10.0, "count": 1},
+            "2025-02": {"total_power": 50.0, "count": 2},
+        }
+        with pytest.raises(ValueError):
+            projection.buckets("year")
+
+
+class TestCheckpoint:
+    def test_checkpoint_is_resumed_by_a_new_instance(self, event_log):
+        _append(event_log, _donation(1, "Alice", 5000), _deletion(2, 1))
+        DonationProjection(event_log).refresh()
+        assert (event_log.parent / CHECKPOINT_FILENAME).exists()
+
+        _append(event_log, _donation(3, "Bob", 1000))
+        resumed = DonationProjection(event_log)
+        with patch("services.donation.donation_projection.json.loads", wraps=json.loads) as loads:
+            resumed.refresh()
+        assert loads.call_count == 1
+        rows, total = resumed.query()
+        assert total == 3
+        assert resumed.summary() == {"total_power": 10.0, "active_count": 1, "entry_count": 2}
+
+    def test_stale_checkpoint_is_ignored(self, event_log):
+        _append(event_log, _donation(1, "Alice", 5000))
+        DonationProjection(event_log).refresh()
+
+        event_log.write_text(json.dumps(_donation(1, "Zed", 700)) + "\n", encoding="utf-8")
+        projection = DonationProjection(event_log)
+        projection.refresh()
+        assert projection.query()[0][0]["donor_name"] == "Zed"
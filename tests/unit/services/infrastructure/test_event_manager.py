@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Unit tests for the asynchronous EventManager bus.
+
+emit_event only queues; every listener has its own bounded queue and worker,
+so a slow or failing listener neither blocks the emitter nor the others.
+"""
+import asyncio
+import threading
+import time
+
+import pytest
+
+from services.infrastructure.event_manager import EventManager
+
+
+@pytest.fixture
+def manager():
+    mgr = EventManager(queue_size=4, max_history=5)
+    yield mgr
+    mgr.shutdown()
+
+
+class TestDispatch:
+    def test_emit_does_not_wait_for_slow_listener(self, manager):
+        release = threading.Event()
+        seen = []
+        manager.register_listener('donation_completed', lambda e: (release.wait(2), seen.append(e)))
+
+        started = time.monotonic()
+        manager.emit_event('donation_completed', 'test', {'amount': 5})
+        assert time.monotonic() - started < 0.5
+        assert seen == []
+
+        release.set()
+        assert manager.wait_until_idle(timeout=2)
+        assert seen[0].data == {'amount': 5}
+
+    def test_failing_listener_is_isolated(self, manager):
+        seen = []
+
+        def broken(event):
+            raise ValueError("boom")
+
+        manager.register_listener('mech_state_changed', broken)
+        manager.register_listener('mech_state_changed', seen.append)
+
+        manager.emit_event('mech_state_changed', 'test')
+        manager.emit_event('mech_state_changed', 'test')
+        assert manager.wait_until_idle(timeout=2)
+
+        assert len(seen) == 2
+        metrics = manager.get_dispatch_metrics()['mech_state_changed']
+        assert (metrics['emitted'], metrics['delivered'], metrics['failed']) == (2, 2, 2)
+        assert metrics['latency_max_ms'] >= metrics['latency_avg_ms'] >= 0
+
+    def test_per_listener_order_is_kept(self, manager):
+        seen = []
+        manager.register_listener('tick', lambda e: seen.append(e.data['n']))
+
+        for n in range(4):
+            manager.emit_event('tick', 'test', {'n': n})
+        assert manager.wait_until_idle(timeout=2)
+
+        assert seen == [0, 1, 2, 3]
+
+    def test_full_queue_drops_and_counts(self, manager):
+        release = threading.Event()
+        manager.register_listener('tick', lambda e: release.wait(2))
+
+        for _ in range(10):  # 1 in flight + 4 queued, the rest is dropped
+            manager.emit_event('tick', 'test')
+        release.set()
+        assert manager.wait_until_idle(timeout=2)
+
+        metrics = manager.get_dispatch_metrics()['tick']
+        assert metrics['dropped'] >= 5
+        assert metrics['delivered'] + metrics['dropped'] == 10
+
+    def test_coroutine_listener_without_loop(self, manager):
+        seen = []
+
+        async def listener(event):
+            await asyncio.sleep(0)
+            seen.append(event.event_type)
+
+        manager.register_listener('tick', listener)
+        manager.emit_event('tick', 'test')
+        assert manager.wait_until_idle(timeout=2)
+
+        assert seen == ['tick']
+
+    @pytest.mark.asyncio
+    async def test_coroutine_listener_runs_on_registering_loop(self, manager):
+        loop = asyncio.get_running_loop()
+        ran_on = []
+
+        async def listener(event):
+            ran_on.append(asyncio.get_running_loop())
+
+        manager.register_listener('tick', listener)
+        manager.emit_event('tick', 'test')
+        # The loop must keep running while the worker waits for it
+        for _ in range(200):
+            if ran_on:
+                break
+            await asyncio.sleep(0.01)
+
+        assert ran_on == [loop]
+
+    def test_unregister_listener(self, manager):
+        seen = []
+        manager.register_listener('tick', seen.append)
+        assert manager.unregister_listener('tick', seen.append) is True
+
+        manager.emit_event('tick', 'test')
+        assert manager.wait_until_idle(timeout=2)
+
+        assert seen == []
+
+
+class TestHistory:
+    def test_history_is_bounded(self, manager):
+        for n in range(8):
+            manager.emit_event(f'event_{n}', 'test')
+
+        stats = manager.get_event_stats()
+        assert stats['event_history_count'] == 5
+        assert [e['type'] for e in stats['recent_events']] == [f'event_{n}' for n in range(3, 8)]
+        assert stats['dispatch']['event_7']['emitted'] == 1
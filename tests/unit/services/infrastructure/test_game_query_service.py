@@ -9,6 +9,7 @@ module into sys.modules. The Docker client is mocked for port autodiscovery.
 """
 import asyncio
 import sys
+import time
 import types
 
 import pytest
@@ -182,6 +183,130 @@ class TestBulk:
         assert out["x"].success is False and out["x"].error_type == 'unreachable'
 
 
+# ---------------------------------------------------------------------------
+# staggered port racing + winning-port memoization + adaptive TTL
+# ---------------------------------------------------------------------------
+
+def _multi(name="icarus", port=17777, candidates=(27015, 27016), timeout=1.0):
+    return GameQueryRequest(container_name=name, protocol="source", host="h", port=port,
+                            candidate_ports=candidates, timeout_seconds=timeout)
+
+
+class TestPortRace:
+    async def test_silent_primary_costs_stagger_not_timeout(self):
+        svc = GameQueryService()
+
+        async def _proto(protocol, host, port, timeout, token=''):
+            if port == 17777:
+                await asyncio.sleep(10)  # dead UDP port: no answer at all
+            return (2, 8)
+
+        svc._query_protocol = _proto
+        start = time.monotonic()
+        r = await svc.get_game_query(_multi(timeout=2.0))
+        assert r.success and r.port == 27015
+        assert time.monotonic() - start < 1.0  # one stagger, not the 2s timeout
+
+    async def test_all_ports_failing_returns_primary_failure(self):
+        svc = GameQueryService()
+        svc._query_protocol = AsyncMock(side_effect=ConnectionError("nope"))
+        r = await svc.get_game_query(_multi())
+        assert r.success is False and r.error_type == 'unreachable'
+        assert svc._query_protocol.await_count == 3
+
+    async def test_winning_port_is_queried_alone_next_time(self):
+        svc = GameQueryService(cache_ttl_seconds=0.0)
+        tried = []
+
+        async def _proto(protocol, host, port, timeout, token=''):
+            tried.append(port)
+            if port != 27016:
+                raise ConnectionError("no")
+            return (1, 4)
+
+        svc._query_protocol = _proto
+        await svc.get_game_query(_multi())
+        tried.clear()
+        r = await svc.get_game_query(_multi())
+        assert r.success and tried == [27016]
+
+    async def test_failed_winning_port_is_forgotten(self):
+        svc = GameQueryService(cache_ttl_seconds=0.0)
+        svc._winning_ports[("icarus", "source")] = 27016
+        svc._query_protocol = AsyncMock(side_effect=ConnectionError("restarted"))
+        await svc.get_game_query(_multi())
+        assert ("icarus", "source") not in svc._winning_ports
+
+    async def test_probes_always_race(self):
+        svc = GameQueryService()
+        svc._query_protocol = AsyncMock(return_value=(1, 4))
+        await svc._fetch(_multi(name="__probe__:icarus"))
+        assert svc._winning_ports == {}
+
+    async def test_bulk_of_30_dead_primaries_fits_one_timeout_window(self):
+        svc = GameQueryService()
+
+        async def _proto(protocol, host, port, timeout, token=''):
+            if port == 17777:
+                await asyncio.sleep(10)
+            await asyncio.sleep(0.05)
+            return (3, 10)
+
+        svc._query_protocol = _proto
+        reqs = [_multi(name=f"g{i}", timeout=1.0) for i in range(30)]
+        start = time.monotonic()
+        out = await svc.get_bulk_game_queries(reqs)
+        assert all(r.success for r in out.values())
+        assert time.monotonic() - start < 1.0
+
+
+class TestAdaptiveTtl:
+    async def test_stable_player_count_stretches_ttl_and_change_resets(self):
+        svc = GameQueryService(cache_ttl_seconds=10.0)
+        counts = iter([(3, 10), (3, 10), (3, 10), (4, 10)])
+        svc._query_protocol = AsyncMock(side_effect=lambda *a, **k: next(counts))
+
+        for expected_ttl in (10.0, 20.0, 40.0, 10.0):
+            await svc.get_game_query(_req())
+            assert svc.effective_ttl("valheim") == expected_ttl
+            # age the entry so the next call queries again
+            ts, result = svc._cache["valheim"]
+            svc._cache["valheim"] = (ts - 1000, result)
+
+    def test_ttl_is_capped(self):
+        svc = GameQueryService(cache_ttl_seconds=10.0)
+        svc._stable_streak["x"] = 20
+        assert svc.effective_ttl("x") == 60.0
+
+
+class TestTargetMemo:
+    async def test_resolved_target_is_reused_until_forgotten(self):
+        svc = GameQueryService()
+        c = MagicMock()
+        c.attrs = {"NetworkSettings": {"IPAddress": "172.17.0.5",
+                                       "Ports": {"2457/udp": [{"HostPort": "2457"}]}}}
+        client = MagicMock()
+        client.containers.get.return_value = c
+
+        class _CM:
+            async def __aenter__(self):
+                return client
+
+            async def __aexit__(self, *a):
+                return False
+
+        with patch('services.docker_service.docker_client_pool.get_docker_client_async',
+                   side_effect=lambda **k: _CM()):
+            first = await svc.resolve_query_candidates("v")
+            second = await svc.resolve_query_candidates("v")
+            assert first == second == ("172.17.0.5", [2457])
+            assert client.containers.get.call_count == 1
+
+            svc.forget_container("v")
+            await svc.resolve_query_candidates("v")
+            assert client.containers.get.call_count == 2
+
+
 # ---------------------------------------------------------------------------
 # protocol dispatch (lazy opengsq import) via injected fake module
 # ---------------------------------------------------------------------------
@@ -466,8 +591,11 @@ class TestResolveTarget:
         client.containers.get.return_value = c
 
         class _CM:
-            async def __aenter__(self): return client
-            async def __aexit__(self, *a): return False
+            async def __aenter__(self):
+                return client
+
+            async def __aexit__(self, *a):
+                return False
 
         with patch('services.docker_service.docker_client_pool.get_docker_client_async', return_value=_CM()):
             host, port = await svc.resolve_query_target("v", "", 0)
@@ -0,0 +1,114 @@
+# -*- coding: utf-8 -*-
+"""
+Unit tests for the tracemalloc memory profiler service.
+"""
+
+import json
+import tracemalloc
+
+import pytest
+
+from services.infrastructure import memory_profiler_service as profiler_module
+from services.infrastructure.memory_profiler_service import (
+    MemoryProfilerService,
+    module_for_filename,
+)
+
+_retained = []
+
+
+def _allocate(kib):
+    _retained.extend(bytearray(1024) for _ in range(kib))
+
+
+@pytest.fixture
+def profiler():
+    if tracemalloc.is_tracing():
+        pytest.skip("tracemalloc already running in this process")
+    service = MemoryProfilerService()
+    yield service
+    service.stop()
+    _retained.clear()
+
+
+def test_module_for_filename_maps_source_files_to_modules():
+    import services.infrastructure.event_manager as event_manager
+    import services.infrastructure as package
+
+    assert module_for_filename(event_manager.__file__) == "services.infrastructure.event_manager"
+    assert module_for_filename(package.__file__) == "services.infrastructure"
+    assert module_for_filename("<frozen posixpath>") == "<frozen posixpath>"
+
+
+def test_report_without_tracing_is_minimal():
+    report = MemoryProfilerService().get_report()
+    assert report["tracing"] is False
+    assert "top" not in report
+
+
+def test_diff_attributes_growth_to_allocating_module(profiler):
+    assert profiler.start() is True
+    _allocate(256)
+
+    diffs = profiler.diff(top=3)
+
+    assert diffs[0].name == module_for_filename(__file__)
+    assert diffs[0].size_diff >= 256 * 1024
+    assert diffs[0].count_diff >= 256
+
+
+def test_group_by_package(profiler):
+    profiler.start()
+    _allocate(64)
+
+    package = module_for_filename(__file__).split(".", 1)[0]
+    assert profiler.diff(top=1, group_by="package")[0].name == package
+    with pytest.raises(ValueError):
+        profiler.diff(group_by="line")
+
+
+def test_diff_since_labelled_snapshot_excludes_earlier_growth(profiler):
+    profiler.start()
+    _allocate(256)
+    profiler.take_snapshot("after-first")
+    _allocate(16)
+
+    growth = {d.name: d.size_diff for d in profiler.diff(since="after-first")}
+    assert 16 * 1024 <= growth[module_for_filename(__file__)] < 256 * 1024
+
+    with pytest.raises(KeyError):
+        profiler.diff(since="missing")
+
+
+def test_snapshots_are_bounded(profiler):
+    profiler.start()
+    for i in range(profiler_module.MAX_SNAPSHOTS + 3):
+        profiler.take_snapshot(f"s{i}")
+
+    labels = [s["label"] for s in profiler.get_report()["snapshots"]]
+    assert len(labels) == profiler_module.MAX_SNAPSHOTS
+    assert labels[-1] == f"s{profiler_module.MAX_SNAPSHOTS + 2}"
+
+
+def test_report_and_stop(profiler):
+    profiler.start()
+    _allocate(32)
+
+    report = profiler.get_report(top=2)
+    assert report["tracing"] is True
+    assert report["since"]["label"] == "baseline"
+    assert report["total_size_diff"] >= 32 * 1024
+    assert len(report["top"]) == 2
+    json.dumps(report)
+
+    profiler.stop()
+    assert not tracemalloc.is_tracing()
+    with pytest.raises(RuntimeError):
+        profiler.take_snapshot()
+
+
+def test_enabled_only_with_env_flag(monkeypatch):
+    monkeypatch.delenv(profiler_module.ENV_FLAG, raising=False)
+    assert profiler_module.is_enabled() is False
+    monkeypatch.setenv(profiler_module.ENV_FLAG, "1")
+    assert profiler_module.is_enabled() is True
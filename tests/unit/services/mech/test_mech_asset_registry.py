@@ -0,0 +1,96 @@
+# -*- coding: utf-8 -*-
+# ============================================================================ #
+# DockerDiscordControl (DDC) - Unit Tests for MechAssetRegistry               #
+# https://ddc.bot                                                              #
+# Copyright (c) 2025 MAX                                                       #
+# Licensed under the MIT License                                               #
+# ============================================================================ #
+
+"""Unit tests for the content-addressed mech asset registry."""
+
+from __future__ import annotations
+
+import os
+from unittest.mock import patch
+
+import pytest
+
+from services.mech.mech_asset_registry import MechAssetRegistry, compute_etag
+from services.mech.mech_display_cache_service import (
+    MechDisplayCacheService,
+    MechDisplayImageRequest,
+)
+
+
+@pytest.fixture
+def registry():
+    return MechAssetRegistry(max_bytes=1024)
+
+
+class TestFileAssets:
+    def test_etag_is_content_hash(self, registry, tmp_path):
+        path = tmp_path / "mech_1_shadow.webp"
+        path.write_bytes(b"shadow")
+        asset = registry.get_file(path)
+        assert asset.data == b"shadow"
+        assert asset.etag == compute_etag(b"shadow")
+
+    def test_unchanged_file_is_not_reread(self, registry, tmp_path):
+        path = tmp_path / "mech_1_shadow.webp"
+        path.write_bytes(b"shadow")
+        first = registry.get_file(path)
+        with patch("builtins.open", side_effect=AssertionError("file re-read")):
+            assert registry.get_file(path) is first
+
+    def test_rewritten_file_gets_new_etag(self, registry, tmp_path):
+        path = tmp_path / "mech_1_unlocked.webp"
+        path.write_bytes(b"old render")
+        old = registry.get_file(path)
+        path.write_bytes(b"new render!")
+        st = path.stat()
+        os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+        new = registry.get_file(path)
+        assert new.data == b"new render!"
+        assert new.etag != old.etag
+
+    def test_missing_file_raises(self, registry, tmp_path):
+        with pytest.raises(OSError):
+            registry.get_file(tmp_path / "missing.webp")
+
+
+class TestGeneratedAssets:
+    def test_same_object_is_not_rehashed(self, registry):
+        data = b"animation" * 10
+        first = registry.register_bytes("live_animation/small", data)
+        with patch("services.mech.mech_asset_registry.compute_etag", side_effect=AssertionError("rehashed")):
+            assert registry.register_bytes("live_animation/small", data) is first
+
+    def test_equal_content_keeps_etag(self, registry):
+        a = registry.register_bytes("k", bytes(b"abc" * 10))
+        b = registry.register_bytes("k", bytes(b"abc" * 10))
+        assert a.etag == b.etag
+
+    def test_lru_eviction_bounds_memory(self, registry):
+        for i in range(5):
+            registry.register_bytes(f"k{i}", bytes([i]) * 400)
+        stats = registry.get_stats()
+        assert stats["total_bytes"] <= 1024
+        assert stats["assets"] == 2
+
+    def test_invalidate_and_clear(self, registry):
+        registry.register_bytes("a", b"x" * 10)
+        registry.register_bytes("b", b"y" * 10)
+        registry.invalidate("a")
+        assert registry.get_stats() == {"assets": 1, "total_bytes": 10, "max_bytes": 1024}
+        registry.clear()
+        assert registry.get_stats()["assets"] == 0
+
+
+class TestDisplayCacheIntegration:
+    def test_display_image_result_carries_etag(self, tmp_path):
+        svc = MechDisplayCacheService()
+        svc.cache_dir = tmp_path
+        (tmp_path / "mech_3_shadow.webp").write_bytes(b"shadow-3")
+        result = svc.get_mech_display_image(MechDisplayImageRequest(evolution_level=3, image_type="shadow"))
+        assert result.success is True
+        assert result.etag == compute_etag(b"shadow-3")
@@ -472,14 +472,24 @@ class TestMechDataStorePipeline:
 #                    mech_status_cache_service tests
 # ===========================================================================
 class TestMechStatusCacheService:
-    """Cache get/set/invalidate, mtime/TTL based expiry, fallback flows."""
+    """Single cached state, event invalidation, analytic decay, fallback flows."""
 
     @pytest.fixture
     def service(self):
         # Patch the event-manager so __init__ does not touch the production
         # singleton.
         with patch.object(MechStatusCacheService, "_setup_event_listeners"):
-            yield MechStatusCacheService()
+            svc = MechStatusCacheService()
+        # No decay anchor unless a test provides one
+        svc._fetch_decay_anchor = MagicMock(return_value=None)
+        yield svc
+
+    @staticmethod
+    def _anchor(power_cents, hours_ago, per_day_cents):
+        from services.mech.progress_service import DecayAnchor
+        return DecayAnchor(power_acc=power_cents,
+                           started_ts=time.time() - hours_ago * 3600,
+                           decay_per_day=per_day_cents)
 
     def test_init_calls_event_listener_setup(self):
         with patch.object(MechStatusCacheService, "_setup_event_listeners") as m:
@@ -492,62 +502,36 @@ class TestMechStatusCacheService:
             b = get_mech_status_cache_service()
         assert a is b
 
-    def test_store_and_retrieve_from_cache(self, service):
-        result = MechStatusCacheResult(success=True, level=5, power=12.5)
-        service._store_in_cache(result, include_decimals=False)
-
-        cached = service._get_from_cache(False)
-        assert cached is not None
-        assert cached.level == 5
-        assert cached.cache_age_seconds >= 0
-
-    def test_cache_get_misses_when_empty(self, service):
-        assert service._get_from_cache(False) is None
-
-    def test_cache_expires_after_ttl(self, service):
-        service._cache_ttl = 0.01
-        service._store_in_cache(
-            MechStatusCacheResult(success=True), include_decimals=False)
-        time.sleep(0.05)
-        assert service._get_from_cache(False) is None
-
-    def test_clear_cache_empties_storage(self, service):
-        service._store_in_cache(MechStatusCacheResult(success=True), False)
-        service._store_in_cache(MechStatusCacheResult(success=True), True)
-        assert len(service._cache) == 2
-        service.clear_cache()
-        assert service._cache == {}
-
-    def test_get_cached_status_cache_hit(self, service):
-        result = MechStatusCacheResult(success=True, level=7)
-        service._store_in_cache(result, include_decimals=False)
-
-        out = service.get_cached_status(MechStatusCacheRequest(
-            include_decimals=False, force_refresh=False))
-        assert out.level == 7
-        assert out.success is True
-
-    def test_get_cached_status_cache_miss_calls_fetch(self, service):
+    def test_cache_miss_fetches_once_and_reuses_state(self, service):
         fresh = MechStatusCacheResult(success=True, level=9, power=33.0)
         with patch.object(service, "_fetch_fresh_status",
                           return_value=fresh) as fetch:
-            out = service.get_cached_status(MechStatusCacheRequest(
-                include_decimals=False, force_refresh=False))
-
-        fetch.assert_called_once_with(False)
-        assert out.level == 9
-        # And it has been stored.
-        assert service._get_from_cache(False) is not None
-
-    def test_get_cached_status_force_refresh_bypasses_cache(self, service):
-        service._store_in_cache(
-            MechStatusCacheResult(success=True, level=1), False)
-        fresh = MechStatusCacheResult(success=True, level=99)
-        with patch.object(service, "_fetch_fresh_status", return_value=fresh):
-            out = service.get_cached_status(MechStatusCacheRequest(
-                force_refresh=True))
+            first = service.get_cached_status(MechStatusCacheRequest())
+            second = service.get_cached_status(MechStatusCacheRequest(include_decimals=True))
+
+        fetch.assert_called_once_with(True)
+        assert first.level == second.level == 9
+        assert first.cached_at is not None
+        assert second.cache_age_seconds >= 0
+        # Callers get their own copies
+        assert first is not second
+
+    def test_force_refresh_recomputes(self, service):
+        with patch.object(service, "_fetch_fresh_status",
+                          side_effect=[MechStatusCacheResult(success=True, level=1),
+                                       MechStatusCacheResult(success=True, level=99)]):
+            service.get_cached_status(MechStatusCacheRequest())
+            out = service.get_cached_status(MechStatusCacheRequest(force_refresh=True))
         assert out.level == 99
 
+    def test_failed_fetch_is_not_cached(self, service):
+        with patch.object(service, "_fetch_fresh_status",
+                          side_effect=[MechStatusCacheResult(success=False, error_message="x"),
+                                       MechStatusCacheResult(success=True, level=3)]) as fetch:
+            assert service.get_cached_status(MechStatusCacheRequest()).success is False
+            assert service.get_cached_status(MechStatusCacheRequest()).level == 3
+        assert fetch.call_count == 2
+
     def test_get_cached_status_handles_fetch_exception(self, service):
         with patch.object(service, "_fetch_fresh_status",
                           side_effect=ImportError("no module")):
@@ -555,6 +539,36 @@ class TestMechStatusCacheService:
         assert out.success is False
         assert "Service dependency error" in (out.error_message or "")
 
+    def test_power_decays_on_read_without_refetch(self, service):
+        fresh = MechStatusCacheResult(
+            success=True, level=2, power=10.0, total_donated=50.0,
+            bars=BarsCompat(Power_current=10.0, Power_max_for_level=20),
+            speed_description="RUN")
+        service._fetch_decay_anchor.return_value = self._anchor(1000, 12, 200)
+
+        with patch.object(service, "_fetch_fresh_status", return_value=fresh) as fetch, \
+             patch("services.mech.speed_levels.get_combined_mech_status",
+                   return_value=_build_combined_status(description="WALK", color="#aaa")) as combined:
+            out = service.get_cached_status(MechStatusCacheRequest())
+            again = service.get_cached_status(MechStatusCacheRequest(include_decimals=True))
+
+        fetch.assert_called_once()
+        assert out.power == pytest.approx(9.0, abs=0.01)
+        assert out.bars.Power_current == out.power
+        assert out.speed_description == "WALK"
+        assert again.power == out.power
+        # Speed info is derived once per power value
+        combined.assert_called_once()
+
+    def test_undecayed_power_serves_fetched_result(self, service):
+        fresh = MechStatusCacheResult(success=True, power=10.0, speed_description="RUN")
+        service._fetch_decay_anchor.return_value = self._anchor(1000, 0, 0)
+        with patch.object(service, "_fetch_fresh_status", return_value=fresh), \
+             patch("services.mech.speed_levels.get_combined_mech_status") as combined:
+            out = service.get_cached_status(MechStatusCacheRequest())
+        combined.assert_not_called()
+        assert out.power == 10.0 and out.speed_description == "RUN"
+
     def test_fetch_fresh_status_builds_result_from_data_store(self, service):
         # Build a fake comprehensive_data result.
         fake_data_result = MechDataResult(
@@ -589,6 +603,8 @@ class TestMechStatusCacheService:
         assert out.threshold == 100
         assert out.speed_description == "WALK"
         assert out.bars is not None
+        # Pushed invalidation must not be answered from the data store's TTL cache
+        assert fake_data_store.get_comprehensive_data.call_args.args[0].force_refresh is True
 
     def test_fetch_fresh_status_failure_when_data_store_fails(self, service):
         bad = MechDataResult(success=False, error="store-broken")
@@ -618,57 +634,61 @@ class TestMechStatusCacheService:
         assert out.success is False
 
     def test_get_cache_stats_returns_metadata(self, service):
-        service._store_in_cache(MechStatusCacheResult(success=True), False)
+        assert service.get_cache_stats()["entries"] == 0
+        with patch.object(service, "_fetch_fresh_status",
+                          return_value=MechStatusCacheResult(success=True)):
+            service.get_cached_status(MechStatusCacheRequest())
         stats = service.get_cache_stats()
         assert stats["entries"] == 1
-        assert stats["ttl_seconds"] == service._cache_ttl
-        assert stats["loop_running"] is False
-        assert "entries_detail" in stats
-        # The single entry should be present in the detail dict.
-        assert any("mech_status" in k for k in stats["entries_detail"])
-
-    def test_handle_donation_event_clears_cache(self, service):
-        service._store_in_cache(MechStatusCacheResult(success=True), False)
+        assert stats["stale"] is False
+        assert stats["refresh_count"] == 1
+        assert stats["analytic_decay"] is False
+
+    def test_handle_donation_event_invalidates_cache(self, service):
         evt = SimpleNamespace(
             data={"amount": 12.5},
             source_service="donation",
         )
-
-        # Patch event_manager used inside _handle_donation_event to avoid
-        # the production singleton.
-        with patch("services.infrastructure.event_manager.get_event_manager",
-                   return_value=MagicMock()):
-            service._handle_donation_event(evt)
-        assert service._cache == {}
+        with patch.object(service, "_fetch_fresh_status",
+                          side_effect=[MechStatusCacheResult(success=True, level=1),
+                                       MechStatusCacheResult(success=True, level=2)]):
+            service.get_cached_status(MechStatusCacheRequest())
+            # Patch event_manager used inside _handle_donation_event to avoid
+            # the production singleton.
+            with patch("services.infrastructure.event_manager.get_event_manager",
+                       return_value=MagicMock()):
+                service._handle_donation_event(evt)
+            assert service.get_cache_stats()["entries"] == 0
+            assert service.get_cached_status(MechStatusCacheRequest()).level == 2
 
     def test_handle_state_change_event_clears_cache(self, service):
-        service._store_in_cache(MechStatusCacheResult(success=True), False)
-        service._store_in_cache(MechStatusCacheResult(success=True), True)
+        with patch.object(service, "_fetch_fresh_status",
+                          return_value=MechStatusCacheResult(success=True)):
+            service.get_cached_status(MechStatusCacheRequest())
         evt = SimpleNamespace(
             data={"old_power": 5.0, "new_power": 0.0},
             source_service="mech",
         )
         service._handle_state_change_event(evt)
-        assert service._cache == {}
-
-    def test_stop_background_loop_sets_flag(self, service):
-        service._loop_running = True
-        service.stop_background_loop()
-        assert service._loop_running is False
+        assert service.get_cache_stats()["entries"] == 0
 
-    def test_stop_background_loop_cancels_task(self, service):
-        fake_task = MagicMock()
-        service._loop_task = fake_task
-        service._loop_running = True
-        service.stop_background_loop()
-        fake_task.cancel.assert_called_once()
-        assert service._loop_task is None
+    def test_progress_state_change_marks_state_stale(self, service):
+        with patch.object(service, "_fetch_fresh_status",
+                          return_value=MechStatusCacheResult(success=True)) as fetch:
+            service.get_cached_status(MechStatusCacheRequest())
+            service._handle_progress_state_change("main")
+            assert service.get_cache_stats()["stale"] is True
+            service.get_cached_status(MechStatusCacheRequest())
+        assert fetch.call_count == 2
 
     def test_setup_event_listeners_registers_callbacks(self):
         # Don't suppress _setup_event_listeners here — exercise it.
         fake_event_manager = MagicMock()
+        fake_runtime = MagicMock()
         with patch("services.infrastructure.event_manager.get_event_manager",
-                   return_value=fake_event_manager):
+                   return_value=fake_event_manager), \
+             patch("services.mech.progress.get_progress_runtime",
+                   return_value=fake_runtime):
             svc = MechStatusCacheService()
 
         assert fake_event_manager.register_listener.call_count == 2
@@ -679,13 +699,16 @@ class TestMechStatusCacheService:
         assert registered_events == {
             "donation_completed", "mech_state_changed",
         }
+        fake_runtime.add_state_listener.assert_called_once_with(svc._handle_progress_state_change)
         # Service is fully constructed.
-        assert svc._cache == {}
+        assert svc.get_cache_stats()["entries"] == 0
 
     def test_setup_event_listeners_handles_import_error(self):
         # If event_manager import fails, the service must still construct.
         with patch("services.infrastructure.event_manager.get_event_manager",
-                   side_effect=ImportError("missing")):
+                   side_effect=ImportError("missing")), \
+             patch("services.mech.progress.get_progress_runtime",
+                   return_value=MagicMock()):
             svc = MechStatusCacheService()
         assert isinstance(svc, MechStatusCacheService)
 
@@ -714,64 +737,6 @@ class TestMechStatusCacheService:
         bad_event = object()
         service._handle_state_change_event(bad_event)
 
-    def test_background_refresh_invokes_decay_and_refreshes(self, service):
-        import asyncio as _asyncio
-
-        prog_state = _build_progress_state(power_current=10.0, is_offline=False)
-        fake_progress = MagicMock()
-        fake_progress.get_state.return_value = prog_state
-
-        fresh = MechStatusCacheResult(success=True, level=2, power=10.0)
-        with patch("services.mech.progress_service.get_progress_service",
-                   return_value=fake_progress), \
-             patch.object(service, "_fetch_fresh_status", return_value=fresh):
-            _asyncio.run(service._background_refresh())
-
-        fake_progress.get_state.assert_called_once()
-        # Cache now contains both decimal variants.
-        assert service._get_from_cache(False) is not None
-        assert service._get_from_cache(True) is not None
-
-    def test_background_refresh_logs_offline_state(self, service):
-        import asyncio as _asyncio
-
-        prog_state = _build_progress_state(power_current=0.0, is_offline=True)
-        fake_progress = MagicMock()
-        fake_progress.get_state.return_value = prog_state
-
-        fresh = MechStatusCacheResult(success=True, level=1, power=0.0)
-        with patch("services.mech.progress_service.get_progress_service",
-                   return_value=fake_progress), \
-             patch.object(service, "_fetch_fresh_status", return_value=fresh):
-            _asyncio.run(service._background_refresh())
-
-        assert service._get_from_cache(False) is not None
-
-    def test_background_refresh_tolerates_decay_error(self, service):
-        import asyncio as _asyncio
-
-        fresh = MechStatusCacheResult(success=True)
-        with patch("services.mech.progress_service.get_progress_service",
-                   side_effect=ImportError("no progress")), \
-             patch.object(service, "_fetch_fresh_status", return_value=fresh):
-            # Should not raise.
-            _asyncio.run(service._background_refresh())
-
-        # Cache refresh proceeded despite decay failure.
-        assert service._get_from_cache(False) is not None
-
-    def test_start_background_loop_already_running_is_noop(self, service):
-        import asyncio as _asyncio
-        service._loop_running = True
-
-        async def _runner():
-            await service.start_background_loop()
-
-        # Coroutine returns immediately because flag is set.
-        _asyncio.run(_runner())
-        # Flag is unchanged
-        assert service._loop_running is True
-
 
 # ===========================================================================
 #                       mech_reset_service tests
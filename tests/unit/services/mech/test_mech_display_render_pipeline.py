@@ -0,0 +1,160 @@
+# -*- coding: utf-8 -*-
+# ============================================================================ #
+# DockerDiscordControl (DDC) - Unit Tests for Display Pre-Render Pipeline     #
+# https://ddc.bot                                                              #
+# Copyright (c) 2025 MAX                                                       #
+# Licensed under the MIT License                                               #
+# ============================================================================ #
+
+"""Incremental, parallel pre-rendering of mech display images."""
+
+from __future__ import annotations
+
+import io
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock, patch
+
+import pytest
+from PIL import Image
+
+from services.mech import mech_display_cache_service as module
+from services.mech.mech_display_cache_service import (
+    MANIFEST_FILENAME,
+    MechDisplayCacheRequest,
+    MechDisplayCacheService,
+)
+
+
+def _webp(alpha_values=(0, 90, 255)) -> bytes:
+    img = Image.new("RGBA", (len(alpha_values), 1))
+    img.putdata([(200, 10, 10, a) for a in alpha_values])
+    buf = io.BytesIO()
+    img.save(buf, format="WebP", lossless=True)
+    return buf.getvalue()
+
+
+@pytest.fixture
+def sources(tmp_path):
+    """Base animation cache files for levels 1-11 (small and big)."""
+    src = tmp_path / "cached_animations"
+    src.mkdir()
+    for level in range(1, 12):
+        (src / f"mech_{level}_100speed.cache").write_bytes(b"small-%d" % level)
+        (src / f"mech_{level}_100speed_big.cache").write_bytes(b"big-%d" % level)
+    return src
+
+
+@pytest.fixture
+def animation_service(sources):
+    svc = MagicMock()
+    svc.get_cached_animation_path.side_effect = lambda level, kind, res: (
+        sources / (f"mech_{level}_100speed.cache" if res == "small" else f"mech_{level}_100speed_big.cache"))
+    svc._get_actual_mech_folder.side_effect = TypeError("no PNG sources")
+    svc.get_animation_with_speed.return_value = _webp()
+    svc.get_animation_with_speed_and_power_big.side_effect = lambda level, speed, power: b"unlocked-%d" % level
+    with patch("services.mech.animation_cache_service.get_animation_cache_service", return_value=svc):
+        yield svc
+
+
+@pytest.fixture
+def service(tmp_path, monkeypatch):
+    monkeypatch.setenv("DDC_DISPLAY_RENDER_WORKERS", "1")
+    return MechDisplayCacheService(cache_dir=tmp_path / "displays")
+
+
+def _bump(path, data):
+    path.write_bytes(data)
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+
+class TestIncrementalRendering:
+    def test_second_run_renders_nothing(self, service, animation_service):
+        first = service.pre_render_all_displays(MechDisplayCacheRequest())
+        assert first.levels_processed == 11
+        assert sorted(first.level_timings) == list(range(1, 12))
+        assert all(seconds >= 0 for seconds in first.level_timings.values())
+
+        manifest = json.loads((service.cache_dir / MANIFEST_FILENAME).read_text())
+        assert set(manifest["levels"]["4"]) == {"shadow", "unlocked"}
+
+        animation_service.get_animation_with_speed_and_power_big.reset_mock()
+        second = service.pre_render_all_displays(MechDisplayCacheRequest())
+        assert second.success is True
+        assert second.level_timings == {}
+        assert "11 already cached" in second.message
+        animation_service.get_animation_with_speed_and_power_big.assert_not_called()
+
+    def test_only_changed_source_is_rerendered(self, service, animation_service, sources):
+        service.pre_render_all_displays(MechDisplayCacheRequest())
+        animation_service.get_animation_with_speed.reset_mock()
+        animation_service.get_animation_with_speed_and_power_big.reset_mock()
+
+        _bump(sources / "mech_3_100speed_big.cache", b"big-3 updated")
+        result = service.pre_render_all_displays(MechDisplayCacheRequest())
+
+        assert list(result.level_timings) == [3]
+        animation_service.get_animation_with_speed_and_power_big.assert_called_once_with(3, 100.0, 100.0)
+        animation_service.get_animation_with_speed.assert_not_called()
+
+    def test_same_content_with_new_mtime_is_not_rerendered(self, service, animation_service, sources):
+        service.pre_render_all_displays(MechDisplayCacheRequest())
+        _bump(sources / "mech_5_100speed.cache", b"small-5")
+        assert service.pre_render_all_displays(MechDisplayCacheRequest()).level_timings == {}
+
+    def test_replaced_output_is_rerendered(self, service, animation_service):
+        service.pre_render_all_displays(MechDisplayCacheRequest())
+        _bump(service.cache_dir / "mech_7_unlocked.webp", b"tampered")
+        result = service.pre_render_all_displays(MechDisplayCacheRequest())
+        assert list(result.level_timings) == [7]
+        assert (service.cache_dir / "mech_7_unlocked.webp").read_bytes() == b"unlocked-7"
+
+    def test_existing_images_without_manifest_are_adopted(self, service, animation_service):
+        for level in range(1, 12):
+            for kind in ("shadow", "unlocked"):
+                _bump(service.cache_dir / f"mech_{level}_{kind}.webp", b"old")
+        result = service.pre_render_all_displays(MechDisplayCacheRequest())
+        assert result.level_timings == {}
+        manifest = json.loads((service.cache_dir / MANIFEST_FILENAME).read_text())
+        assert len(manifest["levels"]) == 11
+
+
+class TestShadowRendering:
+    def test_silhouette_matches_per_pixel_rule(self, service, animation_service):
+        assert service._pre_render_shadow_image(1, force=True) is True
+        with Image.open(service.cache_dir / "mech_1_shadow.webp") as img:
+            assert list(img.convert("RGBA").getdata()) == [(0, 0, 0, 0), (0, 0, 0, 90), (0, 0, 0, 180)]
+        # Base speed: no re-encoding just to read the first frame
+        animation_service.get_animation_with_speed.assert_called_once_with(1, 50.0)
+
+
+class TestParallelRendering:
+    def test_levels_are_distributed_over_the_pool(self, service, animation_service, monkeypatch):
+        monkeypatch.setenv("DDC_DISPLAY_RENDER_WORKERS", "3")
+        created = []
+
+        def _pool(max_workers, mp_context=None):
+            created.append(max_workers)
+            return ThreadPoolExecutor(max_workers=max_workers)
+
+        with patch.object(module, "ProcessPoolExecutor", side_effect=_pool):
+            result = service.pre_render_all_displays(MechDisplayCacheRequest())
+
+        assert created == [3]
+        assert result.levels_processed == 11
+        assert sorted(result.level_timings) == list(range(1, 12))
+        assert (service.cache_dir / "mech_11_unlocked.webp").read_bytes() == b"unlocked-11"
+
+    def test_broken_pool_falls_back_to_serial(self, service, animation_service, monkeypatch):
+        monkeypatch.setenv("DDC_DISPLAY_RENDER_WORKERS", "4")
+        with patch.object(module, "ProcessPoolExecutor", side_effect=OSError("no semaphores")):
+            result = service.pre_render_all_displays(MechDisplayCacheRequest())
+        assert result.levels_processed == 11
+
+    def test_worker_count_is_bounded_by_jobs(self, service, monkeypatch):
+        monkeypatch.setenv("DDC_DISPLAY_RENDER_WORKERS", "8")
+        assert service._render_worker_count(2) == 2
+        monkeypatch.delenv("DDC_DISPLAY_RENDER_WORKERS")
+        assert service._render_worker_count(11) <= module.MAX_RENDER_WORKERS
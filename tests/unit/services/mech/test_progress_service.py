@@ -265,6 +265,38 @@ def test_persist_snapshot_atomic_write(progress_env):
     assert data["mech_id"] == "atomic"
 
 
+def test_state_listener_fires_only_on_change(progress_env):
+    calls = []
+    progress_env.runtime.add_state_listener(calls.append)
+    try:
+        progress_env.load_snapshot("listened")  # creating the snapshot is a change
+        calls.clear()
+
+        snap = progress_env.load_snapshot("listened")
+        progress_env.persist_snapshot(snap)
+        assert calls == []
+
+        snap.power_acc += 100
+        snap.version += 1
+        progress_env.persist_snapshot(snap)
+        assert calls == ["listened"]
+    finally:
+        progress_env.runtime.remove_state_listener(calls.append)
+
+
+def test_decay_anchor_matches_compute_ui_state(progress_env):
+    snap = progress_env.Snapshot(mech_id="decay", power_acc=1000, goal_requirement=1000)
+    snap.goal_started_at = (datetime.now(timezone.utc) - timedelta(hours=12)).isoformat()
+
+    anchor = progress_env.decay_anchor(snap)
+    state = progress_env.compute_ui_state(snap)
+
+    assert anchor.decay_per_day == 100
+    assert anchor.power_at(anchor.started_ts) == 1000
+    assert anchor.power_at(anchor.started_ts + 86400 * 20) == 0
+    assert round(state.power_current * 100) == pytest.approx(950, abs=1)
+
+
 def test_snapshot_path_sanitises_mech_id(progress_env):
     p = progress_env.snapshot_path("../../etc/passwd")
     # ".." replaced with "_", "/" replaced with "_"
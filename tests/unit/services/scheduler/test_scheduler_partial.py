@@ -50,6 +50,7 @@ from services.scheduling.scheduler import (
     add_task,
     check_task_time_collision,
     delete_task,
+    expire_missed_once_tasks,
     find_task_by_id,
     get_next_week_tasks,
     get_tasks_for_container,
@@ -778,6 +779,52 @@ class TestCRUD:
         assert delete_task(f"{SYSTEM_TASK_PREFIX}ANYTHING") is False
 
 
+class TestExpireMissedOnceTasks:
+    def _once_task(self, task_id):
+        task = ScheduledTask(
+            task_id=task_id,
+            container_name="nginx",
+            action="restart",
+            cycle=CYCLE_ONCE,
+            year=2099,
+            month=1,
+            day=1,
+            hour=12,
+            minute=0,
+            timezone_str="UTC",
+        )
+        assert task.next_run_ts is not None
+        return task
+
+    def test_missed_once_task_is_deactivated_and_persisted(self):
+        task = self._once_task("once-1")
+        assert save_tasks([task]) is True
+        store = scheduler_mod.refresh_task_store()
+
+        assert expire_missed_once_tasks(store, task.next_run_ts + 600, grace_seconds=90) == 1
+        assert store.get("once-1").is_active is False
+        assert store.next_due_ts() is None
+
+        reloaded = load_tasks()
+        assert reloaded[0].is_active is False
+
+    def test_task_inside_grace_window_is_kept(self):
+        task = self._once_task("once-2")
+        assert save_tasks([task]) is True
+        store = scheduler_mod.refresh_task_store()
+
+        assert expire_missed_once_tasks(store, task.next_run_ts + 30, grace_seconds=90) == 0
+        assert store.get("once-2").is_active is True
+
+    def test_recurring_tasks_are_ignored(self):
+        task = _make_daily_task(task_id="daily-1")
+        assert save_tasks([task]) is True
+        store = scheduler_mod.refresh_task_store()
+
+        assert expire_missed_once_tasks(store, task.next_run_ts + 10 * 86400) == 0
+        assert store.get("daily-1").is_active is True
+
+
 # ---------------------------------------------------------------------------
 # Container/timeframe queries + collision check
 # ---------------------------------------------------------------------------
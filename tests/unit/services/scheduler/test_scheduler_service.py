@@ -69,6 +69,7 @@ from services.scheduling.scheduler_service import (  # noqa: E402
     SchedulerService,
     get_scheduler_service,
 )
+from services.scheduling.task_store import TaskStore  # noqa: E402
 
 
 # ---------------------------------------------------------------------------
@@ -90,7 +91,10 @@ def service():
 @pytest.fixture(autouse=True)
 def _patch_load_tasks():
     """Stop the service loop from hitting the real task store."""
-    with patch("services.scheduling.scheduler_service.load_tasks", return_value=[]):
+    with patch(
+        "services.scheduling.scheduler_service.refresh_task_store",
+        side_effect=lambda *a, **kw: TaskStore(),
+    ):
         yield
 
 
@@ -244,3 +248,41 @@ class TestGuardRails:
         # No prior start: nothing to stop.
         assert service.running is False
         assert service.stop() is False
+
+
+# ===========================================================================
+# Heap-driven wakeups
+# ===========================================================================
+class TestWakeups:
+    def test_next_wakeup_is_time_until_next_due_task(self, service):
+        from types import SimpleNamespace
+        import services.scheduling.scheduler_service as ss
+
+        store = TaskStore()
+        store.replace([SimpleNamespace(task_id="t", container_name="c",
+                                       next_run_ts=time.time() + 5, is_active=True)])
+        service._task_store = store
+        wait = service._calculate_next_wakeup(0.0)
+        assert 0 < wait <= 5
+        assert wait <= ss.FILE_POLL_INTERVAL
+
+    def test_idle_wakeup_uses_file_poll_interval(self, service):
+        import services.scheduling.scheduler_service as ss
+
+        service._task_store = TaskStore()
+        assert service._calculate_next_wakeup(0.0) == ss.FILE_POLL_INTERVAL
+
+    def test_store_change_wakes_sleeping_loop(self, service):
+        async def _scenario():
+            service.event_loop = asyncio.get_running_loop()
+            service._wakeup = asyncio.Event()
+            store = TaskStore()
+            store.add_listener(service._on_tasks_changed)
+
+            # Mutate from another thread, as the Web UI does
+            threading.Timer(0.05, lambda: store.replace([])).start()
+            started = time.monotonic()
+            await service._wait_for_wakeup(10)
+            return time.monotonic() - started
+
+        assert asyncio.run(_scenario()) < 5
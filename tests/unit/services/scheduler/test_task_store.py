@@ -0,0 +1,123 @@
+# -*- coding: utf-8 -*-
+"""
+Unit tests for the heap/slot indexed TaskStore used by the scheduler loop.
+"""
+
+from types import SimpleNamespace
+
+import pytest
+
+from services.scheduling.task_store import TaskStore
+
+BASE_TS = 1_700_000_000.0
+
+
+def _task(task_id, ts, container="alpha", active=True):
+    return SimpleNamespace(task_id=task_id, container_name=container,
+                           next_run_ts=ts, is_active=active)
+
+
+@pytest.fixture
+def store():
+    return TaskStore(slot_seconds=600)
+
+
+class TestHeapOrdering:
+    def test_next_due_is_minimum(self, store):
+        store.replace([_task("a", BASE_TS + 300), _task("b", BASE_TS + 100), _task("c", None)])
+        assert store.loaded is True
+        assert store.next_due_ts() == BASE_TS + 100
+
+    def test_pop_due_returns_only_due_tasks_in_order(self, store):
+        store.replace([_task("a", BASE_TS + 10), _task("b", BASE_TS), _task("c", BASE_TS + 500)])
+        due = store.pop_due(BASE_TS + 20, window=90)
+        assert [t.task_id for t in due] == ["b", "a"]
+        assert store.next_due_ts() == BASE_TS + 500
+
+    def test_missed_tasks_are_dropped_not_returned(self, store):
+        store.replace([_task("old", BASE_TS - 10_000), _task("new", BASE_TS)])
+        due = store.pop_due(BASE_TS + 1, window=90)
+        assert [t.task_id for t in due] == ["new"]
+        assert store.next_due_ts() is None
+        # Still stored, just not queued
+        assert "old" in store
+
+    def test_inactive_tasks_are_not_queued(self, store):
+        store.replace([_task("off", BASE_TS, active=False)])
+        assert store.next_due_ts() is None
+        assert store.pop_due(BASE_TS + 1, window=90) == []
+
+    def test_fired_timestamp_is_not_requeued_until_it_changes(self, store):
+        task = _task("a", BASE_TS)
+        store.replace([task])
+        assert store.pop_due(BASE_TS, window=90) == [task]
+
+        # Same timestamp (e.g. failed execution) must not fire again
+        store.upsert(task)
+        assert store.next_due_ts() is None
+
+        task.next_run_ts = BASE_TS + 86400
+        assert store.reschedule("a") is True
+        assert store.next_due_ts() == BASE_TS + 86400
+
+    def test_in_place_mutation_is_picked_up_lazily(self, store):
+        task = _task("a", BASE_TS)
+        store.replace([task, _task("b", BASE_TS + 50)])
+        task.next_run_ts = BASE_TS + 1000
+        assert store.next_due_ts() == BASE_TS + 50
+
+    def test_requeue_puts_popped_task_back(self, store):
+        task = _task("a", BASE_TS)
+        store.replace([task])
+        store.pop_due(BASE_TS, window=90)
+        store.requeue(task)
+        assert store.next_due_ts() == BASE_TS
+
+    def test_remove_discards_heap_entry(self, store):
+        store.replace([_task("a", BASE_TS), _task("b", BASE_TS + 5)])
+        assert store.remove("a").task_id == "a"
+        assert store.remove("a") is None
+        assert store.next_due_ts() == BASE_TS + 5
+
+
+class TestCollisionIndex:
+    def test_collision_within_interval(self, store):
+        store.replace([_task("a", BASE_TS)])
+        assert store.find_collision("alpha", BASE_TS + 599).task_id == "a"
+        assert store.find_collision("alpha", BASE_TS - 599).task_id == "a"
+
+    def test_no_collision_outside_interval_or_other_container(self, store):
+        store.replace([_task("a", BASE_TS)])
+        assert store.find_collision("alpha", BASE_TS + 600) is None
+        assert store.find_collision("beta", BASE_TS) is None
+        assert store.find_collision("alpha", None) is None
+
+    def test_ignored_task_id(self, store):
+        store.replace([_task("a", BASE_TS)])
+        assert store.find_collision("alpha", BASE_TS, ignore_task_id="a") is None
+
+    def test_upsert_moves_slot_and_container(self, store):
+        store.replace([_task("a", BASE_TS)])
+        store.upsert(_task("a", BASE_TS + 7200, container="beta"))
+        assert store.find_collision("alpha", BASE_TS) is None
+        assert store.find_collision("beta", BASE_TS + 7200).task_id == "a"
+        assert store.for_container("alpha") == []
+        assert [t.task_id for t in store.for_container("beta")] == ["a"]
+
+
+class TestListeners:
+    def test_mutations_notify_listeners(self, store):
+        calls = []
+        store.add_listener(lambda: calls.append(store.version))
+        store.replace([])
+        store.upsert(_task("a", BASE_TS))
+        store.remove("a")
+        assert calls == [1, 2, 3]
+
+    def test_failing_listener_does_not_break_mutation(self, store):
+        def _boom():
+            raise RuntimeError("loop closed")
+
+        store.add_listener(_boom)
+        store.upsert(_task("a", BASE_TS))
+        assert "a" in store
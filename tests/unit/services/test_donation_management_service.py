@@ -180,7 +180,7 @@ class TestDonationManagementService:
     def test_get_donation_history_returns_newest_first(
         self, patch_mech_service, patch_progress_paths, event_log_path
     ):
-        """Donations are returned ordered newest-first by seq."""
+        """The newest ``limit`` donations are returned, ordered newest-first by seq."""
         mech_service = Mock()
         mech_service.get_mech_state_service.return_value = _mech_state_result(
             total_donated=500.0
@@ -202,10 +202,35 @@ class TestDonationManagementService:
 
         assert result.success is True
         donations = result.data["donations"]
-        # Production returns ALL donations newest-first; the ``limit`` is
-        # currently informational and not applied.  We only assert ordering.
-        assert donations[0]["donor_name"] == "User9"
-        assert donations[-1]["donor_name"] == "User0"
+        assert [d["donor_name"] for d in donations] == [f"User{i}" for i in range(9, 4, -1)]
+        assert result.data["total"] == 10
+        # Stats still cover every donation, not just the returned rows
+        assert result.data["stats"].total_donations == 10
+
+    def test_get_donation_page_includes_stats(
+        self, patch_progress_paths, event_log_path
+    ):
+        """Pages carry the unfiltered stats so the modal needs no second request."""
+        _write_event_log(event_log_path, [
+            {
+                "seq": i,
+                "type": "DonationAdded",
+                "ts": f"2025-01-01T{i:02d}:00:00Z",
+                "payload": {"donor": f"User{i}", "units": 1000},
+            }
+            for i in range(4)
+        ])
+
+        result = self.service.get_donation_page(offset=2, limit=2)
+
+        assert result.success is True
+        assert [d["donor_name"] for d in result.data["donations"]] == ["User1", "User0"]
+        assert result.data["total"] == 4
+        assert result.data["stats"] == {
+            "total_power": pytest.approx(40.0),
+            "total_donations": 4,
+            "average_donation": pytest.approx(10.0),
+        }
 
     def test_delete_donation_success(
         self, patch_mech_service, patch_progress_paths, event_log_path
@@ -0,0 +1,156 @@
+# -*- coding: utf-8 -*-
+"""
+Unit tests for the persistent message location registry.
+"""
+
+import json
+from unittest.mock import AsyncMock, MagicMock
+
+import discord
+import pytest
+
+from services.discord.message_location_registry import ADMIN_OVERVIEW, OVERVIEW, MessageLocationRegistry
+
+
+class _History:
+    """Async iterator standing in for ``channel.history``."""
+
+    def __init__(self, messages):
+        self._messages = list(messages)
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        if not self._messages:
+            raise StopAsyncIteration
+        return self._messages.pop(0)
+
+
+def _channel(channel_id=10, guild_id=1, messages=(), fetch=None):
+    channel = MagicMock()
+    channel.id = channel_id
+    channel.guild.id = guild_id
+    channel.fetch_message = AsyncMock(side_effect=fetch)
+    channel.history = MagicMock(side_effect=lambda limit: _History(list(messages)[:limit]))
+    return channel
+
+
+def _message(message_id, title=None):
+    message = MagicMock()
+    message.id = message_id
+    message.embeds = [MagicMock(title=title)] if title else []
+    return message
+
+
+def _not_found():
+    return discord.NotFound(MagicMock(status=404), "Unknown Message")
+
+
+@pytest.fixture
+def registry(tmp_path):
+    return MessageLocationRegistry(tmp_path / "message_locations.json")
+
+
+class TestRegistryPersistence:
+    def test_record_survives_reload(self, registry):
+        registry.record(10, OVERVIEW, 500, guild_id=1)
+
+        reloaded = MessageLocationRegistry(registry.state_file)
+        location = reloaded.get_location(10, OVERVIEW)
+        assert (location.guild_id, location.message_id) == (1, 500)
+
+    def test_unchanged_record_does_not_write(self, registry, monkeypatch):
+        registry.record(10, OVERVIEW, 500, guild_id=1)
+        saves = MagicMock()
+        monkeypatch.setattr(registry, "_save", saves)
+
+        registry.record(10, OVERVIEW, 500)  # unknown guild keeps the recorded one
+
+        saves.assert_not_called()
+        assert registry.get_location(10, OVERVIEW).guild_id == 1
+
+    def test_sync_replaces_only_given_purposes(self, registry):
+        registry.record(10, OVERVIEW, 500, guild_id=1)
+        registry.record(11, ADMIN_OVERVIEW, 700, guild_id=1)
+        registry.record(12, "other", 900, guild_id=1)
+
+        registry.sync((OVERVIEW, ADMIN_OVERVIEW), {10: {OVERVIEW: 501, "Enshrouded": 5}}, {10: 2})
+
+        assert registry.get(10, OVERVIEW) == 501
+        assert registry.get_location(10, OVERVIEW).guild_id == 2
+        assert registry.get(11, ADMIN_OVERVIEW) is None
+        assert registry.get(12, "other") == 900
+        saved = json.loads(registry.state_file.read_text())["locations"]
+        assert {(e["channel_id"], e["purpose"]) for e in saved} == {(10, OVERVIEW), (12, "other")}
+
+    def test_forget_guild(self, registry):
+        registry.record(10, OVERVIEW, 500, guild_id=1)
+        registry.record(20, OVERVIEW, 600, guild_id=2)
+
+        registry.forget_guild(1)
+
+        assert [loc.channel_id for loc in registry.locations()] == [20]
+
+    def test_corrupt_file_starts_empty(self, tmp_path):
+        path = tmp_path / "message_locations.json"
+        path.write_text("{not json")
+        assert MessageLocationRegistry(path).locations() == []
+
+
+class TestResolve:
+    @pytest.mark.asyncio
+    async def test_recorded_id_needs_one_fetch_and_no_scan(self, registry):
+        registry.record(10, ADMIN_OVERVIEW, 500, guild_id=1)
+        target = _message(500, "Admin Overview")
+        channel = _channel(fetch=lambda mid: target)
+
+        found = await registry.resolve(channel, ADMIN_OVERVIEW, matcher=lambda m: True)
+
+        assert found is target
+        channel.fetch_message.assert_awaited_once_with(500)
+        channel.history.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_deleted_message_falls_back_to_bounded_scan_and_records(self, registry):
+        registry.record(10, ADMIN_OVERVIEW, 500, guild_id=1)
+        history = [_message(i) for i in range(900, 880, -1)] + [_message(777, "Admin Overview")]
+
+        def _fetch(mid):
+            raise _not_found()
+
+        channel = _channel(messages=history, fetch=_fetch)
+
+        def matcher(m):
+            return bool(m.embeds) and m.embeds[0].title == "Admin Overview"
+
+        found = await registry.resolve(channel, ADMIN_OVERVIEW, matcher=matcher, scan_limit=50)
+
+        assert found.id == 777
+        assert registry.get(10, ADMIN_OVERVIEW) == 777
+        assert registry.get_stats()["fetch_misses"] == 1
+
+    @pytest.mark.asyncio
+    async def test_scan_is_bounded(self, registry):
+        history = [_message(i) for i in range(100)] + [_message(777, "Admin Overview")]
+        channel = _channel(messages=history)
+
+        found = await registry.resolve(channel, ADMIN_OVERVIEW,
+                                       matcher=lambda m: bool(m.embeds), scan_limit=50)
+
+        assert found is None
+        assert registry.get_stats()["scanned_messages"] == 50
+        assert registry.get(10, ADMIN_OVERVIEW) is None
+
+    @pytest.mark.asyncio
+    async def test_forbidden_fetch_does_not_scan_or_forget(self, registry):
+        registry.record(10, OVERVIEW, 500, guild_id=1)
+
+        def _fetch(mid):
+            raise discord.Forbidden(MagicMock(status=403), "Missing Access")
+
+        channel = _channel(fetch=_fetch)
+
+        assert await registry.resolve(channel, OVERVIEW, matcher=lambda m: True) is None
+        channel.history.assert_not_called()
+        assert registry.get(10, OVERVIEW) == 500
@@ -40,12 +40,14 @@ import docker.errors  # noqa: F401
 from services.web.container_log_service import (
     ActionLogRequest,
     ClearLogRequest,
+    ContainerLogCursor,
     ContainerLogRequest,
     ContainerLogService,
     FilteredLogRequest,
     LogResult,
     LogType,
     get_container_log_service,
+    read_tail_lines,
 )
 
 
@@ -126,6 +128,81 @@ class TestReadLogFile:
             assert service._read_log_file(str(log_file), 10) is None
 
 
+class TestReadTailLines:
+    """Tests for the reverse-seeking ``read_tail_lines`` helper."""
+
+    def _write(self, tmp_path, content: bytes):
+        path = tmp_path / "tail.log"
+        path.write_bytes(content)
+        return path
+
+    def test_tail_spanning_multiple_blocks(self, tmp_path):
+        path = self._write(tmp_path, b"".join(b"line%d\n" % i for i in range(1000)))
+        with open(path, "rb") as f:
+            out = read_tail_lines(f, 3, block_size=16)
+        assert out == b"line997\nline998\nline999\n"
+
+    def test_file_without_trailing_newline(self, tmp_path):
+        path = self._write(tmp_path, b"a\nb\nc")
+        with open(path, "rb") as f:
+            assert read_tail_lines(f, 2, block_size=2) == b"b\nc"
+
+    def test_fewer_lines_than_requested_returns_everything(self, tmp_path):
+        path = self._write(tmp_path, b"a\nb\n")
+        with open(path, "rb") as f:
+            assert read_tail_lines(f, 10) == b"a\nb\n"
+
+    def test_zero_lines_returns_empty(self, tmp_path):
+        path = self._write(tmp_path, b"a\nb\n")
+        with open(path, "rb") as f:
+            assert read_tail_lines(f, 0) == b""
+
+    def test_only_reads_the_tail(self, tmp_path):
+        path = self._write(tmp_path, b"x" * 1_000_000 + b"\nlast\n")
+        with open(path, "rb") as f:
+            read_tail_lines(f, 1, block_size=64)
+            # Cursor stops near the end instead of scanning the whole file
+            assert f.tell() >= 1_000_000
+
+
+class TestContainerLogCursor:
+    """Tests for incremental per-viewer container log streaming."""
+
+    def _container(self, *chunks: str):
+        container = MagicMock()
+        container.logs.side_effect = [c.encode("utf-8") for c in chunks]
+        return container
+
+    def test_first_poll_fetches_tail_then_uses_since(self):
+        cursor = ContainerLogCursor("web", max_lines=5)
+        container = self._container(
+            "2025-01-01T00:00:01.000000000Z one\n2025-01-01T00:00:02.000000000Z two\n",
+            "2025-01-01T00:00:02.000000000Z two\n2025-01-01T00:00:03.500000000Z three\n",
+        )
+
+        assert len(cursor.poll(container)) == 2
+        container.logs.assert_called_with(tail=5, timestamps=True)
+
+        new_lines = cursor.poll(container)
+        # The line at the cursor timestamp is not repeated
+        assert new_lines == ["2025-01-01T00:00:03.500000000Z three"]
+        since = container.logs.call_args.kwargs["since"]
+        assert since == int(datetime(2025, 1, 1, 0, 0, 2, tzinfo=timezone.utc).timestamp())
+
+    def test_window_is_bounded(self):
+        cursor = ContainerLogCursor("web", max_lines=2)
+        cursor.feed("\n".join(f"2025-01-01T00:00:0{i}.000000000Z l{i}" for i in range(5)))
+        assert cursor.render().splitlines() == [
+            "2025-01-01T00:00:03.000000000Z l3",
+            "2025-01-01T00:00:04.000000000Z l4",
+        ]
+
+    def test_no_new_lines_returns_empty(self):
+        cursor = ContainerLogCursor("web")
+        cursor.feed("2025-01-01T00:00:01.000000000Z one\n")
+        assert cursor.feed("2025-01-01T00:00:01.000000000Z one\n") == []
+
+
 class TestGetWebuiLogs:
     """Exercises file-fallback path for webui log retrieval."""
 
@@ -348,25 +348,30 @@ class TestAddTask:
 # ---------------------------------------------------------------------------
 # list_tasks
 # ---------------------------------------------------------------------------
+def _store(tasks):
+    from services.scheduling.task_store import TaskStore
+
+    store = TaskStore()
+    store.replace(tasks)
+    return store
+
+
 class TestListTasks:
     def test_list_tasks_success_returns_dict_per_task(self, service):
         future_ts = time.time() + 3600
         t1 = _FakeScheduledTask(task_id="a", next_run_ts=future_ts)
         t2 = _FakeScheduledTask(task_id="b", next_run_ts=future_ts, is_active=False)
 
-        with patch.object(service, "_load_tasks_from_scheduler", return_value=[t1, t2]), \
-             patch.object(service, "_determine_timezone", return_value="UTC"), \
-             patch.object(service, "_save_updated_tasks") as save_mock:
+        with patch.object(service, "_get_task_store", return_value=_store([t1, t2])), \
+             patch.object(service, "_determine_timezone", return_value="UTC"):
             result = service.list_tasks(ListTasksRequest(timezone_str="UTC"))
 
         assert isinstance(result, ListTasksResult)
         assert result.success is True
         assert len(result.tasks) == 2
         assert {t["task_id"] for t in result.tasks} == {"a", "b"}
-        # No expired tasks → no save attempted.
-        save_mock.assert_called_once_with([])
 
-    def test_list_tasks_marks_expired_once_task_for_update(self, service):
+    def test_list_tasks_is_read_only_for_expired_once_task(self, service):
         past_ts = time.time() - 3600
         expired = _FakeScheduledTask(
             task_id="exp",
@@ -374,22 +379,66 @@ class TestListTasks:
             next_run_ts=past_ts,
             is_active=True,
         )
-        with patch.object(service, "_load_tasks_from_scheduler", return_value=[expired]), \
+        with patch.object(service, "_get_task_store", return_value=_store([expired])), \
              patch.object(service, "_determine_timezone", return_value="UTC"), \
-             patch.object(service, "_save_updated_tasks") as save_mock:
+             patch("services.scheduling.scheduler.update_task") as update_mock:
             result = service.list_tasks(ListTasksRequest())
 
         assert result.success is True
-        # Expired-flag was popped before returning to the caller.
+        assert result.tasks[0]["frontend_status"] == "expired"
         assert "needs_update" not in result.tasks[0]
-        # The expired task was passed to the bulk update helper.
-        args, _ = save_mock.call_args
-        assert expired in args[0]
+        # Deactivation is the scheduler's job; listing never writes
+        assert expired.is_active is True
+        update_mock.assert_not_called()
+
+    def test_view_is_reused_until_store_changes(self, service):
+        future_ts = time.time() + 3600
+        store = _store([_FakeScheduledTask(task_id="a", next_run_ts=future_ts)])
+
+        with patch.object(service, "_get_task_store", return_value=store), \
+             patch.object(service, "_format_timestamp_local", return_value="ts") as fmt:
+            first = service.list_tasks(ListTasksRequest(timezone_str="UTC"))
+            second = service.list_tasks(ListTasksRequest(timezone_str="UTC"))
+            assert fmt.call_count == 2  # created_at + next_run, formatted once
+
+            store.upsert(_FakeScheduledTask(task_id="b", next_run_ts=future_ts + 60))
+            third = service.list_tasks(ListTasksRequest(timezone_str="UTC"))
+
+        assert first.tasks == second.tasks
+        assert {t["task_id"] for t in third.tasks} == {"a", "b"}
+
+    def test_view_is_rebuilt_for_other_timezone(self, service):
+        store = _store([_FakeScheduledTask(task_id="a", next_run_ts=time.time() + 3600)])
+        with patch.object(service, "_get_task_store", return_value=store):
+            utc = service.list_tasks(ListTasksRequest(timezone_str="UTC"))
+            tokyo = service.list_tasks(ListTasksRequest(timezone_str="Asia/Tokyo"))
+        assert utc.tasks[0]["next_run_local"] != tokyo.tasks[0]["next_run_local"]
+
+    def test_view_is_rebuilt_when_scheduled_time_passes(self, service):
+        now = time.time()
+        task = _FakeScheduledTask(task_id="a", cycle="once", next_run_ts=now + 30)
+        store = _store([task])
+
+        with patch.object(service, "_get_task_store", return_value=store):
+            before = service.list_tasks(ListTasksRequest(timezone_str="UTC"))
+            with patch("services.web.task_management_service.time.time", return_value=now + 31):
+                after = service.list_tasks(ListTasksRequest(timezone_str="UTC"))
+
+        assert before.tasks[0]["frontend_status"] == "active"
+        assert after.tasks[0]["frontend_status"] == "expired"
+        assert after.tasks[0]["is_in_past"] is True
+
+    def test_returned_rows_do_not_alias_cache(self, service):
+        store = _store([_FakeScheduledTask(task_id="a", next_run_ts=time.time() + 3600)])
+        with patch.object(service, "_get_task_store", return_value=store):
+            service.list_tasks(ListTasksRequest(timezone_str="UTC")).tasks[0]["task_id"] = "mutated"
+            result = service.list_tasks(ListTasksRequest(timezone_str="UTC"))
+        assert result.tasks[0]["task_id"] == "a"
 
     def test_list_tasks_handles_service_error(self, service):
         with patch.object(
             service,
-            "_load_tasks_from_scheduler",
+            "_get_task_store",
             side_effect=RuntimeError("scheduler down"),
         ):
             result = service.list_tasks(ListTasksRequest())
@@ -399,7 +448,7 @@ class TestListTasks:
     def test_list_tasks_handles_data_error(self, service):
         with patch.object(
             service,
-            "_load_tasks_from_scheduler",
+            "_get_task_store",
             side_effect=KeyError("schema"),
         ):
             result = service.list_tasks(ListTasksRequest())
@@ -661,23 +710,17 @@ class TestUpdateScheduleDetails:
 class TestCalculateFrontendStatus:
     def test_active_task_with_future_next_run(self, service):
         task = _FakeScheduledTask(cycle="daily", next_run_ts=time.time() + 60)
-        status, needs_update = service._calculate_frontend_status(task, time.time())
-        assert status == "active"
-        assert needs_update is False
+        assert service._calculate_frontend_status(task, time.time()) == "active"
 
     def test_deactivated_task_with_future_next_run(self, service):
         task = _FakeScheduledTask(cycle="daily", next_run_ts=time.time() + 60, is_active=False)
-        status, needs_update = service._calculate_frontend_status(task, time.time())
-        assert status == "deactivated"
-        assert needs_update is False
+        assert service._calculate_frontend_status(task, time.time()) == "deactivated"
 
-    def test_once_task_in_past_is_expired_and_marked(self, service):
+    def test_once_task_in_past_is_expired_without_mutation(self, service):
         past = time.time() - 60
         task = _FakeScheduledTask(cycle="once", next_run_ts=past, is_active=True)
-        status, needs_update = service._calculate_frontend_status(task, time.time())
-        assert status == "expired"
-        assert needs_update is True
-        assert task.is_active is False  # auto-deactivated
+        assert service._calculate_frontend_status(task, time.time()) == "expired"
+        assert task.is_active is True  # deactivation happens in the scheduler
 
     def test_once_task_completed_status_is_expired(self, service):
         task = _FakeScheduledTask(
@@ -686,24 +729,17 @@ class TestCalculateFrontendStatus:
             status="completed",
             is_active=True,
         )
-        status, needs_update = service._calculate_frontend_status(task, time.time())
-        assert status == "expired"
-        assert needs_update is True
-        assert task.is_active is False
+        assert service._calculate_frontend_status(task, time.time()) == "expired"
+        assert task.is_active is True
 
     def test_no_next_run_for_recurring_task(self, service):
         task = _FakeScheduledTask(cycle="daily", next_run_ts=None, is_active=False)
-        status, needs_update = service._calculate_frontend_status(task, time.time())
         # Inactive + no next run -> "deactivated"
-        assert status == "deactivated"
-        assert needs_update is False
+        assert service._calculate_frontend_status(task, time.time()) == "deactivated"
 
-    def test_once_task_with_no_next_run_marks_expired(self, service):
+    def test_once_task_with_no_next_run_is_expired(self, service):
         task = _FakeScheduledTask(cycle="once", next_run_ts=None, is_active=True)
-        status, needs_update = service._calculate_frontend_status(task, time.time())
-        assert status == "expired"
-        assert needs_update is True
-        assert task.is_active is False
+        assert service._calculate_frontend_status(task, time.time()) == "expired"
 
 
 # ---------------------------------------------------------------------------
@@ -1059,36 +1095,6 @@ class TestGetTaskForEditing:
         assert "Data error" in out.error
 
 
-# ---------------------------------------------------------------------------
-# _save_updated_tasks
-# ---------------------------------------------------------------------------
-class TestSaveUpdatedTasks:
-    def test_noop_for_empty_list(self, service):
-        # No exceptions; no scheduler call.
-        with patch(
-            "services.scheduling.scheduler.update_task"
-        ) as upd:
-            service._save_updated_tasks([])
-        upd.assert_not_called()
-
-    def test_calls_update_task_for_each(self, service):
-        tasks = [_FakeScheduledTask(task_id="a"), _FakeScheduledTask(task_id="b")]
-        with patch(
-            "services.scheduling.scheduler.update_task"
-        ) as upd:
-            service._save_updated_tasks(tasks)
-        assert upd.call_count == 2
-
-    def test_swallows_service_error(self, service):
-        tasks = [_FakeScheduledTask()]
-        with patch(
-            "services.scheduling.scheduler.update_task",
-            side_effect=RuntimeError(),
-        ):
-            # Must not raise.
-            service._save_updated_tasks(tasks)
-
-
 # ---------------------------------------------------------------------------
 # _process_task_for_frontend — combines several helpers
 # ---------------------------------------------------------------------------
@@ -1101,12 +1107,12 @@ class TestProcessTaskForFrontend:
         assert out["is_in_past"] in (False, 0)
         assert "next_run_local" in out
 
-    def test_expired_once_task_marks_needs_update(self, service):
+    def test_expired_once_task_is_reported_not_updated(self, service):
         past = time.time() - 60
         task = _FakeScheduledTask(cycle="once", next_run_ts=past, is_active=True)
         out = service._process_task_for_frontend(task, "UTC", time.time())
         assert out["frontend_status"] == "expired"
-        assert out["needs_update"] is True
+        assert "needs_update" not in out
         assert out["is_in_past"] is True
 
     def test_system_and_donation_flags_propagate(self, service):
@@ -0,0 +1,87 @@
+# -*- coding: utf-8 -*-
+"""
+Unit tests for the prefix/substring autocomplete index.
+"""
+
+import time
+
+import pytest
+
+from utils.autocomplete_index import MAX_CHOICES, AutocompleteIndex, AutocompleteIndexCache
+
+
+def _reference_filter(query, values):
+    """Linear substring filter the handlers used before the index."""
+    return [v for v in values if query.lower() in v.lower()]
+
+
+@pytest.fixture
+def index():
+    return AutocompleteIndex(["nginx", "plex", "Minecraft", "valheim", "nginx-proxy"])
+
+
+class TestSearch:
+    def test_empty_query_returns_entries_in_order(self, index):
+        assert index.search("") == ["nginx", "plex", "Minecraft", "valheim", "nginx-proxy"]
+        assert index.search(None, limit=2) == ["nginx", "plex"]
+
+    def test_prefix_matches_rank_before_substring_matches(self, index):
+        assert index.search("ngi") == ["nginx", "nginx-proxy"]
+        assert index.search("ex") == ["plex"]
+        assert index.search("e") == ["plex", "Minecraft", "valheim"]
+
+    def test_case_insensitive_and_stripped(self, index):
+        assert index.search("  MINE ") == ["Minecraft"]
+
+    def test_alternate_terms_match_but_value_is_returned(self):
+        idx = AutocompleteIndex([("01", ["01 - Januar", "January"]), ("02", ["02 - Februar", "February"])])
+        assert idx.search("feb") == ["02"]
+        assert idx.search("janu") == ["01"]
+        assert idx.search("0") == ["01", "02"]
+
+    def test_duplicates_and_empty_values_are_dropped(self):
+        assert AutocompleteIndex(["a", "", "a", "b"]).values == ["a", "b"]
+
+    def test_predicate_filters_without_rebuild(self, index):
+        assert index.search("nginx", predicate=lambda v: v != "nginx") == ["nginx-proxy"]
+
+    def test_matches_reference_filter_as_a_set(self):
+        values = [f"container-{i:03d}-{name}" for i, name in enumerate(["web", "db", "cache", "game"] * 50)]
+        idx = AutocompleteIndex(values)
+        for query in ("web", "1", "-0", "game", "ZZ", "container-19"):
+            expected = _reference_filter(query, values)
+            found = idx.search(query, limit=len(values))
+            assert sorted(found) == sorted(expected), query
+            assert idx.search(query) == found[:MAX_CHOICES]
+
+    def test_large_index_answers_in_under_a_millisecond(self):
+        idx = AutocompleteIndex(f"server-{i:05d}" for i in range(20_000))
+        idx.search("warm")
+        start = time.perf_counter()
+        for query in ("server-1", "99", "zzz", "0042"):
+            idx.search(query)
+        assert (time.perf_counter() - start) / 4 < 0.001
+
+
+class TestIndexCache:
+    def test_rebuilds_only_when_source_or_version_changes(self):
+        cache = AutocompleteIndexCache()
+        source = ["a"]
+        calls = []
+
+        def _builder():
+            calls.append(1)
+            return list(source)
+
+        first = cache.get("names", _builder, source=source, version=1)
+        assert cache.get("names", _builder, source=source, version=1) is first
+        cache.get("names", _builder, source=source, version=2)
+        cache.get("names", _builder, source=["a"], version=2)
+        assert len(calls) == 3
+        assert cache.get_stats() == {"indexes": {"names": 1}, "builds": 3}
+
+    def test_invalidate(self):
+        cache = AutocompleteIndexCache()
+        first = cache.get("x", lambda: ["a"])
+        cache.invalidate("x")
+        assert cache.get("x", lambda: ["a"]) is not first
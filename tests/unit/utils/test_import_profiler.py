@@ -0,0 +1,83 @@
+# -*- coding: utf-8 -*-
+"""
+Unit tests for the built-in import-time profiler.
+"""
+
+import importlib
+import sys
+import textwrap
+
+import pytest
+
+from utils import import_profiler
+from utils.import_profiler import ImportProfiler
+
+
+@pytest.fixture
+def fake_package(tmp_path, monkeypatch):
+    pkg = tmp_path / "ddc_profiled_pkg"
+    pkg.mkdir()
+    (pkg / "__init__.py").write_text("from . import heavy\n")
+    (pkg / "heavy.py").write_text(textwrap.dedent("""
+        import time
+        time.sleep(0.02)
+    """))
+    monkeypatch.syspath_prepend(str(tmp_path))
+    importlib.invalidate_caches()
+    yield "ddc_profiled_pkg"
+    for name in [n for n in sys.modules if n.startswith("ddc_profiled_pkg")]:
+        del sys.modules[name]
+
+
+def test_records_self_and_cumulative_time(fake_package):
+    profiler = ImportProfiler().start()
+    try:
+        importlib.import_module(fake_package)
+    finally:
+        profiler.stop()
+
+    records = {r.name: r for r in profiler.records()}
+    parent, child = records[fake_package], records[f"{fake_package}.heavy"]
+    assert child.self_seconds >= 0.015
+    assert parent.cumulative_seconds >= child.cumulative_seconds
+    assert parent.self_seconds < child.self_seconds
+    assert (parent.depth, child.depth) == (0, 1)
+    assert profiler.total_seconds() == pytest.approx(parent.cumulative_seconds)
+
+
+def test_profiled_module_keeps_its_real_loader(fake_package):
+    profiler = ImportProfiler().start()
+    try:
+        module = importlib.import_module(fake_package)
+    finally:
+        profiler.stop()
+
+    assert type(module.__spec__.loader).__name__ == "SourceFileLoader"
+    assert profiler._finder not in sys.meta_path
+
+
+def test_report_lists_most_expensive_first(fake_package):
+    profiler = ImportProfiler().start()
+    try:
+        importlib.import_module(fake_package)
+    finally:
+        profiler.stop()
+
+    report = profiler.format_report(top=5)
+    assert report[0].startswith("Import profile: ")
+    assert report[2].endswith(fake_package)
+    assert "ddc_profiled_pkg" in report[-1]
+
+
+def test_start_from_env(monkeypatch):
+    monkeypatch.setattr(import_profiler, "_profiler", None)
+    monkeypatch.delenv(import_profiler.ENV_FLAG, raising=False)
+    assert import_profiler.start_from_env() is None
+
+    monkeypatch.setenv(import_profiler.ENV_FLAG, "1")
+    profiler = import_profiler.start_from_env()
+    try:
+        assert profiler is import_profiler.get_import_profiler()
+        assert profiler.active
+    finally:
+        profiler.stop()
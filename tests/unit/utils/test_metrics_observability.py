@@ -392,6 +392,77 @@ def test_metrics_collector_get_stats_uptime_positive():
     assert mc.get_stats()["uptime_seconds"] > 0
 
 
+def test_streaming_histogram_memory_is_bounded():
+    hist = obs.StreamingHistogram(window_seconds=60, slots=6)
+    now = 1_000_000.0
+    for i in range(50_000):
+        hist.record(1.0 + (i % 1000), now=now)
+    buckets = sum(len(slot["buckets"]) for slot in hist._ring if slot)
+    # 1..1000 spans ~10 octaves of 32 sub-buckets each
+    assert buckets <= 10 * obs.StreamingHistogram.SUB_BUCKETS + 1
+    assert hist.total_count == 50_000
+
+
+def test_streaming_histogram_quantiles_within_relative_error():
+    hist = obs.StreamingHistogram()
+    values = [float(v) for v in range(1, 10_001)]
+    now = 1_000_000.0
+    for v in values:
+        hist.record(v, now=now)
+    snap = hist.snapshot(now=now)
+    for key, q in (("p50", 0.5), ("p95", 0.95), ("p99", 0.99)):
+        exact = values[int(len(values) * q)]
+        assert abs(snap[key] - exact) / exact < 1 / obs.StreamingHistogram.SUB_BUCKETS
+
+
+def test_streaming_histogram_window_expires_old_slots():
+    hist = obs.StreamingHistogram(window_seconds=60, slots=6)
+    hist.record(100.0, now=1_000.0)
+    hist.record(1.0, now=1_050.0)
+    assert hist.snapshot(now=1_050.0)["count"] == 2
+    snap = hist.snapshot(now=1_075.0)
+    assert snap["count"] == 1 and snap["max"] == 1.0
+    assert hist.snapshot(now=2_000.0) is None
+    # Lifetime totals survive the window
+    assert hist.total_count == 2 and hist.total_sum == 101.0
+
+
+def test_streaming_histogram_handles_zero_and_negative_values():
+    hist = obs.StreamingHistogram()
+    for v in (-5.0, 0.0, 5.0):
+        hist.record(v, now=10.0)
+    snap = hist.snapshot(now=10.0)
+    assert snap["min"] == -5.0 and snap["max"] == 5.0
+    assert snap["p50"] == 0.0
+
+
+def test_metrics_collector_render_prometheus():
+    mc = obs.MetricsCollector()
+    mc.increment("donations.total", value=2)
+    mc.gauge("docker.client_pool.queue_depth", 3)
+    mc.histogram("overview.render.duration_ms", 12.0)
+    text = mc.render_prometheus()
+    assert "# TYPE ddc_donations_total counter\nddc_donations_total 2.0\n" in text
+    assert "ddc_docker_client_pool_queue_depth 3.0" in text
+    assert "# TYPE ddc_overview_render_duration_ms summary" in text
+    assert 'ddc_overview_render_duration_ms{quantile="0.5"} 12.0' in text
+    assert "ddc_overview_render_duration_ms_count 1" in text
+    assert text.endswith("\n")
+
+
+def test_timed_decorator_supports_coroutines():
+    import asyncio
+
+    obs.metrics.reset()
+
+    @obs.timed("my.async.metric")
+    async def coro():
+        return "done"
+
+    assert asyncio.run(coro()) == "done"
+    assert obs.metrics.get_stats()["histograms"]["my.async.metric.duration_ms"]["count"] == 1
+
+
 def test_traced_decorator_passes_through_when_disabled():
     @obs.traced("custom.op")
     def my_func(x, y):
@@ -18,7 +18,7 @@ Functional unit tests filling coverage gaps for:
 - services.scheduling.scheduler_service
                             (_calculate_optimal_sleep_interval branches,
                              _check_system_tasks, _check_and_execute_tasks
-                             with mocked load_tasks, _execute_task_batch
+                             with a mocked task store, _execute_task_batch
                              happy/error paths, set_bot_instance/get_bot_instance,
                              stop with no-op task path,
                              start_/stop_/get_scheduler_stats globals)
@@ -682,6 +682,13 @@ def test_log_performance_status_runs_without_error(caplog):
 
 
 from services.scheduling import scheduler_service as ss  # noqa: E402
+from services.scheduling.task_store import TaskStore  # noqa: E402
+
+
+def _store(tasks=()):
+    store = TaskStore()
+    store.replace(tasks)
+    return store
 
 
 @pytest.fixture
@@ -732,8 +739,8 @@ def test_check_system_tasks_runs_without_error(fresh_service):
 
 
 def test_check_and_execute_no_tasks_returns_silently(fresh_service):
-    """Empty load_tasks() -> early return."""
-    with patch.object(ss, "load_tasks", return_value=[]):
+    """Empty task store -> early return."""
+    with patch.object(ss, "refresh_task_store", return_value=_store()):
         asyncio.run(fresh_service._check_and_execute_tasks())
 
 
@@ -745,7 +752,7 @@ def test_check_and_execute_with_inactive_task_skipped(fresh_service):
     inactive.next_run_ts = time.time()
     inactive.container_name = "x"
 
-    with patch.object(ss, "load_tasks", return_value=[inactive]):
+    with patch.object(ss, "refresh_task_store", return_value=_store([inactive])):
         asyncio.run(fresh_service._check_and_execute_tasks())
     assert fresh_service.task_execution_stats["total_executed"] == 0
 
@@ -759,7 +766,7 @@ def test_check_and_execute_skips_already_running_task(fresh_service):
     task.next_run_ts = time.time()  # Due now
 
     fresh_service.active_tasks.add("t-running")
-    with patch.object(ss, "load_tasks", return_value=[task]):
+    with patch.object(ss, "refresh_task_store", return_value=_store([task])):
         asyncio.run(fresh_service._check_and_execute_tasks())
     assert fresh_service.task_execution_stats["total_skipped"] == 1
 
@@ -775,7 +782,7 @@ def test_check_and_execute_runs_due_task_via_mocked_execute_task(fresh_service):
     async def _ok_execute(t):
         return None
 
-    with patch.object(ss, "load_tasks", return_value=[task]), \
+    with patch.object(ss, "refresh_task_store", return_value=_store([task])), \
          patch.object(ss, "execute_task", side_effect=_ok_execute) as mocked_exec, \
          patch.object(ss, "update_task") as mocked_update:
         asyncio.run(fresh_service._check_and_execute_tasks())
@@ -795,7 +802,7 @@ def test_check_and_execute_skips_task_outside_time_window(fresh_service):
     task.container_name = "ctr"
     task.next_run_ts = time.time() - 10_000  # very old
 
-    with patch.object(ss, "load_tasks", return_value=[task]), \
+    with patch.object(ss, "refresh_task_store", return_value=_store([task])), \
          patch.object(ss, "execute_task") as mocked_exec:
         asyncio.run(fresh_service._check_and_execute_tasks())
     mocked_exec.assert_not_called()
@@ -860,7 +867,7 @@ def test_check_and_execute_respects_max_concurrent_limit(fresh_service):
         t.next_run_ts = time.time()
         due_tasks.append(t)
 
-    with patch.object(ss, "load_tasks", return_value=due_tasks), \
+    with patch.object(ss, "refresh_task_store", return_value=_store(due_tasks)), \
          patch.object(ss, "execute_task") as mocked_exec:
         asyncio.run(fresh_service._check_and_execute_tasks())
 
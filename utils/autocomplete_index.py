@@ -0,0 +1,188 @@
+# -*- coding: utf-8 -*-
+# ============================================================================ #
+# DockerDiscordControl (DDC)                                                  #
+# https://ddc.bot                                                              #
+# Copyright (c) 2025 MAX                                                  #
+# Licensed under the MIT License                                               #
+# ============================================================================ #
+"""
+Prebuilt search indexes for Discord autocomplete handlers.
+
+Autocomplete callbacks run on every keystroke and Discord drops answers that
+take longer than three seconds. Instead of reloading the configuration and
+scanning every choice with ``in`` each time, handlers build an
+:class:`AutocompleteIndex` once per source version (config reload, task
+store mutation, language switch) and query it:
+
+* prefix matches come from a sorted key array via :mod:`bisect`;
+* substring matches come from one lower-cased haystack string searched with
+  ``str.find``, so the scan runs in C and stops after ``limit`` hits.
+"""
+
+import threading
+from bisect import bisect_left, bisect_right
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+from utils.logging_utils import setup_logger
+
+logger = setup_logger('ddc.autocomplete_index')
+
+# Discord accepts at most 25 autocomplete choices
+MAX_CHOICES = 25
+
+# Separates terms in the haystack; never produced by ``str.lower()`` on user input
+_SEPARATOR = '\x00'
+
+Entry = Union[str, Tuple[str, Sequence[str]]]
+
+
+class AutocompleteIndex:
+    """Immutable prefix/substring index over autocomplete choices.
+
+    ``entries`` are either plain strings or ``(value, terms)`` pairs; a query
+    matches an entry if it matches its value or any of its terms (e.g. a
+    display label or translation). Values keep the order they were given in,
+    duplicates are dropped.
+    """
+
+    def __init__(self, entries: Iterable[Entry]):
+        self._values: List[str] = []
+        seen = set()
+        keys: List[Tuple[str, int]] = []
+        haystack_parts: List[str] = []
+        self._offsets: List[int] = []
+        self._owners: List[int] = []
+        offset = 0
+
+        for entry in entries:
+            value, terms = (entry, ()) if isinstance(entry, str) else (entry[0], entry[1])
+            if not value or value in seen:
+                continue
+            seen.add(value)
+            idx = len(self._values)
+            self._values.append(value)
+            for term in dict.fromkeys(t.lower() for t in (value, *terms) if t):
+                keys.append((term, idx))
+                haystack_parts.append(term)
+                self._offsets.append(offset)
+                self._owners.append(idx)
+                offset += len(term) + 1
+
+        keys.sort()
+        self._keys = [k for k, _ in keys]
+        self._key_owners = [i for _, i in keys]
+        self._haystack = _SEPARATOR.join(haystack_parts)
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    @property
+    def values(self) -> List[str]:
+        return list(self._values)
+
+    def search(self, query: Optional[str], limit: int = MAX_CHOICES,
+               predicate: Optional[Callable[[str], bool]] = None) -> List[str]:
+        """Return up to ``limit`` values matching ``query``.
+
+        Prefix matches come first (ordered by matching term), followed by
+        entries that only contain ``query`` somewhere, in entry order. An
+        empty query returns the first ``limit`` values. ``predicate`` filters
+        values at query time, for conditions that change without the index
+        being rebuilt (e.g. expiry).
+        """
+        if limit <= 0:
+            return []
+        needle = (query or '').strip().lower()
+        if not needle:
+            return self._take(range(len(self._values)), limit, predicate, set())
+
+        found: List[str] = []
+        taken = set()
+
+        # Prefix matches: contiguous range of the sorted key array
+        lo = bisect_left(self._keys, needle)
+        hi = bisect_right(self._keys, needle + '\uffff', lo)
+        found.extend(self._take((self._key_owners[i] for i in range(lo, hi)), limit, predicate, taken))
+        if len(found) >= limit or _SEPARATOR in needle:
+            return found
+
+        # Substring matches in entry order
+        found.extend(self._take(self._substring_owners(needle), limit - len(found), predicate, taken))
+        return found
+
+    def _substring_owners(self, needle: str):
+        haystack = self._haystack
+        pos = haystack.find(needle)
+        while pos != -1:
+            term_idx = bisect_right(self._offsets, pos) - 1
+            yield self._owners[term_idx]
+            # Continue after the current term; further hits in it add nothing
+            next_term = term_idx + 1
+            if next_term >= len(self._offsets):
+                return
+            pos = haystack.find(needle, self._offsets[next_term])
+
+    def _take(self, owners: Iterable[int], limit: int,
+              predicate: Optional[Callable[[str], bool]], taken: set) -> List[str]:
+        result: List[str] = []
+        for idx in owners:
+            if idx in taken:
+                continue
+            taken.add(idx)
+            value = self._values[idx]
+            if predicate is not None and not predicate(value):
+                continue
+            result.append(value)
+            if len(result) >= limit:
+                break
+        return result
+
+
+class AutocompleteIndexCache:
+    """Named indexes rebuilt only when their source changes.
+
+    A cached index is reused while the caller passes the same ``source``
+    object (compared by identity, and kept referenced so its id cannot be
+    recycled) and an equal ``version``.
+    """
+
+    def __init__(self):
+        self._entries: Dict[str, Tuple[Any, Any, AutocompleteIndex]] = {}
+        self._lock = threading.Lock()
+        self._builds = 0
+
+    def get(self, name: str, builder: Callable[[], Iterable[Entry]],
+            source: Any = None, version: Any = None) -> AutocompleteIndex:
+        with self._lock:
+            cached = self._entries.get(name)
+        if cached is not None and cached[0] is source and cached[1] == version:
+            return cached[2]
+
+        index = AutocompleteIndex(builder())
+        with self._lock:
+            self._entries[name] = (source, version, index)
+            self._builds += 1
+        logger.debug(f"Built autocomplete index '{name}' ({len(index)} choices)")
+        return index
+
+    def invalidate(self, name: Optional[str] = None) -> None:
+        with self._lock:
+            if name is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(name, None)
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                'indexes': {name: len(entry[2]) for name, entry in self._entries.items()},
+                'builds': self._builds,
+            }
+
+
+_index_cache = AutocompleteIndexCache()
+
+
+def get_autocomplete_index_cache() -> AutocompleteIndexCache:
+    """Return the process-wide :class:`AutocompleteIndexCache`."""
+    return _index_cache
@@ -0,0 +1,215 @@
+# -*- coding: utf-8 -*-
+# ============================================================================ #
+# DockerDiscordControl (DDC) - Import Time Profiler                           #
+# https://ddc.bot                                                              #
+# Copyright (c) 2025 MAX                                                       #
+# Licensed under the MIT License                                               #
+# ============================================================================ #
+"""
+Built-in import-time profiler for cold start analysis.
+
+Like ``python -X importtime`` but switchable at runtime and readable from the
+bot log: every module executed while the profiler is active is timed, with
+its self time and its cumulative time (including the imports it triggered).
+
+Enabled by setting ``DDC_PROFILE_IMPORTS=1``; ``run.py`` starts it before the
+Web UI and bot imports (``bot.py`` too, when run standalone) and the extension
+loading step logs the report.
+
+Usage:
+    from utils import import_profiler
+
+    profiler = import_profiler.start()
+    import cogs.docker_control
+    profiler.stop()
+    for line in profiler.format_report(top=20):
+        print(line)
+
+Only stdlib is imported here so the profiler does not distort what it measures.
+"""
+
+import importlib.abc
+import logging
+import os
+import sys
+import threading
+import time
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
+logger = logging.getLogger('ddc.import_profiler')
+
+ENV_FLAG = 'DDC_PROFILE_IMPORTS'
+DEFAULT_REPORT_SIZE = 25
+
+
+@dataclass
+class ImportRecord:
+    """Timing of one executed module."""
+    name: str
+    self_seconds: float
+    cumulative_seconds: float
+    depth: int
+
+
+class _TimingFinder(importlib.abc.MetaPathFinder):
+    """Meta path entry that times ``exec_module`` of every module it sees.
+
+    It resolves specs through the remaining finders and wraps the loader's
+    ``exec_module`` on that loader instance, so modules keep their real
+    loader (no proxy objects in ``__loader__``/``__spec__``).
+    """
+
+    def __init__(self, profiler: 'ImportProfiler'):
+        self._profiler = profiler
+        self._local = threading.local()
+
+    def find_spec(self, fullname, path, target=None):
+        if getattr(self._local, 'busy', False):
+            return None
+        self._local.busy = True
+        try:
+            for finder in sys.meta_path:
+                if finder is self or not hasattr(finder, 'find_spec'):
+                    continue
+                spec = finder.find_spec(fullname, path, target)
+                if spec is not None:
+                    self._profiler._instrument(spec)
+                    return spec
+            return None
+        finally:
+            self._local.busy = False
+
+
+class ImportProfiler:
+    """Collects per-module import timings while active."""
+
+    def __init__(self):
+        self._finder = _TimingFinder(self)
+        self._lock = threading.Lock()
+        self._records: Dict[str, ImportRecord] = {}
+        self._local = threading.local()
+        self.started_at: Optional[float] = None
+        self.stopped_at: Optional[float] = None
+
+    @property
+    def active(self) -> bool:
+        return self._finder in sys.meta_path
+
+    def start(self) -> 'ImportProfiler':
+        if not self.active:
+            sys.meta_path.insert(0, self._finder)
+            self.started_at = time.perf_counter()
+            self.stopped_at = None
+        return self
+
+    def stop(self) -> 'ImportProfiler':
+        if self.active:
+            sys.meta_path.remove(self._finder)
+            self.stopped_at = time.perf_counter()
+        return self
+
+    def _instrument(self, spec) -> None:
+        loader = spec.loader
+        exec_module = getattr(loader, 'exec_module', None)
+        # Class-level loaders (builtin/frozen importers) are shared and cheap - skip them
+        if exec_module is None or isinstance(loader, type) or getattr(exec_module, '_ddc_timed', False):
+            return
+        profiler = self
+        name = spec.name
+
+        def timed_exec_module(module):
+            stack = profiler._stack()
+            stack.append(0.0)  # children time accumulates here
+            start = time.perf_counter()
+            try:
+                exec_module(module)
+            finally:
+                elapsed = time.perf_counter() - start
+                children = stack.pop()
+                if stack:
+                    stack[-1] += elapsed
+                profiler._record(ImportRecord(name, elapsed - children, elapsed, len(stack)))
+
+        timed_exec_module._ddc_timed = True
+        try:
+            loader.exec_module = timed_exec_module
+        except (AttributeError, TypeError):
+            pass  # Loader without instance dict (__slots__) - not timed
+
+    def _stack(self) -> List[float]:
+        stack = getattr(self._local, 'stack', None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    def _record(self, record: ImportRecord) -> None:
+        with self._lock:
+            self._records[record.name] = record
+
+    # ------------------------------------------------------------------
+    # Reporting
+    # ------------------------------------------------------------------
+    def records(self) -> List[ImportRecord]:
+        """All timed modules, most expensive (cumulative) first."""
+        with self._lock:
+            records = list(self._records.values())
+        return sorted(records, key=lambda r: r.cumulative_seconds, reverse=True)
+
+    def total_seconds(self) -> float:
+        """Time spent importing top-level (not nested) modules."""
+        with self._lock:
+            return sum(r.cumulative_seconds for r in self._records.values() if r.depth == 0)
+
+    def by_package(self) -> Dict[str, float]:
+        """Self time summed per top-level package (e.g. 'discord', 'cogs', 'PIL')."""
+        totals: Dict[str, float] = {}
+        with self._lock:
+            for record in self._records.values():
+                package = record.name.split('.', 1)[0]
+                totals[package] = totals.get(package, 0.0) + record.self_seconds
+        return dict(sorted(totals.items(), key=lambda item: item[1], reverse=True))
+
+    def format_report(self, top: int = DEFAULT_REPORT_SIZE) -> List[str]:
+        records = self.records()
+        lines = [f"Import profile: {len(records)} modules, {self.total_seconds() * 1000:.1f} ms total"]
+        lines.append(f"{'cumulative':>12} {'self':>10}  module")
+        for record in records[:top]:
+            lines.append(f"{record.cumulative_seconds * 1000:10.1f}ms {record.self_seconds * 1000:8.1f}ms  "
+                         f"{'  ' * record.depth}{record.name}")
+        packages = list(self.by_package().items())[:10]
+        if packages:
+            lines.append("Self time by package: " + ", ".join(f"{name} {seconds * 1000:.1f}ms"
+                                                            for name, seconds in packages))
+        return lines
+
+    def log_report(self, log: Optional[logging.Logger] = None, top: int = DEFAULT_REPORT_SIZE) -> None:
+        log = log or logger
+        for line in self.format_report(top):
+            log.info(line)
+
+
+# Global profiler instance
+_profiler: Optional[ImportProfiler] = None
+
+
+def get_import_profiler() -> ImportProfiler:
+    """Get the global import profiler (not started)."""
+    global _profiler
+    if _profiler is None:
+        _profiler = ImportProfiler()
+    return _profiler
+
+
+def start() -> ImportProfiler:
+    """Start the global import profiler."""
+    return get_import_profiler().start()
+
+
+def is_enabled() -> bool:
+    return os.environ.get(ENV_FLAG, '').strip().lower() in ('1', 'true', 'yes', 'on')
+
+
+def start_from_env() -> Optional[ImportProfiler]:
+    """Start the global profiler if ``DDC_PROFILE_IMPORTS`` is set."""
+    return start() if is_enabled() else None
@@ -13,7 +13,8 @@ with OpenTelemetry integration.
 
 Features:
 - JSON structured logging
-- Lightweight metrics collection (counters, histograms, gauges)
+- Lightweight metrics collection (counters, fixed-memory windowed histograms, gauges)
+- Prometheus text exposition of all metrics
 - OpenTelemetry tracing (optional)
 - Context propagation
 - Service identification
@@ -32,10 +33,15 @@ Example:
     >>> metrics.histogram("donation.amount", 5.0)
 """
 
+import functools
+import inspect
 import json
 import logging
+import math
+import re
+import threading
 import time
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Tuple
 from datetime import datetime, timezone
 from pathlib import Path
 from collections import defaultdict
@@ -196,12 +202,118 @@ def get_structured_logger(
 # Metrics Collection                                                           #
 # ============================================================================ #
 
+class StreamingHistogram:
+    """
+    Fixed-memory histogram over a sliding time window.
+
+    Values are counted in log-linear buckets (HDR-style: every power of two
+    is split into ``SUB_BUCKETS`` equal-width sub-buckets), so quantiles carry
+    a relative error below ``1 / SUB_BUCKETS`` and memory is bounded by the
+    value range instead of the number of observations.
+
+    The window is a ring of ``slots`` sub-windows; a slot is recycled once it
+    falls out of the window. Lifetime ``count``/``sum`` are kept separately
+    for cumulative exports.
+    """
+
+    SUB_BUCKETS = 32
+    _BucketKey = Tuple[int, int]
+
+    def __init__(self, window_seconds: float = 300.0, slots: int = 10):
+        self.window_seconds = float(window_seconds)
+        self.slots = max(1, int(slots))
+        self._slot_width = self.window_seconds / self.slots
+        self._ring: List[Optional[Dict[str, Any]]] = [None] * self.slots
+        self.total_count = 0
+        self.total_sum = 0.0
+
+    @classmethod
+    def _bucket_key(cls, value: float) -> _BucketKey:
+        """Map a value to an ordered ``(sign, index)`` bucket key."""
+        if value == 0:
+            return (0, 0)
+        mantissa, exponent = math.frexp(abs(value))  # 0.5 <= mantissa < 1
+        index = exponent * cls.SUB_BUCKETS + int((mantissa - 0.5) * 2 * cls.SUB_BUCKETS)
+        return (1, index) if value > 0 else (-1, -index)
+
+    @classmethod
+    def _bucket_value(cls, key: _BucketKey) -> float:
+        """Lower bound (by magnitude) of the bucket identified by ``key``."""
+        sign, index = key
+        if sign == 0:
+            return 0.0
+        exponent, sub = divmod(index if sign > 0 else -index, cls.SUB_BUCKETS)
+        magnitude = math.ldexp(0.5 + sub / (2 * cls.SUB_BUCKETS), exponent)
+        return magnitude if sign > 0 else -magnitude
+
+    def _current_slot(self, now: float) -> Dict[str, Any]:
+        epoch = int(now // self._slot_width)
+        position = epoch % self.slots
+        slot = self._ring[position]
+        if slot is None or slot["epoch"] != epoch:
+            slot = {"epoch": epoch, "buckets": {}, "count": 0, "sum": 0.0,
+                    "min": math.inf, "max": -math.inf}
+            self._ring[position] = slot
+        return slot
+
+    def record(self, value: float, now: Optional[float] = None) -> None:
+        slot = self._current_slot(time.time() if now is None else now)
+        key = self._bucket_key(value)
+        slot["buckets"][key] = slot["buckets"].get(key, 0) + 1
+        slot["count"] += 1
+        slot["sum"] += value
+        slot["min"] = min(slot["min"], value)
+        slot["max"] = max(slot["max"], value)
+        self.total_count += 1
+        self.total_sum += value
+
+    def snapshot(self, now: Optional[float] = None,
+                 quantiles: Tuple[float, ...] = (0.5, 0.95, 0.99)) -> Optional[Dict[str, Any]]:
+        """Summary statistics over the current window, or ``None`` if empty."""
+        now = time.time() if now is None else now
+        oldest_epoch = int(now // self._slot_width) - self.slots + 1
+        live = [slot for slot in self._ring if slot is not None and slot["epoch"] >= oldest_epoch]
+        count = sum(slot["count"] for slot in live)
+        if not count:
+            return None
+
+        merged: Dict[StreamingHistogram._BucketKey, int] = {}
+        for slot in live:
+            for key, bucket_count in slot["buckets"].items():
+                merged[key] = merged.get(key, 0) + bucket_count
+        total = sum(slot["sum"] for slot in live)
+        lowest = min(slot["min"] for slot in live)
+        highest = max(slot["max"] for slot in live)
+
+        ordered = sorted(merged.items())
+        result = {
+            "count": count,
+            "sum": total,
+            "min": lowest,
+            "max": highest,
+            "mean": total / count,
+        }
+        for q in quantiles:
+            # Same rank rule as sorted_values[int(count * q)]
+            rank = min(int(count * q), count - 1)
+            seen = 0
+            for key, bucket_count in ordered:
+                seen += bucket_count
+                if seen > rank:
+                    estimate = self._bucket_value(key)
+                    break
+            result[f"p{int(round(q * 100))}"] = min(max(estimate, lowest), highest)
+        return result
+
+
 class MetricsCollector:
     """
     Lightweight metrics collector for DDC.
 
-    Collects metrics in memory with optional JSON export.
-    Supports counters, histograms, and gauges.
+    Collects metrics in memory with optional JSON export and Prometheus text
+    exposition. Supports counters, histograms, and gauges. Histograms are
+    fixed-memory :class:`StreamingHistogram` instances over a sliding window
+    (``DDC_METRICS_WINDOW_SECONDS``, default 300s).
 
     Thread-safe and designed for low overhead.
 
@@ -213,9 +325,17 @@ class MetricsCollector:
         >>> stats = metrics.get_stats()
     """
 
-    def __init__(self):
+    def __init__(self, window_seconds: Optional[float] = None):
+        if window_seconds is None:
+            import os
+            try:
+                window_seconds = float(os.environ.get("DDC_METRICS_WINDOW_SECONDS", "300"))
+            except ValueError:
+                window_seconds = 300.0
+        self._window_seconds = window_seconds
+        self._lock = threading.Lock()
         self._counters: Dict[str, int] = defaultdict(int)
-        self._histograms: Dict[str, List[float]] = defaultdict(list)
+        self._histograms: Dict[str, StreamingHistogram] = {}
         self._gauges: Dict[str, float] = {}
         self._start_time = time.time()
 
@@ -232,7 +352,8 @@ class MetricsCollector:
             >>> metrics.increment("api.requests")
             >>> metrics.increment("donations.total", value=1)
         """
-        self._counters[name] += value
+        with self._lock:
+            self._counters[name] += value
 
     def decrement(self, name: str, value: int = 1, tags: Optional[Dict[str, str]] = None) -> None:
         """
@@ -243,7 +364,8 @@ class MetricsCollector:
             value: Amount to decrement by (default: 1)
             tags: Optional tags for metric
         """
-        self._counters[name] -= value
+        with self._lock:
+            self._counters[name] -= value
 
     def histogram(self, name: str, value: float, tags: Optional[Dict[str, str]] = None) -> None:
         """
@@ -260,7 +382,11 @@ class MetricsCollector:
             >>> metrics.histogram("donation.amount", 5.0)
             >>> metrics.histogram("request.duration_ms", 123.45)
         """
-        self._histograms[name].append(value)
+        with self._lock:
+            hist = self._histograms.get(name)
+            if hist is None:
+                hist = self._histograms[name] = StreamingHistogram(self._window_seconds)
+            hist.record(value)
 
     def gauge(self, name: str, value: float, tags: Optional[Dict[str, str]] = None) -> None:
         """
@@ -277,7 +403,8 @@ class MetricsCollector:
             >>> metrics.gauge("queue.size", 10)
             >>> metrics.gauge("memory.used_mb", 256.5)
         """
-        self._gauges[name] = value
+        with self._lock:
+            self._gauges[name] = value
 
     @contextmanager
     def timer(self, name: str):
@@ -304,6 +431,9 @@ class MetricsCollector:
         """
         Get statistics for all metrics.
 
+        Histogram statistics cover the sliding window; ``total_count`` and
+        ``total_sum`` are lifetime values.
+
         Returns:
             Dictionary with metric statistics
 
@@ -311,37 +441,86 @@ class MetricsCollector:
             >>> stats = metrics.get_stats()
             >>> print(stats['counters']['donations.total'])
         """
-        stats = {
-            "counters": dict(self._counters),
-            "gauges": dict(self._gauges),
-            "histograms": {},
-            "uptime_seconds": time.time() - self._start_time
-        }
+        with self._lock:
+            stats = {
+                "counters": dict(self._counters),
+                "gauges": dict(self._gauges),
+                "histograms": {},
+                "uptime_seconds": time.time() - self._start_time
+            }
 
-        # Calculate histogram statistics
-        for name, values in self._histograms.items():
-            if values:
-                sorted_values = sorted(values)
-                count = len(values)
-                stats["histograms"][name] = {
-                    "count": count,
-                    "sum": sum(values),
-                    "min": sorted_values[0],
-                    "max": sorted_values[-1],
-                    "mean": sum(values) / count,
-                    "p50": sorted_values[int(count * 0.5)],
-                    "p95": sorted_values[int(count * 0.95)] if count > 1 else sorted_values[0],
-                    "p99": sorted_values[int(count * 0.99)] if count > 1 else sorted_values[0],
-                }
+            now = time.time()
+            for name, hist in self._histograms.items():
+                snapshot = hist.snapshot(now)
+                if snapshot:
+                    snapshot["total_count"] = hist.total_count
+                    snapshot["total_sum"] = hist.total_sum
+                    stats["histograms"][name] = snapshot
 
         return stats
 
+    @staticmethod
+    def _prometheus_name(name: str, prefix: str) -> str:
+        metric_name = re.sub(r"[^a-zA-Z0-9_:]", "_", f"{prefix}_{name}" if prefix else name)
+        return metric_name if not metric_name[0].isdigit() else f"_{metric_name}"
+
+    @staticmethod
+    def _prometheus_value(value: float) -> str:
+        if isinstance(value, float) and math.isnan(value):
+            return "NaN"
+        if value == math.inf:
+            return "+Inf"
+        if value == -math.inf:
+            return "-Inf"
+        return repr(float(value))
+
+    def render_prometheus(self, prefix: str = "ddc") -> str:
+        """
+        Render all metrics in the Prometheus text exposition format (0.0.4).
+
+        Counters and gauges map directly; histograms are exported as
+        summaries with windowed quantiles and lifetime ``_sum``/``_count``.
+
+        Example:
+            >>> text = metrics.render_prometheus()
+        """
+        lines: List[str] = []
+        fmt = self._prometheus_value
+        now = time.time()
+        with self._lock:
+            for name in sorted(self._counters):
+                metric_name = self._prometheus_name(name, prefix)
+                lines.append(f"# TYPE {metric_name} counter")
+                lines.append(f"{metric_name} {fmt(self._counters[name])}")
+
+            for name in sorted(self._gauges):
+                metric_name = self._prometheus_name(name, prefix)
+                lines.append(f"# TYPE {metric_name} gauge")
+                lines.append(f"{metric_name} {fmt(self._gauges[name])}")
+
+            for name in sorted(self._histograms):
+                hist = self._histograms[name]
+                metric_name = self._prometheus_name(name, prefix)
+                snapshot = hist.snapshot(now) or {}
+                lines.append(f"# TYPE {metric_name} summary")
+                for quantile, key in (("0.5", "p50"), ("0.95", "p95"), ("0.99", "p99")):
+                    lines.append(f'{metric_name}{{quantile="{quantile}"}} {fmt(snapshot.get(key, math.nan))}')
+                lines.append(f"{metric_name}_sum {fmt(hist.total_sum)}")
+                lines.append(f"{metric_name}_count {hist.total_count}")
+
+            uptime_name = self._prometheus_name("uptime_seconds", prefix)
+            lines.append(f"# TYPE {uptime_name} gauge")
+            lines.append(f"{uptime_name} {fmt(now - self._start_time)}")
+
+        return "\n".join(lines) + "\n"
+
     def reset(self) -> None:
         """Reset all metrics."""
-        self._counters.clear()
-        self._histograms.clear()
-        self._gauges.clear()
-        self._start_time = time.time()
+        with self._lock:
+            self._counters.clear()
+            self._histograms.clear()
+            self._gauges.clear()
+            self._start_time = time.time()
 
     def export_json(self, file_path: Path) -> None:
         """
@@ -519,6 +698,14 @@ def timed(metric_name: Optional[str] = None):
     def decorator(func):
         name = metric_name or f"{func.__module__}.{func.__name__}"
 
+        if inspect.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                with metrics.timer(name):
+                    return await func(*args, **kwargs)
+
+            return async_wrapper
+
         def wrapper(*args, **kwargs):
             with metrics.timer(name):
                 return func(*args, **kwargs)